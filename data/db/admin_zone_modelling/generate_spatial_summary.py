@@ -15,94 +15,13 @@ This solves the polygon storage problem by:
 import json
 import os
 from pathlib import Path
-import math
 
-def calculate_polygon_centroid(coordinates):
-    """Calculate centroid of a polygon using the shoelace formula"""
-    # Handle different coordinate structures
-    if isinstance(coordinates[0][0], list):
-        # MultiPolygon or Polygon with holes - use first ring
-        coords = coordinates[0] if len(coordinates[0]) > 2 else coordinates[0][0]
-    else:
-        # Simple polygon
-        coords = coordinates
-    
-    # Remove last point if it duplicates the first (closed polygon)
-    if len(coords) > 3 and coords[0] == coords[-1]:
-        coords = coords[:-1]
-    
-    # Calculate centroid using shoelace formula
-    area = 0.0
-    centroid_x = 0.0
-    centroid_y = 0.0
-    
-    for i in range(len(coords)):
-        j = (i + 1) % len(coords)
-        cross = coords[i][0] * coords[j][1] - coords[j][0] * coords[i][1]
-        area += cross
-        centroid_x += (coords[i][0] + coords[j][0]) * cross
-        centroid_y += (coords[i][1] + coords[j][1]) * cross
-    
-    if area == 0:
-        # Fallback to simple average if shoelace fails
-        centroid_x = sum(coord[0] for coord in coords) / len(coords)
-        centroid_y = sum(coord[1] for coord in coords) / len(coords)
-    else:
-        area *= 3.0
-        centroid_x /= area
-        centroid_y /= area
-    
-    return centroid_x, centroid_y
+from ortsteil_grid import DEFAULT_CELL_SIZE, OrtsteilGrid
+from ortsteil_topology import LEVELS, build_topology, write_topology_levels
+from polygon_metrics import area_deviations, feature_metrics, historic_bezirk_metrics, load_timeline
 
-def calculate_bounding_box(coordinates):
-    """Calculate bounding box from polygon coordinates"""
-    # Flatten all coordinates
-    all_coords = []
-    
-    def flatten_coords(coord_list):
-        for item in coord_list:
-            if isinstance(item[0], list):
-                flatten_coords(item)
-            else:
-                all_coords.append(item)
-    
-    flatten_coords(coordinates)
-    
-    if not all_coords:
-        return None
-    
-    lons = [coord[0] for coord in all_coords]
-    lats = [coord[1] for coord in all_coords]
-    
-    return {
-        'min_lon': min(lons),
-        'max_lon': max(lons),
-        'min_lat': min(lats),
-        'max_lat': max(lats)
-    }
-
-def calculate_area_km2(coordinates):
-    """Calculate approximate area in km² using simple projection"""
-    # This is a rough approximation - for precise area calculation,
-    # use a proper geographic library like GeoPandas
-    
-    bbox = calculate_bounding_box(coordinates)
-    if not bbox:
-        return 0
-    
-    # Convert to approximate meters (rough)
-    lat_center = (bbox['min_lat'] + bbox['max_lat']) / 2
-    lon_diff = bbox['max_lon'] - bbox['min_lon']
-    lat_diff = bbox['max_lat'] - bbox['min_lat']
-    
-    # Rough conversion (not accurate but good enough for comparison)
-    meters_per_degree_lat = 111000  # approximately
-    meters_per_degree_lon = 111000 * math.cos(math.radians(lat_center))
-    
-    area_m2 = (lon_diff * meters_per_degree_lon) * (lat_diff * meters_per_degree_lat)
-    area_km2 = area_m2 / 1000000
-    
-    return area_km2
+SUMMARY_COORDINATE_FIELDS = ['centroid_lat', 'centroid_lon',
+                             'bbox_min_lat', 'bbox_max_lat', 'bbox_min_lon', 'bbox_max_lon']
 
 def process_ortsteil_geometries(geojson_file):
     """Process Ortsteil geometries into spatial summaries"""
@@ -111,6 +30,9 @@ def process_ortsteil_geometries(geojson_file):
     with open(geojson_file, 'r', encoding='utf-8') as f:
         geojson_data = json.load(f)
     
+    # Areas, centroids and bounding boxes of all Ortsteile in one vectorized pass
+    metrics = feature_metrics(geojson_data)
+    
     spatial_summaries = []
     geometry_files = {}
     
@@ -118,93 +40,72 @@ def process_ortsteil_geometries(geojson_file):
     os.makedirs("geometry_files", exist_ok=True)
     os.makedirs("geometry_files/ortsteil", exist_ok=True)
     
-    for feature in geojson_data['features']:
+    for row, index in enumerate(metrics['feature_index']):
+        feature = geojson_data['features'][index]
         properties = feature['properties']
         geometry = feature['geometry']
+        ortsteil_name = properties['nam']
         
-        ortsteil_name = properties.get('nam')
-        if not ortsteil_name:
-            continue
-        
-        # Calculate spatial summary
         try:
-            if geometry['type'] in ['Polygon', 'MultiPolygon']:
-                coordinates = geometry['coordinates']
-                
-                # Calculate centroid
-                centroid_lon, centroid_lat = calculate_polygon_centroid(coordinates)
-                
-                # Calculate bounding box
-                bbox = calculate_bounding_box(coordinates)
-                
-                # Calculate approximate area
-                area_km2 = calculate_area_km2(coordinates)
-                
-                # Create clean filename
-                clean_name = ortsteil_name.replace(' ', '_').replace('/', '_').replace('-', '_')
-                geometry_filename = f"geometry_files/ortsteil/{clean_name}.json"
-                
-                # Save individual geometry file
-                individual_geometry = {
-                    "type": "Feature",
-                    "properties": properties,
-                    "geometry": geometry
-                }
-                
-                with open(geometry_filename, 'w', encoding='utf-8') as f:
-                    json.dump(individual_geometry, f, ensure_ascii=False, indent=2)
-                
-                # Create spatial summary
-                spatial_summary = {
-                    "ortsteil_name": ortsteil_name,
-                    "centroid_lat": round(centroid_lat, 8),
-                    "centroid_lon": round(centroid_lon, 8),
-                    "bbox_min_lat": round(bbox['min_lat'], 8),
-                    "bbox_max_lat": round(bbox['max_lat'], 8),
-                    "bbox_min_lon": round(bbox['min_lon'], 8),
-                    "bbox_max_lon": round(bbox['max_lon'], 8),
-                    "area_km2": round(area_km2, 6),
-                    "geometry_type": geometry['type'],
-                    "geometry_file": geometry_filename,
-                    "properties": {k: v for k, v in properties.items() if k != 'geometry'}
-                }
-                
-                spatial_summaries.append(spatial_summary)
-                geometry_files[ortsteil_name] = geometry_filename
-                
+            # Create clean filename
+            clean_name = ortsteil_name.replace(' ', '_').replace('/', '_').replace('-', '_')
+            geometry_filename = f"geometry_files/ortsteil/{clean_name}.json"
+            
+            # Save individual geometry file
+            individual_geometry = {
+                "type": "Feature",
+                "properties": properties,
+                "geometry": geometry
+            }
+            
+            with open(geometry_filename, 'w', encoding='utf-8') as f:
+                json.dump(individual_geometry, f, ensure_ascii=False, indent=2)
+            
+            # Create spatial summary
+            spatial_summary = {
+                "ortsteil_name": ortsteil_name,
+                **{field: round(float(metrics[field][row]), 8) for field in SUMMARY_COORDINATE_FIELDS},
+                "area_km2": round(float(metrics['area_km2'][row]), 6),
+                "geometry_type": geometry['type'],
+                "geometry_file": geometry_filename,
+                "properties": {k: v for k, v in properties.items() if k != 'geometry'}
+            }
+            
+            spatial_summaries.append(spatial_summary)
+            geometry_files[ortsteil_name] = geometry_filename
+            
         except Exception as e:
             print(f"Warning: Could not process {ortsteil_name}: {e}")
             continue
     
+    for name, official, computed in area_deviations(geojson_data, metrics):
+        print(f"Warning: {name} area {computed / 1e6:.3f} km² differs from official gdf {official / 1e6:.3f} km²")
+    
     print(f"Processed {len(spatial_summaries)} Ortsteil geometries")
-    return spatial_summaries, geometry_files
+    return spatial_summaries, geometry_files, metrics
+
+def process_historic_bezirke(ortsteil_metrics):
+    """Spatial summaries of every historic Bezirk composition, aggregated from the Ortsteile"""
+    print("Processing historic Bezirk compositions...")
+    
+    try:
+        timeline = load_timeline()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Warning: Could not load the administrative timeline: {e}")
+        return []
+    
+    bezirk_summaries = historic_bezirk_metrics(ortsteil_metrics, timeline)
+    print(f"Processed {len(bezirk_summaries)} historic Bezirk periods")
+    return bezirk_summaries
 
-def create_station_assignment_helpers(spatial_summaries):
-    """Create helper data for station assignment"""
+def create_station_assignment_helpers(geojson_file, cell_size=DEFAULT_CELL_SIZE):
+    """Create the integer-keyed assignment grid (see ortsteil_grid.py)"""
     print("Creating station assignment helpers...")
     
-    # Create a lookup structure for fast station assignment
-    assignment_grid = {}
+    with open(geojson_file, 'r', encoding='utf-8') as f:
+        grid = OrtsteilGrid.from_geojson(json.load(f), cell_size=cell_size)
     
-    for summary in spatial_summaries:
-        # Create grid cells for faster lookup (0.01 degree grid ≈ 1km)
-        min_lat_grid = math.floor(summary['bbox_min_lat'] * 100) / 100
-        max_lat_grid = math.ceil(summary['bbox_max_lat'] * 100) / 100
-        min_lon_grid = math.floor(summary['bbox_min_lon'] * 100) / 100
-        max_lon_grid = math.ceil(summary['bbox_max_lon'] * 100) / 100
-        
-        lat = min_lat_grid
-        while lat <= max_lat_grid:
-            lon = min_lon_grid
-            while lon <= max_lon_grid:
-                grid_key = f"{lat:.2f},{lon:.2f}"
-                if grid_key not in assignment_grid:
-                    assignment_grid[grid_key] = []
-                assignment_grid[grid_key].append(summary['ortsteil_name'])
-                lon += 0.01
-            lat += 0.01
-    
-    return assignment_grid
+    return grid.to_dict()
 
 def generate_neo4j_cypher_templates(spatial_summaries):
     """Generate Cypher query templates for Neo4j import"""
@@ -235,23 +136,20 @@ CREATE INDEX station_coords IF NOT EXISTS FOR (s:Station) ON (s.latitude, s.long
 """,
         
         "assign_stations_to_ortsteil": """
-// Assign stations to Ortsteil using bounding box containment
-MATCH (s:Station), (o:Ortsteil)
-WHERE s.latitude >= o.bbox_min_lat 
-  AND s.latitude <= o.bbox_max_lat
-  AND s.longitude >= o.bbox_min_lon 
-  AND s.longitude <= o.bbox_max_lon
-WITH s, o, 
-     // Calculate distance to centroid for tie-breaking
-     sqrt(pow(s.latitude - o.centroid_lat, 2) + pow(s.longitude - o.centroid_lon, 2)) AS distance
-ORDER BY s.stop_id, distance
-WITH s, collect(o)[0] AS closest_ortsteil
-WHERE closest_ortsteil IS NOT NULL
-CREATE (s)-[:LOCATED_IN_ORTSTEIL {
-  assignment_method: "bbox_containment",
-  assignment_date: datetime(),
-  confidence: "approximate"
-}]->(closest_ortsteil);
+// Assign stations to Ortsteil from the local grid assignment
+// (station_ortsteil_assignments.csv written by `python ortsteil_grid.py`;
+//  `python ortsteil_grid.py --neo4j` runs the same import directly)
+LOAD CSV WITH HEADERS FROM "file:///station_ortsteil_assignments.csv" AS row
+WITH row WHERE row.ortsteil_name IS NOT NULL
+CALL {
+  WITH row
+  MATCH (s:Station {stop_id: row.stop_id})
+  MERGE (o:Ortsteil {name: row.ortsteil_name})
+  MERGE (s)-[r:LOCATED_IN_ORTSTEIL]->(o)
+  SET r.assignment_method = row.assignment_method,
+      r.confidence = "exact",
+      r.assignment_date = datetime()
+} IN TRANSACTIONS OF 5000 ROWS;
 """
     }
     
@@ -270,7 +168,7 @@ def main():
         return
     
     # Process geometries
-    spatial_summaries, geometry_files = process_ortsteil_geometries(geojson_file)
+    spatial_summaries, geometry_files, ortsteil_metrics = process_ortsteil_geometries(geojson_file)
     
     if not spatial_summaries:
         print("❌ No spatial summaries generated")
@@ -283,8 +181,22 @@ def main():
     
     print(f"✅ Saved spatial summary: {output_file}")
     
+    # Historic Bezirke as compositions of the Ortsteile
+    bezirk_summaries = process_historic_bezirke(ortsteil_metrics)
+    bezirk_output_file = "historic_bezirk_spatial_summary.json"
+    with open(bezirk_output_file, 'w', encoding='utf-8') as f:
+        json.dump(bezirk_summaries, f, ensure_ascii=False, indent=2)
+    
+    print(f"✅ Saved historic Bezirk summary: {bezirk_output_file}")
+    
+    # Multi-resolution topology of Ortsteile and historic Bezirke
+    with open(geojson_file, 'r', encoding='utf-8') as f:
+        topology = build_topology(json.load(f), load_timeline())
+    for level, (path, size) in write_topology_levels(topology).items():
+        print(f"✅ Saved {level} topology ({LEVELS[level]:g} m): {path.name} ({size / 1024:.0f} KB)")
+    
     # Create station assignment helpers
-    assignment_grid = create_station_assignment_helpers(spatial_summaries)
+    assignment_grid = create_station_assignment_helpers(geojson_file)
     
     with open("station_assignment_grid.json", 'w', encoding='utf-8') as f:
         json.dump(assignment_grid, f, ensure_ascii=False, indent=2)
@@ -313,7 +225,9 @@ def main():
     print(f"   Total area: {total_area:.2f} km²")
     print(f"   Average area: {avg_area:.2f} km²")
     print(f"   Geometry files created: {len(geometry_files)}")
-    print(f"   Assignment grid cells: {len(assignment_grid)}")
+    print(f"   Historic Bezirk periods: {len(bezirk_summaries)}")
+    print(f"   Assignment grid cells: {len(assignment_grid['interior'])} interior, "
+          f"{len(assignment_grid['boundary'])} boundary ({assignment_grid['cell_size']:.0f} m)")
     
     # Show largest and smallest Ortsteil
     largest = max(spatial_summaries, key=lambda x: x['area_km2'])
@@ -326,10 +240,11 @@ def main():
     print(f"\n🎯 NEXT STEPS:")
     print(f"   1. Review the generated files:")
     print(f"      - {output_file} (for Neo4j import)")
+    print(f"      - {bezirk_output_file} (historic Bezirk areas and extents)")
     print(f"      - geometry_files/ortsteil/ (individual polygon files)")
     print(f"      - neo4j_spatial_import.cypher (import queries)")
     print(f"   2. Import spatial summaries into Neo4j using the Cypher file")
-    print(f"   3. Run station assignment queries")
+    print(f"   3. Assign stations: python ortsteil_grid.py --neo4j")
     print(f"   4. Use validation script to check results")
     print(f"\n💡 STORAGE EFFICIENCY:")
     print(f"   - Neo4j stores only ~{len(spatial_summaries) * 8 * 9} bytes of spatial data")
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Grid-Hash Station Assignment to Ortsteile
+=========================================
+
+Assigns every station of every processed snapshot to its modern Ortsteil
+and writes the LOCATED_IN_ORTSTEIL relationships back to Neo4j.
+
+The Ortsteil polygons (EPSG:25833) are covered by a square grid whose cells
+are addressed by a single integer key (row * ncols + col). Each cell is
+classified once:
+
+- interior: the cell lies completely inside one Ortsteil, so every point in
+  it belongs to that Ortsteil without further tests
+- boundary: an Ortsteil edge may cross the cell; the cell keeps the
+  candidate Ortsteile and its points get an exact point-in-polygon test
+
+Stations are projected to EPSG:25833 in one batch, hashed to their cells,
+and only points in boundary cells are tested against polygon edges.
+
+Usage:
+    python ortsteil_grid.py                  # assign and write the CSV
+    python ortsteil_grid.py --neo4j          # also write the relationships to Neo4j
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from projection import UTM33_CRS, geojson_crs, transform, wgs84_to_utm33
+
+# The processed-data schema and the Neo4j connector live in the fahrplanbuch sources
+FAHRPLANBUCH_SRC = Path(__file__).resolve().parents[2] / 'fahrplanbuch' / 'src'
+
+DEFAULT_CELL_SIZE = 250.0  # metres
+ASSIGNMENT_METHOD = "grid_point_in_polygon"
+
+# Points tested against one polygon's edges at a time (bounds the crossing matrix)
+_PIP_BATCH = 2048
+
+ASSIGNMENT_QUERY = """
+UNWIND $rows AS row
+MATCH (s:Station {stop_id: row.stop_id})
+MERGE (o:Ortsteil {name: row.ortsteil_name})
+MERGE (s)-[r:LOCATED_IN_ORTSTEIL]->(o)
+SET r.assignment_method = row.assignment_method,
+    r.confidence = "exact",
+    r.assignment_date = datetime()
+"""
+
+
+def polygon_rings(geometry):
+    """All rings (outer and holes) of a Polygon or MultiPolygon as Nx2 arrays"""
+    if geometry['type'] == 'Polygon':
+        polygons = [geometry['coordinates']]
+    elif geometry['type'] == 'MultiPolygon':
+        polygons = geometry['coordinates']
+    else:
+        return []
+    return [np.asarray(ring, dtype=float)[:, :2] for polygon in polygons for ring in polygon if len(ring) >= 3]
+
+
+def ring_edges(rings):
+    """
+    Edge arrays of a set of rings.
+
+    Args:
+        rings: List of Nx2 coordinate arrays (closed or open)
+
+    Returns:
+        Tuple of (x1, y1, x2, y2) arrays with one entry per edge
+    """
+    starts, ends = [], []
+    for ring in rings:
+        if not np.array_equal(ring[0], ring[-1]):
+            ring = np.vstack([ring, ring[:1]])
+        starts.append(ring[:-1])
+        ends.append(ring[1:])
+    start = np.concatenate(starts)
+    end = np.concatenate(ends)
+    return start[:, 0], start[:, 1], end[:, 0], end[:, 1]
+
+
+def points_in_polygon(edges, x, y):
+    """
+    Exact even-odd point-in-polygon test.
+
+    Counting crossings over all rings at once handles holes and
+    multi-part polygons without distinguishing them.
+
+    Args:
+        edges: (x1, y1, x2, y2) edge arrays of one polygon
+        x: Point x coordinates
+        y: Point y coordinates
+
+    Returns:
+        Boolean array, True for points inside the polygon
+    """
+    x1, y1, x2, y2 = edges
+    inside = np.zeros(len(x), dtype=bool)
+    for start in range(0, len(x), _PIP_BATCH):
+        px = x[start:start + _PIP_BATCH, None]
+        py = y[start:start + _PIP_BATCH, None]
+        spans = (y1 > py) != (y2 > py)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+        crossings = np.count_nonzero(spans & (px < x_cross), axis=1)
+        inside[start:start + _PIP_BATCH] = crossings % 2 == 1
+    return inside
+
+
+class OrtsteilGrid:
+    """
+    Integer-keyed grid over projected Ortsteil polygons.
+
+    Args:
+        names: Ortsteil names
+        rings: Per Ortsteil, the list of its rings (Nx2 arrays in metres)
+        cell_size: Grid cell edge length in metres
+    """
+
+    def __init__(self, names, rings, cell_size=DEFAULT_CELL_SIZE):
+        self.names = list(names)
+        self.cell_size = float(cell_size)
+        self.edges = [ring_edges(polygon) for polygon in rings]
+
+        all_points = np.concatenate([np.concatenate(polygon) for polygon in rings])
+        self.origin = np.floor(all_points.min(axis=0) / self.cell_size) * self.cell_size
+        extent = all_points.max(axis=0) - self.origin
+        self.ncols, self.nrows = (np.floor(extent / self.cell_size).astype(int) + 1).tolist()
+
+        interior = {}
+        boundary = {}
+        for index, edges in enumerate(self.edges):
+            edge_keys = self._edge_cells(edges)
+            for key in edge_keys.tolist():
+                boundary.setdefault(key, []).append(index)
+
+            # Cells of the bounding box not touched by an edge are entirely inside or outside
+            candidates = np.setdiff1d(self._bbox_cells(edges), edge_keys, assume_unique=True)
+            cx, cy = self.cell_centres(candidates)
+            for key in candidates[points_in_polygon(edges, cx, cy)].tolist():
+                interior[key] = index
+
+        # An edge bounding box may reach into another Ortsteil's interior cells
+        for key in set(interior) & set(boundary):
+            boundary[key].insert(0, interior.pop(key))
+
+        keys = np.array(sorted(interior), dtype=np.int64)
+        self.interior_keys = keys
+        self.interior_index = np.array([interior[key] for key in keys.tolist()], dtype=np.int64)
+        self.boundary = boundary
+
+    @classmethod
+    def from_geojson(cls, geojson_data, name_property='nam', cell_size=DEFAULT_CELL_SIZE):
+        """Build the grid from a GeoJSON FeatureCollection, projecting other CRS to EPSG:25833"""
+        source_crs = geojson_crs(geojson_data)
+        names, rings = [], []
+        for feature in geojson_data['features']:
+            name = feature['properties'].get(name_property)
+            feature_rings = polygon_rings(feature['geometry'])
+            if not name or not feature_rings:
+                continue
+            if source_crs != UTM33_CRS:
+                feature_rings = [np.column_stack(transform(ring[:, 0], ring[:, 1], source_crs, UTM33_CRS))
+                                 for ring in feature_rings]
+            names.append(name)
+            rings.append(feature_rings)
+        return cls(names, rings, cell_size)
+
+    # ---- Cell addressing ----
+
+    def cell_keys(self, x, y):
+        """Integer cell key of each point, -1 outside the grid or for NaN coordinates"""
+        with np.errstate(invalid='ignore'):
+            col = np.floor((np.asarray(x, dtype=float) - self.origin[0]) / self.cell_size)
+            row = np.floor((np.asarray(y, dtype=float) - self.origin[1]) / self.cell_size)
+        valid = (col >= 0) & (col < self.ncols) & (row >= 0) & (row < self.nrows)
+        keys = np.full(len(col), -1, dtype=np.int64)
+        keys[valid] = row[valid].astype(np.int64) * self.ncols + col[valid].astype(np.int64)
+        return keys
+
+    def cell_centres(self, keys):
+        """Projected centre coordinates of the given cells"""
+        row, col = np.divmod(np.asarray(keys, dtype=np.int64), self.ncols)
+        return (self.origin[0] + (col + 0.5) * self.cell_size,
+                self.origin[1] + (row + 0.5) * self.cell_size)
+
+    def _cell_index(self, values, axis):
+        return np.floor((values - self.origin[axis]) / self.cell_size).astype(np.int64)
+
+    def _bbox_cells(self, edges):
+        x1, y1, _, _ = edges
+        cols = np.arange(self._cell_index(x1.min(), 0), self._cell_index(x1.max(), 0) + 1)
+        rows = np.arange(self._cell_index(y1.min(), 1), self._cell_index(y1.max(), 1) + 1)
+        return (rows[:, None] * self.ncols + cols[None, :]).ravel()
+
+    def _edge_cells(self, edges):
+        """Cells touched by each edge's bounding box (a superset of the cells it crosses)"""
+        x1, y1, x2, y2 = edges
+        col0 = self._cell_index(np.minimum(x1, x2), 0)
+        col1 = self._cell_index(np.maximum(x1, x2), 0)
+        row0 = self._cell_index(np.minimum(y1, y2), 1)
+        row1 = self._cell_index(np.maximum(y1, y2), 1)
+
+        width = col1 - col0 + 1
+        counts = width * (row1 - row0 + 1)
+        edge = np.repeat(np.arange(len(counts)), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        rows = row0[edge] + offset // width[edge]
+        cols = col0[edge] + offset % width[edge]
+        return np.unique(rows * self.ncols + cols)
+
+    # ---- Assignment ----
+
+    def assign(self, x, y):
+        """
+        Ortsteil of each projected point.
+
+        Args:
+            x: Eastings (EPSG:25833)
+            y: Northings (EPSG:25833)
+
+        Returns:
+            Tuple of (index, exact): the Ortsteil index per point (-1 if
+            unassigned) and a mask of points that needed an exact test
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        keys = self.cell_keys(x, y)
+        result = np.full(len(keys), -1, dtype=np.int64)
+
+        position = np.searchsorted(self.interior_keys, keys)
+        position = np.minimum(position, max(len(self.interior_keys) - 1, 0))
+        hit = (keys >= 0) & (self.interior_keys[position] == keys) if len(self.interior_keys) else keys < -1
+        result[hit] = self.interior_index[position[hit]]
+
+        # Only points in boundary cells reach the exact test, grouped by candidate polygon
+        pending = np.flatnonzero(~hit & (keys >= 0))
+        unique_keys, inverse = np.unique(keys[pending], return_inverse=True)
+        candidate_cells = {}
+        for cell, key in enumerate(unique_keys.tolist()):
+            for index in self.boundary.get(key, ()):
+                candidate_cells.setdefault(index, []).append(cell)
+
+        exact = np.zeros(len(keys), dtype=bool)
+        for index in sorted(candidate_cells):
+            points = pending[np.isin(inverse, candidate_cells[index])]
+            points = points[result[points] < 0]
+            if not len(points):
+                continue
+            exact[points] = True
+            inside = points_in_polygon(self.edges[index], x[points], y[points])
+            result[points[inside]] = index
+        return result, exact
+
+    def assign_names(self, x, y):
+        """Ortsteil name of each projected point (None if unassigned)"""
+        index, _ = self.assign(x, y)
+        names = np.array(self.names + [None], dtype=object)
+        return names[index]
+
+    def to_dict(self):
+        """JSON-serialisable description of the grid (cell keys as strings)"""
+        return {
+            'crs': 'EPSG:25833',
+            'cell_size': self.cell_size,
+            'origin': self.origin.tolist(),
+            'ncols': self.ncols,
+            'nrows': self.nrows,
+            'key': 'row * ncols + col',
+            'interior': {str(key): self.names[index]
+                         for key, index in zip(self.interior_keys.tolist(), self.interior_index.tolist())},
+            'boundary': {str(key): [self.names[index] for index in indices]
+                         for key, indices in sorted(self.boundary.items())},
+        }
+
+
+def load_snapshot_stations(processed_dir):
+    """
+    Stops of every processed snapshot.
+
+    Args:
+        processed_dir: fahrplanbuch data/processed directory
+
+    Returns:
+        DataFrame with stop_id, stop_name, latitude, longitude and year_side
+    """
+    import pandas as pd
+
+    sys.path.append(str(FAHRPLANBUCH_SRC))
+    from processed_schema import load_snapshot
+
+    frames = []
+    for snapshot_dir in sorted(p for p in Path(processed_dir).iterdir() if p.is_dir()):
+        stops = load_snapshot(snapshot_dir, ['stops']).get('stops')
+        if stops is None or stops.empty:
+            continue
+        stops = stops[['stop_id', 'stop_name', 'latitude', 'longitude']].copy()
+        stops['year_side'] = snapshot_dir.name
+        frames.append(stops)
+    if not frames:
+        return pd.DataFrame(columns=['stop_id', 'stop_name', 'latitude', 'longitude', 'year_side'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def assign_stations(grid, stations):
+    """
+    Assign stations to Ortsteile.
+
+    Args:
+        grid: OrtsteilGrid
+        stations: DataFrame with latitude and longitude (WGS84)
+
+    Returns:
+        Copy of stations with ortsteil_name and assignment_method columns
+    """
+    x, y = wgs84_to_utm33(stations['latitude'].to_numpy(dtype=float), stations['longitude'].to_numpy(dtype=float))
+    index, exact = grid.assign(x, y)
+    names = np.array(grid.names + [None], dtype=object)
+
+    result = stations.copy()
+    result['ortsteil_name'] = names[index]
+    result['assignment_method'] = np.where(exact, ASSIGNMENT_METHOD, "grid_interior_cell")
+    result.loc[index < 0, 'assignment_method'] = None
+    return result
+
+
+def write_assignments_to_neo4j(assignments, uri, username, password, batch_size=5000):
+    """
+    Write LOCATED_IN_ORTSTEIL relationships in one transaction of batched UNWINDs.
+
+    Args:
+        assignments: Output of assign_stations
+        uri: Neo4j URI
+        username: Neo4j username
+        password: Neo4j password
+        batch_size: Rows per UNWIND statement
+
+    Returns:
+        Number of relationships written
+    """
+    sys.path.append(str(FAHRPLANBUCH_SRC))
+    from db_connector import BerlinTransportDB
+
+    rows = (assignments.dropna(subset=['ortsteil_name'])
+            .drop_duplicates('stop_id')[['stop_id', 'ortsteil_name', 'assignment_method']]
+            .to_dict('records'))
+
+    def write(tx):
+        for start in range(0, len(rows), batch_size):
+            tx.run(ASSIGNMENT_QUERY, rows=rows[start:start + batch_size]).consume()
+
+    db = BerlinTransportDB(uri, username, password)
+    if not db.connect():
+        raise ConnectionError(f"Could not connect to Neo4j at {uri}")
+    with db.driver.session() as session:
+        session.execute_write(write)
+    return len(rows)
+
+
+def main():
+    """Assign all snapshot stations and export the results"""
+    here = Path(__file__).resolve().parent
+    parser = argparse.ArgumentParser(description="Assign stations to Ortsteile with a grid-hashed point-in-polygon test")
+    parser.add_argument("--geojson", default=str(here / "moderne_ortsteile.json"), help="Ortsteil polygons")
+    parser.add_argument("--processed-dir", default=str(here.parents[1] / "fahrplanbuch" / "data" / "processed"),
+                        help="Processed snapshot directory")
+    parser.add_argument("--cell-size", type=float, default=DEFAULT_CELL_SIZE, help="Grid cell size in metres")
+    parser.add_argument("--output", default=str(here / "station_ortsteil_assignments.csv"), help="Assignment CSV")
+    parser.add_argument("--neo4j", action="store_true", help="Write the relationships to Neo4j")
+    parser.add_argument("--uri", default="bolt://localhost:7687", help="Neo4j URI")
+    parser.add_argument("--username", default="neo4j", help="Neo4j username")
+    parser.add_argument("--password", default=os.environ.get("NEO4J_PASSWORD"),
+                        help="Neo4j password (can also be set via NEO4J_PASSWORD environment variable)")
+    args = parser.parse_args()
+
+    with open(args.geojson, 'r', encoding='utf-8') as f:
+        grid = OrtsteilGrid.from_geojson(json.load(f), cell_size=args.cell_size)
+    print(f"Grid: {grid.ncols}x{grid.nrows} cells of {grid.cell_size:.0f} m, "
+          f"{len(grid.interior_keys)} interior, {len(grid.boundary)} boundary")
+
+    stations = load_snapshot_stations(args.processed_dir)
+    assignments = assign_stations(grid, stations)
+    assignments.to_csv(args.output, index=False)
+
+    assigned = assignments['ortsteil_name'].notna()
+    exact = assignments['assignment_method'] == ASSIGNMENT_METHOD
+    print(f"Assigned {assigned.sum()}/{len(assignments)} stations "
+          f"({exact.sum()} needed an exact test) -> {args.output}")
+
+    if args.neo4j:
+        written = write_assignments_to_neo4j(assignments, args.uri, args.username, args.password)
+        print(f"Wrote {written} LOCATED_IN_ORTSTEIL relationships")
+
+
+if __name__ == "__main__":
+    main()
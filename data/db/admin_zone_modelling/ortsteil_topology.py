@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+"""
+Multi-Resolution Ortsteil and Bezirk Topology
+=============================================
+
+Builds compact, topology-preserving geometry files at several
+simplification levels and loads them back as GeoJSON.
+
+Build:
+- Ortsteil rings (EPSG:25833) are cut at junctions, i.e. vertices where
+  neighbouring borders meet, into arcs. Every shared border is stored
+  once and referenced by both Ortsteile, as in TopoJSON.
+- Each arc is simplified on its own (Douglas-Peucker, endpoints fixed),
+  so neighbouring Ortsteile always get the same simplified border and no
+  gaps or overlaps appear between them.
+- Historic Bezirke are merged from their Ortsteile' arcs (inner borders
+  cancel out), so every Bezirk composition shares the same arcs too.
+- Arcs are quantized and delta-encoded per level and written as
+  geometry_files/topology/berlin_admin_{level}.topojson.
+
+Load:
+    from ortsteil_topology import load_geometries
+    ortsteile = load_geometries('ortsteile', zoom=11)             # WGS84 GeoJSON
+    bezirke = load_geometries('bezirke', tolerance=10, crs='EPSG:25833')
+
+Usage:
+    python ortsteil_topology.py                  # build all levels
+"""
+
+import os
+import json
+import argparse
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from projection import UTM33_CRS, WGS84_CRS, geojson_crs, reproject_geojson
+from ortsteil_grid import points_in_polygon, ring_edges
+from polygon_metrics import load_timeline
+
+TOPOLOGY_DIR = Path(__file__).resolve().parent / "geometry_files" / "topology"
+TOPOLOGY_FILE = "berlin_admin_{level}.topojson"
+
+# Simplification tolerance per level in metres
+LEVELS = {
+    'full': 0.0,
+    'fine': 2.0,
+    'medium': 10.0,
+    'coarse': 50.0,
+}
+
+# Smallest quantization step (m); coarser levels quantize to 1/100 of their tolerance
+MIN_QUANTUM = 0.001
+
+# Ground resolution of Web Mercator zoom 0 at the equator (m/px)
+_ZOOM0_RESOLUTION = 156543.03392
+_BERLIN_LAT = 52.5
+
+
+# ---- Arcs ----
+
+def _ring_vertices(ring):
+    """Open ring (closing vertex dropped) as a list of coordinate tuples"""
+    vertices = [tuple(point[:2]) for point in ring]
+    if vertices[0] == vertices[-1]:
+        vertices = vertices[:-1]
+    return vertices
+
+
+def find_junctions(rings):
+    """
+    Vertices where borders meet.
+
+    A vertex is a junction if its neighbours differ between the rings that
+    share it (a border starts, ends or branches there).
+
+    Args:
+        rings: Open rings as lists of coordinate tuples
+
+    Returns:
+        Set of junction coordinates
+    """
+    neighbours = {}
+    junctions = set()
+    for ring in rings:
+        count = len(ring)
+        for i, point in enumerate(ring):
+            pair = frozenset((ring[i - 1], ring[(i + 1) % count]))
+            seen = neighbours.setdefault(point, pair)
+            if seen != pair:
+                junctions.add(point)
+    return junctions
+
+
+class ArcIndex:
+    """Deduplicated arcs; a reference ~i means arc i traversed backwards"""
+
+    def __init__(self):
+        self.arcs = []
+        self._index = {}
+
+    def add(self, coordinates, reverse=None):
+        """
+        Reference to an arc, registering it if neither direction is known.
+
+        Args:
+            coordinates: Arc vertices
+            reverse: The arc traversed backwards (defaults to the reversed
+                vertices; closed loops pass their own canonical form)
+        """
+        coordinates = tuple(coordinates)
+        if coordinates in self._index:
+            return self._index[coordinates]
+        reverse = tuple(reverse) if reverse is not None else coordinates[::-1]
+        if reverse in self._index:
+            return ~self._index[reverse]
+        self._index[coordinates] = len(self.arcs)
+        self.arcs.append(coordinates)
+        return len(self.arcs) - 1
+
+
+def _canonical_loop(ring):
+    """Closed ring without junctions, rotated to start at its smallest vertex"""
+    start = ring.index(min(ring))
+    rotated = ring[start:] + ring[:start]
+    return rotated + [rotated[0]]
+
+
+def ring_arcs(ring, junctions, arc_index):
+    """
+    Cut one open ring at its junctions and register the arcs.
+
+    Args:
+        ring: Open ring as a list of coordinate tuples
+        junctions: Set of junction coordinates
+        arc_index: ArcIndex
+
+    Returns:
+        List of arc references making up the ring
+    """
+    cuts = [i for i, point in enumerate(ring) if point in junctions]
+    if not cuts:
+        # A loop shared with an enclave runs the other way round in the enclave
+        return [arc_index.add(_canonical_loop(ring), reverse=_canonical_loop(ring[::-1]))]
+
+    rotated = ring[cuts[0]:] + ring[:cuts[0]] + [ring[cuts[0]]]
+    offsets = [i - cuts[0] for i in cuts] + [len(ring)]
+    return [arc_index.add(rotated[start:end + 1]) for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def merge_rings(arc_refs, arc_endpoints):
+    """
+    Merge the rings of several polygons into the rings of their union.
+
+    Arcs used by two members are inner borders and cancel out; the remaining
+    arcs are chained end to start.
+
+    Args:
+        arc_refs: All arc references of the member rings
+        arc_endpoints: (start, end) coordinates of each arc
+
+    Returns:
+        List of rings, each a list of arc references
+    """
+    counts = {}
+    for ref in arc_refs:
+        index = ~ref if ref < 0 else ref
+        counts[index] = counts.get(index, 0) + 1
+    outer = [ref for ref in arc_refs if counts[~ref if ref < 0 else ref] == 1]
+
+    def endpoints(ref):
+        start, end = arc_endpoints[~ref if ref < 0 else ref]
+        return (end, start) if ref < 0 else (start, end)
+
+    by_start = {}
+    for ref in outer:
+        by_start.setdefault(endpoints(ref)[0], []).append(ref)
+
+    used = set()
+    rings = []
+    for first in outer:
+        if first in used:
+            continue
+        ring = [first]
+        used.add(first)
+        start, end = endpoints(first)
+        while end != start:
+            candidates = [ref for ref in by_start.get(end, []) if ref not in used]
+            if not candidates:
+                break
+            ring.append(candidates[0])
+            used.add(candidates[0])
+            end = endpoints(candidates[0])[1]
+        rings.append(ring)
+    return rings
+
+
+# ---- Simplification and encoding ----
+
+def douglas_peucker(points, tolerance):
+    """
+    Mask of the vertices kept by Douglas-Peucker simplification.
+
+    Endpoints are always kept; closed arcs are split at their farthest
+    vertex so that they cannot collapse to a point.
+
+    Args:
+        points: Nx2 array
+        tolerance: Maximum deviation in coordinate units
+
+    Returns:
+        Boolean mask over the points
+    """
+    count = len(points)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    if tolerance <= 0:
+        keep[:] = True
+        return keep
+
+    stack = [(0, count - 1)]
+    if count > 3 and np.array_equal(points[0], points[-1]):
+        # Closed arc: split at the vertex farthest from the start
+        far = int(np.argmax(np.hypot(*(points - points[0]).T)))
+        keep[far] = True
+        stack = [(0, far), (far, count - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length = np.hypot(*segment)
+        if length == 0:
+            distances = np.hypot(*offsets.T)
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return keep
+
+
+def _ring_is_valid(ring_refs, arcs):
+    """A ring needs at least three distinct vertices"""
+    points = set()
+    for ref in ring_refs:
+        points.update(map(tuple, arcs[~ref if ref < 0 else ref].tolist()))
+        if len(points) >= 3:
+            return True
+    return False
+
+
+def crossing_arcs(ring_refs, arcs):
+    """
+    Arcs whose segments cross or touch each other within one polygon.
+
+    Segments sharing an endpoint are not compared, so the test finds the
+    self-intersections simplification can introduce.
+
+    Args:
+        ring_refs: Rings (lists of arc references) of one polygon
+        arcs: List of Nx2 arrays
+
+    Returns:
+        Set of arc indices involved in an intersection
+    """
+    indices = sorted({~ref if ref < 0 else ref for ring in ring_refs for ref in ring})
+    starts = np.vstack([arcs[i][:-1] for i in indices])
+    ends = np.vstack([arcs[i][1:] for i in indices])
+    owner = np.repeat(indices, [len(arcs[i]) - 1 for i in indices])
+
+    # Coordinates relative to the polygon keep the cross products small
+    origin = starts.min(axis=0)
+    a, b = starts - origin, ends - origin
+    direction = b - a
+
+    def side(p):
+        # Orientation of points p (columns) relative to every segment (rows)
+        offset = p[None, :, :] - a[:, None, :]
+        return direction[:, None, 0] * offset[..., 1] - direction[:, None, 1] * offset[..., 0]
+
+    side_a, side_b = side(a), side(b)
+    straddles = side_a * side_b <= 0
+    collinear = (side_a == 0) & (side_b == 0)
+    intersects = straddles & straddles.T & ~(collinear & collinear.T)
+
+    def same(p, q):
+        return np.all(p[:, None, :] == q[None, :, :], axis=2)
+
+    shared = same(a, a) | same(a, b) | same(b, a) | same(b, b)
+    first, second = np.nonzero(np.triu(intersects & ~shared, 1))
+    return set(owner[first].tolist()) | set(owner[second].tolist())
+
+
+def misplaced_holes(polygons, arcs):
+    """Arcs of holes that no longer lie inside their exterior ring"""
+    misplaced = set()
+    for polygon in polygons:
+        if len(polygon) < 2:
+            continue
+        edges = ring_edges([_ring_coordinates(polygon[0], arcs)])
+        for hole in polygon[1:]:
+            points = _ring_coordinates(hole, arcs)
+            if not points_in_polygon(edges, points[:, 0], points[:, 1]).all():
+                misplaced.update(~ref if ref < 0 else ref for ring in (polygon[0], hole) for ref in ring)
+    return misplaced
+
+
+def simplify_arcs(arcs, shapes, tolerance, max_passes=16):
+    """
+    Simplify every arc without collapsing or self-intersecting a polygon.
+
+    Arcs of collapsed rings, crossing segments or escaped holes are
+    simplified again with half the tolerance until the check passes.
+    Shared arcs get the same treatment for every neighbour, so borders
+    stay aligned.
+
+    Args:
+        arcs: List of Nx2 arrays
+        shapes: Polygons (lists of rings of arc references) of each shape to check
+        tolerance: Douglas-Peucker tolerance
+        max_passes: Limit on refinement passes before arcs are kept whole
+
+    Returns:
+        List of simplified Nx2 arrays
+    """
+    if tolerance <= 0:
+        return list(arcs)
+    tolerances = np.full(len(arcs), float(tolerance))
+    simplified = [arc[douglas_peucker(arc, tolerance)] for arc in arcs]
+    for attempt in range(max_passes + 1):
+        refine = set()
+        for polygons in shapes:
+            rings = [ring for polygon in polygons for ring in polygon]
+            for ring in rings:
+                if not _ring_is_valid(ring, simplified):
+                    refine.update(~ref if ref < 0 else ref for ref in ring)
+            refine |= crossing_arcs(rings, simplified)
+            refine |= misplaced_holes(polygons, simplified)
+        refine = [i for i in refine if tolerances[i] > 0]
+        if not refine:
+            break
+        for i in refine:
+            tolerances[i] = tolerances[i] / 2 if attempt < max_passes else 0
+            simplified[i] = arcs[i][douglas_peucker(arcs[i], tolerances[i])]
+    return simplified
+
+
+def quantize_arcs(arcs, quantum, origin):
+    """
+    Snap arcs to integer steps of `quantum` from `origin`.
+
+    Vertices merged by snapping are dropped; endpoints stay, so arcs still
+    meet at their junctions.
+    """
+    quantized = []
+    for arc in arcs:
+        steps = np.round((arc - origin) / quantum)
+        kept = steps[np.concatenate([[True], np.any(np.diff(steps, axis=0) != 0, axis=1)])]
+        if len(kept) == 1:
+            kept = steps[[0, -1]]
+        quantized.append(kept)
+    return quantized
+
+
+def encode_arcs(arcs):
+    """Delta-encode quantized arcs"""
+    return [np.vstack([arc[:1], np.diff(arc, axis=0)]).astype(np.int64).tolist() for arc in arcs]
+
+
+def decode_arcs(topology):
+    """Absolute coordinates of every arc of a quantized topology"""
+    scale = np.asarray(topology['transform']['scale'], dtype=float)
+    translate = np.asarray(topology['transform']['translate'], dtype=float)
+    return [np.cumsum(np.asarray(arc, dtype=float), axis=0) * scale + translate for arc in topology['arcs']]
+
+
+# ---- Build ----
+
+def _period_properties(steps):
+    """valid_from/valid_to of each composition id over the timeline steps"""
+    periods = {}
+    previous = set()
+    for step in steps:
+        current = set(step['geometries'])
+        for geometry_id in current - previous:
+            periods.setdefault(geometry_id, []).append({'valid_from': step['date'], 'valid_to': None})
+        for geometry_id in previous - current:
+            periods[geometry_id][-1]['valid_to'] = step['date']
+        previous = current
+    return periods
+
+
+def build_topology(ortsteil_geojson, timeline=None, name_property='nam'):
+    """
+    Arc topology of the Ortsteile and of every historic Bezirk composition.
+
+    Args:
+        ortsteil_geojson: Ortsteil FeatureCollection (projected to EPSG:25833 if needed)
+        timeline: admin_timeline.AdminTimeline for the Bezirk objects (optional)
+        name_property: Ortsteil name property
+
+    Returns:
+        Dict with 'arcs' (list of Nx2 arrays), 'ortsteile' and 'bezirke'
+        (lists of (properties, polygons) with polygons as lists of rings of
+        arc references)
+    """
+    source_crs = geojson_crs(ortsteil_geojson)
+    if source_crs != UTM33_CRS:
+        ortsteil_geojson = reproject_geojson(ortsteil_geojson, source_crs, UTM33_CRS)
+
+    features = [f for f in ortsteil_geojson['features']
+                if f['properties'].get(name_property) and f['geometry']['type'] in ('Polygon', 'MultiPolygon')]
+    feature_polygons = []
+    for feature in features:
+        geometry = feature['geometry']
+        polygons = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+        feature_polygons.append([[_ring_vertices(ring) for ring in polygon if len(ring) >= 4] for polygon in polygons])
+
+    junctions = find_junctions([ring for polygons in feature_polygons for polygon in polygons for ring in polygon])
+    arc_index = ArcIndex()
+    ortsteile = []
+    for feature, polygons in zip(features, feature_polygons):
+        arc_polygons = [[ring_arcs(ring, junctions, arc_index) for ring in polygon] for polygon in polygons]
+        ortsteile.append((dict(feature['properties']), arc_polygons))
+
+    arcs = [np.asarray(arc, dtype=float) for arc in arc_index.arcs]
+    bezirke = []
+    if timeline is not None:
+        bezirke = _bezirk_objects(ortsteile, arcs, timeline, name_property)
+    return {'arcs': arcs, 'ortsteile': ortsteile, 'bezirke': bezirke}
+
+
+def _bezirk_objects(ortsteile, arcs, timeline, name_property):
+    from timeline_map import timeline_steps
+
+    steps, compositions = timeline_steps(timeline, timeline.change_dates())
+    periods = _period_properties(steps)
+    arc_endpoints = [(tuple(arc[0]), tuple(arc[-1])) for arc in arcs]
+    by_name = {properties[name_property]: polygons for properties, polygons in ortsteile}
+
+    objects = []
+    for geometry_id, (bezirk_id, members) in compositions.items():
+        refs = [ref for name in members for polygon in by_name.get(name, []) for ring in polygon for ref in ring]
+        if not refs:
+            continue
+        rings = merge_rings(refs, arc_endpoints)
+
+        # Exterior rings keep the members' counter-clockwise orientation, holes run clockwise
+        coordinates = [_ring_coordinates(ring, arcs) for ring in rings]
+        areas = [_signed_area(ring) for ring in coordinates]
+        exteriors = [i for i, area in enumerate(areas) if area > 0]
+        polygons = {i: [rings[i]] for i in exteriors}
+        for i, area in enumerate(areas):
+            if area > 0:
+                continue
+            x, y = coordinates[i][0]
+            for j in exteriors:
+                if points_in_polygon(ring_edges([coordinates[j]]), np.array([x]), np.array([y]))[0]:
+                    polygons[j].append(rings[i])
+                    break
+
+        info = timeline.bezirke.get(bezirk_id, {})
+        for period in periods.get(geometry_id, [{'valid_from': None, 'valid_to': None}]):
+            properties = {
+                'geometry_id': geometry_id,
+                'bezirk_id': bezirk_id,
+                'name': info.get('name', bezirk_id),
+                'east_west': info.get('east_west'),
+                'ortsteile': list(members),
+                **period,
+            }
+            objects.append((properties, list(polygons.values())))
+    return objects
+
+
+def _ring_coordinates(ring, arcs):
+    parts = [arcs[~ref][::-1] if ref < 0 else arcs[ref] for ref in ring]
+    return np.vstack([parts[0]] + [part[1:] for part in parts[1:]])
+
+
+def _signed_area(points):
+    x, y = points[:, 0] - points[0, 0], points[:, 1] - points[0, 1]
+    return float(np.sum(x[:-1] * y[1:] - x[1:] * y[:-1]) / 2)
+
+
+def _topology_object(objects):
+    geometries = []
+    for properties, polygons in objects:
+        geometries.append({'type': 'MultiPolygon', 'arcs': polygons, 'properties': properties})
+    return {'type': 'GeometryCollection', 'geometries': geometries}
+
+
+def write_topology_levels(topology, output_dir=TOPOLOGY_DIR, levels=None):
+    """
+    Write one quantized TopoJSON file per simplification level.
+
+    Args:
+        topology: Output of build_topology
+        output_dir: Directory for the files
+        levels: Level name -> tolerance in metres (default: LEVELS)
+
+    Returns:
+        Dictionary mapping level name to (path, size in bytes)
+    """
+    levels = levels or LEVELS
+    output_dir = Path(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    arcs = topology['arcs']
+    # Checking the Ortsteile is enough: Bezirk rings are built from the same arcs
+    shapes = [polygons for _, polygons in topology['ortsteile']]
+    origin = np.min(np.vstack([arc.min(axis=0) for arc in arcs]), axis=0)
+    origin = np.floor(origin)
+
+    written = {}
+    for level, tolerance in levels.items():
+        # Simplification runs on the quantized arcs, so the checks see the stored coordinates
+        quantum = max(tolerance / 100, MIN_QUANTUM)
+        quantized = quantize_arcs(arcs, quantum, origin)
+        simplified = simplify_arcs(quantized, shapes, tolerance / quantum)
+        document = {
+            'type': 'Topology',
+            'crs': UTM33_CRS,
+            'level': level,
+            'tolerance': tolerance,
+            'transform': {'scale': [quantum, quantum], 'translate': origin.tolist()},
+            'objects': {
+                'ortsteile': _topology_object(topology['ortsteile']),
+                'bezirke': _topology_object(topology['bezirke']),
+            },
+            'arcs': encode_arcs(simplified),
+        }
+        path = output_dir / TOPOLOGY_FILE.format(level=level)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, separators=(',', ':'))
+        written[level] = (path, path.stat().st_size)
+    return written
+
+
+# ---- Loading ----
+
+def level_for(tolerance=None, zoom=None, levels=None):
+    """
+    Coarsest level whose tolerance does not exceed the requested one.
+
+    Args:
+        tolerance: Acceptable deviation in metres
+        zoom: Web map zoom level (tolerance = one pixel at Berlin's latitude)
+        levels: Level name -> tolerance (default: LEVELS)
+
+    Returns:
+        Level name ('full' if neither tolerance nor zoom is given)
+    """
+    levels = levels or LEVELS
+    if tolerance is None and zoom is not None:
+        tolerance = _ZOOM0_RESOLUTION * np.cos(np.radians(_BERLIN_LAT)) / 2 ** zoom
+    if tolerance is None:
+        return min(levels, key=levels.get)
+    fitting = [level for level, value in levels.items() if value <= tolerance]
+    return max(fitting, key=levels.get) if fitting else min(levels, key=levels.get)
+
+
+@lru_cache(maxsize=8)
+def _load_topology(path, mtime_ns):
+    with open(path, 'r', encoding='utf-8') as f:
+        topology = json.load(f)
+    return topology, decode_arcs(topology)
+
+
+def load_geometries(layer='ortsteile', tolerance=None, zoom=None, crs=WGS84_CRS, topology_dir=TOPOLOGY_DIR):
+    """
+    Ortsteil or Bezirk geometries at a resolution fitting the request.
+
+    Args:
+        layer: 'ortsteile' or 'bezirke' (one feature per composition period)
+        tolerance: Acceptable deviation in metres
+        zoom: Web map zoom level, used if no tolerance is given
+        crs: Output CRS (default WGS84; EPSG:25833 for metric spatial joins)
+        topology_dir: Directory of the built topology files
+
+    Returns:
+        GeoJSON FeatureCollection with a crs member
+    """
+    path = Path(topology_dir) / TOPOLOGY_FILE.format(level=level_for(tolerance, zoom))
+    topology, arcs = _load_topology(str(path), path.stat().st_mtime_ns)
+
+    features = []
+    for geometry in topology['objects'][layer]['geometries']:
+        polygons = [[_ring_coordinates(ring, arcs).tolist() for ring in polygon] for polygon in geometry['arcs']]
+        features.append({'type': 'Feature', 'properties': dict(geometry['properties']),
+                         'geometry': {'type': 'MultiPolygon', 'coordinates': polygons}})
+
+    collection = {'type': 'FeatureCollection', 'features': features,
+                  'crs': {'type': 'name', 'properties': {'name': topology['crs']}}}
+    if crs != topology['crs']:
+        collection = reproject_geojson(collection, topology['crs'], crs)
+    return collection
+
+
+def main():
+    """Build the topology files from the admin zone data next to this script"""
+    here = Path(__file__).resolve().parent
+    parser = argparse.ArgumentParser(description="Build multi-resolution Ortsteil/Bezirk topology files")
+    parser.add_argument("--geojson", default=str(here / "moderne_ortsteile.json"), help="Ortsteil polygons")
+    parser.add_argument("--output-dir", default=str(TOPOLOGY_DIR), help="Output directory")
+    args = parser.parse_args()
+
+    with open(args.geojson, 'r', encoding='utf-8') as f:
+        ortsteil_geojson = json.load(f)
+    timeline = load_timeline(here)
+
+    topology = build_topology(ortsteil_geojson, timeline)
+    print(f"Topology: {len(topology['arcs'])} arcs, {len(topology['ortsteile'])} Ortsteile, "
+          f"{len(topology['bezirke'])} Bezirk periods")
+    for level, (path, size) in write_topology_levels(topology, args.output_dir).items():
+        print(f"   {level:>6} ({LEVELS[level]:g} m): {path.name} {size / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
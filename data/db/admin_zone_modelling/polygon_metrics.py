@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Vectorized Polygon Metrics
+==========================
+
+Area, centroid and bounding box of the modern Ortsteile and of every
+historic Bezirk composition, computed in one pass over NumPy arrays.
+
+All rings of all features are flattened into one coordinate array once.
+Areas and centroids use the shoelace formula per ring in an equal-area
+projection (ETRS89 / LAEA Europe, EPSG:3035): outer rings count positive
+and holes negative, and every part of a MultiPolygon contributes, so the
+results are exact for the polygons as stored. Bounding boxes are array
+min/max per feature in WGS84.
+
+Historic Bezirke have no geometry of their own; they are unions of
+Ortsteile (see admin_timeline.AdminTimeline). Their metrics are
+aggregated from the Ortsteil metrics: areas add up, centroids are
+area-weighted and bounding boxes combine.
+"""
+
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from projection import LAEA_CRS, WGS84_CRS, geojson_crs, transform
+
+# Relative deviation from the official 'gdf' area above which a feature is reported
+AREA_TOLERANCE = 0.01
+
+
+def flatten_rings(geometries):
+    """
+    Flatten the rings of Polygon/MultiPolygon geometries into arrays.
+
+    Args:
+        geometries: GeoJSON geometry dicts
+
+    Returns:
+        Dict with vertex arrays 'x' and 'y', 'ring_starts' (offset of each
+        ring plus a final end offset), 'ring_feature' (feature index per
+        ring) and 'ring_exterior' (True for the outer ring of each part)
+    """
+    xs, ys, starts, features, exteriors = [], [], [0], [], []
+    for index, geometry in enumerate(geometries):
+        if not geometry:
+            continue
+        if geometry['type'] == 'Polygon':
+            polygons = [geometry['coordinates']]
+        elif geometry['type'] == 'MultiPolygon':
+            polygons = geometry['coordinates']
+        else:
+            continue
+        for polygon in polygons:
+            for ring_number, ring in enumerate(polygon):
+                if len(ring) < 3:
+                    continue
+                ring = np.asarray(ring, dtype=float)[:, :2]
+                if not np.array_equal(ring[0], ring[-1]):
+                    ring = np.vstack([ring, ring[:1]])
+                xs.append(ring[:, 0])
+                ys.append(ring[:, 1])
+                starts.append(starts[-1] + len(ring))
+                features.append(index)
+                exteriors.append(ring_number == 0)
+
+    empty = np.array([], dtype=float)
+    return {
+        'x': np.concatenate(xs) if xs else empty,
+        'y': np.concatenate(ys) if ys else empty,
+        'ring_starts': np.array(starts, dtype=np.int64),
+        'ring_feature': np.array(features, dtype=np.int64),
+        'ring_exterior': np.array(exteriors, dtype=bool),
+    }
+
+
+def ring_area_centroid(x, y, ring_starts):
+    """
+    Shoelace area and centroid of every ring at once.
+
+    Coordinates are taken relative to each ring's first vertex, which keeps
+    the cross products small for projected coordinates in the millions.
+
+    Args:
+        x: Vertex x coordinates of closed rings, concatenated
+        y: Vertex y coordinates
+        ring_starts: Offset of each ring, plus a final end offset
+
+    Returns:
+        Tuple of (area, centroid_x, centroid_y) arrays; area is unsigned
+    """
+    lengths = np.diff(ring_starts)
+    ring = np.repeat(np.arange(len(lengths)), lengths)
+    dx = x - x[ring_starts[:-1]][ring]
+    dy = y - y[ring_starts[:-1]][ring]
+
+    # Edge i runs from vertex i to i + 1; the closing vertex of each ring starts no edge
+    is_edge = np.ones(len(x), dtype=bool)
+    is_edge[ring_starts[1:] - 1] = False
+    edges = np.flatnonzero(is_edge)
+    cross = dx[edges] * dy[edges + 1] - dx[edges + 1] * dy[edges]
+    edge_ring = ring[edges]
+
+    count = len(lengths)
+    signed_area = np.bincount(edge_ring, weights=cross, minlength=count) / 2
+    moment_x = np.bincount(edge_ring, weights=(dx[edges] + dx[edges + 1]) * cross, minlength=count)
+    moment_y = np.bincount(edge_ring, weights=(dy[edges] + dy[edges + 1]) * cross, minlength=count)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        centroid_x = x[ring_starts[:-1]] + moment_x / (6 * signed_area)
+        centroid_y = y[ring_starts[:-1]] + moment_y / (6 * signed_area)
+    return np.abs(signed_area), centroid_x, centroid_y
+
+
+def feature_metrics(geojson_data, name_property='nam'):
+    """
+    Area, centroid and bounding box of every feature of a FeatureCollection.
+
+    Args:
+        geojson_data: Parsed GeoJSON FeatureCollection (any CRS pyproj knows,
+            or EPSG:4326/25833/3035 without pyproj)
+        name_property: Property holding the feature name
+
+    Returns:
+        Dict of arrays, one entry per feature with a name and polygon geometry:
+        name, area_m2, area_km2, centroid_x/centroid_y (EPSG:3035),
+        centroid_lat/centroid_lon, bbox_min_lat/max_lat/min_lon/max_lon,
+        parts, holes and the feature index in the collection
+    """
+    features = [(i, f) for i, f in enumerate(geojson_data['features'])
+                if f.get('properties', {}).get(name_property)
+                and (f.get('geometry') or {}).get('type') in ('Polygon', 'MultiPolygon')]
+    flat = flatten_rings([f['geometry'] for _, f in features])
+    source_crs = geojson_crs(geojson_data)
+
+    lon, lat = transform(flat['x'], flat['y'], source_crs, WGS84_CRS)
+    ex, ey = transform(flat['x'], flat['y'], source_crs, LAEA_CRS)
+
+    area, cx, cy = ring_area_centroid(ex, ey, flat['ring_starts'])
+    weight = np.where(flat['ring_exterior'], area, -area)
+
+    count = len(features)
+    ring_feature = flat['ring_feature']
+    area_m2 = np.bincount(ring_feature, weights=weight, minlength=count)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        centroid_x = np.bincount(ring_feature, weights=weight * cx, minlength=count) / area_m2
+        centroid_y = np.bincount(ring_feature, weights=weight * cy, minlength=count) / area_m2
+    centroid_lon, centroid_lat = transform(centroid_x, centroid_y, LAEA_CRS, WGS84_CRS)
+
+    # Vertices are contiguous per feature, so one reduceat per bound suffices
+    feature_rings = np.searchsorted(ring_feature, np.arange(count))
+    vertex_starts = flat['ring_starts'][feature_rings]
+
+    return {
+        'name': np.array([f['properties'][name_property] for _, f in features], dtype=object),
+        'feature_index': np.array([i for i, _ in features], dtype=np.int64),
+        'area_m2': area_m2,
+        'area_km2': area_m2 / 1e6,
+        'centroid_x': centroid_x,
+        'centroid_y': centroid_y,
+        'centroid_lat': centroid_lat,
+        'centroid_lon': centroid_lon,
+        'bbox_min_lat': np.minimum.reduceat(lat, vertex_starts),
+        'bbox_max_lat': np.maximum.reduceat(lat, vertex_starts),
+        'bbox_min_lon': np.minimum.reduceat(lon, vertex_starts),
+        'bbox_max_lon': np.maximum.reduceat(lon, vertex_starts),
+        'parts': np.bincount(ring_feature[flat['ring_exterior']], minlength=count),
+        'holes': np.bincount(ring_feature[~flat['ring_exterior']], minlength=count),
+    }
+
+
+def area_deviations(geojson_data, metrics, area_property='gdf', tolerance=AREA_TOLERANCE):
+    """
+    Features whose computed area deviates from an official area property.
+
+    Args:
+        geojson_data: The FeatureCollection metrics were computed from
+        metrics: Output of feature_metrics
+        area_property: Property holding the official area in m²
+        tolerance: Relative deviation to report
+
+    Returns:
+        List of (name, official_m2, computed_m2) tuples
+    """
+    deviations = []
+    for name, index, computed in zip(metrics['name'], metrics['feature_index'], metrics['area_m2']):
+        official = geojson_data['features'][index]['properties'].get(area_property)
+        if official and abs(computed / float(official) - 1) > tolerance:
+            deviations.append((name, float(official), float(computed)))
+    return deviations
+
+
+def historic_bezirk_metrics(ortsteil_metrics, timeline):
+    """
+    Metrics of every historic Bezirk composition.
+
+    A Bezirk gets one row per period with a distinct set of Ortsteile.
+    Ortsteile split between Bezirke are counted in full for each of them
+    (flagged as has_split_ortsteile).
+
+    Args:
+        ortsteil_metrics: Output of feature_metrics for the modern Ortsteile
+        timeline: admin_timeline.AdminTimeline
+
+    Returns:
+        List of dicts with bezirk_id, name, valid_from, valid_to (exclusive,
+        None if open), ortsteile, area_km2, centroid and bbox fields
+    """
+    dates = timeline.change_dates()
+    compositions = [timeline.composition_at(date) for date in dates]
+
+    # Periods per Bezirk: consecutive change dates with the same Ortsteile are merged
+    periods = []
+    open_periods = {}
+    for date, composition in zip(dates, compositions):
+        for bezirk_id in sorted(set(open_periods) | set(composition)):
+            ortsteile = tuple(sorted(composition.get(bezirk_id, [])))
+            current = open_periods.get(bezirk_id)
+            if current is not None and current['ortsteile'] == ortsteile:
+                continue
+            if current is not None:
+                current['valid_to'] = str(date)
+            if ortsteile:
+                open_periods[bezirk_id] = {'bezirk_id': bezirk_id, 'valid_from': str(date),
+                                           'valid_to': None, 'ortsteile': ortsteile}
+                periods.append(open_periods[bezirk_id])
+            else:
+                open_periods.pop(bezirk_id, None)
+
+    split = set()
+    for composition in compositions:
+        members = Counter(o for ortsteile in composition.values() for o in ortsteile)
+        split.update(o for o, count in members.items() if count > 1)
+
+    # Membership matrix (periods x Ortsteile) turns the aggregation into array reductions
+    position = {name: i for i, name in enumerate(ortsteil_metrics['name'])}
+    membership = np.zeros((len(periods), len(position)), dtype=bool)
+    for row, period in enumerate(periods):
+        membership[row, [position[o] for o in period['ortsteile'] if o in position]] = True
+
+    area = membership @ ortsteil_metrics['area_m2']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        centroid_x = membership @ (ortsteil_metrics['area_m2'] * ortsteil_metrics['centroid_x']) / area
+        centroid_y = membership @ (ortsteil_metrics['area_m2'] * ortsteil_metrics['centroid_y']) / area
+    centroid_lon, centroid_lat = transform(centroid_x, centroid_y, LAEA_CRS, WGS84_CRS)
+
+    def combine(field, reducer, empty):
+        return reducer(np.where(membership, ortsteil_metrics[field][None, :], empty), axis=1)
+
+    bbox = {
+        'bbox_min_lat': combine('bbox_min_lat', np.min, np.inf),
+        'bbox_max_lat': combine('bbox_max_lat', np.max, -np.inf),
+        'bbox_min_lon': combine('bbox_min_lon', np.min, np.inf),
+        'bbox_max_lon': combine('bbox_max_lon', np.max, -np.inf),
+    }
+
+    results = []
+    for row, period in enumerate(periods):
+        info = timeline.bezirke.get(period['bezirk_id'], {})
+        missing = [o for o in period['ortsteile'] if o not in position]
+        results.append({
+            'bezirk_id': period['bezirk_id'],
+            'name': info.get('name', period['bezirk_id']),
+            'east_west': info.get('east_west'),
+            'valid_from': period['valid_from'],
+            'valid_to': period['valid_to'],
+            'ortsteile': list(period['ortsteile']),
+            'missing_geometries': missing,
+            'has_split_ortsteile': any(o in split for o in period['ortsteile']),
+            'area_km2': round(float(area[row]) / 1e6, 6),
+            'centroid_lat': round(float(centroid_lat[row]), 8),
+            'centroid_lon': round(float(centroid_lon[row]), 8),
+            **{key: round(float(values[row]), 8) for key, values in bbox.items()},
+        })
+    return results
+
+
+def load_timeline(admin_dir=None):
+    """AdminTimeline of the admin zone data next to this script"""
+    sys.path.append(str(Path(__file__).resolve().parents[2] / 'fahrplanbuch' / 'src'))
+    from admin_timeline import AdminTimeline
+
+    return AdminTimeline.from_directory(admin_dir or Path(__file__).resolve().parent)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Vectorized projections for Berlin's administrative geometries
+=============================================================
+
+Transforms between WGS84 (EPSG:4326), ETRS89 / UTM 33N (EPSG:25833, the CRS
+of Berlin's official geodata) and ETRS89 / LAEA Europe (EPSG:3035, an
+equal-area projection for areas and centroids).
+
+Uses pyproj when it is installed. Without it, transverse Mercator is
+evaluated with Krüger's series (as in pyproj's own "tmerc") and LAEA with
+Snyder's ellipsoidal formulas, both accurate to well below a millimetre
+around Berlin, so the results do not depend on whether pyproj is available.
+"""
+
+import copy
+
+import numpy as np
+
+try:
+    from pyproj import Transformer
+    PYPROJ_AVAILABLE = True
+except ImportError:
+    PYPROJ_AVAILABLE = False
+
+UTM33_CRS = "EPSG:25833"
+WGS84_CRS = "EPSG:4326"
+LAEA_CRS = "EPSG:3035"
+
+# GRS80 ellipsoid (ETRS89); differs from WGS84 by < 0.1 mm
+_A = 6378137.0
+_F = 1 / 298.257222101
+_N = _F / (2 - _F)
+_E2 = _F * (2 - _F)
+_E = np.sqrt(_E2)
+
+# UTM zone 33N
+_K0 = 0.9996
+_LON0 = np.radians(15.0)
+_FALSE_EASTING = 500000.0
+
+# Rectifying radius and Krüger series coefficients (fourth order in n)
+_RECTIFYING_RADIUS = _A / (1 + _N) * (1 + _N ** 2 / 4 + _N ** 4 / 64)
+_ALPHA = (
+    _N / 2 - 2 * _N ** 2 / 3 + 5 * _N ** 3 / 16 + 41 * _N ** 4 / 180,
+    13 * _N ** 2 / 48 - 3 * _N ** 3 / 5 + 557 * _N ** 4 / 1440,
+    61 * _N ** 3 / 240 - 103 * _N ** 4 / 140,
+    49561 * _N ** 4 / 161280,
+)
+_BETA = (
+    _N / 2 - 2 * _N ** 2 / 3 + 37 * _N ** 3 / 96 - _N ** 4 / 360,
+    _N ** 2 / 48 + _N ** 3 / 15 - 437 * _N ** 4 / 1440,
+    17 * _N ** 3 / 480 - 37 * _N ** 4 / 840,
+    4397 * _N ** 4 / 161280,
+)
+_DELTA = (
+    2 * _N - 2 * _N ** 2 / 3 - 2 * _N ** 3 + 116 * _N ** 4 / 45,
+    7 * _N ** 2 / 3 - 8 * _N ** 3 / 5 - 227 * _N ** 4 / 45,
+    56 * _N ** 3 / 15 - 136 * _N ** 4 / 35,
+    4279 * _N ** 4 / 630,
+)
+
+# LAEA Europe: centre 52N 10E
+_LAEA_LAT0 = np.radians(52.0)
+_LAEA_LON0 = np.radians(10.0)
+_LAEA_FALSE_EASTING = 4321000.0
+_LAEA_FALSE_NORTHING = 3210000.0
+
+_transformers = {}
+
+
+def geojson_crs(geojson_data):
+    """CRS of a GeoJSON from its (legacy) crs member, "EPSG:4326" if it has none"""
+    name = str(geojson_data.get('crs', {}).get('properties', {}).get('name', ''))
+    code = name.replace('::', ':').rsplit(':', 1)[-1]
+    return f"EPSG:{code}" if code.isdigit() else WGS84_CRS
+
+
+def _transformer(source_crs, target_crs):
+    key = (source_crs, target_crs)
+    if key not in _transformers:
+        _transformers[key] = Transformer.from_crs(source_crs, target_crs, always_xy=True)
+    return _transformers[key]
+
+
+def _utm33_forward(lat, lon):
+    phi = np.radians(lat)
+    dlon = np.radians(lon) - _LON0
+
+    root_n = 2 * np.sqrt(_N) / (1 + _N)
+    t = np.sinh(np.arctanh(np.sin(phi)) - root_n * np.arctanh(root_n * np.sin(phi)))
+    xi_prime = np.arctan2(t, np.cos(dlon))
+    eta_prime = np.arctanh(np.sin(dlon) / np.sqrt(1 + t ** 2))
+
+    xi = xi_prime.copy()
+    eta = eta_prime.copy()
+    for j, alpha in enumerate(_ALPHA, start=1):
+        xi += alpha * np.sin(2 * j * xi_prime) * np.cosh(2 * j * eta_prime)
+        eta += alpha * np.cos(2 * j * xi_prime) * np.sinh(2 * j * eta_prime)
+
+    easting = _FALSE_EASTING + _K0 * _RECTIFYING_RADIUS * eta
+    northing = _K0 * _RECTIFYING_RADIUS * xi
+    return easting, northing
+
+
+def _utm33_inverse(easting, northing):
+    xi = northing / (_K0 * _RECTIFYING_RADIUS)
+    eta = (easting - _FALSE_EASTING) / (_K0 * _RECTIFYING_RADIUS)
+
+    xi_prime = xi.copy()
+    eta_prime = eta.copy()
+    for j, beta in enumerate(_BETA, start=1):
+        xi_prime -= beta * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        eta_prime -= beta * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+
+    chi = np.arcsin(np.sin(xi_prime) / np.cosh(eta_prime))
+    phi = chi.copy()
+    for j, delta in enumerate(_DELTA, start=1):
+        phi += delta * np.sin(2 * j * chi)
+    lon = _LON0 + np.arctan2(np.sinh(eta_prime), np.cos(xi_prime))
+    return np.degrees(phi), np.degrees(lon)
+
+
+def _authalic_q(phi):
+    sin_phi = np.sin(phi)
+    return (1 - _E2) * (sin_phi / (1 - _E2 * sin_phi ** 2)
+                        - np.log((1 - _E * sin_phi) / (1 + _E * sin_phi)) / (2 * _E))
+
+
+_QP = _authalic_q(np.pi / 2)
+_RQ = _A * np.sqrt(_QP / 2)
+_BETA0 = np.arcsin(_authalic_q(_LAEA_LAT0) / _QP)
+_LAEA_D = _A * np.cos(_LAEA_LAT0) / np.sqrt(1 - _E2 * np.sin(_LAEA_LAT0) ** 2) / (_RQ * np.cos(_BETA0))
+
+
+def _laea_forward(lat, lon):
+    beta = np.arcsin(_authalic_q(np.radians(lat)) / _QP)
+    dlon = np.radians(lon) - _LAEA_LON0
+    b = _RQ * np.sqrt(2 / (1 + np.sin(_BETA0) * np.sin(beta) + np.cos(_BETA0) * np.cos(beta) * np.cos(dlon)))
+    easting = _LAEA_FALSE_EASTING + b * _LAEA_D * np.cos(beta) * np.sin(dlon)
+    northing = _LAEA_FALSE_NORTHING + (b / _LAEA_D) * (np.cos(_BETA0) * np.sin(beta)
+                                                     - np.sin(_BETA0) * np.cos(beta) * np.cos(dlon))
+    return easting, northing
+
+
+def _laea_inverse(easting, northing):
+    x = easting - _LAEA_FALSE_EASTING
+    y = northing - _LAEA_FALSE_NORTHING
+    rho = np.hypot(x / _LAEA_D, _LAEA_D * y)
+    c = 2 * np.arcsin(rho / (2 * _RQ))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = np.where(rho > 0,
+                        np.arcsin(np.cos(c) * np.sin(_BETA0) + _LAEA_D * y * np.sin(c) * np.cos(_BETA0) / rho),
+                        _BETA0)
+    lon = _LAEA_LON0 + np.arctan2(x * np.sin(c),
+                                  _LAEA_D * rho * np.cos(_BETA0) * np.cos(c)
+                                  - _LAEA_D ** 2 * y * np.sin(_BETA0) * np.sin(c))
+    e4, e6 = _E2 ** 2, _E2 ** 3
+    phi = (beta + (_E2 / 3 + 31 * e4 / 180 + 517 * e6 / 5040) * np.sin(2 * beta)
+           + (23 * e4 / 360 + 251 * e6 / 3780) * np.sin(4 * beta)
+           + (761 * e6 / 45360) * np.sin(6 * beta))
+    return np.degrees(phi), np.degrees(lon)
+
+
+def _to_wgs84(x, y, crs):
+    """(lat, lon) from coordinates in one of the supported CRS"""
+    if crs == WGS84_CRS:
+        return y, x
+    if crs == UTM33_CRS:
+        return _utm33_inverse(x, y)
+    if crs == LAEA_CRS:
+        return _laea_inverse(x, y)
+    raise ValueError(f"Unsupported CRS without pyproj: {crs}")
+
+
+def _from_wgs84(lat, lon, crs):
+    """Coordinates in one of the supported CRS from (lat, lon)"""
+    if crs == WGS84_CRS:
+        return lon, lat
+    if crs == UTM33_CRS:
+        return _utm33_forward(lat, lon)
+    if crs == LAEA_CRS:
+        return _laea_forward(lat, lon)
+    raise ValueError(f"Unsupported CRS without pyproj: {crs}")
+
+
+def transform(x, y, source_crs, target_crs):
+    """
+    Transform coordinate arrays between CRS.
+
+    Coordinates are in the CRS's x/y order, i.e. (lon, lat) for EPSG:4326.
+    Without pyproj only EPSG:4326, EPSG:25833 and EPSG:3035 are supported.
+
+    Args:
+        x: x coordinates (array-like)
+        y: y coordinates (array-like)
+        source_crs: Source CRS, e.g. "EPSG:25833"
+        target_crs: Target CRS
+
+    Returns:
+        Tuple of (x, y) arrays in the target CRS
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if source_crs == target_crs:
+        return x, y
+    if PYPROJ_AVAILABLE:
+        tx, ty = _transformer(source_crs, target_crs).transform(x, y)
+        return np.asarray(tx, dtype=float), np.asarray(ty, dtype=float)
+    lat, lon = _to_wgs84(x, y, source_crs)
+    return _from_wgs84(lat, lon, target_crs)
+
+
+def wgs84_to_utm33(lat, lon):
+    """
+    Project WGS84 latitudes/longitudes to EPSG:25833.
+
+    Args:
+        lat: Latitudes in degrees (array-like)
+        lon: Longitudes in degrees (array-like)
+
+    Returns:
+        Tuple of (easting, northing) arrays in metres; NaN stays NaN
+    """
+    return transform(lon, lat, WGS84_CRS, UTM33_CRS)
+
+
+def _collect_positions(coordinates, positions):
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        positions.append(coordinates)
+        return
+    for item in coordinates:
+        _collect_positions(item, positions)
+
+
+def reproject_geojson(geojson_data, source_crs, target_crs=WGS84_CRS):
+    """
+    Reproject all geometries of a FeatureCollection in one array transform.
+
+    Positions of every feature are gathered into a single coordinate array,
+    transformed with one call and written back into a copy of the data, so
+    the structure (rings, parts, extra ordinates) is preserved.
+
+    Args:
+        geojson_data: Parsed GeoJSON FeatureCollection
+        source_crs: CRS of the input coordinates
+        target_crs: CRS to reproject to
+
+    Returns:
+        Reprojected copy with its crs member set to target_crs
+    """
+    reprojected = copy.deepcopy(geojson_data)
+    positions = []
+    for feature in reprojected['features']:
+        geometry = feature.get('geometry') or {}
+        if 'coordinates' in geometry:
+            _collect_positions(geometry['coordinates'], positions)
+
+    if positions:
+        x = np.fromiter((position[0] for position in positions), dtype=float, count=len(positions))
+        y = np.fromiter((position[1] for position in positions), dtype=float, count=len(positions))
+        tx, ty = transform(x, y, source_crs, target_crs)
+        for position, new_x, new_y in zip(positions, tx.tolist(), ty.tolist()):
+            position[0] = new_x
+            position[1] = new_y
+
+    reprojected['crs'] = {"type": "name", "properties": {"name": target_crs}}
+    return reprojected
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Batch Time-Slider Validation Map
+================================
+
+Renders the whole administrative timeline as one map instead of one
+folium HTML file per date.
+
+- Every date's Bezirk composition is reduced to (bezirk_id, Ortsteile);
+  most dates share compositions, so each distinct Bezirk geometry is
+  dissolved and simplified exactly once.
+- Distinct compositions are dissolved in a process pool (shapely if
+  installed; otherwise the Ortsteil polygons are kept as one MultiPolygon).
+- All geometries go to one shared file, bezirk_geometries.js, reprojected
+  to WGS84 in a single array transform. The map page holds only the
+  timeline (geometry ids per date) and switches layers with a slider.
+
+Usage:
+    python timeline_map.py                       # writes validation_maps/berlin_timeline.html
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from string import Template
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from projection import WGS84_CRS, geojson_crs, reproject_geojson
+
+try:
+    import shapely
+    from shapely.geometry import mapping, shape
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+# Simplification tolerance in metres (source CRS units); ~1 px at zoom 12
+DEFAULT_TOLERANCE = 15.0
+# Decimal places of the WGS84 output (~0.1 m)
+COORDINATE_DECIMALS = 6
+
+GEOMETRY_FILE = "bezirk_geometries.js"
+MAP_FILE = "berlin_timeline.html"
+
+COLORS = [
+    '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7',
+    '#DDA0DD', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9',
+    '#F8C471', '#82E0AA', '#F1948A', '#85929E', '#D5A6BD',
+    '#AED6F1', '#A9DFBF', '#F9E79F', '#D7BDE2', '#A3E4D7'
+]
+
+
+def composition_id(bezirk_id, ortsteile):
+    """Stable id of one Bezirk composition"""
+    key = bezirk_id + "|" + "|".join(sorted(ortsteile))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+
+
+def timeline_steps(timeline, dates):
+    """
+    Bezirk compositions of each date, deduplicated.
+
+    Args:
+        timeline: admin_timeline.AdminTimeline
+        dates: Dates (strings or datetime64) to include
+
+    Returns:
+        Tuple of (steps, compositions): steps lists per date the composition
+        ids of its Bezirke, compositions maps id to (bezirk_id, Ortsteile)
+    """
+    steps = []
+    compositions = {}
+    for date in dates:
+        ids = []
+        for bezirk_id, ortsteile in sorted(timeline.composition_at(date).items()):
+            geometry_id = composition_id(bezirk_id, ortsteile)
+            compositions.setdefault(geometry_id, (bezirk_id, tuple(sorted(ortsteile))))
+            ids.append(geometry_id)
+        steps.append({'date': str(np.datetime64(date, 'D')), 'geometries': ids})
+    return steps, compositions
+
+
+def _round_coordinates(coordinates, decimals):
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        return [round(value, decimals) for value in coordinates]
+    return [_round_coordinates(item, decimals) for item in coordinates]
+
+
+def dissolve_geometries(geometries, tolerance=DEFAULT_TOLERANCE):
+    """
+    Dissolve Ortsteil geometries into one Bezirk geometry.
+
+    Args:
+        geometries: GeoJSON geometry dicts in a projected CRS
+        tolerance: Simplification tolerance in CRS units (0 to keep all vertices)
+
+    Returns:
+        GeoJSON geometry dict
+    """
+    if SHAPELY_AVAILABLE:
+        union = shapely.union_all([shape(geometry) for geometry in geometries])
+        if tolerance:
+            union = shapely.simplify(union, tolerance, preserve_topology=True)
+        return mapping(union)
+
+    polygons = []
+    for geometry in geometries:
+        if geometry['type'] == 'Polygon':
+            polygons.append(geometry['coordinates'])
+        elif geometry['type'] == 'MultiPolygon':
+            polygons.extend(geometry['coordinates'])
+    return {'type': 'MultiPolygon', 'coordinates': polygons}
+
+
+def _dissolve_worker(args):
+    geometry_id, geometries, tolerance = args
+    geometry = dissolve_geometries(geometries, tolerance)
+    # shapely's mapping returns tuples; lists keep the output JSON-compatible
+    return geometry_id, json.loads(json.dumps(geometry))
+
+
+def build_geometry_collection(compositions, ortsteil_geojson, bezirke_lookup, tolerance=DEFAULT_TOLERANCE,
+                              workers=None):
+    """
+    Dissolve every distinct composition into a WGS84 FeatureCollection.
+
+    Args:
+        compositions: Output of timeline_steps
+        ortsteil_geojson: Ortsteil FeatureCollection in its source CRS
+        bezirke_lookup: bezirk_id -> historical_bezirke.json entry
+        tolerance: Simplification tolerance in source CRS units
+        workers: Worker processes (None: one per CPU, 1: run in this process)
+
+    Returns:
+        Tuple of (FeatureCollection, missing Ortsteil names)
+    """
+    geometry_by_name = {}
+    for feature in ortsteil_geojson['features']:
+        geometry_by_name.setdefault(feature['properties']['nam'], feature['geometry'])
+
+    missing = set()
+    jobs = []
+    for geometry_id, (bezirk_id, ortsteile) in compositions.items():
+        missing.update(o for o in ortsteile if o not in geometry_by_name)
+        geometries = [geometry_by_name[o] for o in ortsteile if o in geometry_by_name]
+        if geometries:
+            jobs.append((geometry_id, geometries, tolerance))
+
+    if workers == 1 or len(jobs) < 2:
+        dissolved = dict(map(_dissolve_worker, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            dissolved = dict(executor.map(_dissolve_worker, jobs))
+
+    color_of = {}
+    features = []
+    for geometry_id, (bezirk_id, ortsteile) in compositions.items():
+        if geometry_id not in dissolved:
+            continue
+        color = color_of.setdefault(bezirk_id, COLORS[len(color_of) % len(COLORS)])
+        info = bezirke_lookup.get(bezirk_id, {})
+        features.append({
+            'type': 'Feature',
+            'properties': {
+                'geometry_id': geometry_id,
+                'bezirk_id': bezirk_id,
+                'name': info.get('name', bezirk_id),
+                'east_west': info.get('east_west'),
+                'ortsteile': list(ortsteile),
+                'color': color,
+            },
+            'geometry': dissolved[geometry_id],
+        })
+
+    collection = {'type': 'FeatureCollection', 'features': features}
+    source_crs = geojson_crs(ortsteil_geojson)
+    if source_crs != WGS84_CRS:
+        collection = reproject_geojson(collection, source_crs, WGS84_CRS)
+    for feature in collection['features']:
+        feature['geometry']['coordinates'] = _round_coordinates(feature['geometry']['coordinates'],
+                                                                COORDINATE_DECIMALS)
+    return collection, sorted(missing)
+
+
+def step_stats(steps, compositions, bezirke_lookup, missing):
+    """Per-date counts matching create_validation_map's stats"""
+    missing = set(missing)
+    all_stats = []
+    for step in steps:
+        stats = {'date': step['date'], 'east': 0, 'west': 0, 'ortsteil_added': 0, 'ortsteil_missing': 0}
+        for geometry_id in step['geometries']:
+            bezirk_id, ortsteile = compositions[geometry_id]
+            east_west = bezirke_lookup.get(bezirk_id, {}).get('east_west')
+            if east_west in ('east', 'west'):
+                stats[east_west] += 1
+            stats['ortsteil_missing'] += sum(o in missing for o in ortsteile)
+            stats['ortsteil_added'] += sum(o not in missing for o in ortsteile)
+        all_stats.append(stats)
+    return all_stats
+
+
+_MAP_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Berlin administrative timeline</title>
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css">
+<script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js"></script>
+<script src="$geometry_file"></script>
+<style>
+  html, body, #map { height: 100%; margin: 0; }
+  #panel { position: fixed; top: 10px; right: 10px; width: 280px; z-index: 9999; background: white;
+           border: 2px solid grey; font: 12px sans-serif; padding: 10px; max-height: 90%; overflow-y: auto; }
+  #panel input { width: 100%; }
+</style>
+</head>
+<body>
+<div id="map"></div>
+<div id="panel">
+  <h4 style="margin-top:0">Berlin - <span id="date"></span></h4>
+  <div id="description"></div>
+  <input id="slider" type="range" min="0" max="0" value="0">
+  <div id="legend"></div>
+</div>
+<script>
+const TIMELINE = $timeline;
+const byId = {};
+BEZIRK_GEOMETRIES.features.forEach(f => { byId[f.properties.geometry_id] = f; });
+
+const map = L.map('map').setView([52.52, 13.405], 10);
+L.tileLayer('https://tile.openstreetmap.org/{z}/{x}/{y}.png', {
+  maxZoom: 18, attribution: '&copy; OpenStreetMap contributors'
+}).addTo(map);
+
+const layer = L.geoJSON(null, {
+  style: f => ({fillColor: f.properties.color, color: 'black', weight: 1, fillOpacity: 0.6}),
+  onEachFeature: (f, l) => {
+    const p = f.properties;
+    l.bindTooltip(p.name);
+    l.bindPopup('<b>' + p.name + '</b><br>Sector: ' + p.east_west + '<br>Ortsteile: ' + p.ortsteile.join(', '));
+  }
+}).addTo(map);
+
+function legend(features, side) {
+  const rows = features.filter(f => f.properties.east_west === side)
+    .sort((a, b) => a.properties.name.localeCompare(b.properties.name))
+    .map(f => '<span style="color:' + f.properties.color + '">&#9632;</span> ' + f.properties.name);
+  return rows.length ? '<b>' + side[0].toUpperCase() + side.slice(1) + ':</b> ' + rows.length + '<br>' + rows.join('<br>') + '<br>' : '';
+}
+
+function show(i) {
+  const step = TIMELINE[i];
+  const features = step.geometries.map(id => byId[id]).filter(Boolean);
+  layer.clearLayers();
+  features.forEach(f => layer.addData(f));
+  document.getElementById('date').textContent = step.date;
+  document.getElementById('description').textContent = step.description || '';
+  document.getElementById('legend').innerHTML = legend(features, 'east') + '<br>' + legend(features, 'west');
+}
+
+const slider = document.getElementById('slider');
+slider.max = TIMELINE.length - 1;
+slider.addEventListener('input', e => show(+e.target.value));
+show(0);
+</script>
+</body>
+</html>
+""")
+
+
+def render_timeline_map(assignments_data, bezirke_data, ortsteil_geojson, output_dir="validation_maps",
+                        dates=None, descriptions=None, tolerance=DEFAULT_TOLERANCE, workers=None):
+    """
+    Render the administrative timeline as one time-slider map.
+
+    Args:
+        assignments_data: Parsed ortsteil_assignments.json
+        bezirke_data: Parsed historical_bezirke.json
+        ortsteil_geojson: Ortsteil FeatureCollection (any CRS projection.transform supports)
+        output_dir: Directory for the map and the shared geometry file
+        dates: Dates to include besides every change date of the timeline
+        descriptions: Optional date -> label for the slider
+        tolerance: Simplification tolerance in metres
+        workers: Worker processes for dissolving
+
+    Returns:
+        List of per-date stats (date, east, west, ortsteil_added, ortsteil_missing)
+    """
+    sys.path.append(str(Path(__file__).resolve().parents[2] / 'fahrplanbuch' / 'src'))
+    from admin_timeline import AdminTimeline
+
+    timeline = AdminTimeline(assignments_data, bezirke_data)
+    dates = sorted({np.datetime64(date, 'D') for date in list(timeline.change_dates()) + list(dates or [])})
+    descriptions = descriptions or {}
+
+    steps, compositions = timeline_steps(timeline, dates)
+    print(f"   {len(steps)} dates share {len(compositions)} distinct Bezirk compositions")
+
+    bezirke_lookup = {b['bezirk_id']: b for b in bezirke_data['bezirke']}
+    collection, missing = build_geometry_collection(compositions, ortsteil_geojson, bezirke_lookup,
+                                                    tolerance=tolerance, workers=workers)
+    for step in steps:
+        step['description'] = descriptions.get(step['date'], '')
+
+    os.makedirs(output_dir, exist_ok=True)
+    geometry_path = Path(output_dir) / GEOMETRY_FILE
+    with open(geometry_path, 'w', encoding='utf-8') as f:
+        f.write("const BEZIRK_GEOMETRIES = ")
+        json.dump(collection, f, ensure_ascii=False, separators=(',', ':'))
+        f.write(";\n")
+
+    map_path = Path(output_dir) / MAP_FILE
+    with open(map_path, 'w', encoding='utf-8') as f:
+        f.write(_MAP_TEMPLATE.substitute(geometry_file=GEOMETRY_FILE,
+                                         timeline=json.dumps(steps, ensure_ascii=False)))
+
+    size_kb = (geometry_path.stat().st_size + map_path.stat().st_size) / 1024
+    print(f"   ✅ {map_path} + {geometry_path.name} ({size_kb:.0f} KB)")
+    return step_stats(steps, compositions, bezirke_lookup, missing)
+
+
+def main():
+    """Render the time-slider map from the files next to this script"""
+    here = Path(__file__).resolve().parent
+    parser = argparse.ArgumentParser(description="Render the Berlin administrative timeline as one slider map")
+    parser.add_argument("--output-dir", default=str(here / "validation_maps"), help="Output directory")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Simplification tolerance (m)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    with open(here / "ortsteil_assignments.json", "r", encoding="utf-8") as f:
+        assignments_data = json.load(f)
+    with open(here / "historical_bezirke.json", "r", encoding="utf-8") as f:
+        bezirke_data = json.load(f)
+    with open(here / "moderne_ortsteile.json", "r", encoding="utf-8") as f:
+        ortsteil_geojson = json.load(f)
+
+    stats = render_timeline_map(assignments_data, bezirke_data, ortsteil_geojson, args.output_dir,
+                                tolerance=args.tolerance, workers=args.workers)
+    for stat in stats:
+        print(f"   {stat['date']}: {stat['east']} East + {stat['west']} West = {stat['east'] + stat['west']} districts")
+
+
+if __name__ == "__main__":
+    main()
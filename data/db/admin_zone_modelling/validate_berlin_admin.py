@@ -14,17 +14,26 @@ Usage: python unified_validation.py
 """
 
 import json
+import sys
+import hashlib
+import argparse
 import pandas as pd
 import folium
 from datetime import datetime
 import os
+from pathlib import Path
 
-# Try to import coordinate transformation libraries
-try:
-    from pyproj import Transformer
-    PYPROJ_AVAILABLE = True
-except ImportError:
-    PYPROJ_AVAILABLE = False
+# Temporal Ortsteil/Bezirk index shared with the Fahrplanbuch enricher
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'fahrplanbuch' / 'src'))
+from admin_timeline import AdminTimeline
+
+# Array reprojection (pyproj if installed, exact series formulas otherwise)
+from projection import PYPROJ_AVAILABLE, WGS84_CRS, reproject_geojson
+from timeline_map import render_timeline_map
+
+# Reprojected GeoJSON is cached on disk, keyed by source content and CRS
+REPROJECTION_CACHE_DIR = Path(__file__).resolve().parent / "reprojection_cache"
+REPROJECTION_CACHE_VERSION = 1
 
 def detect_and_parse_crs(geojson_data):
     """Detect and parse coordinate system from GeoJSON"""
@@ -90,72 +99,13 @@ def needs_reprojection(geojson_data):
     source_crs = detect_and_parse_crs(geojson_data)
     return source_crs != "EPSG:4326"
 
-def reproject_coordinates_pyproj(coords, source_crs="EPSG:25833", target_crs="EPSG:4326"):
-    """Reproject coordinates using pyproj"""
-    
-    # Ensure source_crs is a string
-    if isinstance(source_crs, dict):
-        if 'properties' in source_crs and 'name' in source_crs['properties']:
-            crs_name = source_crs['properties']['name']
-            if 'urn:ogc:def:crs:EPSG::' in crs_name:
-                epsg_code = crs_name.split('::')[-1]
-                source_crs = f"EPSG:{epsg_code}"
-            else:
-                source_crs = "EPSG:25833"
-        else:
-            source_crs = "EPSG:25833"
-    
-    try:
-        transformer = Transformer.from_crs(source_crs, target_crs, always_xy=True)
-    except Exception as e:
-        print(f"Error creating transformer: {e}")
-        raise
-    
-    def transform_coord_list(coord_list):
-        if not coord_list:
-            return coord_list
-        
-        if isinstance(coord_list[0], list):
-            return [transform_coord_list(sublist) for sublist in coord_list]
-        else:
-            if len(coord_list) >= 2:
-                try:
-                    lon, lat = transformer.transform(coord_list[0], coord_list[1])
-                    return [lon, lat] + coord_list[2:]
-                except Exception as e:
-                    print(f"Error transforming coordinates {coord_list}: {e}")
-                    return coord_list
-            return coord_list
-    
-    return transform_coord_list(coords)
-
-def reproject_coordinates_manual(coords, source_crs="EPSG:25833"):
-    """Manual coordinate transformation fallback"""
-    if source_crs == "EPSG:4326":
-        return coords
-    
-    def transform_coord_list(coord_list):
-        if not coord_list:
-            return coord_list
-        
-        if isinstance(coord_list[0], list):
-            return [transform_coord_list(sublist) for sublist in coord_list]
-        else:
-            x, y = coord_list[0], coord_list[1]
-            
-            # Approximate transformation for Berlin UTM to WGS84
-            if 300000 < x < 400000 and 5800000 < y < 5900000:
-                lon = 13.4 + (x - 390000) / 80000
-                lat = 52.5 + (y - 5820000) / 111000
-            else:
-                lon = (x - 500000) / 111320.0 + 15.0
-                lat = y / 111320.0 - 52.0
-            
-            return [lon, lat] + coord_list[2:]
-    
-    return transform_coord_list(coords)
+def reprojection_cache_path(source_bytes, source_crs, target_crs=WGS84_CRS, cache_dir=REPROJECTION_CACHE_DIR):
+    """Cache file for a source dataset reprojected between two CRS"""
+    digest = hashlib.sha256(source_bytes).hexdigest()[:16]
+    crs_tag = f"{source_crs}_{target_crs}".replace(':', '').lower()
+    return Path(cache_dir) / f"{digest}_{crs_tag}_v{REPROJECTION_CACHE_VERSION}.json"
 
-def reproject_geojson_if_needed(geojson_data):
+def reproject_geojson_if_needed(geojson_data, source_bytes=None, cache_dir=REPROJECTION_CACHE_DIR):
     """Reproject GeoJSON to WGS84 if needed, return (data, was_reprojected)"""
     
     if not needs_reprojection(geojson_data):
@@ -163,31 +113,27 @@ def reproject_geojson_if_needed(geojson_data):
         return geojson_data, False
     
     source_crs = detect_and_parse_crs(geojson_data)
-    print(f"🔄 Reprojecting from {source_crs} to EPSG:4326...")
+    if source_bytes is None:
+        source_bytes = json.dumps(geojson_data, sort_keys=True).encode('utf-8')
+    cache_path = reprojection_cache_path(source_bytes, source_crs, WGS84_CRS, cache_dir)
+    
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                reprojected_data = json.load(f)
+            print(f"✅ Loaded cached reprojection from {source_crs}: {cache_path.name}")
+            return reprojected_data, True
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable reprojection cache {cache_path}: {e}")
     
-    # Choose reprojection method
+    print(f"🔄 Reprojecting from {source_crs} to EPSG:4326...")
     if PYPROJ_AVAILABLE:
         print("   Using pyproj for accurate reprojection")
-        reproject_func = lambda coords: reproject_coordinates_pyproj(coords, source_crs, "EPSG:4326")
     else:
-        print("   Using manual approximation (install pyproj for accuracy)")
-        reproject_func = lambda coords: reproject_coordinates_manual(coords, source_crs)
+        print("   Using built-in projection formulas (pyproj not installed)")
     
-    # Create copy and reproject
-    reprojected_data = json.loads(json.dumps(geojson_data))
-    
-    for feature in reprojected_data['features']:
-        geometry = feature['geometry']
-        if geometry['type'] in ['Polygon', 'MultiPolygon']:
-            geometry['coordinates'] = reproject_func(geometry['coordinates'])
-        elif geometry['type'] == 'Point':
-            geometry['coordinates'] = reproject_func([geometry['coordinates']])[0]
-    
-    # Update CRS info
-    reprojected_data['crs'] = {
-        "type": "name",
-        "properties": {"name": "EPSG:4326"}
-    }
+    # All coordinates of the collection are transformed in one array call
+    reprojected_data = reproject_geojson(geojson_data, source_crs, WGS84_CRS)
     
     # Verify reprojection
     sample_feature = reprojected_data['features'][0]
@@ -205,8 +151,33 @@ def reproject_geojson_if_needed(geojson_data):
     else:
         print(f"⚠️  Warning: Coordinates may not be correct: lon={lon:.3f}, lat={lat:.3f}")
     
+    try:
+        os.makedirs(cache_path.parent, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(reprojected_data, f, ensure_ascii=False)
+        print(f"💾 Cached reprojection: {cache_path.name}")
+    except OSError as e:
+        print(f"⚠️  Could not write reprojection cache: {e}")
+    
     return reprojected_data, True
 
+_geojson_cache = {}
+
+def load_ortsteil_geojson(path="moderne_ortsteile.json"):
+    """Load an Ortsteil GeoJSON and its WGS84 version, once per file version
+    
+    Returns (original, wgs84, was_reprojected). Every validation map of a run
+    shares the same reprojected dataset; across runs it comes from the disk cache.
+    """
+    path = Path(path)
+    key = (str(path.resolve()), path.stat().st_mtime_ns)
+    if key not in _geojson_cache:
+        source_bytes = path.read_bytes()
+        geojson_data = json.loads(source_bytes.decode('utf-8-sig'))
+        wgs84_data, was_reprojected = reproject_geojson_if_needed(geojson_data, source_bytes)
+        _geojson_cache[key] = (geojson_data, wgs84_data, was_reprojected)
+    return _geojson_cache[key]
+
 def validate_data_coverage(assignments_data, ortsteil_geojson):
     """Check data coverage and consistency"""
     print("\n=== DATA VALIDATION ===")
@@ -233,28 +204,27 @@ def validate_data_coverage(assignments_data, ortsteil_geojson):
     
     return in_both, only_in_assignments, only_in_geojson
 
+_timeline_cache = {}
+
 def get_assignments_at_date(assignments_data, target_date):
     """Get Bezirke composition at specific date"""
-    target_dt = pd.to_datetime(target_date)
-    
-    active_assignments = []
-    for assignment in assignments_data['assignments']:
-        start_dt = pd.to_datetime(assignment['start_date'])
-        end_dt = pd.to_datetime(assignment['end_date']) if assignment['end_date'] else None
-        
-        if start_dt <= target_dt and (end_dt is None or end_dt >= target_dt):
-            active_assignments.append(assignment)
-    
-    bezirk_composition = {}
-    for assignment in active_assignments:
-        bezirk_id = assignment['bezirk_id']
-        ortsteil_name = assignment['ortsteil_name']
-        
-        if bezirk_id not in bezirk_composition:
-            bezirk_composition[bezirk_id] = []
-        bezirk_composition[bezirk_id].append(ortsteil_name)
-    
-    return bezirk_composition
+    # Index is built once per assignments dataset and answers each date by binary search
+    key = id(assignments_data)
+    if key not in _timeline_cache:
+        _timeline_cache[key] = (assignments_data, AdminTimeline(assignments_data))
+    return _timeline_cache[key][1].composition_at(target_date)
+
+_feature_index_cache = {}
+
+def get_features_by_name(ortsteil_geojson):
+    """Ortsteil features by name, built once per dataset"""
+    key = id(ortsteil_geojson)
+    if key not in _feature_index_cache:
+        index = {}
+        for feature in ortsteil_geojson['features']:
+            index.setdefault(feature['properties']['nam'], feature)
+        _feature_index_cache[key] = (ortsteil_geojson, index)
+    return _feature_index_cache[key][1]
 
 def create_validation_map(bezirk_composition, bezirke_data, ortsteil_geojson, target_date, filename):
     """Create validation map for specific date"""
@@ -270,6 +240,7 @@ def create_validation_map(bezirk_composition, bezirke_data, ortsteil_geojson, ta
     ]
     
     bezirke_lookup = {b['bezirk_id']: b for b in bezirke_data['bezirke']}
+    features_by_name = get_features_by_name(ortsteil_geojson)
     bezirk_colors = {}
     color_idx = 0
     stats = {'east': 0, 'west': 0, 'ortsteil_added': 0, 'ortsteil_missing': 0}
@@ -289,34 +260,31 @@ def create_validation_map(bezirk_composition, bezirke_data, ortsteil_geojson, ta
         stats[east_west] += 1
         
         for ortsteil_name in ortsteil_list:
-            found = False
-            for feature in ortsteil_geojson['features']:
-                if feature['properties']['nam'] == ortsteil_name:
-                    popup_text = f"""
-                    <b>{ortsteil_name}</b><br>
-                    Bezirk: {bezirk_name}<br>
-                    Sector: {east_west.title()}<br>
-                    Date: {target_date}
-                    """
-                    
-                    folium.GeoJson(
-                        feature,
-                        style_function=lambda x, color=color: {
-                            'fillColor': color,
-                            'color': 'black',
-                            'weight': 1,
-                            'fillOpacity': 0.6
-                        },
-                        popup=folium.Popup(popup_text, max_width=300),
-                        tooltip=f"{ortsteil_name} ({bezirk_name})"
-                    ).add_to(m)
-                    
-                    stats['ortsteil_added'] += 1
-                    found = True
-                    break
-            
-            if not found:
+            feature = features_by_name.get(ortsteil_name)
+            if feature is None:
                 stats['ortsteil_missing'] += 1
+                continue
+            
+            popup_text = f"""
+            <b>{ortsteil_name}</b><br>
+            Bezirk: {bezirk_name}<br>
+            Sector: {east_west.title()}<br>
+            Date: {target_date}
+            """
+            
+            folium.GeoJson(
+                feature,
+                style_function=lambda x, color=color: {
+                    'fillColor': color,
+                    'color': 'black',
+                    'weight': 1,
+                    'fillOpacity': 0.6
+                },
+                popup=folium.Popup(popup_text, max_width=300),
+                tooltip=f"{ortsteil_name} ({bezirk_name})"
+            ).add_to(m)
+            
+            stats['ortsteil_added'] += 1
     
     # Add legend
     legend_html = f'''
@@ -356,8 +324,12 @@ def create_validation_map(bezirk_composition, bezirke_data, ortsteil_geojson, ta
     
     return stats
 
-def main():
-    """Main unified validation workflow"""
+def main(per_date_maps=False, workers=None):
+    """Main unified validation workflow
+    
+    By default the whole timeline is rendered as one time-slider map; with
+    per_date_maps one folium map per key date is written as before.
+    """
     print("🗺️  Berlin Administrative Zone Unified Validator")
     print("=" * 55)
     
@@ -371,8 +343,9 @@ def main():
         with open("historical_bezirke.json", "r", encoding="utf-8") as f:
             bezirke_data = json.load(f)
         
-        with open("moderne_ortsteile.json", "r", encoding="utf-8") as f:
-            ortsteil_geojson = json.load(f)
+        # Loaded together with its (cached) WGS84 version, shared by all maps below
+        print(f"\n🌍 Checking coordinate system...")
+        ortsteil_geojson, ortsteil_geojson_wgs84, was_reprojected = load_ortsteil_geojson("moderne_ortsteile.json")
             
         print(f"✅ Loaded {len(assignments_data['assignments'])} assignments")
         print(f"✅ Loaded {len(bezirke_data['bezirke'])} historical Bezirke")
@@ -383,13 +356,11 @@ def main():
         print("Required files: ortsteil_assignments.json, historical_bezirke.json, moderne_ortsteile.json")
         return
     
-    # Check and reproject coordinates if needed
-    print(f"\n🌍 Checking coordinate system...")
-    ortsteil_geojson_wgs84, was_reprojected = reproject_geojson_if_needed(ortsteil_geojson)
-    
-    if was_reprojected:
+    wgs84_file = Path("moderne_ortsteile_wgs84.json")
+    if was_reprojected and (not wgs84_file.exists()
+                            or wgs84_file.stat().st_mtime < Path("moderne_ortsteile.json").stat().st_mtime):
         # Save reprojected data for future use
-        with open("moderne_ortsteile_wgs84.json", "w", encoding="utf-8") as f:
+        with open(wgs84_file, "w", encoding="utf-8") as f:
             json.dump(ortsteil_geojson_wgs84, f, ensure_ascii=False, indent=2)
         print("💾 Saved reprojected data: moderne_ortsteile_wgs84.json")
     
@@ -409,23 +380,33 @@ def main():
         ("1989-12-31", "End of Cold War")
     ]
     
-    print(f"\n🗺️  Creating validation maps for {len(key_dates)} time periods...")
-    
-    all_stats = []
-    for date, description in key_dates:
-        print(f"\n📅 {description}")
+    if per_date_maps:
+        print(f"\n🗺️  Creating validation maps for {len(key_dates)} time periods...")
+        
+        all_stats = []
+        for date, description in key_dates:
+            print(f"\n📅 {description}")
+            
+            composition = get_assignments_at_date(assignments_data, date)
+            filename = f"validation_maps/berlin_{date.replace('-', '_')}.html"
+            stats = create_validation_map(composition, bezirke_data, ortsteil_geojson_wgs84, date, filename)
+            stats['date'] = date
+            stats['description'] = description
+            all_stats.append(stats)
+        maps_created = len(key_dates)
+    else:
+        print(f"\n🗺️  Rendering the administrative timeline as one slider map...")
         
-        composition = get_assignments_at_date(assignments_data, date)
-        filename = f"validation_maps/berlin_{date.replace('-', '_')}.html"
-        stats = create_validation_map(composition, bezirke_data, ortsteil_geojson_wgs84, date, filename)
-        stats['date'] = date
-        stats['description'] = description
-        all_stats.append(stats)
+        # Dissolving works in metres, so the map is built from the source-CRS polygons
+        all_stats = render_timeline_map(assignments_data, bezirke_data, ortsteil_geojson, "validation_maps",
+                                        dates=[date for date, _ in key_dates],
+                                        descriptions=dict(key_dates), workers=workers)
+        maps_created = 1
     
     # Final summary
     print(f"\n🎉 VALIDATION COMPLETE!")
     print(f"=" * 30)
-    print(f"✅ Created {len(key_dates)} validation maps in 'validation_maps/'")
+    print(f"✅ Created {maps_created} validation map(s) in 'validation_maps/'")
     print(f"📊 Data coverage: {len(in_both)} Ortsteil with complete data")
     
     if was_reprojected:
@@ -456,4 +437,9 @@ def main():
     print(f"   - Run spatial summary generator next")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Validate Berlin administrative zones and render validation maps")
+    parser.add_argument("--per-date-maps", action="store_true",
+                        help="Write one full folium map per key date instead of the timeline slider map")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for dissolving Bezirke")
+    args = parser.parse_args()
+    main(per_date_maps=args.per_date_maps, workers=args.workers)
\ No newline at end of file
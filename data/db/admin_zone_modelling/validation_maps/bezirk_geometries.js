@@ -0,0 +1 @@
+const BEZIRK_GEOMETRIES = {"type":"FeatureCollection","features":[{"type":"Feature","properties":{"geometry_id":"f200197df850","bezirk_id":"charlottenburg_west","name":"Charlottenburg","east_west":"west","ortsteile":["Charlottenburg","Charlottenburg-Nord","Halensee","Westend"],"color":"#FF6B6B"},"geometry":{"type":"Polygon","coordinates":[[[13.301635,52.498769],[13.301171,52.495094],[13.300415,52.494755],[13.301381,52.494501],[13.300582,52.489768],[13.30197,52.488736],[13.300377,52.488043],[13.296733,52.490692],[13.290195,52.494404],[13.288777,52.494267],[13.286471,52.494555],[13.286125,52.494655],[13.286247,52.495118],[13.285204,52.495155],[13.283415,52.497492],[13.281347,52.499547],[13.28207,52.499766],[13.281645,52.500481],[13.272358,52.497706],[13.27248,52.497553],[13.271215,52.496814],[13.271016,52.496914],[13.26756,52.494192],[13.264433,52.490717],[13.261645,52.488919],[13.259354,52.489975],[13.2581,52.491201],[13.256501,52.49518],[13.251808,52.497411],[13.255243,52.500104],[13.252519,52.501395],[13.253762,52.502348],[13.253414,52.502514],[13.255507,52.504156],[13.253808,52.50496],[13.254135,52.505209],[13.223383,52.503319],[13.211863,52.50222],[13.212022,52.502611],[13.209727,52.50291],[13.209347,52.504301],[13.208764,52.505046],[13.210496,52.5072],[13.211014,52.508523],[13.211862,52.509347],[13.213231,52.509097],[13.214085,52.509101],[13.214546,52.509369],[13.215583,52.50916],[13.215693,52.509365],[13.214981,52.509509],[13.216201,52.51134],[13.218472,52.513402],[13.218833,52.513367],[13.219458,52.513994],[13.219752,52.513577],[13.220948,52.513622],[13.220097,52.514599],[13.219838,52.515787],[13.219388,52.521421],[13.219696,52.522414],[13.22202,52.526174],[13.227305,52.525615],[13.228039,52.525712],[13.228181,52.52602],[13.231275,52.52577],[13.236449,52.526132],[13.238576,52.526114],[13.239835,52.525881],[13.23997,52.52609],[13.24751,52.524285],[13.247703,52.524574],[13.247112,52.52728],[13.246342,52.527689],[13.246681,52.528314],[13.248307,52.527546],[13.249806,52.52718],[13.256849,52.527137],[13.26093,52.527544],[13.26515,52.528756],[13.269903,52.52895],[13.273953,52.528787],[13.275533,52.529086],[13.278217,52.530197],[13.279327,52.530326],[13.280839,52.530067],[13.281242,52.530573],[13.282182,52.534051],[13.276276,52.535639],[13.275228,52.53769],[13.273929,52.53843],[13.272307,52.538867],[13.273484,52.54207],[13.273141,52.542909],[13.27337,52.542943],[13.270661,52.547886],[13.269969,52.548555],[13.270305,52.54865],[13.270337,52.549345],[13.301007,52.548819],[13.317936,52.548238],[13.326233,52.541874],[13.327326,52.541431],[13.327191,52.539646],[13.329134,52.53823],[13.326827,52.537749],[13.311413,52.535614],[13.31303,52.531874],[13.317515,52.532377],[13.317052,52.53205],[13.317305,52.531545],[13.316614,52.531162],[13.316748,52.530905],[13.313354,52.530261],[13.316649,52.520963],[13.317798,52.520367],[13.318779,52.521115],[13.31903,52.52323],[13.319778,52.52393],[13.32082,52.524388],[13.324109,52.52465],[13.32692,52.523717],[13.32866,52.522551],[13.32936,52.521654],[13.32955,52.52083],[13.329094,52.519038],[13.329634,52.517954],[13.330728,52.517208],[13.331843,52.516816],[13.334215,52.516772],[13.334793,52.515504],[13.336136,52.514377],[13.335854,52.513293],[13.330559,52.512831],[13.331194,52.512307],[13.334027,52.511716],[13.332755,52.51097],[13.330043,52.510075],[13.334659,52.508759],[13.334843,52.508159],[13.33375,52.506721],[13.335293,52.505925],[13.336708,52.505717],[13.338638,52.50592],[13.339068,52.505074],[13.340131,52.505144],[13.341421,52.504868],[13.336041,52.499815],[13.332647,52.501183],[13.331723,52.500303],[13.316076,52.499357],[13.313584,52.499624],[13.311767,52.500308],[13.307144,52.499834],[13.301635,52.498769]]]}},{"type":"Feature","properties":{"geometry_id":"93d65126ceee","bezirk_id":"friedrichshain_east","name":"Friedrichshain","east_west":"east","ortsteile":["Friedrichshain"],"color":"#4ECDC4"},"geometry":{"type":"Polygon","coordinates":[[[13.447168,52.526408],[13.442277,52.531026],[13.438748,52.528778],[13.438311,52.5288],[13.437482,52.529548],[13.425027,52.528095],[13.424854,52.527878],[13.423642,52.527915],[13.419753,52.525546],[13.424099,52.523844],[13.426502,52.523291],[13.426521,52.522939],[13.425548,52.522791],[13.42919,52.521204],[13.428401,52.519586],[13.426917,52.519744],[13.425927,52.518392],[13.426305,52.518289],[13.426151,52.518069],[13.426754,52.517959],[13.425096,52.51507],[13.422779,52.512235],[13.428373,52.509071],[13.429126,52.508902],[13.429402,52.508572],[13.435479,52.505645],[13.43713,52.50456],[13.441466,52.502914],[13.446512,52.500514],[13.449638,52.499481],[13.450593,52.498675],[13.45111,52.498911],[13.451645,52.498843],[13.453352,52.497525],[13.455071,52.497421],[13.459449,52.496552],[13.461926,52.495589],[13.463186,52.495447],[13.463983,52.495025],[13.4632,52.494215],[13.464215,52.493742],[13.471019,52.49149],[13.473789,52.491036],[13.475443,52.490329],[13.477688,52.488785],[13.478638,52.487031],[13.479423,52.487923],[13.481684,52.487635],[13.482956,52.486046],[13.486739,52.487649],[13.488504,52.487836],[13.490709,52.487444],[13.491454,52.488266],[13.488813,52.489249],[13.488462,52.489888],[13.486087,52.490799],[13.484936,52.491604],[13.484145,52.491658],[13.47308,52.498991],[13.468573,52.499652],[13.470207,52.503743],[13.471163,52.505134],[13.472827,52.506707],[13.473409,52.506924],[13.473066,52.507126],[13.475828,52.510257],[13.476266,52.510441],[13.475438,52.513433],[13.475887,52.514863],[13.477485,52.514389],[13.477748,52.514729],[13.476547,52.515173],[13.474197,52.519117],[13.47376,52.519088],[13.472272,52.520678],[13.462695,52.519928],[13.45529,52.521272],[13.456156,52.522456],[13.4558,52.522552],[13.452182,52.527798],[13.447168,52.526408]]]}},{"type":"Feature","properties":{"geometry_id":"d087a6689f1e","bezirk_id":"koepenick_east","name":"Köpenick","east_west":"east","ortsteile":["Friedrichshagen","Grünau","Köpenick","Müggelheim","Rahnsdorf","Schmöckwitz"],"color":"#45B7D1"},"geometry":{"type":"Polygon","coordinates":[[[13.709852,52.396374],[13.707941,52.395125],[13.706556,52.39512],[13.704485,52.393538],[13.703293,52.393265],[13.702348,52.393328],[13.70015,52.391145],[13.6987,52.390596],[13.698419,52.391139],[13.699014,52.391912],[13.698269,52.391771],[13.697653,52.391122],[13.697864,52.390962],[13.697344,52.389922],[13.695968,52.388984],[13.695418,52.388882],[13.690606,52.385498],[13.688871,52.385033],[13.688025,52.386072],[13.687593,52.38517],[13.686831,52.385304],[13.686645,52.385028],[13.686179,52.383863],[13.687061,52.38388],[13.687311,52.383323],[13.687915,52.382953],[13.689721,52.383254],[13.695165,52.380955],[13.698835,52.381501],[13.697209,52.377438],[13.699293,52.377736],[13.699422,52.377514],[13.700406,52.377507],[13.70062,52.377193],[13.699957,52.37559],[13.698715,52.374155],[13.69509,52.370703],[13.692853,52.369178],[13.692679,52.368822],[13.693083,52.367978],[13.691277,52.367778],[13.691426,52.367489],[13.692203,52.367209],[13.689992,52.367855],[13.689263,52.367846],[13.68953,52.367661],[13.688918,52.367413],[13.687221,52.367302],[13.684753,52.368816],[13.682151,52.36964],[13.679209,52.369445],[13.67542,52.367681],[13.671183,52.366482],[13.670009,52.364771],[13.668478,52.36421],[13.666664,52.362361],[13.66575,52.359626],[13.666202,52.358089],[13.664905,52.358127],[13.663635,52.357408],[13.662439,52.355862],[13.662686,52.355082],[13.661986,52.354607],[13.662023,52.354214],[13.659571,52.353308],[13.658967,52.352809],[13.658984,52.352359],[13.657086,52.351614],[13.656772,52.349614],[13.656009,52.348477],[13.656114,52.347814],[13.653298,52.345557],[13.652301,52.343851],[13.651151,52.342607],[13.651695,52.339467],[13.650693,52.338858],[13.647739,52.338246],[13.645508,52.338785],[13.644496,52.339916],[13.642817,52.339941],[13.640858,52.341884],[13.638704,52.343193],[13.637167,52.344731],[13.636318,52.346817],[13.636701,52.348144],[13.637793,52.348213],[13.638137,52.357095],[13.638719,52.358753],[13.638435,52.359735],[13.639085,52.360981],[13.641144,52.363097],[13.646099,52.365275],[13.646945,52.366078],[13.64719,52.367017],[13.646831,52.370156],[13.643538,52.370467],[13.642098,52.37081],[13.642843,52.372583],[13.642678,52.377507],[13.633223,52.376244],[13.628514,52.381356],[13.607365,52.373978],[13.60582,52.373624],[13.606594,52.374944],[13.606809,52.376028],[13.605472,52.377973],[13.606326,52.378606],[13.606398,52.379118],[13.604859,52.380944],[13.603718,52.381666],[13.603003,52.382841],[13.600474,52.384317],[13.599383,52.385405],[13.59612,52.385985],[13.594965,52.38721],[13.595203,52.388744],[13.595019,52.388943],[13.594315,52.38892],[13.593676,52.38996],[13.594141,52.392442],[13.592695,52.393813],[13.593257,52.395613],[13.592994,52.396905],[13.590361,52.397174],[13.588548,52.399647],[13.586466,52.399405],[13.5843,52.401333],[13.586959,52.403638],[13.583289,52.40596],[13.580617,52.407158],[13.577506,52.408971],[13.574885,52.409328],[13.573162,52.411827],[13.572907,52.413046],[13.566009,52.417361],[13.554363,52.425689],[13.563419,52.426714],[13.563691,52.430509],[13.563396,52.432155],[13.562709,52.433628],[13.560053,52.437335],[13.559351,52.439411],[13.558223,52.453145],[13.561487,52.453171],[13.562855,52.453456],[13.564965,52.453109],[13.565796,52.454285],[13.564581,52.454717],[13.566638,52.45549],[13.566353,52.455797],[13.563811,52.456551],[13.561507,52.458705],[13.552492,52.468549],[13.552323,52.468777],[13.552739,52.469246],[13.551618,52.46978],[13.547991,52.473866],[13.559643,52.473242],[13.563094,52.473467],[13.565128,52.473957],[13.56567,52.473599],[13.566633,52.473723],[13.567723,52.474582],[13.57306,52.476656],[13.573425,52.476795],[13.573879,52.476507],[13.573839,52.47697],[13.574441,52.47752],[13.575118,52.479479],[13.579716,52.481024],[13.581875,52.479971],[13.586342,52.481122],[13.60307,52.472786],[13.608376,52.472855],[13.608153,52.471091],[13.611313,52.470477],[13.611498,52.470628],[13.612126,52.470516],[13.615069,52.469715],[13.617123,52.471208],[13.621172,52.470463],[13.621024,52.468497],[13.621919,52.468486],[13.622011,52.468024],[13.62196,52.467009],[13.621388,52.466639],[13.622743,52.466456],[13.6234,52.466711],[13.622663,52.467781],[13.622943,52.467913],[13.622608,52.468061],[13.622897,52.468793],[13.625206,52.468745],[13.624709,52.469062],[13.625341,52.473698],[13.628181,52.473544],[13.631041,52.475027],[13.63615,52.476146],[13.642567,52.478705],[13.643215,52.479223],[13.648306,52.478731],[13.655464,52.476645],[13.658364,52.475002],[13.662652,52.473758],[13.664332,52.473695],[13.667239,52.474285],[13.667559,52.473738],[13.670084,52.473094],[13.676411,52.470022],[13.678644,52.469236],[13.680164,52.467828],[13.682774,52.466069],[13.686565,52.465138],[13.689831,52.465012],[13.695433,52.464185],[13.69708,52.461733],[13.697532,52.460483],[13.697691,52.458496],[13.698675,52.456477],[13.698348,52.45526],[13.701496,52.454864],[13.704615,52.45476],[13.705242,52.455616],[13.705588,52.457699],[13.705259,52.459867],[13.70336,52.460044],[13.702096,52.464366],[13.69908,52.468278],[13.701259,52.468223],[13.701913,52.467534],[13.705701,52.465559],[13.711517,52.463289],[13.713352,52.462997],[13.715964,52.462916],[13.720585,52.456751],[13.72908,52.450783],[13.732716,52.45036],[13.734351,52.450736],[13.735561,52.450608],[13.735609,52.450256],[13.737759,52.449642],[13.743302,52.448938],[13.744788,52.449236],[13.749248,52.448668],[13.753486,52.447587],[13.755037,52.446544],[13.755395,52.446002],[13.756442,52.446174],[13.754379,52.44328],[13.757085,52.442962],[13.755318,52.438418],[13.760938,52.437878],[13.760947,52.43732],[13.759988,52.43617],[13.754447,52.436681],[13.756304,52.441613],[13.750506,52.441482],[13.744072,52.438071],[13.742886,52.432938],[13.738276,52.433291],[13.738196,52.432962],[13.73143,52.433803],[13.727464,52.435032],[13.722808,52.437144],[13.722802,52.436825],[13.726317,52.435184],[13.729693,52.433982],[13.733245,52.433223],[13.740104,52.432473],[13.738942,52.428855],[13.741725,52.428195],[13.741275,52.426765],[13.740767,52.42642],[13.739617,52.426666],[13.739491,52.426424],[13.737659,52.426694],[13.731069,52.42051],[13.731385,52.41918],[13.729806,52.416345],[13.730256,52.41535],[13.733348,52.412483],[13.734611,52.410571],[13.735847,52.410299],[13.73717,52.409642],[13.739035,52.407336],[13.737975,52.406718],[13.735361,52.405984],[13.734164,52.403343],[13.73427,52.402135],[13.731306,52.400078],[13.730291,52.399669],[13.72979,52.399722],[13.729408,52.400202],[13.728972,52.400091],[13.72886,52.39977],[13.727451,52.400233],[13.726437,52.399607],[13.725792,52.399532],[13.725444,52.399704],[13.724642,52.398848],[13.722789,52.398257],[13.719843,52.399069],[13.718784,52.398762],[13.718052,52.398819],[13.717567,52.398927],[13.716977,52.399639],[13.71587,52.399694],[13.714127,52.398832],[13.713594,52.397997],[13.712067,52.397529],[13.710179,52.396194],[13.709852,52.396374]]]}},{"type":"Feature","properties":{"geometry_id":"4729195e2a46","bezirk_id":"kreuzberg_west","name":"Kreuzberg","east_west":"west","ortsteile":["Kreuzberg"],"color":"#96CEB4"},"geometry":{"type":"Polygon","coordinates":[[[13.404434,52.507775],[13.400229,52.509381],[13.399232,52.508077],[13.378938,52.50693],[13.377649,52.507968],[13.374977,52.503378],[13.374681,52.503235],[13.374399,52.503389],[13.373606,52.504163],[13.371382,52.501573],[13.370846,52.499899],[13.369528,52.49887],[13.369601,52.498109],[13.368678,52.497385],[13.368581,52.493956],[13.368215,52.493331],[13.371077,52.492913],[13.371069,52.492757],[13.376434,52.491676],[13.375475,52.490456],[13.375399,52.489432],[13.374731,52.48938],[13.373536,52.487982],[13.373502,52.487746],[13.374164,52.487711],[13.374021,52.48517],[13.371643,52.485184],[13.371569,52.484951],[13.386269,52.484864],[13.386291,52.485826],[13.394253,52.485771],[13.39424,52.484105],[13.400229,52.483905],[13.406395,52.48277],[13.406865,52.48548],[13.408529,52.487142],[13.407886,52.488861],[13.420843,52.487168],[13.423682,52.486358],[13.425411,52.488085],[13.420401,52.495864],[13.422619,52.495408],[13.438271,52.490376],[13.439264,52.48961],[13.439628,52.489659],[13.440037,52.490733],[13.444976,52.494423],[13.445819,52.494717],[13.447659,52.494721],[13.450908,52.497108],[13.452244,52.497506],[13.453352,52.497525],[13.451645,52.498843],[13.45111,52.498911],[13.450593,52.498675],[13.449638,52.499481],[13.446512,52.500514],[13.441466,52.502914],[13.43713,52.50456],[13.435479,52.505645],[13.429402,52.508572],[13.4272,52.505666],[13.426709,52.505799],[13.424951,52.50518],[13.423078,52.504981],[13.421542,52.505076],[13.419431,52.505649],[13.418943,52.50506],[13.418213,52.505018],[13.417601,52.50417],[13.414909,52.504916],[13.414073,52.504038],[13.411521,52.504891],[13.409971,52.506926],[13.408029,52.50618],[13.405285,52.508211],[13.404434,52.507775]]]}},{"type":"Feature","properties":{"geometry_id":"6ffad5ceab11","bezirk_id":"lichtenberg_east","name":"Lichtenberg","east_west":"east","ortsteile":["Biesdorf","Fennpfuhl","Friedrichsfelde","Hellersdorf","Karlshorst","Kaulsdorf","Lichtenberg","Mahlsdorf","Marzahn","Rummelsburg"],"color":"#FFEAA7"},"geometry":{"type":"Polygon","coordinates":[[[13.555046,52.473614],[13.547991,52.473866],[13.548478,52.473312],[13.542068,52.473988],[13.539848,52.474979],[13.530772,52.467938],[13.523668,52.473864],[13.521581,52.475218],[13.520315,52.47407],[13.516519,52.475373],[13.514617,52.475697],[13.512968,52.475661],[13.507847,52.474904],[13.504324,52.478125],[13.501891,52.482574],[13.497853,52.483284],[13.494179,52.483121],[13.492741,52.485817],[13.490709,52.487444],[13.491454,52.488266],[13.488813,52.489249],[13.488462,52.489888],[13.486087,52.490799],[13.484936,52.491604],[13.484145,52.491658],[13.47308,52.498991],[13.468573,52.499652],[13.470207,52.503743],[13.471163,52.505134],[13.472827,52.506707],[13.473409,52.506924],[13.473066,52.507126],[13.475828,52.510257],[13.476266,52.510441],[13.475438,52.513433],[13.475887,52.514863],[13.477485,52.514389],[13.477748,52.514729],[13.476547,52.515173],[13.474197,52.519117],[13.47376,52.519088],[13.472554,52.520527],[13.469911,52.522635],[13.467095,52.523818],[13.462756,52.524504],[13.459668,52.52551],[13.458179,52.526399],[13.456196,52.528265],[13.460674,52.529358],[13.463389,52.532634],[13.468743,52.534712],[13.467796,52.536133],[13.466384,52.536657],[13.467648,52.53845],[13.46731,52.538495],[13.469841,52.540458],[13.47132,52.538074],[13.475569,52.533119],[13.477011,52.533487],[13.478731,52.533413],[13.495506,52.534504],[13.505649,52.534954],[13.50583,52.534786],[13.519251,52.535708],[13.523066,52.536275],[13.527844,52.537803],[13.531593,52.5386],[13.531291,52.538893],[13.532265,52.539315],[13.531898,52.539528],[13.530992,52.541736],[13.527238,52.552273],[13.525354,52.55532],[13.533951,52.560388],[13.54117,52.566005],[13.543917,52.566618],[13.545625,52.567768],[13.564414,52.572196],[13.566465,52.57293],[13.566552,52.573164],[13.566142,52.573015],[13.567705,52.574509],[13.568572,52.573104],[13.569159,52.573082],[13.569083,52.573366],[13.571408,52.573236],[13.574972,52.573834],[13.576968,52.572902],[13.577887,52.571126],[13.581542,52.571106],[13.583346,52.567747],[13.583168,52.565213],[13.583933,52.563762],[13.583831,52.562607],[13.584431,52.559857],[13.584885,52.559082],[13.586479,52.557691],[13.5876,52.555624],[13.587771,52.553328],[13.586382,52.549785],[13.587412,52.549452],[13.618714,52.544214],[13.634399,52.542825],[13.63545,52.542305],[13.637373,52.542254],[13.637646,52.540921],[13.634905,52.538224],[13.634554,52.537928],[13.634164,52.538028],[13.633946,52.537653],[13.63161,52.538002],[13.630583,52.537621],[13.628858,52.537977],[13.628221,52.53757],[13.627539,52.537485],[13.624822,52.538105],[13.625744,52.534039],[13.624811,52.533585],[13.625688,52.530184],[13.626006,52.530402],[13.626736,52.530127],[13.631559,52.530572],[13.640631,52.530422],[13.646255,52.52968],[13.656911,52.529837],[13.658032,52.526529],[13.658502,52.525945],[13.655354,52.524073],[13.642459,52.51855],[13.63578,52.514216],[13.633139,52.511708],[13.629206,52.50615],[13.626766,52.499071],[13.624006,52.494198],[13.625844,52.493605],[13.629718,52.493037],[13.614893,52.480762],[13.613551,52.475619],[13.615452,52.4753],[13.616486,52.47483],[13.611313,52.470477],[13.608153,52.471091],[13.608376,52.472855],[13.60307,52.472786],[13.586342,52.481122],[13.581875,52.479971],[13.579716,52.481024],[13.575118,52.479479],[13.574441,52.47752],[13.573839,52.47697],[13.573879,52.476507],[13.573425,52.476795],[13.57306,52.476656],[13.567723,52.474582],[13.566633,52.473723],[13.56567,52.473599],[13.565128,52.473957],[13.563094,52.473467],[13.559643,52.473242],[13.557345,52.473291],[13.555046,52.473614]]]}},{"type":"Feature","properties":{"geometry_id":"daadf90b11a0","bezirk_id":"mitte_east","name":"Mitte","east_west":"east","ortsteile":["Mitte"],"color":"#DDA0DD"},"geometry":{"type":"Polygon","coordinates":[[[13.379711,52.540115],[13.374546,52.537033],[13.372982,52.538037],[13.368607,52.53599],[13.367883,52.536621],[13.36586,52.53566],[13.373837,52.527683],[13.373797,52.526963],[13.373367,52.526526],[13.371004,52.526498],[13.370993,52.525236],[13.371721,52.524785],[13.371692,52.522781],[13.373611,52.522615],[13.375324,52.521859],[13.37592,52.521216],[13.37622,52.520148],[13.376862,52.51963],[13.377189,52.51683],[13.376629,52.516306],[13.377374,52.515638],[13.376697,52.512769],[13.376377,52.509005],[13.378938,52.50693],[13.399232,52.508077],[13.400229,52.509381],[13.404434,52.507775],[13.405285,52.508211],[13.408029,52.50618],[13.409971,52.506926],[13.411521,52.504891],[13.414073,52.504038],[13.414909,52.504916],[13.417601,52.50417],[13.418213,52.505018],[13.418943,52.50506],[13.419431,52.505649],[13.421542,52.505076],[13.423078,52.504981],[13.424951,52.50518],[13.426709,52.505799],[13.4272,52.505666],[13.429402,52.508572],[13.422779,52.512235],[13.425096,52.51507],[13.426754,52.517959],[13.426151,52.518069],[13.426305,52.518289],[13.425927,52.518392],[13.426917,52.519744],[13.428401,52.519586],[13.429181,52.521224],[13.425548,52.522791],[13.426521,52.522939],[13.426502,52.523291],[13.423769,52.523965],[13.41543,52.527462],[13.411298,52.528623],[13.405586,52.529665],[13.406426,52.532347],[13.40835,52.534348],[13.407486,52.53469],[13.404705,52.540188],[13.404191,52.540401],[13.393521,52.537422],[13.390149,52.535357],[13.387731,52.533139],[13.382095,52.537744],[13.379711,52.540115]]]}},{"type":"Feature","properties":{"geometry_id":"6755aaf86204","bezirk_id":"neukoelln_west","name":"Neukölln","east_west":"west","ortsteile":["Britz","Buckow","Gropiusstadt","Neukölln","Rudow"],"color":"#98D8C8"},"geometry":{"type":"Polygon","coordinates":[[[13.46598,52.44891],[13.497768,52.433427],[13.507639,52.42888],[13.513103,52.42737],[13.520507,52.426559],[13.518438,52.42291],[13.518651,52.422255],[13.520504,52.420836],[13.520845,52.419543],[13.522123,52.418432],[13.522222,52.416922],[13.522961,52.41545],[13.522261,52.41443],[13.524063,52.413592],[13.523014,52.412135],[13.52348,52.41167],[13.522934,52.41104],[13.523207,52.410813],[13.521789,52.407442],[13.520707,52.406293],[13.519053,52.405123],[13.519331,52.40494],[13.516652,52.403334],[13.51698,52.402839],[13.515985,52.402186],[13.516003,52.401788],[13.513025,52.401047],[13.508169,52.400265],[13.495029,52.398569],[13.490559,52.397758],[13.486478,52.397416],[13.483548,52.396937],[13.47976,52.395945],[13.478952,52.39998],[13.477608,52.402718],[13.47761,52.403429],[13.476846,52.404259],[13.471011,52.414062],[13.468018,52.420033],[13.463548,52.42108],[13.458947,52.420482],[13.454685,52.419454],[13.447903,52.417159],[13.447056,52.416685],[13.431932,52.412515],[13.419584,52.410184],[13.419677,52.410491],[13.418161,52.410798],[13.414267,52.412314],[13.410584,52.41332],[13.407561,52.413401],[13.402505,52.412711],[13.399497,52.418019],[13.400121,52.418773],[13.404815,52.420003],[13.405468,52.421764],[13.402601,52.422161],[13.405763,52.426461],[13.406867,52.430139],[13.41038,52.436144],[13.410568,52.437453],[13.412376,52.442033],[13.416837,52.452239],[13.417683,52.452202],[13.421197,52.456752],[13.42657,52.4567],[13.424616,52.457898],[13.420608,52.459368],[13.421425,52.460655],[13.423233,52.460404],[13.423009,52.461318],[13.421972,52.461516],[13.42214,52.462512],[13.42171,52.463497],[13.421542,52.465839],[13.41688,52.465396],[13.413488,52.478708],[13.410885,52.477724],[13.406672,52.478218],[13.406802,52.478862],[13.406063,52.480986],[13.406823,52.485393],[13.408529,52.487142],[13.407886,52.488861],[13.420843,52.487168],[13.423682,52.486358],[13.425411,52.488085],[13.420401,52.495864],[13.422619,52.495408],[13.438271,52.490376],[13.439264,52.48961],[13.439628,52.489659],[13.439657,52.489909],[13.444444,52.487458],[13.446763,52.488955],[13.456067,52.484254],[13.458135,52.48582],[13.470573,52.476906],[13.469607,52.473994],[13.469796,52.473333],[13.478479,52.464987],[13.478549,52.463981],[13.477197,52.461993],[13.475798,52.460913],[13.47498,52.459473],[13.47497,52.458764],[13.45723,52.459259],[13.45698,52.459108],[13.462666,52.451203],[13.463915,52.450192],[13.46598,52.44891]]]}},{"type":"Feature","properties":{"geometry_id":"0376b873ef8d","bezirk_id":"pankow_east","name":"Pankow","east_west":"east","ortsteile":["Blankenburg","Blankenfelde","Buch","Französisch Buchholz","Heinersdorf","Karow","Niederschönhausen","Pankow","Rosenthal","Wilhelmsruh"],"color":"#F7DC6F"},"geometry":{"type":"MultiPolygon","coordinates":[[[[13.435608,52.5588],[13.428962,52.556407],[13.430222,52.551707],[13.429976,52.551545],[13.427277,52.552588],[13.414934,52.553951],[13.414493,52.55744],[13.402984,52.557988],[13.397922,52.558586],[13.397098,52.558268],[13.395905,52.561822],[13.39319,52.564557],[13.388918,52.567001],[13.38906,52.56738],[13.388381,52.567679],[13.389282,52.568243],[13.387775,52.569147],[13.388264,52.569479],[13.383082,52.572333],[13.382239,52.572021],[13.379685,52.572524],[13.378917,52.573455],[13.378589,52.573413],[13.378483,52.573716],[13.378157,52.573614],[13.375144,52.575632],[13.371181,52.577289],[13.364011,52.581468],[13.363868,52.581252],[13.363451,52.581433],[13.358814,52.584172],[13.357818,52.584387],[13.352104,52.587534],[13.349791,52.58891],[13.34992,52.589239],[13.349133,52.5892],[13.347557,52.590083],[13.351756,52.590794],[13.360649,52.59127],[13.37057,52.59948],[13.376212,52.607738],[13.376284,52.611129],[13.375228,52.614226],[13.371554,52.619695],[13.366928,52.625346],[13.366939,52.625851],[13.367219,52.625751],[13.367657,52.626006],[13.367684,52.625715],[13.36853,52.625579],[13.369162,52.625829],[13.369135,52.626033],[13.36951,52.626014],[13.370175,52.627069],[13.370803,52.627375],[13.371484,52.62716],[13.371605,52.627401],[13.372322,52.627271],[13.373547,52.6278],[13.374142,52.627676],[13.374186,52.627918],[13.374572,52.627767],[13.375452,52.628679],[13.376378,52.628378],[13.375827,52.629038],[13.376679,52.628895],[13.376366,52.629215],[13.37685,52.629156],[13.377022,52.629819],[13.376282,52.630806],[13.376344,52.631369],[13.375822,52.631607],[13.376358,52.631783],[13.376473,52.632141],[13.376869,52.632175],[13.376564,52.632414],[13.377193,52.632674],[13.376793,52.632916],[13.377274,52.633188],[13.377618,52.633071],[13.378709,52.634353],[13.379401,52.633872],[13.380105,52.634278],[13.379967,52.634408],[13.382859,52.635217],[13.382693,52.635747],[13.381935,52.635952],[13.381814,52.636397],[13.382958,52.636349],[13.383326,52.636636],[13.383498,52.636434],[13.383935,52.636462],[13.384026,52.636184],[13.384761,52.636448],[13.38508,52.636263],[13.38515,52.636519],[13.386374,52.636743],[13.386358,52.636926],[13.387617,52.637238],[13.388228,52.637174],[13.388621,52.637594],[13.389205,52.637624],[13.389061,52.638131],[13.389936,52.639122],[13.389613,52.639373],[13.39061,52.639915],[13.389911,52.640538],[13.390402,52.640853],[13.389687,52.641225],[13.389659,52.641519],[13.390181,52.641346],[13.390397,52.641505],[13.390045,52.64157],[13.390464,52.641825],[13.390205,52.642154],[13.390591,52.642194],[13.390145,52.642436],[13.390899,52.642472],[13.390669,52.642622],[13.391304,52.643176],[13.3913,52.643547],[13.392248,52.643276],[13.392287,52.643652],[13.391502,52.643633],[13.392286,52.643705],[13.391745,52.643841],[13.392172,52.644042],[13.39183,52.644199],[13.391961,52.64446],[13.392331,52.644404],[13.391912,52.644749],[13.392407,52.644783],[13.392949,52.645235],[13.392718,52.645307],[13.392848,52.645467],[13.392846,52.645323],[13.393178,52.645411],[13.392932,52.645562],[13.393298,52.645798],[13.393148,52.645964],[13.393867,52.646317],[13.394502,52.647532],[13.396389,52.647424],[13.39727,52.64815],[13.397938,52.648289],[13.397906,52.648115],[13.403241,52.645187],[13.40659,52.643846],[13.407885,52.642686],[13.412292,52.643482],[13.413629,52.642466],[13.414736,52.642385],[13.414751,52.64178],[13.414258,52.64124],[13.41655,52.639434],[13.424355,52.635465],[13.427631,52.637512],[13.432723,52.637378],[13.434261,52.637954],[13.43339,52.641474],[13.434009,52.644283],[13.43979,52.645267],[13.440821,52.649263],[13.441546,52.649384],[13.44161,52.649023],[13.442773,52.649124],[13.44331,52.649538],[13.444913,52.649502],[13.44749,52.650025],[13.448737,52.650001],[13.452098,52.649672],[13.452085,52.648699],[13.459733,52.648081],[13.460414,52.648477],[13.462209,52.648893],[13.463057,52.649924],[13.465724,52.651169],[13.467075,52.651653],[13.469267,52.651665],[13.469967,52.651863],[13.472176,52.653411],[13.473907,52.654119],[13.474263,52.655752],[13.473513,52.656531],[13.462383,52.65754],[13.453945,52.66185],[13.450786,52.662667],[13.455506,52.665749],[13.459554,52.668975],[13.465928,52.667118],[13.475493,52.675008],[13.477273,52.673901],[13.479488,52.675508],[13.480084,52.674858],[13.476466,52.671358],[13.474532,52.668222],[13.475681,52.667535],[13.475697,52.666652],[13.477975,52.667678],[13.485219,52.66964],[13.488424,52.670787],[13.485359,52.659426],[13.49076,52.654797],[13.503143,52.649971],[13.504723,52.649564],[13.512828,52.645399],[13.515187,52.646119],[13.519267,52.646945],[13.520391,52.644877],[13.523022,52.645035],[13.52244,52.640761],[13.521719,52.63866],[13.518471,52.631697],[13.517816,52.629565],[13.511392,52.627787],[13.505855,52.625752],[13.505458,52.619975],[13.503703,52.619261],[13.503308,52.618993],[13.498509,52.610743],[13.496662,52.605028],[13.494433,52.602693],[13.493756,52.602232],[13.483538,52.60006],[13.47852,52.591272],[13.471251,52.589706],[13.467072,52.587512],[13.461967,52.584415],[13.462553,52.577631],[13.45764,52.577267],[13.457347,52.573835],[13.458076,52.572542],[13.458292,52.570091],[13.45762,52.567409],[13.4549,52.567177],[13.448807,52.564467],[13.448426,52.564525],[13.448145,52.564143],[13.4425,52.562039],[13.435608,52.5588]],[[13.434045,52.642167],[13.433624,52.642132],[13.433585,52.641891],[13.433925,52.641982],[13.434045,52.642167]]],[[[13.3927,52.645582],[13.392921,52.645666],[13.392786,52.645495],[13.3927,52.645582]]],[[[13.393021,52.646006],[13.393066,52.646009],[13.393058,52.645909],[13.393021,52.646006]]],[[[13.50344,52.618994],[13.504672,52.619534],[13.505452,52.619888],[13.505438,52.619686],[13.50344,52.618994]]]]}},{"type":"Feature","properties":{"geometry_id":"570bde24cc84","bezirk_id":"prenzlauer_berg_east","name":"Prenzlauer Berg","east_west":"east","ortsteile":["Prenzlauer Berg"],"color":"#BB8FCE"},"geometry":{"type":"Polygon","coordinates":[[[13.40329,52.557973],[13.397922,52.558586],[13.397124,52.55831],[13.397177,52.556344],[13.398064,52.5526],[13.39763,52.551418],[13.396846,52.550704],[13.3989,52.550886],[13.399234,52.549068],[13.400304,52.546646],[13.399207,52.54653],[13.400246,52.543376],[13.402031,52.540125],[13.403378,52.540506],[13.403528,52.540213],[13.404191,52.540401],[13.404705,52.540188],[13.407486,52.53469],[13.40835,52.534348],[13.406426,52.532347],[13.405586,52.529665],[13.411298,52.528623],[13.41543,52.527462],[13.419753,52.525546],[13.423642,52.527915],[13.424854,52.527878],[13.425027,52.528095],[13.437482,52.529548],[13.438311,52.5288],[13.438748,52.528778],[13.442277,52.531026],[13.447168,52.526408],[13.452182,52.527798],[13.4558,52.522552],[13.456156,52.522456],[13.45529,52.521272],[13.462695,52.519928],[13.472107,52.520694],[13.470299,52.522379],[13.468585,52.523299],[13.466023,52.524062],[13.462756,52.524504],[13.459118,52.525768],[13.456196,52.528265],[13.460674,52.529358],[13.463389,52.532634],[13.468743,52.534712],[13.467796,52.536133],[13.466384,52.536657],[13.467648,52.53845],[13.455058,52.543674],[13.455622,52.544048],[13.455069,52.544645],[13.454758,52.544537],[13.454481,52.544835],[13.453597,52.544532],[13.448032,52.546808],[13.447238,52.547339],[13.447011,52.54717],[13.442747,52.548662],[13.433962,52.550947],[13.430071,52.551756],[13.429976,52.551545],[13.427277,52.552588],[13.414934,52.553951],[13.414493,52.55744],[13.40329,52.557973]]]}},{"type":"Feature","properties":{"geometry_id":"c8603286ba69","bezirk_id":"reinickendorf_west","name":"Reinickendorf","east_west":"west","ortsteile":["Borsigwalde","Frohnau","Heiligensee","Hermsdorf","Konradshöhe","Lübars","Märkisches Viertel","Reinickendorf","Tegel","Waidmannslust","Wittenau"],"color":"#85C1E9"},"geometry":{"type":"Polygon","coordinates":[[[13.227045,52.567809],[13.226725,52.56933],[13.225305,52.571222],[13.225079,52.573145],[13.223921,52.574204],[13.222042,52.57494],[13.218862,52.577158],[13.217959,52.57854],[13.218309,52.580961],[13.218084,52.581462],[13.215209,52.583875],[13.215362,52.584758],[13.216435,52.585714],[13.218878,52.590481],[13.219252,52.5914],[13.218854,52.592371],[13.218115,52.593196],[13.21532,52.594967],[13.21129,52.596823],[13.208183,52.599011],[13.205807,52.60142],[13.202324,52.604249],[13.2017,52.605492],[13.201852,52.607046],[13.202645,52.607523],[13.206036,52.608548],[13.206882,52.609136],[13.209631,52.612301],[13.214824,52.619263],[13.216763,52.620162],[13.21976,52.624438],[13.220693,52.627808],[13.220544,52.628317],[13.223005,52.628198],[13.224242,52.628414],[13.225287,52.628206],[13.225123,52.628409],[13.225876,52.628266],[13.225923,52.627857],[13.230396,52.627389],[13.235784,52.627799],[13.239695,52.627828],[13.242427,52.628296],[13.246415,52.627274],[13.249133,52.627476],[13.252517,52.627313],[13.260303,52.627743],[13.264235,52.626863],[13.265202,52.634534],[13.264684,52.635978],[13.262407,52.639064],[13.262153,52.640685],[13.269599,52.639713],[13.274244,52.640271],[13.276457,52.640206],[13.283833,52.641118],[13.284566,52.647949],[13.284241,52.648447],[13.284604,52.648343],[13.285132,52.652628],[13.281909,52.652753],[13.282769,52.660739],[13.287747,52.659836],[13.29019,52.65986],[13.293691,52.659362],[13.302525,52.659204],[13.307118,52.659619],[13.307671,52.658929],[13.308835,52.658218],[13.308639,52.658001],[13.309674,52.657363],[13.310098,52.657395],[13.300429,52.653505],[13.30843,52.643814],[13.309199,52.643946],[13.309407,52.642725],[13.30903,52.642673],[13.309179,52.641986],[13.308867,52.641937],[13.308943,52.641458],[13.308153,52.640772],[13.308232,52.640237],[13.307269,52.640108],[13.307303,52.639689],[13.30627,52.639607],[13.307062,52.637548],[13.305785,52.637355],[13.306251,52.636405],[13.309336,52.632802],[13.310185,52.63062],[13.309774,52.630608],[13.309683,52.630095],[13.310274,52.630007],[13.308873,52.629152],[13.306408,52.628728],[13.303049,52.627772],[13.302542,52.627554],[13.302609,52.62719],[13.308507,52.627952],[13.312987,52.628184],[13.318886,52.626781],[13.323837,52.626383],[13.328691,52.62544],[13.332552,52.624029],[13.332864,52.624194],[13.336684,52.622648],[13.338391,52.622929],[13.338727,52.623345],[13.339284,52.62317],[13.339641,52.623309],[13.340518,52.623137],[13.34153,52.623332],[13.342202,52.623204],[13.342859,52.623474],[13.343571,52.623416],[13.343976,52.62374],[13.346692,52.623608],[13.351072,52.623862],[13.351484,52.622729],[13.352082,52.623052],[13.352589,52.622853],[13.352463,52.623059],[13.353054,52.623401],[13.354347,52.62337],[13.354692,52.623623],[13.355876,52.623201],[13.35712,52.623197],[13.357639,52.622978],[13.358036,52.623318],[13.358376,52.623125],[13.358488,52.623382],[13.359175,52.623285],[13.359681,52.624051],[13.360544,52.623829],[13.360471,52.624042],[13.360862,52.624021],[13.360978,52.624259],[13.361897,52.624277],[13.362522,52.624776],[13.363686,52.625087],[13.364071,52.624657],[13.364219,52.624859],[13.364809,52.624846],[13.364599,52.625206],[13.365269,52.625455],[13.365832,52.625284],[13.365908,52.625476],[13.366857,52.625271],[13.367111,52.6254],[13.371554,52.619695],[13.375228,52.614226],[13.376284,52.611129],[13.376212,52.607738],[13.37057,52.59948],[13.360649,52.59127],[13.351756,52.590794],[13.347557,52.590083],[13.349133,52.5892],[13.34992,52.589239],[13.349791,52.58891],[13.352104,52.587534],[13.357818,52.584387],[13.358814,52.584172],[13.363451,52.581433],[13.363868,52.581252],[13.364011,52.581468],[13.371181,52.577289],[13.375144,52.575632],[13.378157,52.573614],[13.378483,52.573716],[13.378589,52.573413],[13.378917,52.573455],[13.379685,52.572524],[13.382239,52.572021],[13.383082,52.572333],[13.388264,52.569479],[13.387775,52.569147],[13.389282,52.568243],[13.387902,52.56731],[13.384298,52.567713],[13.38116,52.566422],[13.378585,52.566193],[13.377148,52.560662],[13.370831,52.560541],[13.366657,52.558228],[13.365104,52.558118],[13.364524,52.561176],[13.360098,52.560472],[13.359715,52.561855],[13.356897,52.562017],[13.349089,52.561929],[13.337102,52.564456],[13.331792,52.561659],[13.330923,52.562151],[13.326795,52.562382],[13.326153,52.56141],[13.324876,52.560775],[13.317764,52.559739],[13.30967,52.557722],[13.30153,52.548806],[13.259085,52.549551],[13.254244,52.550129],[13.250592,52.551334],[13.238948,52.557018],[13.238912,52.55728],[13.234563,52.559257],[13.230915,52.561484],[13.230729,52.561398],[13.228002,52.563443],[13.228688,52.565974],[13.227045,52.567809]]]}},{"type":"Feature","properties":{"geometry_id":"813dae980473","bezirk_id":"schoeneberg_west","name":"Schöneberg","east_west":"west","ortsteile":["Friedenau","Schöneberg"],"color":"#F8C471"},"geometry":{"type":"Polygon","coordinates":[[[13.336253,52.467396],[13.334832,52.466201],[13.331411,52.465857],[13.330629,52.465152],[13.329365,52.465573],[13.328164,52.464333],[13.320993,52.466963],[13.319983,52.46698],[13.320096,52.469629],[13.320521,52.47013],[13.320143,52.470745],[13.320428,52.477471],[13.332868,52.477415],[13.332986,52.477847],[13.337068,52.478132],[13.33721,52.488062],[13.336896,52.489688],[13.336966,52.490374],[13.337533,52.490716],[13.337087,52.49101],[13.337457,52.494189],[13.337284,52.495857],[13.33899,52.499417],[13.338923,52.499913],[13.336978,52.500691],[13.341421,52.504868],[13.357519,52.501105],[13.362538,52.499663],[13.369321,52.498709],[13.369528,52.49887],[13.369601,52.498109],[13.368678,52.497385],[13.368581,52.493956],[13.368215,52.493331],[13.371077,52.492913],[13.371069,52.492757],[13.376434,52.491676],[13.375475,52.490456],[13.375399,52.489432],[13.374731,52.48938],[13.373536,52.487982],[13.373502,52.487746],[13.374164,52.487711],[13.374021,52.48517],[13.371643,52.485184],[13.366183,52.475774],[13.366585,52.474483],[13.367782,52.473144],[13.369462,52.472304],[13.371084,52.472034],[13.369916,52.460528],[13.370758,52.460114],[13.370949,52.459399],[13.370609,52.458701],[13.369748,52.458397],[13.369601,52.456528],[13.370169,52.455614],[13.366654,52.455703],[13.36655,52.454621],[13.363883,52.454897],[13.36396,52.455771],[13.36192,52.455942],[13.359308,52.454841],[13.359053,52.45681],[13.35582,52.457294],[13.355976,52.455622],[13.3542,52.455642],[13.353683,52.456701],[13.352947,52.457124],[13.350893,52.456619],[13.349078,52.456775],[13.349044,52.458765],[13.347559,52.45899],[13.347821,52.459246],[13.344956,52.461719],[13.338906,52.465564],[13.338773,52.466569],[13.338482,52.466383],[13.336253,52.467396]]]}},{"type":"Feature","properties":{"geometry_id":"d583a5163208","bezirk_id":"spandau_west","name":"Spandau","east_west":"west","ortsteile":["Falkenhagener Feld","Gatow","Hakenfelde","Haselhorst","Kladow","Siemensstadt","Spandau","Staaken","Wilhelmstadt"],"color":"#82E0AA"},"geometry":{"type":"Polygon","coordinates":[[[13.18817,52.471837],[13.185305,52.462579],[13.181215,52.459625],[13.177413,52.455917],[13.17085,52.456116],[13.161727,52.452135],[13.154516,52.446598],[13.148521,52.443374],[13.133272,52.442087],[13.131724,52.441101],[13.130806,52.441414],[13.128046,52.440962],[13.126882,52.441146],[13.12412,52.440676],[13.123121,52.439615],[13.119931,52.441521],[13.119018,52.442966],[13.119011,52.444009],[13.115365,52.445652],[13.109296,52.450635],[13.11203,52.454412],[13.112674,52.457694],[13.112409,52.458995],[13.110503,52.459997],[13.111341,52.461863],[13.111429,52.463728],[13.110557,52.465657],[13.111855,52.467447],[13.113954,52.468619],[13.113788,52.4698],[13.116206,52.47168],[13.117235,52.47328],[13.117693,52.47732],[13.126277,52.478657],[13.128334,52.479821],[13.14959,52.496315],[13.158586,52.502591],[13.168824,52.509226],[13.158588,52.51294],[13.157379,52.513174],[13.147501,52.517195],[13.145631,52.517466],[13.144354,52.519193],[13.143182,52.519698],[13.141465,52.519611],[13.137433,52.518847],[13.126998,52.517547],[13.12278,52.517395],[13.119272,52.517004],[13.117382,52.517061],[13.118327,52.520748],[13.119507,52.530346],[13.120176,52.531925],[13.1212,52.533284],[13.121792,52.535045],[13.123104,52.536631],[13.124184,52.53905],[13.125605,52.543541],[13.124965,52.543792],[13.130472,52.555974],[13.132484,52.554926],[13.134448,52.553351],[13.136329,52.552707],[13.141368,52.552461],[13.143214,52.552078],[13.144223,52.552116],[13.144587,52.552547],[13.145582,52.552723],[13.146908,52.55428],[13.147287,52.555837],[13.146855,52.558619],[13.145799,52.560605],[13.147141,52.561451],[13.147517,52.564407],[13.149867,52.566762],[13.151185,52.569152],[13.151265,52.569986],[13.15239,52.570462],[13.152865,52.571602],[13.152776,52.572484],[13.153547,52.573256],[13.153598,52.577461],[13.153158,52.578945],[13.151596,52.58114],[13.15124,52.582212],[13.149886,52.582879],[13.14961,52.583361],[13.144633,52.582034],[13.143842,52.581571],[13.140049,52.580803],[13.139157,52.580389],[13.137518,52.580531],[13.136033,52.580106],[13.132477,52.579608],[13.131678,52.580228],[13.13026,52.58304],[13.129543,52.583275],[13.127965,52.583128],[13.129346,52.585931],[13.128433,52.586018],[13.128964,52.587303],[13.131078,52.58693],[13.132666,52.586921],[13.135478,52.587366],[13.138454,52.588867],[13.143506,52.589705],[13.149285,52.591873],[13.153889,52.595713],[13.157057,52.597626],[13.16453,52.598795],[13.167897,52.597011],[13.170077,52.596788],[13.17197,52.596289],[13.173668,52.595328],[13.178338,52.59488],[13.181219,52.594027],[13.183423,52.593692],[13.184473,52.593377],[13.185627,52.592554],[13.189116,52.591399],[13.191738,52.59019],[13.200347,52.588768],[13.205376,52.586853],[13.206711,52.586598],[13.20734,52.588375],[13.211238,52.588227],[13.217397,52.587477],[13.216435,52.585714],[13.215362,52.584758],[13.215209,52.583875],[13.218084,52.581462],[13.218309,52.580961],[13.217959,52.57854],[13.218862,52.577158],[13.222042,52.57494],[13.223921,52.574204],[13.225079,52.573145],[13.225305,52.571222],[13.226725,52.56933],[13.227045,52.567809],[13.228647,52.566123],[13.228656,52.565359],[13.227905,52.563873],[13.228259,52.56315],[13.233156,52.559978],[13.249449,52.551882],[13.252988,52.550453],[13.255617,52.549864],[13.258377,52.549576],[13.270337,52.549345],[13.270305,52.54865],[13.269969,52.548555],[13.270661,52.547886],[13.27337,52.542943],[13.273141,52.542909],[13.273484,52.54207],[13.272307,52.538867],[13.273929,52.53843],[13.275228,52.53769],[13.276276,52.535639],[13.282182,52.534051],[13.281242,52.530573],[13.280839,52.530067],[13.279327,52.530326],[13.278217,52.530197],[13.274686,52.52887],[13.265624,52.528806],[13.259792,52.527324],[13.253874,52.527052],[13.249806,52.52718],[13.248307,52.527546],[13.246681,52.528314],[13.246342,52.527689],[13.247112,52.52728],[13.247703,52.524574],[13.24751,52.524285],[13.23997,52.52609],[13.239835,52.525881],[13.238576,52.526114],[13.236449,52.526132],[13.231275,52.52577],[13.228181,52.52602],[13.228039,52.525712],[13.227305,52.525615],[13.22202,52.526174],[13.219696,52.522414],[13.219388,52.521421],[13.219838,52.515787],[13.220097,52.514599],[13.220948,52.513622],[13.219752,52.513577],[13.219458,52.513994],[13.218833,52.513367],[13.218472,52.513402],[13.216201,52.51134],[13.214981,52.509509],[13.215693,52.509365],[13.215583,52.50916],[13.214546,52.509369],[13.214085,52.509101],[13.213231,52.509097],[13.211862,52.509347],[13.211014,52.508523],[13.210496,52.5072],[13.208764,52.505046],[13.209347,52.504301],[13.209727,52.50291],[13.205132,52.501348],[13.19908,52.49988],[13.195208,52.49974],[13.191699,52.498676],[13.18984,52.497545],[13.189534,52.492934],[13.187549,52.49121],[13.186597,52.489292],[13.187149,52.487128],[13.189812,52.484334],[13.190167,52.482619],[13.187248,52.478654],[13.188295,52.474084],[13.18817,52.471837]]]}},{"type":"Feature","properties":{"geometry_id":"1e710fdff337","bezirk_id":"steglitz_west","name":"Steglitz","east_west":"west","ortsteile":["Lankwitz","Lichterfelde","Steglitz"],"color":"#F1948A"},"geometry":{"type":"Polygon","coordinates":[[[13.345375,52.415221],[13.342742,52.414167],[13.343098,52.4133],[13.342936,52.411727],[13.343347,52.411722],[13.318498,52.402399],[13.314137,52.400619],[13.312064,52.399105],[13.303789,52.407283],[13.295933,52.414504],[13.296724,52.414742],[13.296958,52.41505],[13.297092,52.415777],[13.296753,52.416253],[13.293225,52.414561],[13.280351,52.407365],[13.275817,52.405198],[13.271998,52.404316],[13.269014,52.404236],[13.268604,52.405762],[13.268851,52.405787],[13.268199,52.407651],[13.267689,52.407435],[13.267486,52.408823],[13.271187,52.409147],[13.273643,52.409741],[13.272207,52.413252],[13.276536,52.42545],[13.2802,52.433141],[13.281487,52.437391],[13.28194,52.438531],[13.282309,52.438735],[13.28194,52.438882],[13.283115,52.442185],[13.293768,52.445981],[13.293168,52.446472],[13.295845,52.450902],[13.30361,52.458339],[13.304228,52.458539],[13.30498,52.463202],[13.306147,52.465687],[13.308229,52.466129],[13.309942,52.467228],[13.310654,52.466902],[13.311389,52.467125],[13.320993,52.466963],[13.328164,52.464333],[13.329365,52.465573],[13.330629,52.465152],[13.331411,52.465857],[13.334832,52.466201],[13.336274,52.467417],[13.338482,52.466383],[13.338773,52.466569],[13.338906,52.465564],[13.344956,52.461719],[13.347821,52.459246],[13.347559,52.45899],[13.349044,52.458765],[13.349078,52.456775],[13.350893,52.456619],[13.352947,52.457124],[13.353683,52.456701],[13.3542,52.455642],[13.356119,52.455612],[13.371595,52.429116],[13.368545,52.427608],[13.367918,52.427611],[13.363402,52.42149],[13.360291,52.420575],[13.35927,52.419944],[13.345974,52.415442],[13.345833,52.415195],[13.345375,52.415221]]]}},{"type":"Feature","properties":{"geometry_id":"3c4a8b0453ed","bezirk_id":"tempelhof_west","name":"Tempelhof","east_west":"west","ortsteile":["Lichtenrade","Mariendorf","Marienfelde","Tempelhof"],"color":"#85929E"},"geometry":{"type":"Polygon","coordinates":[[[13.399497,52.418019],[13.402505,52.412711],[13.407561,52.413401],[13.410584,52.41332],[13.414267,52.412314],[13.418161,52.410798],[13.419677,52.410491],[13.419584,52.410184],[13.418748,52.409979],[13.418296,52.407994],[13.418419,52.407078],[13.425831,52.390583],[13.427446,52.386176],[13.427457,52.385782],[13.420813,52.37614],[13.412643,52.37641],[13.412835,52.376878],[13.409889,52.376585],[13.397119,52.377584],[13.388432,52.377862],[13.38809,52.37936],[13.388225,52.382131],[13.3873,52.388574],[13.37785,52.388146],[13.370355,52.388427],[13.371951,52.393797],[13.359366,52.39847],[13.350832,52.402903],[13.343058,52.407686],[13.343347,52.411722],[13.342936,52.411727],[13.343098,52.4133],[13.342742,52.414167],[13.35927,52.419944],[13.360291,52.420575],[13.363402,52.42149],[13.367918,52.427611],[13.368545,52.427608],[13.371595,52.429116],[13.357258,52.453327],[13.355911,52.455773],[13.355703,52.457173],[13.355896,52.457297],[13.359167,52.456766],[13.359006,52.455578],[13.359308,52.454841],[13.36192,52.455942],[13.36396,52.455771],[13.363883,52.454897],[13.36655,52.454621],[13.366654,52.455703],[13.370169,52.455614],[13.369601,52.456528],[13.369748,52.458397],[13.370609,52.458701],[13.370949,52.459399],[13.370758,52.460114],[13.369916,52.460528],[13.371084,52.472034],[13.369462,52.472304],[13.367782,52.473144],[13.366585,52.474483],[13.366183,52.475774],[13.371569,52.484951],[13.386269,52.484864],[13.386291,52.485826],[13.394253,52.485771],[13.39424,52.484105],[13.400229,52.483905],[13.406395,52.48277],[13.406063,52.480986],[13.406802,52.478862],[13.406623,52.478234],[13.410885,52.477724],[13.413488,52.478708],[13.41688,52.465396],[13.421542,52.465839],[13.42171,52.463497],[13.42214,52.462512],[13.421972,52.461516],[13.423009,52.461318],[13.423233,52.460404],[13.421425,52.460655],[13.420608,52.459368],[13.424616,52.457898],[13.42657,52.4567],[13.421197,52.456752],[13.417683,52.452202],[13.416837,52.452239],[13.412376,52.442033],[13.410568,52.437453],[13.41038,52.436144],[13.406867,52.430139],[13.405763,52.426461],[13.402601,52.422161],[13.405468,52.421764],[13.404815,52.420003],[13.400121,52.418773],[13.399497,52.418019]]]}},{"type":"Feature","properties":{"geometry_id":"c79c45452da8","bezirk_id":"tiergarten_west","name":"Tiergarten","east_west":"west","ortsteile":["Hansaviertel","Moabit","Tiergarten"],"color":"#D5A6BD"},"geometry":{"type":"Polygon","coordinates":[[[13.37174,52.522783],[13.373611,52.522615],[13.375324,52.521859],[13.37592,52.521216],[13.37622,52.520148],[13.376862,52.51963],[13.377189,52.51683],[13.376629,52.516306],[13.377374,52.515638],[13.376697,52.512769],[13.376377,52.509005],[13.377649,52.507968],[13.374977,52.503378],[13.374681,52.503235],[13.374399,52.503389],[13.373606,52.504163],[13.371382,52.501573],[13.370846,52.499899],[13.369321,52.498709],[13.362538,52.499663],[13.357519,52.501105],[13.346867,52.503643],[13.340426,52.505103],[13.339068,52.505074],[13.338638,52.50592],[13.335735,52.505799],[13.334001,52.506518],[13.33375,52.506721],[13.334862,52.50821],[13.334687,52.508736],[13.330043,52.510075],[13.332755,52.51097],[13.334027,52.511716],[13.331194,52.512307],[13.330559,52.512831],[13.335854,52.513293],[13.336136,52.514377],[13.334793,52.515504],[13.334215,52.516772],[13.331843,52.516816],[13.330728,52.517208],[13.329634,52.517954],[13.329099,52.518989],[13.32955,52.52083],[13.329255,52.521843],[13.328185,52.522885],[13.325503,52.524325],[13.323252,52.524687],[13.320534,52.524292],[13.31955,52.523776],[13.318942,52.523075],[13.318779,52.521115],[13.317798,52.520367],[13.316649,52.520963],[13.313354,52.530261],[13.316748,52.530905],[13.316614,52.531162],[13.317305,52.531545],[13.317052,52.53205],[13.317515,52.532377],[13.31303,52.531874],[13.311413,52.535614],[13.326827,52.537749],[13.329134,52.53823],[13.327191,52.539646],[13.327326,52.541431],[13.328692,52.541098],[13.333652,52.541247],[13.339351,52.539755],[13.34704,52.538743],[13.34895,52.538816],[13.35367,52.539703],[13.354591,52.539627],[13.360983,52.53792],[13.361188,52.537836],[13.360926,52.537724],[13.361395,52.537573],[13.362785,52.537784],[13.36519,52.53706],[13.365985,52.536525],[13.366286,52.536004],[13.365696,52.53582],[13.368932,52.532848],[13.370879,52.530449],[13.373837,52.527683],[13.373797,52.526963],[13.373367,52.526526],[13.371004,52.526498],[13.370993,52.525236],[13.371721,52.524785],[13.37174,52.522783]]]}},{"type":"Feature","properties":{"geometry_id":"093a97c815b4","bezirk_id":"treptow_east","name":"Treptow","east_west":"east","ortsteile":["Adlershof","Alt-Treptow","Altglienicke","Baumschulenweg","Bohnsdorf","Johannisthal","Niederschöneweide","Oberschöneweide","Plänterwald"],"color":"#AED6F1"},"geometry":{"type":"Polygon","coordinates":[[[13.566009,52.417361],[13.572907,52.413046],[13.573162,52.411827],[13.574885,52.409328],[13.577506,52.408971],[13.580617,52.407158],[13.583289,52.40596],[13.586959,52.403638],[13.5843,52.401333],[13.586466,52.399405],[13.588548,52.399647],[13.590361,52.397174],[13.592994,52.396905],[13.593257,52.395613],[13.592676,52.394379],[13.592802,52.393835],[13.582896,52.391459],[13.574371,52.390115],[13.564159,52.388135],[13.535492,52.388991],[13.534825,52.390772],[13.535152,52.393507],[13.536693,52.39721],[13.536306,52.397823],[13.53721,52.398037],[13.537075,52.398252],[13.538432,52.400633],[13.529693,52.397302],[13.526388,52.398936],[13.524601,52.399384],[13.521798,52.400571],[13.518627,52.401092],[13.516003,52.401788],[13.515985,52.402186],[13.51698,52.402839],[13.516652,52.403334],[13.519331,52.40494],[13.519053,52.405123],[13.520707,52.406293],[13.521789,52.407442],[13.523207,52.410813],[13.522934,52.41104],[13.52348,52.41167],[13.523014,52.412135],[13.524063,52.413592],[13.522261,52.41443],[13.522961,52.41545],[13.522222,52.416922],[13.522123,52.418432],[13.520845,52.419543],[13.520504,52.420836],[13.518651,52.422255],[13.518438,52.42291],[13.520507,52.426559],[13.512698,52.427444],[13.509757,52.428156],[13.507147,52.429073],[13.466142,52.448829],[13.462666,52.451203],[13.456995,52.459196],[13.47497,52.458764],[13.47498,52.459473],[13.475798,52.460913],[13.477197,52.461993],[13.478549,52.463981],[13.478479,52.464987],[13.469796,52.473333],[13.469607,52.473994],[13.470573,52.476906],[13.458135,52.48582],[13.456067,52.484254],[13.446763,52.488955],[13.444444,52.487458],[13.439657,52.489909],[13.440037,52.490733],[13.444976,52.494423],[13.445819,52.494717],[13.447729,52.494749],[13.451512,52.497354],[13.452711,52.497577],[13.455071,52.497421],[13.459483,52.496544],[13.461926,52.495589],[13.463384,52.495379],[13.463983,52.495025],[13.4632,52.494215],[13.464215,52.493742],[13.471019,52.49149],[13.473789,52.491036],[13.475443,52.490329],[13.477688,52.488785],[13.478638,52.487031],[13.479423,52.487923],[13.481684,52.487635],[13.482956,52.486046],[13.486739,52.487649],[13.488504,52.487836],[13.490709,52.487444],[13.492741,52.485817],[13.494179,52.483121],[13.497853,52.483284],[13.501891,52.482574],[13.504324,52.478125],[13.507847,52.474904],[13.512968,52.475661],[13.514617,52.475697],[13.516519,52.475373],[13.520315,52.47407],[13.521581,52.475218],[13.523668,52.473864],[13.530772,52.467938],[13.539848,52.474979],[13.542068,52.473988],[13.548478,52.473312],[13.551618,52.46978],[13.552739,52.469246],[13.552323,52.468777],[13.552492,52.468549],[13.561507,52.458705],[13.563811,52.456551],[13.566353,52.455797],[13.566638,52.45549],[13.564581,52.454717],[13.565796,52.454285],[13.564965,52.453109],[13.562855,52.453456],[13.561487,52.453171],[13.558223,52.453145],[13.559351,52.439411],[13.560053,52.437335],[13.562709,52.433628],[13.563396,52.432155],[13.563691,52.430509],[13.563419,52.426714],[13.554363,52.425689],[13.566009,52.417361]]]}},{"type":"Feature","properties":{"geometry_id":"ced394da8bf9","bezirk_id":"wedding_west","name":"Wedding","east_west":"west","ortsteile":["Gesundbrunnen","Wedding"],"color":"#A9DFBF"},"geometry":{"type":"Polygon","coordinates":[[[13.366884,52.558345],[13.370831,52.560541],[13.377148,52.560662],[13.378585,52.566193],[13.38116,52.566422],[13.384298,52.567713],[13.387902,52.56731],[13.388655,52.567659],[13.38906,52.56738],[13.388918,52.567001],[13.39339,52.564405],[13.396216,52.56129],[13.398067,52.552806],[13.39763,52.551418],[13.396846,52.550704],[13.3989,52.550886],[13.399234,52.549068],[13.400304,52.546646],[13.399207,52.54653],[13.400246,52.543376],[13.402031,52.540125],[13.403378,52.540506],[13.403528,52.540213],[13.393521,52.537422],[13.390149,52.535357],[13.387731,52.533139],[13.382095,52.537744],[13.379711,52.540115],[13.374546,52.537033],[13.372982,52.538037],[13.368607,52.53599],[13.367883,52.536621],[13.36586,52.53566],[13.365696,52.53582],[13.366286,52.536004],[13.36519,52.53706],[13.362663,52.537809],[13.361373,52.537578],[13.360926,52.537724],[13.361188,52.537836],[13.360983,52.53792],[13.354389,52.539663],[13.352583,52.539574],[13.348773,52.538792],[13.347136,52.538737],[13.339351,52.539755],[13.333652,52.541247],[13.328055,52.541168],[13.326233,52.541874],[13.317936,52.548238],[13.30153,52.548806],[13.30967,52.557722],[13.317764,52.559739],[13.324876,52.560775],[13.326153,52.56141],[13.326795,52.562382],[13.330923,52.562151],[13.331792,52.561659],[13.337102,52.564456],[13.349089,52.561929],[13.356897,52.562017],[13.359715,52.561855],[13.360098,52.560472],[13.364524,52.561176],[13.365104,52.558118],[13.366884,52.558345]]]}},{"type":"Feature","properties":{"geometry_id":"91d1921895a9","bezirk_id":"weissensee_east","name":"Weißensee","east_west":"east","ortsteile":["Alt-Hohenschönhausen","Falkenberg","Malchow","Neu-Hohenschönhausen","Stadtrandsiedlung Malchow","Wartenberg","Weißensee"],"color":"#F9E79F"},"geometry":{"type":"Polygon","coordinates":[[[13.525354,52.55532],[13.527238,52.552273],[13.530992,52.541736],[13.531898,52.539528],[13.532265,52.539315],[13.531291,52.538893],[13.531593,52.5386],[13.527844,52.537803],[13.523066,52.536275],[13.519251,52.535708],[13.50583,52.534786],[13.505649,52.534954],[13.495506,52.534504],[13.478731,52.533413],[13.477011,52.533487],[13.475569,52.533119],[13.47132,52.538074],[13.469841,52.540458],[13.46731,52.538495],[13.455058,52.543674],[13.455622,52.544048],[13.455069,52.544645],[13.454758,52.544537],[13.454481,52.544835],[13.453597,52.544532],[13.448032,52.546808],[13.447238,52.547339],[13.447011,52.54717],[13.442747,52.548662],[13.433962,52.550947],[13.430222,52.551707],[13.428962,52.556407],[13.435608,52.5588],[13.4425,52.562039],[13.448145,52.564143],[13.448426,52.564525],[13.448807,52.564467],[13.4549,52.567177],[13.45762,52.567409],[13.458292,52.570091],[13.458076,52.572542],[13.457347,52.573835],[13.45764,52.577267],[13.462553,52.577631],[13.461967,52.584415],[13.467072,52.587512],[13.471251,52.589706],[13.47852,52.591272],[13.483538,52.60006],[13.493756,52.602232],[13.496662,52.605028],[13.498974,52.605162],[13.508119,52.592138],[13.522879,52.592748],[13.527694,52.592235],[13.547125,52.587853],[13.546987,52.587643],[13.555472,52.58415],[13.56056,52.581248],[13.564523,52.578197],[13.567705,52.574509],[13.566142,52.573015],[13.566552,52.573164],[13.566465,52.57293],[13.564414,52.572196],[13.545625,52.567768],[13.543917,52.566618],[13.54117,52.566005],[13.533951,52.560388],[13.525354,52.55532]]]}},{"type":"Feature","properties":{"geometry_id":"8c0e85d23836","bezirk_id":"wilmersdorf_west","name":"Wilmersdorf","east_west":"west","ortsteile":["Grunewald","Schmargendorf","Wilmersdorf"],"color":"#D7BDE2"},"geometry":{"type":"Polygon","coordinates":[[[13.290195,52.494404],[13.296733,52.490692],[13.300377,52.488043],[13.30197,52.488736],[13.300582,52.489768],[13.301381,52.494501],[13.300415,52.494755],[13.301171,52.495094],[13.30164,52.498805],[13.307144,52.499834],[13.311767,52.500308],[13.313584,52.499624],[13.316076,52.499357],[13.331723,52.500303],[13.332647,52.501183],[13.336041,52.499815],[13.336978,52.500691],[13.338923,52.499913],[13.33899,52.499417],[13.337284,52.495857],[13.337457,52.494189],[13.337087,52.49101],[13.337533,52.490716],[13.336966,52.490374],[13.336896,52.489688],[13.33721,52.488062],[13.337068,52.478132],[13.332986,52.477847],[13.332868,52.477415],[13.320428,52.477471],[13.320143,52.470745],[13.320521,52.47013],[13.320096,52.469629],[13.319983,52.46698],[13.311389,52.467125],[13.310654,52.466902],[13.309098,52.467715],[13.308566,52.467422],[13.307477,52.46788],[13.306333,52.467414],[13.290176,52.47033],[13.289885,52.469892],[13.289083,52.470529],[13.281092,52.468849],[13.264277,52.467001],[13.262743,52.467045],[13.261626,52.467773],[13.259093,52.466499],[13.251836,52.46686],[13.235102,52.469661],[13.23147,52.470756],[13.223776,52.469986],[13.216159,52.470098],[13.21323,52.469531],[13.211475,52.469439],[13.205097,52.470523],[13.203732,52.470498],[13.201692,52.46996],[13.200639,52.469045],[13.199152,52.468746],[13.197928,52.469135],[13.197576,52.47064],[13.196622,52.471341],[13.195232,52.471249],[13.19456,52.470978],[13.18817,52.471837],[13.188295,52.474084],[13.187248,52.478654],[13.190167,52.482619],[13.189812,52.484334],[13.187149,52.487128],[13.186597,52.489292],[13.187549,52.49121],[13.189534,52.492934],[13.18984,52.497545],[13.191699,52.498676],[13.195208,52.49974],[13.19908,52.49988],[13.205132,52.501348],[13.209727,52.50291],[13.212022,52.502611],[13.211863,52.50222],[13.223383,52.503319],[13.254135,52.505209],[13.253808,52.50496],[13.255507,52.504156],[13.253414,52.502514],[13.253762,52.502348],[13.252519,52.501395],[13.255243,52.500104],[13.251808,52.497411],[13.256501,52.49518],[13.2581,52.491201],[13.259354,52.489975],[13.261645,52.488919],[13.264433,52.490717],[13.26756,52.494192],[13.271016,52.496914],[13.271215,52.496814],[13.27248,52.497553],[13.272358,52.497706],[13.281645,52.500481],[13.28207,52.499766],[13.281347,52.499547],[13.283415,52.497492],[13.285204,52.495155],[13.286247,52.495118],[13.286125,52.494655],[13.286471,52.494555],[13.288777,52.494267],[13.290195,52.494404]]]}},{"type":"Feature","properties":{"geometry_id":"4c6af5f6b2aa","bezirk_id":"zehlendorf_west","name":"Zehlendorf","east_west":"west","ortsteile":["Dahlem","Nikolassee","Schlachtensee","Wannsee","Zehlendorf"],"color":"#A3E4D7"},"geometry":{"type":"Polygon","coordinates":[[[13.197246,52.415538],[13.159234,52.402775],[13.159389,52.399907],[13.157783,52.397227],[13.157796,52.396356],[13.16874,52.397358],[13.171166,52.397827],[13.171757,52.395642],[13.168769,52.394396],[13.158869,52.393939],[13.15329,52.39484],[13.145771,52.395497],[13.143859,52.396139],[13.143134,52.396673],[13.143204,52.397248],[13.141987,52.396961],[13.141819,52.3971],[13.134708,52.393563],[13.130374,52.390366],[13.132874,52.388743],[13.133979,52.388736],[13.133181,52.387305],[13.131986,52.387517],[13.131444,52.387469],[13.131305,52.387225],[13.126734,52.389584],[13.127294,52.391608],[13.131198,52.391836],[13.129852,52.390696],[13.130167,52.390497],[13.131491,52.391882],[13.131746,52.391799],[13.134493,52.393686],[13.13895,52.395992],[13.135712,52.396175],[13.13513,52.397374],[13.138044,52.397683],[13.138103,52.397856],[13.134956,52.398596],[13.133509,52.399366],[13.132523,52.398663],[13.127424,52.39664],[13.124781,52.396869],[13.120232,52.399849],[13.11775,52.402119],[13.116337,52.402323],[13.111819,52.403985],[13.111204,52.40451],[13.111103,52.405298],[13.109694,52.406536],[13.108325,52.407256],[13.10945,52.408048],[13.109267,52.408179],[13.10861,52.408476],[13.106383,52.40869],[13.106933,52.409486],[13.108506,52.409243],[13.110631,52.409443],[13.110425,52.410352],[13.111797,52.41048],[13.111512,52.411413],[13.110137,52.411286],[13.109624,52.412941],[13.10778,52.413332],[13.107106,52.413181],[13.107418,52.412088],[13.107141,52.409993],[13.106187,52.409562],[13.101003,52.410539],[13.100859,52.413761],[13.09645,52.413089],[13.097587,52.411655],[13.098977,52.41096],[13.098639,52.410261],[13.097392,52.40942],[13.093412,52.410537],[13.092124,52.411242],[13.090768,52.41156],[13.090275,52.412214],[13.090211,52.413549],[13.088348,52.419631],[13.095839,52.421974],[13.097724,52.423466],[13.0984,52.424889],[13.099314,52.425344],[13.099976,52.425448],[13.100949,52.425163],[13.101601,52.424636],[13.104568,52.423983],[13.105409,52.425283],[13.106916,52.425646],[13.108022,52.426661],[13.112783,52.429196],[13.112074,52.43231],[13.113931,52.432966],[13.117218,52.436164],[13.122142,52.437878],[13.123153,52.438709],[13.123121,52.439615],[13.12412,52.440676],[13.126882,52.441146],[13.128046,52.440962],[13.130806,52.441414],[13.131724,52.441101],[13.133272,52.442087],[13.148521,52.443374],[13.154516,52.446598],[13.161727,52.452135],[13.17085,52.456116],[13.177413,52.455917],[13.181215,52.459625],[13.185305,52.462579],[13.18817,52.471837],[13.19456,52.470978],[13.195232,52.471249],[13.196622,52.471341],[13.197576,52.47064],[13.197928,52.469135],[13.199152,52.468746],[13.200639,52.469045],[13.201692,52.46996],[13.203732,52.470498],[13.205097,52.470523],[13.211475,52.469439],[13.21323,52.469531],[13.216159,52.470098],[13.223776,52.469986],[13.23147,52.470756],[13.235102,52.469661],[13.251836,52.46686],[13.259093,52.466499],[13.261626,52.467773],[13.262743,52.467045],[13.264277,52.467001],[13.281092,52.468849],[13.289083,52.470529],[13.289885,52.469892],[13.290176,52.47033],[13.306333,52.467414],[13.307477,52.46788],[13.308566,52.467422],[13.309098,52.467715],[13.309942,52.467228],[13.308229,52.466129],[13.306147,52.465687],[13.30498,52.463202],[13.304228,52.458539],[13.30361,52.458339],[13.295845,52.450902],[13.293168,52.446472],[13.293768,52.445981],[13.283115,52.442185],[13.28194,52.438882],[13.282309,52.438735],[13.28194,52.438531],[13.281487,52.437391],[13.2802,52.433141],[13.276536,52.42545],[13.272207,52.413252],[13.273643,52.409741],[13.271187,52.409147],[13.267486,52.408823],[13.267689,52.407435],[13.268199,52.407651],[13.268851,52.405787],[13.268604,52.405762],[13.269014,52.404236],[13.265933,52.404441],[13.263599,52.404993],[13.260865,52.406001],[13.258057,52.406395],[13.253309,52.406035],[13.249781,52.404982],[13.24915,52.407904],[13.24874,52.408408],[13.248991,52.411959],[13.247146,52.4189],[13.245952,52.421175],[13.235633,52.420871],[13.233141,52.420343],[13.225266,52.420838],[13.22506,52.421078],[13.217092,52.419169],[13.214226,52.418041],[13.209713,52.416798],[13.202321,52.41561],[13.199444,52.41541],[13.197246,52.415538]]]}},{"type":"Feature","properties":{"geometry_id":"8daa2d43fba0","bezirk_id":"lichtenberg_east","name":"Lichtenberg","east_west":"east","ortsteile":["Fennpfuhl","Friedrichsfelde","Karlshorst","Lichtenberg","Rummelsburg"],"color":"#FFEAA7"},"geometry":{"type":"Polygon","coordinates":[[[13.542081,52.498259],[13.544087,52.496206],[13.54381,52.495925],[13.544455,52.495478],[13.544762,52.493214],[13.546254,52.491766],[13.550138,52.485489],[13.549893,52.48445],[13.548283,52.482481],[13.547916,52.482514],[13.547883,52.47978],[13.548451,52.479778],[13.550857,52.477015],[13.552048,52.473748],[13.552597,52.473652],[13.547991,52.473866],[13.548391,52.47332],[13.542068,52.473988],[13.539848,52.474979],[13.530772,52.467938],[13.523668,52.473864],[13.521581,52.475218],[13.520315,52.47407],[13.516519,52.475373],[13.514617,52.475697],[13.512968,52.475661],[13.507847,52.474904],[13.504324,52.478125],[13.501891,52.482574],[13.497853,52.483284],[13.494179,52.483121],[13.492741,52.485817],[13.490709,52.487444],[13.491454,52.488266],[13.488813,52.489249],[13.488462,52.489888],[13.486087,52.490799],[13.484936,52.491604],[13.484145,52.491658],[13.47308,52.498991],[13.468573,52.499652],[13.470207,52.503743],[13.471163,52.505134],[13.472827,52.506707],[13.473409,52.506924],[13.473066,52.507126],[13.475828,52.510257],[13.476266,52.510441],[13.475438,52.513433],[13.475887,52.514863],[13.477485,52.514389],[13.477748,52.514729],[13.476547,52.515173],[13.474197,52.519117],[13.47376,52.519088],[13.472554,52.520527],[13.469911,52.522635],[13.467095,52.523818],[13.462756,52.524504],[13.459668,52.52551],[13.458179,52.526399],[13.456196,52.528265],[13.460674,52.529358],[13.463389,52.532634],[13.468743,52.534712],[13.467796,52.536133],[13.466384,52.536657],[13.467648,52.53845],[13.46731,52.538495],[13.469841,52.540458],[13.47132,52.538074],[13.475569,52.533119],[13.477011,52.533487],[13.478731,52.533413],[13.495506,52.534504],[13.505649,52.534954],[13.505638,52.534776],[13.516879,52.535544],[13.518691,52.532671],[13.519415,52.524561],[13.518553,52.513912],[13.519306,52.514027],[13.519991,52.513731],[13.523587,52.513915],[13.533985,52.513623],[13.53652,52.512751],[13.537574,52.511787],[13.537847,52.509934],[13.538211,52.509909],[13.536214,52.509994],[13.536295,52.506406],[13.535191,52.505553],[13.539497,52.498548],[13.542081,52.498259]]]}},{"type":"Feature","properties":{"geometry_id":"a5febd8672ce","bezirk_id":"marzahn_east","name":"Marzahn","east_west":"east","ortsteile":["Biesdorf","Hellersdorf","Kaulsdorf","Mahlsdorf","Marzahn"],"color":"#FF6B6B"},"geometry":{"type":"Polygon","coordinates":[[[13.625817,52.530272],[13.626006,52.530402],[13.626736,52.530127],[13.631559,52.530572],[13.636793,52.530506],[13.640631,52.530422],[13.646255,52.52968],[13.656911,52.529837],[13.658032,52.526529],[13.658502,52.525945],[13.655354,52.524073],[13.642459,52.51855],[13.63578,52.514216],[13.633139,52.511708],[13.629206,52.50615],[13.626766,52.499071],[13.624006,52.494198],[13.625844,52.493605],[13.629718,52.493037],[13.614893,52.480762],[13.613551,52.475619],[13.615452,52.4753],[13.616486,52.47483],[13.611313,52.470477],[13.608153,52.471091],[13.608376,52.472855],[13.60307,52.472786],[13.586342,52.481122],[13.581875,52.479971],[13.579716,52.481024],[13.575118,52.479479],[13.574441,52.47752],[13.573839,52.47697],[13.573879,52.476507],[13.573425,52.476795],[13.57306,52.476656],[13.567723,52.474582],[13.566633,52.473723],[13.56567,52.473599],[13.565128,52.473957],[13.563094,52.473467],[13.559643,52.473242],[13.552048,52.473748],[13.550857,52.477015],[13.548451,52.479778],[13.547883,52.47978],[13.547916,52.482514],[13.548283,52.482481],[13.549893,52.48445],[13.550138,52.485489],[13.546254,52.491766],[13.544762,52.493214],[13.544455,52.495478],[13.54381,52.495925],[13.544087,52.496206],[13.542142,52.498252],[13.539497,52.498548],[13.535191,52.505553],[13.536295,52.506406],[13.536214,52.509994],[13.538211,52.509909],[13.537847,52.509934],[13.537822,52.511095],[13.537323,52.512105],[13.535722,52.513161],[13.533985,52.513623],[13.523587,52.513915],[13.519991,52.513731],[13.519306,52.514027],[13.518553,52.513912],[13.519415,52.524561],[13.518691,52.532671],[13.516879,52.535544],[13.523066,52.536275],[13.527844,52.537803],[13.531593,52.5386],[13.531291,52.538893],[13.532265,52.539315],[13.531898,52.539528],[13.530992,52.541736],[13.527238,52.552273],[13.525493,52.555431],[13.533951,52.560388],[13.541081,52.565957],[13.543917,52.566618],[13.545625,52.567768],[13.564414,52.572196],[13.566465,52.57293],[13.566552,52.573164],[13.566142,52.573015],[13.567705,52.574509],[13.568572,52.573104],[13.569159,52.573082],[13.569083,52.573366],[13.571408,52.573236],[13.574972,52.573834],[13.576968,52.572902],[13.577887,52.571126],[13.581542,52.571106],[13.583154,52.568174],[13.583428,52.566775],[13.583168,52.565213],[13.583933,52.563762],[13.583831,52.562607],[13.584431,52.559857],[13.584885,52.559082],[13.586479,52.557691],[13.5877,52.555091],[13.587771,52.553328],[13.586382,52.549785],[13.587412,52.549452],[13.618714,52.544214],[13.634399,52.542825],[13.63545,52.542305],[13.637373,52.542254],[13.637646,52.540921],[13.634905,52.538224],[13.634554,52.537928],[13.634164,52.538028],[13.633946,52.537653],[13.63161,52.538002],[13.630583,52.537621],[13.628858,52.537977],[13.628221,52.53757],[13.627539,52.537485],[13.624822,52.538105],[13.625744,52.534039],[13.624811,52.533585],[13.625817,52.530272]]]}},{"type":"Feature","properties":{"geometry_id":"d7a6066bc7f3","bezirk_id":"weissensee_east","name":"Weißensee","east_west":"east","ortsteile":["Alt-Hohenschönhausen","Malchow","Neu-Hohenschönhausen","Stadtrandsiedlung Malchow","Wartenberg","Weißensee"],"color":"#F9E79F"},"geometry":{"type":"Polygon","coordinates":[[[13.525354,52.55532],[13.527238,52.552273],[13.530992,52.541736],[13.531898,52.539528],[13.532265,52.539315],[13.531291,52.538893],[13.531593,52.5386],[13.527844,52.537803],[13.523066,52.536275],[13.519251,52.535708],[13.50583,52.534786],[13.505649,52.534954],[13.495506,52.534504],[13.478731,52.533413],[13.477011,52.533487],[13.475569,52.533119],[13.47132,52.538074],[13.469841,52.540458],[13.46731,52.538495],[13.455058,52.543674],[13.455622,52.544048],[13.455069,52.544645],[13.454758,52.544537],[13.454481,52.544835],[13.453597,52.544532],[13.448032,52.546808],[13.447238,52.547339],[13.447011,52.54717],[13.442747,52.548662],[13.433962,52.550947],[13.430222,52.551707],[13.428962,52.556407],[13.435608,52.5588],[13.4425,52.562039],[13.448145,52.564143],[13.448426,52.564525],[13.448807,52.564467],[13.4549,52.567177],[13.45762,52.567409],[13.458292,52.570091],[13.458076,52.572542],[13.457347,52.573835],[13.45764,52.577267],[13.462553,52.577631],[13.461967,52.584415],[13.467072,52.587512],[13.471251,52.589706],[13.47852,52.591272],[13.483538,52.60006],[13.493756,52.602232],[13.496662,52.605028],[13.498974,52.605162],[13.508119,52.592138],[13.522879,52.592748],[13.527694,52.592235],[13.547125,52.587853],[13.538368,52.575144],[13.537079,52.572823],[13.536015,52.572821],[13.535975,52.572655],[13.531396,52.572889],[13.53003,52.570598],[13.532486,52.569942],[13.533881,52.569206],[13.53415,52.568545],[13.535803,52.567716],[13.536826,52.567368],[13.53789,52.567809],[13.541897,52.566082],[13.541038,52.565929],[13.533951,52.560388],[13.525354,52.55532]]]}},{"type":"Feature","properties":{"geometry_id":"a7461b24f7be","bezirk_id":"hohenschoenhausen_east","name":"Hohenschönhausen","east_west":"east","ortsteile":["Alt-Hohenschönhausen","Falkenberg","Malchow","Neu-Hohenschönhausen","Wartenberg"],"color":"#4ECDC4"},"geometry":{"type":"Polygon","coordinates":[[[13.525354,52.55532],[13.527238,52.552273],[13.530992,52.541736],[13.531898,52.539528],[13.532265,52.539315],[13.531291,52.538893],[13.531593,52.5386],[13.527844,52.537803],[13.523066,52.536275],[13.519251,52.535708],[13.50583,52.534786],[13.505649,52.534954],[13.495506,52.534504],[13.478731,52.533413],[13.477011,52.533487],[13.475569,52.533119],[13.47132,52.538074],[13.469867,52.54028],[13.467017,52.548071],[13.467363,52.548321],[13.468526,52.54823],[13.469929,52.547742],[13.479645,52.547547],[13.48046,52.54812],[13.479342,52.549303],[13.479747,52.549621],[13.480372,52.549452],[13.482222,52.549648],[13.486117,52.552398],[13.49443,52.550785],[13.495674,52.553865],[13.495105,52.555823],[13.491299,52.559786],[13.490272,52.560368],[13.487592,52.561203],[13.485402,52.561552],[13.485186,52.561802],[13.486069,52.564153],[13.483673,52.564427],[13.484154,52.566027],[13.48359,52.566119],[13.487588,52.569219],[13.482601,52.571635],[13.482795,52.572632],[13.482027,52.572494],[13.479459,52.572694],[13.479575,52.573341],[13.479856,52.573325],[13.479625,52.573778],[13.480071,52.57502],[13.479746,52.57515],[13.47999,52.577695],[13.480516,52.577703],[13.480205,52.577914],[13.47969,52.580093],[13.480477,52.583533],[13.481613,52.583315],[13.481975,52.584002],[13.483566,52.584077],[13.486004,52.588014],[13.488405,52.589784],[13.505176,52.596463],[13.508119,52.592138],[13.522879,52.592748],[13.527694,52.592235],[13.547125,52.587853],[13.546987,52.587643],[13.555472,52.58415],[13.56056,52.581248],[13.564523,52.578197],[13.567705,52.574509],[13.566142,52.573015],[13.566552,52.573164],[13.566465,52.57293],[13.564414,52.572196],[13.545625,52.567768],[13.543917,52.566618],[13.54117,52.566005],[13.533951,52.560388],[13.525354,52.55532]]]}},{"type":"Feature","properties":{"geometry_id":"ec22a8bfd3f3","bezirk_id":"weissensee_east","name":"Weißensee","east_west":"east","ortsteile":["Stadtrandsiedlung Malchow","Weißensee"],"color":"#F9E79F"},"geometry":{"type":"Polygon","coordinates":[[[13.483758,52.564417],[13.486069,52.564153],[13.485186,52.561802],[13.485402,52.561552],[13.487289,52.561288],[13.490823,52.560103],[13.494907,52.556082],[13.495532,52.555003],[13.495674,52.553865],[13.49443,52.550785],[13.486117,52.552398],[13.482222,52.549648],[13.480372,52.549452],[13.479747,52.549621],[13.479342,52.549303],[13.48046,52.54812],[13.479645,52.547547],[13.469929,52.547742],[13.468526,52.54823],[13.467363,52.548321],[13.467017,52.548071],[13.469841,52.540458],[13.46731,52.538495],[13.455058,52.543674],[13.455622,52.544048],[13.455069,52.544645],[13.454758,52.544537],[13.454481,52.544835],[13.453597,52.544532],[13.448032,52.546808],[13.447238,52.547339],[13.447011,52.54717],[13.442747,52.548662],[13.433962,52.550947],[13.430222,52.551707],[13.428962,52.556407],[13.429365,52.556706],[13.435608,52.5588],[13.4425,52.562039],[13.448145,52.564143],[13.448426,52.564525],[13.448807,52.564467],[13.4549,52.567177],[13.45762,52.567409],[13.458292,52.570091],[13.458076,52.572542],[13.457347,52.573835],[13.45764,52.577267],[13.462553,52.577631],[13.461967,52.584415],[13.467072,52.587512],[13.471251,52.589706],[13.47852,52.591272],[13.483538,52.60006],[13.493756,52.602232],[13.496662,52.605028],[13.498974,52.605162],[13.505176,52.596463],[13.488405,52.589784],[13.486004,52.588014],[13.483566,52.584077],[13.481975,52.584002],[13.481613,52.583315],[13.480477,52.583533],[13.47969,52.580093],[13.480205,52.577914],[13.480516,52.577703],[13.47999,52.577695],[13.479746,52.57515],[13.480071,52.57502],[13.479625,52.573778],[13.479856,52.573325],[13.479575,52.573341],[13.479459,52.572694],[13.482027,52.572494],[13.482795,52.572632],[13.482601,52.571635],[13.487588,52.569219],[13.48359,52.566119],[13.484154,52.566027],[13.483758,52.564417]]]}},{"type":"Feature","properties":{"geometry_id":"5a39f1def05c","bezirk_id":"pankow_east","name":"Pankow","east_west":"east","ortsteile":["Blankenfelde","Buch","Französisch Buchholz","Niederschönhausen","Pankow","Rosenthal","Wilhelmsruh"],"color":"#F7DC6F"},"geometry":{"type":"MultiPolygon","coordinates":[[[[13.431592,52.582484],[13.433275,52.582353],[13.433883,52.58203],[13.432871,52.581141],[13.433409,52.580892],[13.433018,52.580207],[13.433461,52.580018],[13.433851,52.57881],[13.429769,52.576166],[13.429625,52.574305],[13.427209,52.564948],[13.429365,52.556706],[13.428962,52.556407],[13.430222,52.551707],[13.429976,52.551545],[13.427277,52.552588],[13.414934,52.553951],[13.414493,52.55744],[13.402984,52.557988],[13.397922,52.558586],[13.397098,52.558268],[13.395905,52.561822],[13.39319,52.564557],[13.388918,52.567001],[13.38906,52.56738],[13.388381,52.567679],[13.389282,52.568243],[13.387775,52.569147],[13.388264,52.569479],[13.383082,52.572333],[13.382239,52.572021],[13.379685,52.572524],[13.378917,52.573455],[13.378589,52.573413],[13.378483,52.573716],[13.378157,52.573614],[13.375144,52.575632],[13.371181,52.577289],[13.364011,52.581468],[13.363868,52.581252],[13.363451,52.581433],[13.358814,52.584172],[13.357818,52.584387],[13.352104,52.587534],[13.349791,52.58891],[13.34992,52.589239],[13.349133,52.5892],[13.347557,52.590083],[13.351756,52.590794],[13.360649,52.59127],[13.37057,52.59948],[13.376212,52.607738],[13.376284,52.611129],[13.375228,52.614226],[13.371554,52.619695],[13.366928,52.625346],[13.366939,52.625851],[13.367219,52.625751],[13.367657,52.626006],[13.367684,52.625715],[13.36853,52.625579],[13.369162,52.625829],[13.369135,52.626033],[13.36951,52.626014],[13.370175,52.627069],[13.370803,52.627375],[13.371484,52.62716],[13.371605,52.627401],[13.372322,52.627271],[13.373547,52.6278],[13.374142,52.627676],[13.374186,52.627918],[13.374572,52.627767],[13.375452,52.628679],[13.376378,52.628378],[13.375827,52.629038],[13.376679,52.628895],[13.376366,52.629215],[13.37685,52.629156],[13.377022,52.629819],[13.376282,52.630806],[13.376344,52.631369],[13.375822,52.631607],[13.376358,52.631783],[13.376473,52.632141],[13.376869,52.632175],[13.376564,52.632414],[13.377193,52.632674],[13.376793,52.632916],[13.377274,52.633188],[13.377618,52.633071],[13.378709,52.634353],[13.379401,52.633872],[13.380105,52.634278],[13.379967,52.634408],[13.382859,52.635217],[13.382693,52.635747],[13.381935,52.635952],[13.381814,52.636397],[13.382958,52.636349],[13.383326,52.636636],[13.383498,52.636434],[13.383935,52.636462],[13.384026,52.636184],[13.384761,52.636448],[13.38508,52.636263],[13.38515,52.636519],[13.386374,52.636743],[13.386358,52.636926],[13.387617,52.637238],[13.388228,52.637174],[13.388621,52.637594],[13.389205,52.637624],[13.389061,52.638131],[13.389936,52.639122],[13.389613,52.639373],[13.39061,52.639915],[13.389911,52.640538],[13.390402,52.640853],[13.389687,52.641225],[13.389659,52.641519],[13.390181,52.641346],[13.390397,52.641505],[13.390045,52.64157],[13.390464,52.641825],[13.390205,52.642154],[13.390591,52.642194],[13.390145,52.642436],[13.390899,52.642472],[13.390669,52.642622],[13.391304,52.643176],[13.3913,52.643547],[13.392248,52.643276],[13.392287,52.643652],[13.391502,52.643633],[13.392286,52.643705],[13.391745,52.643841],[13.392172,52.644042],[13.39183,52.644199],[13.391961,52.64446],[13.392331,52.644404],[13.391912,52.644749],[13.392407,52.644783],[13.392949,52.645235],[13.392718,52.645307],[13.392848,52.645467],[13.392846,52.645323],[13.393178,52.645411],[13.392932,52.645562],[13.393298,52.645798],[13.393148,52.645964],[13.393867,52.646317],[13.394502,52.647532],[13.396389,52.647424],[13.39727,52.64815],[13.397938,52.648289],[13.397906,52.648115],[13.403241,52.645187],[13.40659,52.643846],[13.407885,52.642686],[13.412292,52.643482],[13.413629,52.642466],[13.414736,52.642385],[13.414751,52.64178],[13.414258,52.64124],[13.41655,52.639434],[13.424355,52.635465],[13.427631,52.637512],[13.432723,52.637378],[13.434261,52.637954],[13.43339,52.641474],[13.434009,52.644283],[13.43979,52.645267],[13.440821,52.649263],[13.441546,52.649384],[13.44161,52.649023],[13.442773,52.649124],[13.44331,52.649538],[13.444913,52.649502],[13.44749,52.650025],[13.448737,52.650001],[13.452098,52.649672],[13.452085,52.648699],[13.459733,52.648081],[13.460414,52.648477],[13.462209,52.648893],[13.463057,52.649924],[13.465724,52.651169],[13.467075,52.651653],[13.469267,52.651665],[13.469967,52.651863],[13.472176,52.653411],[13.473907,52.654119],[13.474263,52.655752],[13.473513,52.656531],[13.462383,52.65754],[13.453945,52.66185],[13.450786,52.662667],[13.455506,52.665749],[13.459554,52.668975],[13.465928,52.667118],[13.475493,52.675008],[13.477273,52.673901],[13.479488,52.675508],[13.480084,52.674858],[13.476466,52.671358],[13.474586,52.668064],[13.475131,52.66799],[13.475681,52.667535],[13.475833,52.666548],[13.477975,52.667678],[13.485219,52.66964],[13.488424,52.670787],[13.485359,52.659426],[13.49076,52.654797],[13.503143,52.649971],[13.504723,52.649564],[13.512828,52.645399],[13.515187,52.646119],[13.519267,52.646945],[13.520391,52.644877],[13.523022,52.645035],[13.52244,52.640761],[13.517816,52.629565],[13.511392,52.627787],[13.505855,52.625752],[13.505458,52.619975],[13.504725,52.619645],[13.489896,52.623248],[13.486564,52.624398],[13.483508,52.625869],[13.482273,52.625542],[13.479638,52.625566],[13.478137,52.625309],[13.473576,52.624051],[13.470432,52.622806],[13.465001,52.618735],[13.458301,52.615527],[13.451836,52.611432],[13.450372,52.608593],[13.449732,52.608081],[13.449703,52.606506],[13.449088,52.604698],[13.444896,52.595822],[13.442854,52.593425],[13.431457,52.582864],[13.430894,52.583028],[13.431592,52.582484]],[[13.434045,52.642167],[13.433624,52.642132],[13.433585,52.641891],[13.433925,52.641982],[13.434045,52.642167]]],[[[13.50537,52.619854],[13.505438,52.619686],[13.504844,52.619615],[13.50537,52.619854]]],[[[13.3927,52.645582],[13.392921,52.645666],[13.392786,52.645495],[13.3927,52.645582]]],[[[13.393021,52.646006],[13.393066,52.646009],[13.393058,52.645909],[13.393021,52.646006]]]]}},{"type":"Feature","properties":{"geometry_id":"7d85a57293a3","bezirk_id":"weissensee_east","name":"Weißensee","east_west":"east","ortsteile":["Blankenburg","Heinersdorf","Karow","Stadtrandsiedlung Malchow","Weißensee"],"color":"#F9E79F"},"geometry":{"type":"MultiPolygon","coordinates":[[[[13.483853,52.564406],[13.486069,52.564153],[13.485186,52.561802],[13.485402,52.561552],[13.487289,52.561288],[13.490823,52.560103],[13.494907,52.556082],[13.495532,52.555003],[13.495674,52.553865],[13.49443,52.550785],[13.486117,52.552398],[13.482222,52.549648],[13.480372,52.549452],[13.479747,52.549621],[13.479342,52.549303],[13.48046,52.54812],[13.479645,52.547547],[13.469929,52.547742],[13.468526,52.54823],[13.467363,52.548321],[13.467017,52.548071],[13.469841,52.540458],[13.46731,52.538495],[13.455058,52.543674],[13.455622,52.544048],[13.455069,52.544645],[13.454758,52.544537],[13.454481,52.544835],[13.453597,52.544532],[13.448032,52.546808],[13.447238,52.547339],[13.447011,52.54717],[13.442747,52.548662],[13.433962,52.550947],[13.430222,52.551707],[13.428962,52.556407],[13.429365,52.556706],[13.427209,52.564948],[13.429625,52.574305],[13.429769,52.576166],[13.433851,52.57881],[13.433461,52.580018],[13.433018,52.580207],[13.433409,52.580892],[13.432871,52.581141],[13.433883,52.58203],[13.433275,52.582353],[13.431545,52.582475],[13.430894,52.583028],[13.431457,52.582864],[13.442854,52.593425],[13.444896,52.595822],[13.449088,52.604698],[13.449703,52.606506],[13.449732,52.608081],[13.450372,52.608593],[13.451464,52.610943],[13.452288,52.611861],[13.458301,52.615527],[13.465001,52.618735],[13.470432,52.622806],[13.473576,52.624051],[13.478137,52.625309],[13.479638,52.625566],[13.482273,52.625542],[13.483508,52.625869],[13.486564,52.624398],[13.489896,52.623248],[13.504725,52.619645],[13.503703,52.619261],[13.503308,52.618993],[13.498663,52.611029],[13.496662,52.605028],[13.498974,52.605162],[13.505176,52.596463],[13.488405,52.589784],[13.486004,52.588014],[13.483566,52.584077],[13.481975,52.584002],[13.481613,52.583315],[13.480477,52.583533],[13.47969,52.580093],[13.480205,52.577914],[13.480516,52.577703],[13.47999,52.577695],[13.479746,52.57515],[13.480071,52.57502],[13.479625,52.573778],[13.479856,52.573325],[13.479575,52.573341],[13.479459,52.572694],[13.482027,52.572494],[13.482795,52.572632],[13.482601,52.571635],[13.487588,52.569219],[13.48359,52.566119],[13.484154,52.566027],[13.483853,52.564406]]],[[[13.50344,52.618994],[13.504844,52.619615],[13.50506,52.619562],[13.50344,52.618994]]]]}},{"type":"Feature","properties":{"geometry_id":"0130e9d2cd9d","bezirk_id":"hellersdorf_east","name":"Hellersdorf","east_west":"east","ortsteile":["Hellersdorf","Kaulsdorf","Mahlsdorf"],"color":"#45B7D1"},"geometry":{"type":"Polygon","coordinates":[[[13.625817,52.530272],[13.626006,52.530402],[13.626736,52.530127],[13.631559,52.530572],[13.636793,52.530506],[13.640631,52.530422],[13.646255,52.52968],[13.656911,52.529837],[13.658032,52.526529],[13.658502,52.525945],[13.655354,52.524073],[13.642459,52.51855],[13.63578,52.514216],[13.633139,52.511708],[13.629206,52.50615],[13.626766,52.499071],[13.624006,52.494198],[13.625844,52.493605],[13.629718,52.493037],[13.614893,52.480762],[13.613551,52.475619],[13.615452,52.4753],[13.616486,52.47483],[13.611313,52.470477],[13.608153,52.471091],[13.608376,52.472855],[13.60307,52.472786],[13.586342,52.481122],[13.581875,52.479971],[13.579716,52.481024],[13.575118,52.479479],[13.574441,52.47752],[13.573839,52.47697],[13.573879,52.476507],[13.573425,52.476795],[13.568192,52.474704],[13.567348,52.47682],[13.564283,52.478588],[13.563516,52.479371],[13.563583,52.482014],[13.564066,52.48276],[13.564265,52.484119],[13.563703,52.484529],[13.56472,52.485288],[13.565322,52.485261],[13.564881,52.48539],[13.566145,52.48726],[13.566862,52.489424],[13.568541,52.491512],[13.569004,52.491707],[13.569525,52.492667],[13.570179,52.492661],[13.569162,52.492988],[13.56922,52.493757],[13.568199,52.496207],[13.569097,52.49816],[13.569913,52.498824],[13.571254,52.499386],[13.572394,52.50037],[13.576625,52.500601],[13.577315,52.500944],[13.578534,52.502523],[13.578653,52.503844],[13.579514,52.504561],[13.57929,52.505777],[13.578678,52.50661],[13.573911,52.510228],[13.573408,52.512592],[13.574679,52.514733],[13.575598,52.516776],[13.575888,52.5183],[13.576516,52.519098],[13.577104,52.522386],[13.576977,52.523474],[13.577784,52.525633],[13.58068,52.527591],[13.581559,52.527164],[13.580699,52.5276],[13.583299,52.529579],[13.584004,52.529258],[13.583308,52.529587],[13.583813,52.529981],[13.584604,52.529722],[13.583971,52.530046],[13.584145,52.530157],[13.585177,52.530456],[13.5857,52.530327],[13.585201,52.530468],[13.585968,52.530932],[13.586593,52.53077],[13.585983,52.530944],[13.586398,52.531481],[13.585934,52.532754],[13.586642,52.534075],[13.587496,52.533953],[13.586638,52.534102],[13.586632,52.534513],[13.587409,52.534533],[13.586634,52.534524],[13.584773,52.537156],[13.583308,52.53851],[13.58198,52.539076],[13.581118,52.53994],[13.580705,52.542172],[13.580948,52.543035],[13.582445,52.544441],[13.586387,52.549952],[13.587412,52.549452],[13.618714,52.544214],[13.634399,52.542825],[13.63545,52.542305],[13.637373,52.542254],[13.637646,52.540921],[13.634905,52.538224],[13.634554,52.537928],[13.634164,52.538028],[13.633946,52.537653],[13.63161,52.538002],[13.630583,52.537621],[13.628858,52.537977],[13.628221,52.53757],[13.627539,52.537485],[13.624822,52.538105],[13.625744,52.534039],[13.624811,52.533585],[13.625817,52.530272]]]}},{"type":"Feature","properties":{"geometry_id":"00f3a41072ab","bezirk_id":"marzahn_east","name":"Marzahn","east_west":"east","ortsteile":["Biesdorf","Marzahn"],"color":"#FF6B6B"},"geometry":{"type":"Polygon","coordinates":[[[13.584019,52.530082],[13.584604,52.529722],[13.583961,52.530039],[13.583308,52.529587],[13.584004,52.529258],[13.583299,52.529579],[13.580699,52.5276],[13.581559,52.527164],[13.58068,52.527591],[13.577784,52.525633],[13.576977,52.523474],[13.577104,52.522386],[13.576516,52.519098],[13.575888,52.5183],[13.575598,52.516776],[13.574679,52.514733],[13.573408,52.512592],[13.573911,52.510228],[13.578678,52.50661],[13.57929,52.505777],[13.579514,52.504561],[13.578653,52.503844],[13.578534,52.502523],[13.577315,52.500944],[13.576625,52.500601],[13.572394,52.50037],[13.571254,52.499386],[13.569913,52.498824],[13.569097,52.49816],[13.568199,52.496207],[13.56922,52.493757],[13.569162,52.492988],[13.570179,52.492661],[13.569525,52.492667],[13.569004,52.491707],[13.568541,52.491512],[13.566862,52.489424],[13.566145,52.48726],[13.564881,52.48539],[13.565322,52.485261],[13.56472,52.485288],[13.563703,52.484529],[13.564265,52.484119],[13.564066,52.48276],[13.563583,52.482014],[13.563516,52.479371],[13.564283,52.478588],[13.567348,52.47682],[13.568192,52.474704],[13.566633,52.473723],[13.56567,52.473599],[13.565128,52.473957],[13.563094,52.473467],[13.560869,52.473262],[13.557345,52.473291],[13.552048,52.473748],[13.550857,52.477015],[13.548451,52.479778],[13.547883,52.47978],[13.547916,52.482514],[13.548283,52.482481],[13.549893,52.48445],[13.550138,52.485489],[13.546254,52.491766],[13.544762,52.493214],[13.544455,52.495478],[13.54381,52.495925],[13.544087,52.496206],[13.542142,52.498252],[13.539497,52.498548],[13.535191,52.505553],[13.536295,52.506406],[13.536214,52.509994],[13.538211,52.509909],[13.537847,52.509934],[13.537822,52.511095],[13.537323,52.512105],[13.535722,52.513161],[13.533985,52.513623],[13.523587,52.513915],[13.519991,52.513731],[13.519306,52.514027],[13.518553,52.513912],[13.519415,52.524561],[13.518691,52.532671],[13.516879,52.535544],[13.523066,52.536275],[13.527844,52.537803],[13.531593,52.5386],[13.531291,52.538893],[13.532265,52.539315],[13.531898,52.539528],[13.530992,52.541736],[13.527238,52.552273],[13.525493,52.555431],[13.533951,52.560388],[13.54117,52.566005],[13.543917,52.566618],[13.545625,52.567768],[13.564414,52.572196],[13.566465,52.57293],[13.566552,52.573164],[13.566142,52.573015],[13.567705,52.574509],[13.568572,52.573104],[13.569159,52.573082],[13.569083,52.573366],[13.571408,52.573236],[13.574972,52.573834],[13.576968,52.572902],[13.577887,52.571126],[13.581542,52.571106],[13.583346,52.567747],[13.583168,52.565213],[13.583933,52.563762],[13.583831,52.562607],[13.584431,52.559857],[13.584885,52.559082],[13.586479,52.557691],[13.587352,52.556209],[13.587785,52.553615],[13.586164,52.549435],[13.584764,52.547887],[13.582445,52.544441],[13.580948,52.543035],[13.580705,52.542172],[13.581118,52.53994],[13.58198,52.539076],[13.583308,52.53851],[13.584773,52.537156],[13.586634,52.534524],[13.587409,52.534533],[13.586632,52.534513],[13.586638,52.534102],[13.587496,52.533953],[13.586642,52.534075],[13.585934,52.532754],[13.586398,52.531481],[13.585983,52.530944],[13.586585,52.53076],[13.585968,52.530932],[13.585201,52.530468],[13.5857,52.530327],[13.585177,52.530456],[13.584019,52.530082]]]}}],"crs":{"type":"name","properties":{"name":"EPSG:4326"}}};
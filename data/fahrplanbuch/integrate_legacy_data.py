@@ -1,211 +1,294 @@
-import pandas as pd
+"""
+Integrate the legacy line tables into yearly raw Fahrplanbuch files.
+
+Reads legacy_data/lines.csv and legacy_data/line_stops.csv, normalises
+transport types and east/west sides, and writes one raw table per
+year_side (data/raw/{year}_{side}.csv) in the format of the existing raw
+files.
+
+All rules are applied column-wise: type and side rules are regex masks
+over whole columns, and the stops of every line are joined in a single
+groupby, so a full re-integration is one pass over the data.
+
+Usage:
+    python integrate_legacy_data.py
+    python integrate_legacy_data.py --output-dir /tmp/raw --workers 4
+
+    from integrate_legacy_data import integrate_legacy_data
+    tables = integrate_legacy_data(write=False)   # {(year, side): DataFrame}
+"""
+
 import os
-import re
-from collections import defaultdict
-
-# Create output directory if it doesn't exist
-output_dir = "./data/raw"
-os.makedirs(output_dir, exist_ok=True)
-
-# 1. Load the combined CSV files
-stations_df = pd.read_csv("legacy_data/stations.csv")
-lines_df = pd.read_csv("legacy_data/lines.csv")
-line_stops_df = pd.read_csv("legacy_data/line_stops.csv")
-
-# 2. Normalize transport types
-def normalize_type(transport_type, line_name=None):
-    """Normalize the transport type terminology."""
-    # Check line_name pattern first if provided
-    if line_name is not None:
-        # If line_name starts with O followed by a number, it's omnibus
-        if re.match(r'^O\d+', str(line_name)):
-            return 'omnibus'
-        
-        # If line_name starts with A followed by a number, it's autobus
-        if re.match(r'^A\d+', str(line_name)) or re.match(r'^AS\d+', str(line_name)):
-            return 'autobus'
-        
-        # KBS prefixes are for s-bahn
-        if isinstance(line_name, str) and line_name.startswith('KBS'):
-            return 's-bahn'
-    
-    if not isinstance(transport_type, str):
-        return 'unknown'
-        
-    transport_type = transport_type.lower()
-    
-    # Handle omnibus, bus, autobus variations
-    if transport_type in ['omnibus', 'autobus', 'bus']:
-        return 'autobus'
-    
-    # Handle strassenbahn, tram
-    if transport_type in ['strassenbahn', 'tram']:
-        return 'tram'
-    
-    # Other types remain the same (s-bahn, u-bahn, ferry)
-    return transport_type
-
-# Apply transport type normalization based on both the type field and line_name
-lines_df['type'] = [normalize_type(row['type'], row['line_name']) for _, row in lines_df.iterrows()]
-stations_df['type'] = stations_df['type'].apply(lambda x: normalize_type(x))
-
-# 3. Normalize east/west terminology
-def normalize_side(side, year):
-    """Normalize the east/west terminology with year consideration."""
-    if not isinstance(side, str):
-        # For post-1961, use 'ambiguous' instead of 'unified'
-        return 'ambiguous' if year >= 1961 else 'unified'
-        
-    side = side.lower()
-    
-    if side in ['ost', 'east']:
-        return 'east'
-    elif side in ['west']:
-        return 'west'
-    elif side in ['both/unkown', 'both', 'unknown', 'unified']:
-        # For post-1961, use 'ambiguous' instead of 'unified'
-        return 'ambiguous' if year >= 1961 else 'unified'
-    
-    # Default case - consider year
-    return 'ambiguous' if year >= 1961 else 'unified'
-
-# Apply side normalization with year consideration
-lines_df['east_west'] = lines_df.apply(lambda row: normalize_side(row['east_west'], row['year']), axis=1)
-
-# Additional check: Look for "Ost" or "West" in line_name/stop data for context clues
-def infer_side_from_line_data(row):
-    """Try to infer east/west from line data if current side is unified/ambiguous"""
-    if row['east_west'] not in ['unified', 'ambiguous']:
-        return row['east_west']
-        
-    # Check line name for Ost/West indicators
-    if isinstance(row['line_name'], str):
-        if 'ost' in row['line_name'].lower() or 'east' in row['line_name'].lower():
-            return 'east'
-        if 'west' in row['line_name'].lower():
-            return 'west'
-    
-    # Check start_stop for Ost/West indicators
-    if isinstance(row['start_stop'], str):
-        if 'ost' in row['start_stop'].lower() or 'east' in row['start_stop'].lower():
-            return 'east'
-        if 'west' in row['start_stop'].lower():
-            return 'west'
-            
-    # Return original value (either 'unified' or 'ambiguous')
-    return row['east_west']
-
-# Apply side inference where possible
-lines_df['east_west'] = lines_df.apply(infer_side_from_line_data, axis=1)
-
-# 4. Set pre-1961 data as unified (keep ambiguous for post-1961)
-lines_df.loc[lines_df['year'] < 1961, 'east_west'] = 'unified'
-
-# 5. Check if the line_name needs type correction 
-def check_line_type_from_name(line_name, current_type):
-    """Check if the line name suggests a different transport type"""
-    if not isinstance(line_name, str):
-        return current_type
-        
-    # If line_name starts with O followed by a number, it's omnibus
-    if re.match(r'^O\d+', line_name):
-        return 'omnibus'
-    
-    # If line_name starts with A followed by a number, it's autobus
-    if re.match(r'^A\d+', line_name) or re.match(r'^AS\d+', line_name):
-        return 'autobus'
-        
-    # KBS prefixes are for s-bahn
-    if line_name.startswith('KBS'):
-        return 's-bahn'
-    
-    return current_type
-
-# Apply additional line name-based type correction
-lines_df['type'] = [check_line_type_from_name(row['line_name'], row['type']) 
-                    for _, row in lines_df.iterrows()]
-
-# 6. Group data by year and side
-years = sorted(lines_df['year'].unique())
-
-for year in years:
-    # For each year, identify sides (east, west, unified, or ambiguous)
-    year_data = lines_df[lines_df['year'] == year]
-    sides = year_data['east_west'].unique()
-    
-    for side in sides:
-        # Skip invalid sides
-        if not isinstance(side, str):
-            continue
-            
-        # Get lines for this year and side
-        side_lines = year_data[year_data['east_west'] == side]
-        
-        # Prepare the output dataframe
-        output_data = []
-        
-        # Process each line
-        for _, line in side_lines.iterrows():
-            line_id = line['line_id']
-            line_name = line['line_name']
-            
-            # Get all stops for this line and order them
-            line_stops = line_stops_df[line_stops_df['line_id'] == line_id].sort_values('stop_order')
-            
-            # If we have stop data, format it as a string
-            if not line_stops.empty:
-                stops_list = line_stops['stop_name'].tolist()
-                stops_str = " - ".join(stops_list)
-            else:
-                # If no specific stops, use the start_stop field if available
-                stops_str = line['start_stop'] if isinstance(line['start_stop'], str) else ""
-            
-            # Final type check based on line_name pattern
-            line_type = check_line_type_from_name(line_name, line['type'])
-            
-            # Build the output row
-            output_row = {
-                'line_name': line_name,
-                'type': line_type,
-                'stops': stops_str,
-                'frequency (7:30)': line['Frequency'] if not pd.isna(line['Frequency']) else '',
-                'length (time)': line['Length (time)'] if not pd.isna(line['Length (time)']) else '',
-                'Length (km)': line['Length (km)'] if not pd.isna(line['Length (km)']) else '',  # Match exact column name
-                'year': year,
-                'east_west': side,
-                'info': ''  # No direct mapping for additional info
-            }
-            
-            output_data.append(output_row)
-        
-        # Create the output dataframe
-        if output_data:
-            output_df = pd.DataFrame(output_data)
-            
-            # Ensure the columns are in the correct order to match your existing files
-            column_order = [
-                'line_name', 
-                'type', 
-                'stops', 
-                'frequency (7:30)', 
-                'length (time)', 
-                'Length (km)', 
-                'year', 
-                'east_west', 
-                'info'
-            ]
-            
-            # Reorder columns and handle missing columns
-            for col in column_order:
-                if col not in output_df.columns:
-                    output_df[col] = ''
-            
-            output_df = output_df[column_order]
-            
-            # Save to CSV (with UTF-8 BOM to match your existing files)
-            filename = f"{year}_{side}.csv"
-            filepath = os.path.join(output_dir, filename)
-            output_df.to_csv(filepath, index=False, encoding='utf-8-sig')
-            print(f"Created {filepath} with {len(output_data)} lines")
-
-print("Data migration complete!")
\ No newline at end of file
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_LEGACY_DIR = BASE_DIR / "legacy_data"
+DEFAULT_OUTPUT_DIR = BASE_DIR / "data" / "raw"
+
+# Line name patterns that fix the transport type, checked in order
+LINE_NAME_TYPE_RULES = [
+    (r'O\d', 'omnibus'),
+    (r'AS?\d', 'autobus'),
+    (r'KBS', 's-bahn'),
+]
+
+TYPE_ALIASES = {
+    'omnibus': 'autobus',
+    'autobus': 'autobus',
+    'bus': 'autobus',
+    'strassenbahn': 'tram',
+    'tram': 'tram',
+}
+
+SIDE_ALIASES = {
+    'ost': 'east',
+    'east': 'east',
+    'west': 'west',
+}
+
+# Before the division of the network every line is 'unified'
+DIVISION_YEAR = 1961
+
+OUTPUT_COLUMNS = [
+    'line_name',
+    'type',
+    'stops',
+    'frequency (7:30)',
+    'length (time)',
+    'Length (km)',
+    'year',
+    'east_west',
+    'info',
+]
+
+
+def load_legacy_data(legacy_dir=DEFAULT_LEGACY_DIR):
+    """
+    Load the legacy line tables.
+
+    Args:
+        legacy_dir: Directory with lines.csv and line_stops.csv
+
+    Returns:
+        Tuple of (lines_df, line_stops_df)
+    """
+    legacy_dir = Path(legacy_dir)
+    lines_df = pd.read_csv(legacy_dir / "lines.csv")
+    line_stops_df = pd.read_csv(legacy_dir / "line_stops.csv")
+    return lines_df, line_stops_df
+
+
+def line_types_from_names(line_names, current_types):
+    """
+    Transport types implied by line names (O1 omnibus, A1/AS1 autobus, KBS s-bahn).
+
+    Args:
+        line_names: Series of line names
+        current_types: Series of types kept where no rule matches
+
+    Returns:
+        Series of types
+    """
+    types = current_types.copy()
+    matched = pd.Series(False, index=line_names.index)
+    for pattern, line_type in LINE_NAME_TYPE_RULES:
+        # Non-string names give NaN and never match
+        mask = line_names.str.match(pattern, na=False) & ~matched
+        types[mask] = line_type
+        matched |= mask
+    return types
+
+
+def normalize_types(types, line_names=None):
+    """
+    Normalise the transport type terminology.
+
+    Args:
+        types: Series of raw types
+        line_names: Series of line names whose patterns take precedence (optional)
+
+    Returns:
+        Series of types ('unknown' where the type is missing)
+    """
+    lowered = types.str.lower()
+    normalized = lowered.map(TYPE_ALIASES).fillna(lowered).fillna('unknown')
+    if line_names is not None:
+        normalized = line_types_from_names(line_names, normalized)
+    return normalized
+
+
+def normalize_sides(sides, years):
+    """
+    Normalise the east/west terminology with year consideration.
+
+    Unknown or shared sides become 'unified' before 1961 and 'ambiguous'
+    from 1961 on.
+
+    Args:
+        sides: Series of raw sides
+        years: Series of years
+
+    Returns:
+        Series of sides
+    """
+    default = pd.Series(np.where(years >= DIVISION_YEAR, 'ambiguous', 'unified'), index=sides.index)
+    return sides.str.lower().map(SIDE_ALIASES).fillna(default)
+
+
+def infer_sides(lines_df):
+    """
+    Infer east/west for unified/ambiguous lines from "Ost"/"West" in line name or start stop.
+
+    Args:
+        lines_df: Lines with line_name, start_stop and normalised east_west
+
+    Returns:
+        Series of sides
+    """
+    sides = lines_df['east_west']
+    undecided = sides.isin(['unified', 'ambiguous'])
+    line_name = lines_df['line_name'].str.lower()
+    start_stop = lines_df['start_stop'].str.lower()
+
+    # First hit wins: line name before start stop, east before west
+    conditions = [
+        line_name.str.contains('ost|east', na=False),
+        line_name.str.contains('west', na=False),
+        start_stop.str.contains('ost|east', na=False),
+        start_stop.str.contains('west', na=False),
+    ]
+    inferred = np.select(conditions, ['east', 'west', 'east', 'west'], default=None)
+    return sides.where(~undecided | pd.isna(inferred), inferred)
+
+
+def prepare_lines(lines_df):
+    """
+    Apply the type and side rules to the legacy lines.
+
+    Args:
+        lines_df: Raw legacy lines
+
+    Returns:
+        Copy with normalised 'type' and 'east_west'
+    """
+    lines_df = lines_df.copy()
+    lines_df['type'] = normalize_types(lines_df['type'], lines_df['line_name'])
+    lines_df['east_west'] = normalize_sides(lines_df['east_west'], lines_df['year'])
+    lines_df['east_west'] = infer_sides(lines_df)
+    lines_df.loc[lines_df['year'] < DIVISION_YEAR, 'east_west'] = 'unified'
+    return lines_df
+
+
+def join_line_stops(line_stops_df):
+    """
+    Stops string ("A - B - C") of every line, in stop order.
+
+    Args:
+        line_stops_df: Legacy line stops with line_id, stop_name and stop_order
+
+    Returns:
+        Series of stops strings indexed by line_id
+    """
+    ordered = line_stops_df.sort_values(['line_id', 'stop_order'], kind='stable')
+    return ordered.groupby('line_id', sort=False)['stop_name'].agg(" - ".join)
+
+
+def build_year_side_tables(lines_df, stops_by_line):
+    """
+    Raw tables per year and side.
+
+    Args:
+        lines_df: Lines after prepare_lines
+        stops_by_line: Output of join_line_stops
+
+    Returns:
+        Dict mapping (year, side) to a DataFrame with OUTPUT_COLUMNS
+    """
+    # Lines without stop data fall back to their start_stop field
+    start_stop = lines_df['start_stop'].where(lines_df['start_stop'].map(type) == str, "")
+    stops = lines_df['line_id'].map(stops_by_line).fillna(start_stop)
+
+    output = pd.DataFrame({
+        'line_name': lines_df['line_name'],
+        'type': lines_df['type'],
+        'stops': stops,
+        'frequency (7:30)': lines_df['Frequency'].astype(object).where(lines_df['Frequency'].notna(), ''),
+        'length (time)': lines_df['Length (time)'].astype(object).where(lines_df['Length (time)'].notna(), ''),
+        'Length (km)': lines_df['Length (km)'].astype(object).where(lines_df['Length (km)'].notna(), ''),
+        'year': lines_df['year'],
+        'east_west': lines_df['east_west'],
+        'info': '',
+    })[OUTPUT_COLUMNS]
+
+    tables = {}
+    for (year, side), table in output.groupby(['year', 'east_west'], sort=False):
+        tables[(int(year), side)] = table.reset_index(drop=True)
+    return dict(sorted(tables.items(), key=lambda item: item[0][0]))
+
+
+def _write_table(job):
+    table, filepath = job
+    # UTF-8 BOM to match the existing raw files
+    table.to_csv(filepath, index=False, encoding='utf-8-sig')
+    return filepath, len(table)
+
+
+def write_year_side_tables(tables, output_dir=DEFAULT_OUTPUT_DIR, workers=1):
+    """
+    Write one CSV per year_side.
+
+    Args:
+        tables: Output of build_year_side_tables
+        output_dir: Directory for {year}_{side}.csv
+        workers: Number of processes (1 = serial, None = CPU count)
+
+    Returns:
+        List of (path, line count)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(table, os.path.join(output_dir, f"{year}_{side}.csv")) for (year, side), table in tables.items()]
+    if workers == 1 or len(jobs) < 2:
+        return [_write_table(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_write_table, jobs))
+
+
+def integrate_legacy_data(legacy_dir=DEFAULT_LEGACY_DIR, output_dir=DEFAULT_OUTPUT_DIR, workers=1, write=True):
+    """
+    Convert the legacy line tables into raw year_side files.
+
+    Args:
+        legacy_dir: Directory with lines.csv and line_stops.csv
+        output_dir: Directory for the raw files
+        workers: Number of processes for writing (1 = serial, None = CPU count)
+        write: Write the files (False only builds the tables)
+
+    Returns:
+        Dict mapping (year, side) to its table
+    """
+    lines_df, line_stops_df = load_legacy_data(legacy_dir)
+    tables = build_year_side_tables(prepare_lines(lines_df), join_line_stops(line_stops_df))
+    if write:
+        for filepath, count in write_year_side_tables(tables, output_dir, workers):
+            print(f"Created {filepath} with {count} lines")
+    return tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Integrate legacy line data into raw year_side files")
+    parser.add_argument("--legacy-dir", default=str(DEFAULT_LEGACY_DIR), help="Directory with the legacy CSV files")
+    parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="Directory for the raw files")
+    parser.add_argument("--workers", type=int, default=1, help="Processes for writing files (default: 1)")
+    args = parser.parse_args()
+
+    integrate_legacy_data(args.legacy_dir, args.output_dir, args.workers)
+    print("Data migration complete!")
+
+
+if __name__ == "__main__":
+    main()
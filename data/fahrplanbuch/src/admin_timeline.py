@@ -0,0 +1,163 @@
+"""
+Temporal index of Ortsteil-to-Bezirk assignments.
+
+Built from data/db/admin_zone_modelling/ortsteil_assignments.json, the
+interval data behind administrative_timeline.json. Each Ortsteil's
+assignments are cut into non-overlapping segments at every start/end
+boundary, so "Bezirk of Ortsteil X at date D" is one binary search over
+that Ortsteil's sorted boundaries.
+
+Where an Ortsteil was split between Bezirke (partial transfers) several
+assignments are active at once; `bezirke_at` returns all of them and
+`bezirk_at` the most recently assigned one.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADMIN_DIR = Path(__file__).resolve().parents[2] / 'db' / 'admin_zone_modelling'
+
+# Date used for a yearly Fahrplanbuch snapshot
+SNAPSHOT_MONTH_DAY = '07-01'
+
+_OPEN_END = np.datetime64('9999-12-31', 'D')
+
+
+def _day(value) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value).date(), 'D')
+
+
+def snapshot_date(year: int) -> np.datetime64:
+    """Reference date of a yearly snapshot (mid-year)"""
+    return np.datetime64(f"{int(year)}-{SNAPSHOT_MONTH_DAY}", 'D')
+
+
+class AdminTimeline:
+    """
+    Interval index over Ortsteil assignments.
+
+    Args:
+        assignments_data: Parsed ortsteil_assignments.json
+        bezirke_data: Parsed historical_bezirke.json (optional, for names and sides)
+    """
+
+    def __init__(self, assignments_data: Dict, bezirke_data: Optional[Dict] = None):
+        by_ortsteil: Dict[str, List[Tuple[np.datetime64, np.datetime64, str]]] = {}
+        for assignment in assignments_data['assignments']:
+            start = _day(assignment['start_date'])
+            end = _day(assignment['end_date']) if assignment.get('end_date') else _OPEN_END
+            by_ortsteil.setdefault(assignment['ortsteil_name'], []).append((start, end, assignment['bezirk_id']))
+
+        # Per Ortsteil: sorted segment starts and the Bezirke active in each segment
+        self._segments: Dict[str, Tuple[np.ndarray, List[Tuple[str, ...]]]] = {}
+        # Per Ortsteil: primary Bezirk per segment, plus a trailing None for dates before the first
+        self._primary: Dict[str, np.ndarray] = {}
+        for ortsteil, intervals in by_ortsteil.items():
+            boundaries = sorted({start for start, _, _ in intervals} |
+                                {end + np.timedelta64(1, 'D') for _, end, _ in intervals if end != _OPEN_END})
+            active = []
+            for boundary in boundaries:
+                # Most recently started first, so [0] is the current primary Bezirk
+                current = sorted((iv for iv in intervals if iv[0] <= boundary <= iv[1]),
+                                 key=lambda iv: iv[0], reverse=True)
+                active.append(tuple(bezirk_id for _, _, bezirk_id in current))
+            self._segments[ortsteil] = (np.array(boundaries, dtype='datetime64[D]'), active)
+            self._primary[ortsteil] = np.array([bezirke[0] if bezirke else None for bezirke in active] + [None],
+                                               dtype=object)
+
+        self.bezirke = {b['bezirk_id']: b for b in (bezirke_data or {}).get('bezirke', [])}
+
+    @classmethod
+    def from_directory(cls, admin_dir: Union[str, Path] = DEFAULT_ADMIN_DIR) -> "AdminTimeline":
+        """Load ortsteil_assignments.json and historical_bezirke.json from a directory"""
+        admin_dir = Path(admin_dir)
+        with open(admin_dir / 'ortsteil_assignments.json', 'r', encoding='utf-8') as f:
+            assignments_data = json.load(f)
+        bezirke_data = None
+        bezirke_path = admin_dir / 'historical_bezirke.json'
+        if bezirke_path.exists():
+            with open(bezirke_path, 'r', encoding='utf-8') as f:
+                bezirke_data = json.load(f)
+        timeline = cls(assignments_data, bezirke_data)
+        logger.info(f"Loaded administrative timeline for {len(timeline._segments)} Ortsteile")
+        return timeline
+
+    def bezirke_at(self, ortsteil: str, date) -> Tuple[str, ...]:
+        """All Bezirke an Ortsteil belonged to at a date (empty if unknown)"""
+        segments = self._segments.get(ortsteil)
+        if segments is None:
+            return ()
+        starts, active = segments
+        position = np.searchsorted(starts, _day(date), side='right') - 1
+        return active[position] if position >= 0 else ()
+
+    def bezirk_at(self, ortsteil: str, date) -> Optional[str]:
+        """Primary Bezirk of an Ortsteil at a date"""
+        bezirke = self.bezirke_at(ortsteil, date)
+        return bezirke[0] if bezirke else None
+
+    def change_dates(self) -> np.ndarray:
+        """Sorted dates at which any Ortsteil's assignment changes"""
+        if not self._segments:
+            return np.array([], dtype='datetime64[D]')
+        return np.unique(np.concatenate([starts for starts, _ in self._segments.values()]))
+
+    def composition_at(self, date) -> Dict[str, List[str]]:
+        """Ortsteile of every Bezirk at a date (split Ortsteile are listed under each Bezirk)"""
+        composition: Dict[str, List[str]] = {}
+        for ortsteil in self._segments:
+            for bezirk_id in self.bezirke_at(ortsteil, date):
+                composition.setdefault(bezirk_id, []).append(ortsteil)
+        return composition
+
+    def assign(self, ortsteile, dates) -> np.ndarray:
+        """
+        Primary Bezirk of each (Ortsteil, date) pair.
+
+        One binary search per distinct Ortsteil covers all its rows, so a
+        full history of stations is assigned in a single pass.
+
+        Args:
+            ortsteile: Array-like of Ortsteil names
+            dates: Array-like of dates (or a single date for all rows)
+
+        Returns:
+            Array of bezirk_ids, None where the Ortsteil or date is not covered
+        """
+        ortsteile = pd.Series(ortsteile).reset_index(drop=True)
+        dates = pd.to_datetime(pd.Series(dates) if np.ndim(dates) else pd.Series([dates] * len(ortsteile)))
+        days = dates.to_numpy(dtype='datetime64[D]')
+
+        result = np.full(len(ortsteile), None, dtype=object)
+        codes, uniques = pd.factorize(ortsteile)
+        for code, rows in pd.Series(np.arange(len(codes))).groupby(codes).indices.items():
+            if code < 0 or uniques[code] not in self._segments:
+                continue
+            starts, _ = self._segments[uniques[code]]
+            positions = np.searchsorted(starts, days[rows], side='right') - 1
+            # Position -1 (before the first assignment) maps to the trailing None
+            result[rows] = self._primary[uniques[code]][positions]
+        return result
+
+    def bezirk_names(self, bezirk_ids) -> np.ndarray:
+        """Display names for bezirk_ids"""
+        names = {bezirk_id: info.get('name') for bezirk_id, info in self.bezirke.items()}
+        return pd.Series(bezirk_ids, dtype=object).map(names).to_numpy(dtype=object)
+
+
+_timelines: Dict[str, AdminTimeline] = {}
+
+
+def get_timeline(admin_dir: Union[str, Path] = DEFAULT_ADMIN_DIR) -> AdminTimeline:
+    """Shared timeline for an admin data directory, built on first use"""
+    key = str(Path(admin_dir).resolve())
+    if key not in _timelines:
+        _timelines[key] = AdminTimeline.from_directory(admin_dir)
+    return _timelines[key]
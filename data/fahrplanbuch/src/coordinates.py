@@ -0,0 +1,134 @@
+"""
+Columnar parsing and validation of stop coordinates.
+
+Stop locations are stored as "lat,lon" strings, and stations that OpenRefine
+returned as one row may carry several " - " separated names and locations.
+This module parses whole columns at once into float64 latitude/longitude
+arrays, so downstream steps work on numbers instead of re-parsing strings.
+"""
+
+import logging
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Separator between combined station names/locations
+COMBINED_SEPARATOR = ' - '
+
+# Berlin geographic bounds (approximate)
+BERLIN_BOUNDS = {
+    'lat_min': 52.3,
+    'lat_max': 52.7,
+    'lon_min': 13.1,
+    'lon_max': 13.8
+}
+
+_COORD_PATTERN = r'^(?P<latitude>-?\d+(?:\.\d+)?),(?P<longitude>-?\d+(?:\.\d+)?)$'
+
+
+def is_combined(locations: pd.Series) -> pd.Series:
+    """Mask of locations holding several " - " separated coordinates"""
+    return locations.astype(str).str.contains(COMBINED_SEPARATOR, regex=False) & locations.notna()
+
+
+def parse_coordinates(locations: pd.Series) -> pd.DataFrame:
+    """
+    Parse "lat,lon" strings into float64 columns.
+
+    Whitespace is ignored; missing, combined and malformed locations give NaN.
+
+    Args:
+        locations: Series of location strings
+
+    Returns:
+        DataFrame with 'latitude' and 'longitude' columns, sharing the input's index
+    """
+    compact = locations.astype(str).str.replace(r'\s+', '', regex=True)
+    coords = compact.str.extract(_COORD_PATTERN)
+    return coords.astype('float64')
+
+
+def coordinate_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Float latitude/longitude of each row.
+
+    Uses existing 'latitude'/'longitude' columns and only parses 'location'
+    for rows where they are missing.
+
+    Args:
+        df: DataFrame with 'location' and optionally 'latitude'/'longitude'
+
+    Returns:
+        DataFrame with 'latitude' and 'longitude' columns, sharing df's index
+    """
+    if 'latitude' not in df.columns or 'longitude' not in df.columns:
+        return parse_coordinates(df['location'])
+
+    coords = df[['latitude', 'longitude']].apply(pd.to_numeric, errors='coerce')
+    missing = (coords['latitude'].isna() | coords['longitude'].isna()) & df['location'].notna()
+    if missing.any():
+        coords.loc[missing] = parse_coordinates(df.loc[missing, 'location']).to_numpy()
+    return coords
+
+
+def format_coordinates(latitude, longitude, decimals: int = 8) -> pd.Series:
+    """
+    Format coordinate columns as "lat,lon" strings.
+
+    Args:
+        latitude: Latitudes
+        longitude: Longitudes (same length)
+        decimals: Number of decimal places
+
+    Returns:
+        Series of location strings, NaN where either coordinate is missing
+    """
+    index = latitude.index if isinstance(latitude, pd.Series) else None
+    lat = np.asarray(latitude, dtype='float64')
+    lon = np.asarray(longitude, dtype='float64')
+    template = f'%.{decimals}f'
+    formatted = np.char.add(np.char.add(np.char.mod(template, lat), ','), np.char.mod(template, lon))
+    result = pd.Series(formatted, index=index, dtype=object)
+    result[np.isnan(lat) | np.isnan(lon)] = np.nan
+    return result
+
+
+def within_bounds(latitude, longitude, bounds: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """Mask of coordinates inside the bounds (default: BERLIN_BOUNDS)"""
+    bounds = bounds or BERLIN_BOUNDS
+    lat = np.asarray(latitude, dtype='float64')
+    lon = np.asarray(longitude, dtype='float64')
+    return ((lat >= bounds['lat_min']) & (lat <= bounds['lat_max']) &
+            (lon >= bounds['lon_min']) & (lon <= bounds['lon_max']))
+
+
+def explode_combined(df: pd.DataFrame, columns: Sequence[str] = ('stop_name', 'location')) -> pd.DataFrame:
+    """
+    Split combined rows into one row per station.
+
+    Rows whose columns split into different numbers of parts are left out
+    (with a warning); the caller decides what to do with them.
+
+    Args:
+        df: DataFrame of combined rows
+        columns: Columns split on " - " in parallel
+
+    Returns:
+        Exploded DataFrame keeping the original index, with a 'part' column
+        numbering the stations within each original row
+    """
+    columns = list(columns)
+    parts = {col: df[col].astype(str).str.split(COMBINED_SEPARATOR) for col in columns}
+    lengths = pd.DataFrame({col: parts[col].str.len() for col in columns})
+    consistent = lengths.nunique(axis=1) == 1
+
+    for name in df.loc[~consistent, columns[0]]:
+        logger.warning(f"Mismatch between names and locations for {name}")
+
+    exploded = df.loc[consistent].assign(**{col: parts[col][consistent] for col in columns})
+    exploded = exploded.explode(columns)
+    exploded['part'] = exploded.groupby(level=0).cumcount()
+    return exploded
@@ -1,8 +1,8 @@
 # db_connector.py - Can be used by both notebook and station-verifier
 
-from neo4j import GraphDatabase
 import logging
 from typing import Optional, Dict, List, Tuple
+from driver_registry import get_driver
 
 class BerlinTransportDB:
     def __init__(self, uri: str, username: str, password: str, max_retries: int = 3):
@@ -16,11 +16,8 @@ class BerlinTransportDB:
     def connect(self):
         """Connect to the database if not already connected"""
         if self.driver is None:
-            self.driver = GraphDatabase.driver(
-                self.uri, 
-                auth=(self.username, self.password),
-                max_connection_lifetime=3600  # 1 hour
-            )
+            # Pooled driver shared with every other user of this URI
+            self.driver = get_driver(self.uri, self.username, self.password)
     
     def close(self):
         """Close the database connection"""
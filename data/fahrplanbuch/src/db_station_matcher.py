@@ -14,8 +14,8 @@ class Neo4jStationMatcher:
             username: Neo4j username
             password: Neo4j password
         """
-        from neo4j import GraphDatabase
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        from driver_registry import get_driver
+        self.driver = get_driver(uri, username, password)
         self.logger = logging.getLogger(__name__)
         
     def close(self):
@@ -2,14 +2,17 @@
 
 import logging
 import pandas as pd
-from neo4j import GraphDatabase
+from driver_registry import get_driver
 from fuzzywuzzy import process, fuzz
 from typing import Optional, Dict, List
 
+from name_normalisation import get_normaliser
+
 class DataFrameStationMatcher:
     """
     Matches stations from new data against historical station data fetched once 
-    from Neo4j, using fuzzy matching on names and requiring matching type and line name.
+    from Neo4j, joining on canonical name keys (fuzzy matching only the leftovers)
+    and requiring matching type and line name.
     Matches against the single closest previous year for the specified side (east/west).
     """
     
@@ -22,7 +25,7 @@ class DataFrameStationMatcher:
             username: Neo4j username
             password: Neo4j password
         """
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.driver = get_driver(uri, username, password)
         self.logger = logging.getLogger(__name__)
         self.historical_stations_df = pd.DataFrame() # To store fetched historical data
 
@@ -30,7 +33,7 @@ class DataFrameStationMatcher:
         """Close the database connection."""
         if self.driver:
             self.driver.close()
-            self.logger.info("Neo4j connection closed.")
+            self.logger.info("Neo4j connection released.")
 
     def _fetch_historical_stations(self, current_year: int, side: str) -> bool:
         """
@@ -150,58 +153,83 @@ class DataFrameStationMatcher:
             return result_df
 
 
-        # Iterate through the stops that need matching
-        for idx, row in result_df.iterrows():
-            target_name = row['stop_name']
-            target_type = row['type']
-            target_line_name = row['line_name'] # Get the line name from the current data
-
-            # Filter historical data by station type first
-            candidates_df = self.historical_stations_df[self.historical_stations_df['type'] == target_type].copy() # Use .copy() to avoid SettingWithCopyWarning
-            
-            if candidates_df.empty:
+        historical_df = self.historical_stations_df
+        normaliser = get_normaliser()
+        if 'name_key' not in historical_df.columns:
+            historical_df['name_key'] = normaliser.keys(historical_df['name']).values
+        target_keys = normaliser.keys(result_df['stop_name']).values
+
+        # Historical stations per type, and per (type, canonical key) for the exact join
+        candidates_by_type = {station_type: group for station_type, group in historical_df.groupby('type')}
+        labels_by_key = {}
+        for label, station_type, key in zip(historical_df.index, historical_df['type'], historical_df['name_key']):
+            labels_by_key.setdefault((station_type, key), []).append(label)
+        fuzzy_results = {}
+
+        matched_columns = ['latitude', 'longitude', 'location', 'match_score', 'matched_name', 'matched_stop_id',
+                           'matched_historical_lines']
+        matched_rows = {col: {} for col in matched_columns}
+
+        # Join on canonical keys first; only stops without a same-key station are scored fuzzily
+        for idx, target_name, target_type, target_line_name, target_key in zip(
+                result_df.index, result_df['stop_name'], result_df['type'], result_df['line_name'], target_keys):
+            candidates_df = candidates_by_type.get(target_type)
+            if candidates_df is None:
                 self.logger.debug(f"No historical candidates found for type '{target_type}' for station '{target_name}'")
                 continue
 
-            # Perform fuzzy matching on names within the filtered candidates
-            match_result = process.extractOne(
-                target_name, 
-                candidates_df['name'], 
-                scorer=fuzz.WRatio, # WRatio often works well for variations
-                score_cutoff=score_cutoff
-            )
-
-            if match_result:
-                matched_name_fuzzy, score, original_index = match_result
-                
-                # Get the full data for the potential matched station
-                potential_match_data = candidates_df.loc[original_index]
-
-                # --- ADDED CHECK: Verify if the target_line_name matches the historical lines ---
-                historical_lines_list = potential_match_data['historical_lines']
-                if isinstance(historical_lines_list, list) and target_line_name in historical_lines_list:
-                    # Line name match successful! Accept the match.
-                    
-                    # Add matched data to the result DataFrame
-                    result_df.loc[idx, 'latitude'] = potential_match_data['latitude']
-                    result_df.loc[idx, 'longitude'] = potential_match_data['longitude']
-                    result_df.loc[idx, 'location'] = potential_match_data['location']
-                    result_df.loc[idx, 'match_score'] = score
-                    result_df.loc[idx, 'matched_name'] = potential_match_data['name'] # Name from historical data
-                    result_df.loc[idx, 'matched_stop_id'] = potential_match_data['stop_id']
-                    result_df.loc[idx, 'matched_historical_lines'] = historical_lines_list # Store the list of lines for reference
-                    
-                    match_count += 1
-                    self.logger.debug(f"Matched '{target_name}' ({target_type}, Line: {target_line_name}) -> '{potential_match_data['name']}' ({potential_match_data['type']}, Lines: {historical_lines_list}) with score {score}")
-                
-                else:
-                    # Fuzzy name and type matched, but the line name did not match.
-                    self.logger.info(f"Partial match (name/type ok, score={score}) but line mismatch for: '{target_name}' ({target_type}, Line: {target_line_name}). Historical lines: {historical_lines_list}")
-            
+            exact_labels = labels_by_key.get((target_type, target_key)) if target_key else None
+            if exact_labels:
+                # Several stations can share a name; prefer the one serving this line
+                original_index = next((label for label in exact_labels
+                                       if target_line_name in (historical_df.at[label, 'historical_lines'] or [])),
+                                      exact_labels[0])
+                score = 100
             else:
-                # No fuzzy name match found above the cutoff
-                self.logger.info(f"No fuzzy name match found (cutoff={score_cutoff}) for station: '{target_name}' ({target_type}, Line: {target_line_name})")
+                # Stops with the same key and type share one fuzzy search
+                if (target_type, target_key) not in fuzzy_results:
+                    fuzzy_results[(target_type, target_key)] = process.extractOne(
+                        target_key,
+                        candidates_df['name_key'],
+                        scorer=fuzz.WRatio, # WRatio often works well for variations
+                        score_cutoff=score_cutoff
+                    ) if target_key else None
+                match_result = fuzzy_results[(target_type, target_key)]
+                if not match_result:
+                    # No fuzzy name match found above the cutoff
+                    self.logger.info(f"No fuzzy name match found (cutoff={score_cutoff}) for station: '{target_name}' ({target_type}, Line: {target_line_name})")
+                    continue
+                _, score, original_index = match_result
+
+            # Get the full data for the potential matched station
+            potential_match_data = historical_df.loc[original_index]
+
+            # Verify if the target_line_name matches the historical lines
+            historical_lines_list = potential_match_data['historical_lines']
+            if isinstance(historical_lines_list, list) and target_line_name in historical_lines_list:
+                # Line name match successful! Accept the match.
+                matched_rows['latitude'][idx] = potential_match_data['latitude']
+                matched_rows['longitude'][idx] = potential_match_data['longitude']
+                matched_rows['location'][idx] = potential_match_data['location']
+                matched_rows['match_score'][idx] = score
+                matched_rows['matched_name'][idx] = potential_match_data['name'] # Name from historical data
+                matched_rows['matched_stop_id'][idx] = potential_match_data['stop_id']
+                matched_rows['matched_historical_lines'][idx] = historical_lines_list # Store the list of lines for reference
+
+                match_count += 1
+                self.logger.debug(f"Matched '{target_name}' ({target_type}, Line: {target_line_name}) -> '{potential_match_data['name']}' ({potential_match_data['type']}, Lines: {historical_lines_list}) with score {score}")
+
+            else:
+                # Name and type matched, but the line name did not match.
+                self.logger.info(f"Partial match (name/type ok, score={score}) but line mismatch for: '{target_name}' ({target_type}, Line: {target_line_name}). Historical lines: {historical_lines_list}")
+
+        for col, values in matched_rows.items():
+            if values:
+                result_df[col] = result_df[col].astype(object)
+                result_df.loc[list(values), col] = pd.Series(values, dtype=object)
 
+        normaliser.save()
+        self.logger.info(f"Fuzzy name searches: {len(fuzzy_results)} for {total_stops} stops after the canonical key join.")
         self.logger.info(f"Successfully matched {match_count} out of {total_stops} stations using fuzzy name, type, and line matching.")
         
         # Fill NaNs in location string col based on lat/lon cols if needed
@@ -0,0 +1,210 @@
+# driver_registry.py - Shared Neo4j drivers for the src tooling and station-verifier
+
+import os
+import time
+import atexit
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from neo4j import GraphDatabase
+
+logger = logging.getLogger(__name__)
+
+# Pool settings; each can be overridden per process through the environment
+DEFAULT_POOL_SETTINGS = {
+    "max_connection_pool_size": int(os.environ.get("NEO4J_MAX_POOL_SIZE", 50)),
+    "connection_acquisition_timeout": float(os.environ.get("NEO4J_ACQUISITION_TIMEOUT", 60)),
+    "max_connection_lifetime": int(os.environ.get("NEO4J_MAX_CONNECTION_LIFETIME", 3600)),
+    "keep_alive": os.environ.get("NEO4J_KEEP_ALIVE", "true").lower() == "true",
+}
+
+_drivers: Dict[Tuple[str, str], "SharedDriver"] = {}
+_lock = threading.Lock()
+
+
+class _PoolStats:
+    """Session counters and wait times for one shared driver"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.sessions_opened = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def session_opened(self):
+        with self._lock:
+            self.in_use += 1
+            self.sessions_opened += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def session_closed(self):
+        with self._lock:
+            self.in_use -= 1
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.waits += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "sessions_in_use": self.in_use,
+                "peak_sessions_in_use": self.peak_in_use,
+                "sessions_opened": self.sessions_opened,
+                "avg_wait_seconds": round(self.total_wait / self.waits, 4) if self.waits else 0.0,
+                "max_wait_seconds": round(self.max_wait, 4)
+            }
+
+
+class _TrackedSession:
+    """
+    Session proxy that counts itself as in use while open.
+
+    A session takes a pooled connection on its first query, so the duration
+    of that first call is recorded as the connection wait (acquisition plus
+    one round trip).
+    """
+
+    def __init__(self, session, stats: _PoolStats):
+        self._session = session
+        self._stats = stats
+        self._waited = False
+        self._closed = False
+        stats.session_opened()
+
+    def _timed(self, method, *args, **kwargs):
+        if self._waited:
+            return method(*args, **kwargs)
+        self._waited = True
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self._stats.record_wait(time.perf_counter() - start)
+
+    def run(self, *args, **kwargs):
+        return self._timed(self._session.run, *args, **kwargs)
+
+    def begin_transaction(self, *args, **kwargs):
+        return self._timed(self._session.begin_transaction, *args, **kwargs)
+
+    def execute_read(self, *args, **kwargs):
+        return self._timed(self._session.execute_read, *args, **kwargs)
+
+    def execute_write(self, *args, **kwargs):
+        return self._timed(self._session.execute_write, *args, **kwargs)
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._stats.session_closed()
+            self._session.close()
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SharedDriver:
+    """
+    Handle on a process-wide pooled driver.
+
+    Behaves like a neo4j Driver for the calls used in this project, but
+    close() only releases the handle: the underlying driver stays open for
+    the other users of the same URI until close_all() runs at exit.
+    """
+
+    def __init__(self, driver, uri: str, settings: Dict):
+        self._driver = driver
+        self.uri = uri
+        self.settings = settings
+        self.stats = _PoolStats()
+
+    def session(self, **kwargs):
+        return _TrackedSession(self._driver.session(**kwargs), self.stats)
+
+    def verify_connectivity(self):
+        return self._driver.verify_connectivity()
+
+    def close(self):
+        """Release this handle (the shared driver is closed by close_all)"""
+
+    def metrics(self) -> Dict:
+        """Session counters plus connection counts from the driver's pool where available"""
+        metrics = {"uri": self.uri, "max_pool_size": self.settings.get("max_connection_pool_size")}
+        metrics.update(self.stats.snapshot())
+        metrics.update(_connection_counts(self._driver))
+        return metrics
+
+
+def _connection_counts(driver) -> Dict:
+    """Best-effort in-use/idle connection counts read from the driver's pool internals"""
+    connections = getattr(getattr(driver, "_pool", None), "connections", None)
+    if not connections:
+        return {}
+    try:
+        all_connections = [c for address_connections in list(connections.values()) for c in list(address_connections)]
+        in_use = sum(1 for c in all_connections if getattr(c, "in_use", False))
+        return {"connections_in_use": in_use, "connections_idle": len(all_connections) - in_use}
+    except Exception:
+        return {}
+
+
+def get_driver(uri: str, username: str, password: str, **pool_settings) -> SharedDriver:
+    """
+    Get the shared pooled driver for a URI/user, creating it on first use
+
+    Args:
+        uri: Neo4j connection URI
+        username: Neo4j username
+        password: Neo4j password
+        **pool_settings: Overrides for DEFAULT_POOL_SETTINGS (only applied
+            when the driver is first created)
+
+    Returns:
+        SharedDriver handle
+    """
+    key = (uri, username)
+    with _lock:
+        shared = _drivers.get(key)
+        if shared is None:
+            settings = dict(DEFAULT_POOL_SETTINGS, **pool_settings)
+            driver = GraphDatabase.driver(uri, auth=(username, password), **settings)
+            shared = SharedDriver(driver, uri, settings)
+            _drivers[key] = shared
+            logger.info(f"Created shared Neo4j driver for {uri} "
+                        f"(pool size {settings['max_connection_pool_size']})")
+        return shared
+
+
+def pool_metrics() -> Dict[str, Dict]:
+    """Metrics of every shared driver, keyed by 'user@uri'"""
+    with _lock:
+        drivers = dict(_drivers)
+    return {f"{username}@{uri}": shared.metrics() for (uri, username), shared in drivers.items()}
+
+
+def close_all():
+    """Close every shared driver"""
+    with _lock:
+        drivers = list(_drivers.values())
+        _drivers.clear()
+    for shared in drivers:
+        try:
+            shared._driver.close()
+        except Exception as e:
+            logger.warning(f"Error closing Neo4j driver for {shared.uri}: {e}")
+
+
+atexit.register(close_all)
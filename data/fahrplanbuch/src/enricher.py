@@ -9,7 +9,17 @@ from pathlib import Path
 import json
 import logging
 from typing import Dict, Tuple, Optional, List, Union
-from shapely.geometry import Point
+
+try:
+    from line_rules import load_line_rules, classify_profiles, line_capacities
+    from spatial_assignment import SpatialAssigner, DEFAULT_LAYERS, get_assigner
+    from coordinates import coordinate_columns
+    from admin_timeline import AdminTimeline, get_timeline, snapshot_date
+except ImportError:  # imported as src.enricher from the notebooks
+    from .line_rules import load_line_rules, classify_profiles, line_capacities
+    from .spatial_assignment import SpatialAssigner, DEFAULT_LAYERS, get_assigner
+    from .coordinates import coordinate_columns
+    from .admin_timeline import AdminTimeline, get_timeline, snapshot_date
 
 logger = logging.getLogger(__name__)
 
@@ -51,63 +61,26 @@ def load_data(paths: Dict[str, Path], year: int, side: str) -> Tuple:
 
 # ---- Line Enrichment Functions ----
 
-def enrich_lines(line_df: pd.DataFrame, side) -> pd.DataFrame:
+def enrich_lines(line_df: pd.DataFrame, side, rules: Optional[Dict] = None) -> pd.DataFrame:
     """
     Enrich lines with profile and capacity information.
     
+    Profiles and capacities come from the rule table in line_rules.json.
+    
     Args:
         line_df: DataFrame with line information
+        side: Side of Berlin, appended to the line IDs
+        rules: Rule table (default: line_rules.json)
         
     Returns:
         Enriched line DataFrame
     """
     try:
         line_df = line_df.copy()
+        rules = rules or load_line_rules()
         
-        # Define sets for U-Bahn profile classification
-        kleinprofil = {'1', '2', '3', '4', 'A', 'A I', 'A II', 'A III', 'A1', 'A2', 'B', 'B I', 'B II', 'B III', 'B1', 'B2'}
-        grossprofil = {'5', '6', '7', '8', '9', 'C', 'C I', 'C II', 'D', 'E', 'G'}
-        
-        # Add profile for U-Bahn lines
-        line_df['profile'] = None
-        
-        # Filter for U-Bahn lines
-        u_bahn_mask = line_df['type'] == 'u-bahn'
-        
-        # Add profile based on line name
-        for idx, row in line_df[u_bahn_mask].iterrows():
-            line_name = row['line_name']
-            if line_name in kleinprofil:
-                line_df.loc[idx, 'profile'] = 'Kleinprofil'
-            elif line_name in grossprofil:
-                line_df.loc[idx, 'profile'] = 'Großprofil'
-        
-        # Add capacity information based on type and profile
-        line_df['capacity'] = 0
-        
-        # Set capacity values based on transport type
-        for idx, row in line_df.iterrows():
-            transport_type = row['type']
-            
-            if transport_type == 'u-bahn':
-                if row['profile'] == 'Kleinprofil':
-                    line_df.loc[idx, 'capacity'] = 750
-                elif row['profile'] == 'Großprofil':
-                    line_df.loc[idx, 'capacity'] = 1000
-                else:
-                    line_df.loc[idx, 'capacity'] = 875  # Average if profile unknown
-                    
-            elif transport_type == 's-bahn':
-                line_df.loc[idx, 'capacity'] = 1100
-                
-            elif transport_type == 'strassenbahn' or transport_type == 'tram':
-                line_df.loc[idx, 'capacity'] = 195
-                
-            elif transport_type.startswith('bus'):
-                line_df.loc[idx, 'capacity'] = 100
-                
-            elif transport_type == 'fähre' or transport_type == 'FÃ¤hre':
-                line_df.loc[idx, 'capacity'] = 300
+        line_df['profile'] = classify_profiles(line_df, rules)
+        line_df['capacity'] = line_capacities(line_df, rules)
 
         line_df['line_id'] = line_df['line_id'].astype(str) + '_' + side
         
@@ -193,33 +166,20 @@ def convert_stops_to_geodataframe(stops_df: pd.DataFrame, crs: str = "EPSG:4326"
     Convert stops DataFrame to GeoDataFrame with proper geometry.
     
     Args:
-        stops_df: DataFrame with stops and location column
+        stops_df: DataFrame with stops and latitude/longitude (or location) columns
         crs: Coordinate reference system (default: WGS84)
         
     Returns:
         GeoDataFrame with Point geometries
     """
     try:
-        stops_df = stops_df.copy()
-        
-        # Function to create Point geometry from location string
-        def create_point(loc_str):
-            if pd.isna(loc_str) or loc_str == '':
-                return None
-            try:
-                lat, lon = map(float, str(loc_str).split(','))
-                return Point(lon, lat)  # Note: GeoDataFrame expects (lon, lat)
-            except (ValueError, TypeError):
-                return None
-        
-        # Create geometry column
-        geometries = stops_df['location'].apply(create_point)
-        
-        # Create GeoDataFrame
-        gdf = gpd.GeoDataFrame(stops_df, geometry=geometries, crs=crs)
-        
-        # Remove rows with invalid geometries
-        valid_gdf = gdf[~gdf.geometry.isna()].copy()
+        coords = coordinate_columns(stops_df)
+        lats, lons = coords['latitude'].to_numpy(), coords['longitude'].to_numpy()
+        valid = ~(np.isnan(lats) | np.isnan(lons))
+        
+        # Note: GeoDataFrame expects (lon, lat)
+        valid_gdf = gpd.GeoDataFrame(stops_df[valid].copy(), 
+                                     geometry=gpd.points_from_xy(lons[valid], lats[valid]), crs=crs)
         logger.info(f"Created GeoDataFrame with {len(valid_gdf)} valid geometries "
                     f"from {len(stops_df)} total stops")
         
@@ -230,55 +190,47 @@ def convert_stops_to_geodataframe(stops_df: pd.DataFrame, crs: str = "EPSG:4326"
         # Return empty GeoDataFrame with same schema
         return gpd.GeoDataFrame(stops_df.head(0), geometry=gpd.GeoSeries(dtype=object), crs=crs)
 
+def _located_stops(stops_df: pd.DataFrame) -> pd.DataFrame:
+    """Stops with coordinates"""
+    coords = coordinate_columns(stops_df)
+    return stops_df[coords['latitude'].notna() & coords['longitude'].notna()]
+
 def add_administrative_data(side, stops_df: pd.DataFrame, 
-                           districts_gdf: gpd.GeoDataFrame, 
-                           west_berlin_districts: List[str]) -> pd.DataFrame:
+                           districts_gdf: Optional[gpd.GeoDataFrame] = None, 
+                           west_berlin_districts: Optional[List[str]] = None,
+                           assigner: Optional[SpatialAssigner] = None) -> pd.DataFrame:
     """
     Add district and neighborhood information to stops.
     
+    Stops without a valid location are dropped, as before.
+    
     Args:
+        side: Side of Berlin (east/west)
         stops_df: DataFrame with stops
-        districts_gdf: GeoDataFrame with district boundaries
+        districts_gdf: GeoDataFrame with district boundaries (used if assigner is None)
         west_berlin_districts: List of district names in West Berlin
+        assigner: Prebuilt SpatialAssigner with an 'admin' layer (optional)
         
     Returns:
         DataFrame with added administrative data
     """
     try:
-        # Convert stops to GeoDataFrame
-        stops_gdf = convert_stops_to_geodataframe(stops_df)
+        if assigner is None:
+            assigner = SpatialAssigner({'admin': (districts_gdf, DEFAULT_LAYERS['admin'][1])})
         
-        if len(stops_gdf) == 0:
+        result_df = _located_stops(stops_df).copy()
+        
+        if len(result_df) == 0:
             logger.warning("No valid geometries in stops data, skipping administrative enrichment")
             return stops_df
-            
-        # Ensure CRS match
-        if districts_gdf.crs != stops_gdf.crs:
-            logger.info(f"Converting district CRS from {districts_gdf.crs} to {stops_gdf.crs}")
-            districts_gdf = districts_gdf.to_crs(stops_gdf.crs)
         
-        # Perform spatial join
-        result_gdf = gpd.sjoin(stops_gdf, districts_gdf, how="left", predicate='within')
-        
-        # Drop unnecessary columns from the join
-        columns_to_drop = ["index_right", "gml_id", "spatial_name", "spatial_alias", 
-                           "spatial_type", "FLAECHE_HA"]
-        for col in columns_to_drop:
-            if col in result_gdf.columns:
-                result_gdf = result_gdf.drop(columns=[col])
+        assigned = assigner.assign_stops(result_df)
+        for col in ('neighbourhood', 'district'):
+            if col in assigned.columns:
+                result_df[col] = assigned[col]
         
         # Add east/west column
-        result_gdf['east_west'] = f"{side}"
-        
-        # Rename district columns to standardized names
-        column_mapping = {
-            'OTEIL': 'neighbourhood',
-            'BEZIRK': 'district'
-        }
-        result_gdf = result_gdf.rename(columns=column_mapping)
-        
-        # Convert back to DataFrame
-        result_df = pd.DataFrame(result_gdf.drop(columns='geometry'))
+        result_df['east_west'] = f"{side}"
         
         logger.info(f"Added administrative data to {len(result_df)} stops")
         return result_df
@@ -289,7 +241,8 @@ def add_administrative_data(side, stops_df: pd.DataFrame,
 
 def add_postal_code_data(stops_df: pd.DataFrame, 
                          plz_gdf: Optional[gpd.GeoDataFrame] = None, 
-                         geo_data_dir: Optional[Path] = None) -> pd.DataFrame:
+                         geo_data_dir: Optional[Path] = None,
+                         assigner: Optional[SpatialAssigner] = None) -> pd.DataFrame:
     """
     Add postal code information to stops.
     
@@ -297,42 +250,28 @@ def add_postal_code_data(stops_df: pd.DataFrame,
         stops_df: DataFrame with stops
         plz_gdf: GeoDataFrame with postal code boundaries (optional)
         geo_data_dir: Directory containing geographic data files (used if plz_gdf is None)
+        assigner: Prebuilt SpatialAssigner with a 'plz' layer (optional)
         
     Returns:
         DataFrame with added postal code data
     """
     try:
-        # If no plz_gdf is provided, try to load it
-        if plz_gdf is None:
-            plz_gdf = load_postal_code_data(geo_data_dir)
+        if assigner is None:
+            # If no plz_gdf is provided, try to load it
             if plz_gdf is None:
-                logger.warning("Could not load postal code data, skipping postal code enrichment")
-                return stops_df
-        
-        # Convert stops to GeoDataFrame
-        stops_gdf = convert_stops_to_geodataframe(stops_df)
-        
-        if len(stops_gdf) == 0:
-            logger.warning("No valid geometries in stops data, skipping postal code enrichment")
-            return stops_df
-            
-        # Ensure CRS match
-        if plz_gdf.crs != stops_gdf.crs:
-            logger.info(f"Converting postal code CRS from {plz_gdf.crs} to {stops_gdf.crs}")
-            plz_gdf = plz_gdf.to_crs(stops_gdf.crs)
-        
-        # Perform spatial join
-        joined_gdf = gpd.sjoin(stops_gdf, plz_gdf, how="left", predicate='within')
-        
-        # Check if the 'plz' column is in the result
-        postal_code_column = 'plz'
-        if postal_code_column not in joined_gdf.columns:
-            logger.warning(f"Postal code column '{postal_code_column}' not found in joined data")
+                plz_gdf = load_postal_code_data(geo_data_dir)
+                if plz_gdf is None:
+                    logger.warning("Could not load postal code data, skipping postal code enrichment")
+                    return stops_df
+            assigner = SpatialAssigner({'plz': (plz_gdf, DEFAULT_LAYERS['plz'][1])})
+        
+        if 'postal_code' not in assigner.output_columns:
+            logger.warning("Postal code column 'plz' not found in postal code data")
             return stops_df
         
         # Create a copy of the original DataFrame and add the postal code
         result_df = stops_df.copy()
-        result_df['postal_code'] = joined_gdf[postal_code_column]
+        result_df['postal_code'] = assigner.assign_stops(result_df)['postal_code']
         
         # Count how many stops got a postal code
         postal_codes_added = result_df['postal_code'].notna().sum()
@@ -342,4 +281,82 @@ def add_postal_code_data(stops_df: pd.DataFrame,
         
     except Exception as e:
         logger.error(f"Error adding postal code data: {e}")
-        return stops_df
\ No newline at end of file
+        return stops_df
+
+def add_spatial_data(side, stops_df: pd.DataFrame, geo_data_dir: Path) -> pd.DataFrame:
+    """
+    Add district, neighbourhood and postal code to stops in one spatial query.
+    
+    Uses the shared assigner for geo_data_dir, so repeated calls (e.g. one per
+    snapshot) reuse the loaded polygons, their index and the coordinate cache.
+    
+    Args:
+        side: Side of Berlin (east/west)
+        stops_df: DataFrame with stops
+        geo_data_dir: Directory containing geographic data files
+        
+    Returns:
+        DataFrame with added administrative and postal code data
+    """
+    try:
+        assigner = get_assigner(geo_data_dir)
+        
+        result_df = _located_stops(stops_df).copy()
+        if len(result_df) == 0:
+            logger.warning("No valid geometries in stops data, skipping spatial enrichment")
+            return stops_df
+        
+        assigned = assigner.assign_stops(result_df)
+        for col in ('neighbourhood', 'district'):
+            if col in assigned.columns:
+                result_df[col] = assigned[col]
+        result_df['east_west'] = f"{side}"
+        if 'postal_code' in assigned.columns:
+            result_df['postal_code'] = assigned['postal_code']
+        
+        logger.info(f"Added spatial data to {len(result_df)} stops "
+                    f"({result_df.get('postal_code', pd.Series(dtype=object)).notna().sum()} with postal code)")
+        return result_df
+        
+    except Exception as e:
+        logger.error(f"Error adding spatial data: {e}")
+        return stops_df
+
+def add_historical_bezirk(stops_df: pd.DataFrame, 
+                          year: Optional[int] = None, 
+                          timeline: Optional[AdminTimeline] = None) -> pd.DataFrame:
+    """
+    Add the Bezirk each stop's Ortsteil belonged to at the time of the snapshot.
+    
+    Args:
+        stops_df: DataFrame with a 'neighbourhood' column
+        year: Snapshot year; if None, the 'year' column is used, so the stops
+            of several snapshots can be assigned in one pass
+        timeline: AdminTimeline (default: the shared one from data/db/admin_zone_modelling)
+        
+    Returns:
+        DataFrame with added 'bezirk_id' and 'historical_district' columns
+    """
+    try:
+        if 'neighbourhood' not in stops_df.columns:
+            logger.warning("No neighbourhood column, skipping historical Bezirk assignment")
+            return stops_df
+        
+        timeline = timeline or get_timeline()
+        result_df = stops_df.copy()
+        
+        if year is None:
+            dates = result_df['year'].astype(int).map(snapshot_date).to_numpy()
+        else:
+            dates = snapshot_date(year)
+        
+        result_df['bezirk_id'] = timeline.assign(result_df['neighbourhood'].to_numpy(dtype=object), dates)
+        result_df['historical_district'] = timeline.bezirk_names(result_df['bezirk_id'].to_numpy(dtype=object))
+        
+        assigned = result_df['bezirk_id'].notna().sum()
+        logger.info(f"Assigned historical Bezirk to {assigned} out of {len(result_df)} stops")
+        return result_df
+        
+    except Exception as e:
+        logger.error(f"Error adding historical Bezirk data: {e}")
+        return stops_df
@@ -8,10 +8,22 @@ import shutil
 import glob
 import re
 
+try:
+    from name_normalisation import get_normaliser, match_names
+except ImportError:  # imported as src.fuzzy_line_harmoniser from the notebooks
+    from .name_normalisation import get_normaliser, match_names
+
+def _combined_score(name1: str, name2: str) -> float:
+    """Average of ratio, partial ratio and token sort ratio"""
+    return (fuzz.ratio(name1, name2) + fuzz.partial_ratio(name1, name2) + fuzz.token_sort_ratio(name1, name2)) / 3
+
 def fuzzy_match_stations(stops1: List[str], stops2: List[str], threshold: int = 85) -> Dict:
     """
     Perform fuzzy matching between two lists of station names.
     
+    Names with the same canonical key (or token signature) match with score
+    100; only the remaining names are compared with the fuzzy metrics.
+    
     Args:
         stops1: First list of station names
         stops2: Second list of station names
@@ -20,36 +32,8 @@ def fuzzy_match_stations(stops1: List[str], stops2: List[str], threshold: int =
     Returns:
         Dictionary of matches {index_in_stops1: (index_in_stops2, score, original_name1, original_name2)}
     """
-    matches = {}
-    
-    # Try to find the best match for each station in stops1
-    for i, stop1 in enumerate(stops1):
-        best_match_idx = -1
-        best_match_score = 0
-        
-        for j, stop2 in enumerate(stops2):
-            # Skip empty names
-            if not stop1 or not stop2:
-                continue
-            
-            # Calculate similarity scores using multiple metrics
-            ratio = fuzz.ratio(stop1.lower(), stop2.lower())
-            partial_ratio = fuzz.partial_ratio(stop1.lower(), stop2.lower())
-            token_sort_ratio = fuzz.token_sort_ratio(stop1.lower(), stop2.lower())
-            
-            # Use a weighted average of different fuzzy metrics
-            score = (ratio + partial_ratio + token_sort_ratio) / 3
-            
-            # Update best match if this is better
-            if score > best_match_score and score >= threshold:
-                best_match_score = score
-                best_match_idx = j
-        
-        # If a match was found, store it
-        if best_match_idx >= 0:
-            matches[i] = (best_match_idx, best_match_score, stops1[i], stops2[best_match_idx])
-    
-    return matches
+    matches = match_names(stops1, stops2, _combined_score, threshold)
+    return {i: (j, score, stops1[i], stops2[j]) for i, (j, score) in matches.items()}
 
 def parse_stops(stops_str: str) -> List[str]:
     """Parse the stops string into a list of station names."""
@@ -211,6 +195,8 @@ def main():
         dry_run=args.dry_run
     )
     
+    get_normaliser().save()
+    
     # Print the changes report
     report = format_changes_report(changes_log)
     print("\n" + report)
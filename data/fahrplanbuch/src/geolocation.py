@@ -2,44 +2,38 @@
 
 import pandas as pd
 import numpy as np
-import re
 import logging
 import folium
 from pathlib import Path
 from typing import Dict, Union, Optional
+from coordinates import (BERLIN_BOUNDS, coordinate_columns, explode_combined, format_coordinates,
+                         is_combined, parse_coordinates, within_bounds)
 
 logger = logging.getLogger(__name__)
 
 def verify_geo_format(df: pd.DataFrame) -> pd.DataFrame:
-    """Verify and standardize geolocation format."""
+    """
+    Verify and standardize geolocation format.
+    
+    Valid locations are rewritten as "lat,lon" with 8 decimals and their
+    parsed values are stored in float 'latitude'/'longitude' columns.
+    Combined " - " locations are kept for split_combined_stations.
+    """
     # Make a copy to avoid modifying the original
     df = df.copy()
     
-    # Function to check and format location string
-    def format_location(loc_str):
-        if pd.isna(loc_str) or loc_str == '':
-            return np.nan
-            
-        # Check if it contains multiple locations (with a hyphen)
-        if ' - ' in loc_str:
-            # This will be handled separately
-            return loc_str
-            
-        # Remove any extra spaces
-        loc_str = re.sub(r'\s+', '', loc_str)
-        
-        # Check if it's a valid coordinate pair
-        pattern = r'^(-?\d+(\.\d+)?),(-?\d+(\.\d+)?)$'
-        if re.match(pattern, loc_str):
-            # Valid format, ensure consistent decimal places
-            lat, lon = map(float, loc_str.split(','))
-            return f"{lat:.8f},{lon:.8f}"
-        else:
-            logger.warning(f"Invalid coordinate format: {loc_str}")
-            return np.nan
-    
-    # Apply formatting to location column
-    df['location'] = df['location'].apply(format_location)
+    location = df['location'].where(df['location'] != '')
+    combined = is_combined(location)
+    coords = parse_coordinates(location)
+    valid = coords['latitude'].notna() & coords['longitude'].notna()
+    
+    invalid = location.notna() & ~combined & ~valid
+    for loc_str in location[invalid]:
+        logger.warning(f"Invalid coordinate format: {loc_str}")
+    
+    df['location'] = format_coordinates(coords['latitude'], coords['longitude']).where(~combined, location)
+    df['latitude'] = coords['latitude']
+    df['longitude'] = coords['longitude']
     
     # Count invalid formats
     invalid_count = df['location'].isna().sum()
@@ -56,58 +50,39 @@ def verify_geo_bounds(df: pd.DataFrame, custom_bounds: Optional[Dict[str, float]
         custom_bounds: Optional dictionary with custom bounds (lat_min, lat_max, lon_min, lon_max)
     
     Returns:
-        DataFrame with validation columns added
+        DataFrame (stations outside the bounds are logged)
     """
-    # Berlin geographic bounds (approximate)
-    BERLIN_BOUNDS = custom_bounds or {
-        'lat_min': 52.3,
-        'lat_max': 52.7,
-        'lon_min': 13.1,
-        'lon_max': 13.8
-    }
+    location = df['location'].where(df['location'] != '')
+    coords = coordinate_columns(df)
     
-    df = df.copy()
-    
-    def check_bounds(loc_str):
-        if pd.isna(loc_str) or loc_str == '':
-            return False, "Missing coordinates"
-            
-        # Multiple locations case
-        if ' - ' in loc_str:
-            return True, "Multiple coordinates"
-            
-        try:
-            lat, lon = map(float, loc_str.split(','))
-            
-            if (BERLIN_BOUNDS['lat_min'] <= lat <= BERLIN_BOUNDS['lat_max'] and
-                BERLIN_BOUNDS['lon_min'] <= lon <= BERLIN_BOUNDS['lon_max']):
-                return True, "Within bounds"
-            else:
-                return False, f"Outside Berlin bounds: {lat},{lon}"
-        except:
-            return False, "Invalid format"
-    
-    # Check bounds for all locations
-    results = df['location'].apply(check_bounds)
-    df['valid_bounds'] = results.apply(lambda x: x[0])
-    df['bounds_message'] = results.apply(lambda x: x[1])
+    missing = location.isna()
+    combined = is_combined(location)
+    inside = within_bounds(coords['latitude'], coords['longitude'], custom_bounds or BERLIN_BOUNDS)
+    parsed = coords['latitude'].notna() & coords['longitude'].notna()
+    valid_bounds = ~missing & (combined | inside)
     
     # Log locations outside bounds
-    outside_bounds = df[~df['valid_bounds']]
+    outside_bounds = df[~valid_bounds]
     if not outside_bounds.empty:
+        messages = np.select(
+            [missing[~valid_bounds], ~parsed[~valid_bounds]],
+            ["Missing coordinates", "Invalid format"],
+            default="Outside Berlin bounds: " + coords['latitude'][~valid_bounds].astype(str) + ","
+                    + coords['longitude'][~valid_bounds].astype(str)
+        )
         logger.warning(f"Found {len(outside_bounds)} stations outside Berlin bounds:")
-        for _, row in outside_bounds.iterrows():
-            logger.warning(f"  - {row['stop_name']}: {row['bounds_message']}")
-
-    # Drop the temporary columns if requested
-    df.drop(columns=['bounds_message', 'valid_bounds'], inplace=True)
+        for stop_name, message in zip(outside_bounds['stop_name'], messages):
+            logger.warning(f"  - {stop_name}: {message}")
     
-    return df
+    return df.copy()
 
 def split_combined_stations(df: pd.DataFrame, year: int) -> pd.DataFrame:
     """
     Split rows where multiple stations are combined with hyphen.
     
+    The first station keeps the row and its stop_id; the others are appended
+    as new rows with new stop IDs.
+    
     Args:
         df: DataFrame with stops data
         year: Year for generating new stop IDs
@@ -118,8 +93,7 @@ def split_combined_stations(df: pd.DataFrame, year: int) -> pd.DataFrame:
     df = df.copy()
     
     # Find rows with combined stations
-    combined_mask = df['location'].apply(lambda x: isinstance(x, str) and ' - ' in x)
-    combined_stations = df[combined_mask].copy()
+    combined_stations = df[is_combined(df['location'])]
     
     if combined_stations.empty:
         logger.info("No combined stations found")
@@ -132,35 +106,18 @@ def split_combined_stations(df: pd.DataFrame, year: int) -> pd.DataFrame:
     
     next_stop_id = int(df['stop_id'].str.replace(r'^\D*', '', regex=True).astype(int).max()) + 1
     
-    # Process each combined station
-    for idx, row in combined_stations.iterrows():
-        # Split station names and locations
-        stop_names = row['stop_name'].split(' - ')
-        locations = row['location'].split(' - ')
-        
-        if len(stop_names) != len(locations):
-            logger.warning(f"Mismatch between names and locations for {row['stop_name']}")
-            continue
-        
-        # Update the first station in place
-        df.at[idx, 'stop_name'] = stop_names[0]
-        df.at[idx, 'location'] = locations[0]
-        
-        # Create new rows for additional stations
-        for i in range(1, len(stop_names)):
-            new_stop_id = f"{year}{next_stop_id}"
-            next_stop_id += 1
-            
-            # Create new row with same attributes but different name/location
-            new_row = row.copy()
-            new_row['stop_id'] = new_stop_id
-            new_row['stop_name'] = stop_names[i]
-            new_row['location'] = locations[i]
-            
-            # Add to dataframe
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            
-    return df
+    exploded = explode_combined(combined_stations, ['stop_name', 'location'])
+    
+    # Update the first station in place
+    first = exploded[exploded['part'] == 0]
+    df.loc[first.index, 'stop_name'] = first['stop_name']
+    df.loc[first.index, 'location'] = first['location']
+    
+    # Create new rows for additional stations
+    new_rows = exploded[exploded['part'] > 0].drop(columns='part')
+    new_rows['stop_id'] = [f"{year}{next_stop_id + i}" for i in range(len(new_rows))]
+    
+    return pd.concat([df, new_rows], ignore_index=True)
 
 def visualize_stations(df: pd.DataFrame, output_path: str):
     """
@@ -173,38 +130,12 @@ def visualize_stations(df: pd.DataFrame, output_path: str):
     Returns:
         Folium map object
     """
-    # Filter to only valid locations - properly handle empty strings
-    valid_df = df[(df['location'].notna()) & (df['location'] != '')].copy()
-    
-    # Extract coordinates with better error handling
-    def extract_lat(loc_str):
-        try:
-            if not isinstance(loc_str, str) or loc_str == '':
-                return np.nan
-            parts = loc_str.split(',')
-            if len(parts) != 2:
-                return np.nan
-            return float(parts[0].strip())
-        except (ValueError, IndexError):
-            return np.nan
-    
-    def extract_lon(loc_str):
-        try:
-            if not isinstance(loc_str, str) or loc_str == '':
-                return np.nan
-            parts = loc_str.split(',')
-            if len(parts) != 2:
-                return np.nan
-            return float(parts[1].strip())
-        except (ValueError, IndexError):
-            return np.nan
-    
-    # Apply coordinate extraction
-    valid_df['lat'] = valid_df['location'].apply(extract_lat)
-    valid_df['lon'] = valid_df['location'].apply(extract_lon)
+    # Use the parsed coordinate columns where available
+    coords = coordinate_columns(df)
     
     # Filter out any rows with invalid coordinates
-    valid_df = valid_df[(valid_df['lat'].notna()) & (valid_df['lon'].notna())]
+    valid = coords['latitude'].notna() & coords['longitude'].notna()
+    valid_df = df[valid].assign(lat=coords['latitude'][valid], lon=coords['longitude'][valid])
     
     logger.info(f"Creating map with {len(valid_df)} stations")
     
@@ -220,12 +151,13 @@ def visualize_stations(df: pd.DataFrame, output_path: str):
     }
     
     # Add markers for each station
-    for _, row in valid_df.iterrows():
-        popup_text = f"{row['stop_name']} ({row['type']})<br>ID: {row['stop_id']}"
-        color = type_colors.get(row['type'].lower(), 'gray')
+    for stop_name, stop_type, stop_id, lat, lon in zip(valid_df['stop_name'], valid_df['type'], 
+                                                       valid_df['stop_id'], valid_df['lat'], valid_df['lon']):
+        popup_text = f"{stop_name} ({stop_type})<br>ID: {stop_id}"
+        color = type_colors.get(str(stop_type).lower(), 'gray')
         
         folium.Marker(
-            [row['lat'], row['lon']],
+            [lat, lon],
             popup=popup_text,
             icon=folium.Icon(color=color)
         ).add_to(m)
@@ -240,6 +172,10 @@ def merge_refined_data(original_stops: pd.DataFrame, refined_stops: pd.DataFrame
     """
     Merge refined data with original stops.
     
+    Refined rows update the location (and identifier, if set) of the first
+    original stop with the same name, type and line; refined rows without
+    such a stop are added as new stops.
+    
     Args:
         original_stops: Original stops DataFrame
         refined_stops: Refined stops with updated location data
@@ -247,27 +183,26 @@ def merge_refined_data(original_stops: pd.DataFrame, refined_stops: pd.DataFrame
     Returns:
         Merged DataFrame
     """
+    keys = ['stop_name', 'type', 'line_name']
     merged_stops = original_stops.copy()
+    refined_stops = refined_stops.reset_index(drop=True)
     
-    for idx, row in refined_stops.iterrows():
-        stop_name = row['stop_name']
-        stop_type = row['type']
-        line_name = row['line_name']
-        
-        # Check if this stop exists in the original stops
-        match = merged_stops[(merged_stops['stop_name'] == stop_name) & 
-                            (merged_stops['type'] == stop_type) & 
-                            (merged_stops['line_name'] == line_name)]
-        
-        if not match.empty:
-            # Update location and identifier if match is found
-            merged_idx = match.index[0]
-            merged_stops.at[merged_idx, 'location'] = row['location']
-            if 'identifier' in row and not pd.isna(row['identifier']):
-                merged_stops.at[merged_idx, 'identifier'] = row['identifier']
-        else:
-            # This is a new stop, add to merged_stops
-            merged_stops = pd.concat([merged_stops, pd.DataFrame([row])], ignore_index=True)
+    # This is a new stop, add to merged_stops
+    existing = pd.MultiIndex.from_frame(merged_stops[keys])
+    is_new = ~pd.MultiIndex.from_frame(refined_stops[keys]).isin(existing)
+    new_stops = refined_stops[is_new].drop_duplicates(subset=keys)
+    merged_stops = pd.concat([merged_stops, new_stops], ignore_index=True)
+    
+    # Every refined row now matches; later refined rows win, as when applied one by one
+    targets = merged_stops[keys].rename_axis('_target').reset_index().drop_duplicates(subset=keys)
+    updates = refined_stops.merge(targets, on=keys, how='left')
+    
+    location_updates = updates.drop_duplicates(subset='_target', keep='last')
+    merged_stops.loc[location_updates['_target'], 'location'] = location_updates['location'].values
+    
+    if 'identifier' in updates.columns:
+        identifier_updates = updates[updates['identifier'].notna()].drop_duplicates(subset='_target', keep='last')
+        merged_stops.loc[identifier_updates['_target'], 'identifier'] = identifier_updates['identifier'].values
     
     return merged_stops
 
@@ -0,0 +1,121 @@
+"""
+Rule table for line profile and capacity classification.
+
+The rules live in line_rules.json so that line enrichment and the
+capacities used for station connections come from one place. Capacity
+rules are evaluated in order and the first match wins; a rule matches on
+`type` (a value or list of values), `type_prefix` and optionally `profile`.
+"""
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent / 'line_rules.json'
+
+
+@lru_cache(maxsize=None)
+def _load_rules_file(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_line_rules(path: Optional[Union[str, Path]] = None) -> Dict:
+    """
+    Load the line rule table.
+
+    Args:
+        path: Rule file (default: line_rules.json next to this module)
+
+    Returns:
+        Dictionary with 'profiles', 'capacity' and 'default_capacity'
+    """
+    return _load_rules_file(str(path or DEFAULT_RULES_PATH))
+
+
+def _rule_mask(rule: Dict, types: pd.Series, profiles: pd.Series) -> pd.Series:
+    mask = pd.Series(True, index=types.index)
+    if 'type' in rule:
+        values = rule['type'] if isinstance(rule['type'], list) else [rule['type']]
+        mask &= types.isin(values)
+    if 'type_prefix' in rule:
+        mask &= types.str.startswith(rule['type_prefix'])
+    if 'profile' in rule:
+        mask &= profiles == rule['profile']
+    return mask
+
+
+def classify_profiles(line_df: pd.DataFrame, rules: Optional[Dict] = None) -> pd.Series:
+    """
+    Profile of each line from its type and name (e.g. U-Bahn Klein-/Großprofil).
+
+    Args:
+        line_df: DataFrame with 'type' and 'line_name' columns
+        rules: Rule table (default: load_line_rules())
+
+    Returns:
+        Series of profile names, None where no profile applies
+    """
+    rules = rules or load_line_rules()
+    profiles = pd.Series(None, index=line_df.index, dtype=object)
+    line_names = line_df['line_name'].astype(str)
+
+    for transport_type, profile_names in rules.get('profiles', {}).items():
+        name_to_profile = {name: profile for profile, names in profile_names.items() for name in names}
+        type_mask = line_df['type'] == transport_type
+        profiles[type_mask] = line_names[type_mask].map(name_to_profile)
+
+    return profiles.where(profiles.notna(), None)
+
+
+def line_capacities(line_df: pd.DataFrame, rules: Optional[Dict] = None) -> np.ndarray:
+    """
+    Capacity of each line from its type and profile.
+
+    Works on any number of lines at once, e.g. the concatenated lines of
+    every snapshot.
+
+    Args:
+        line_df: DataFrame with 'type' and 'profile' columns
+        rules: Rule table (default: load_line_rules())
+
+    Returns:
+        Array of capacities
+    """
+    rules = rules or load_line_rules()
+    types = line_df['type'].astype(str)
+    profiles = line_df['profile'] if 'profile' in line_df.columns else pd.Series(None, index=line_df.index)
+
+    conditions = [_rule_mask(rule, types, profiles) for rule in rules['capacity']]
+    choices = [rule['capacity'] for rule in rules['capacity']]
+    return np.select(conditions, choices, default=rules.get('default_capacity', 0))
+
+
+def capacity_lookup(type_profiles, rules: Optional[Dict] = None) -> Dict[str, int]:
+    """
+    Resolve capacities for (type, profile) pairs, keyed 'type|profile'.
+
+    Used to hand the rule table to Cypher queries as a plain map.
+
+    Args:
+        type_profiles: Iterable of (type, profile) pairs; profile may be None
+        rules: Rule table (default: load_line_rules())
+
+    Returns:
+        Dictionary mapping 'type|profile' to capacity
+    """
+    pairs = pd.DataFrame(list(type_profiles), columns=['type', 'profile']).drop_duplicates()
+    if pairs.empty:
+        return {}
+    pairs['capacity'] = line_capacities(pairs, rules)
+    return {
+        f"{row.type}|{'' if pd.isna(row.profile) else row.profile}": int(row.capacity)
+        for row in pairs.itertuples(index=False)
+    }
@@ -0,0 +1,286 @@
+"""
+Canonical keys for station names, shared by all name matchers.
+
+Station names differ in spelling across years and sources ("Tempelhofer
+Damm" / "Tempelhoferdamm", "U-Bhf. Zoo" / "U Bahnhof Zoo", "Straße" /
+"Strasse"). Every name is reduced once to a list of normalised tokens:
+
+- case-folded, umlauts spelled out (ä -> ae, ß -> ss), accents dropped
+- split at anything that is not a letter or digit
+- street-type suffixes split off their word ("tempelhoferdamm" ->
+  "tempelhofer damm")
+- abbreviations unified through TOKEN_ALIASES ("strasse" -> "str")
+
+From the tokens come the canonical key (tokens in order) and the token
+signature (distinct tokens sorted, so word order does not matter).
+Matchers join on keys first and only score the remaining names fuzzily.
+
+Keys are kept in a JSON cache under data/interim that persists across
+runs and is shared by parallel stages; it is tied to NORMALISATION_VERSION,
+so bump that whenever the rules below change.
+"""
+
+import os
+import re
+import json
+import logging
+import tempfile
+import unicodedata
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Bump when the normalisation rules change, so cached keys are recomputed
+NORMALISATION_VERSION = 1
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / 'data' / 'interim' / 'name_key_cache.json'
+
+TOKEN_ALIASES = {
+    'strasse': 'str',
+    'bahnhof': 'bhf',
+    'bf': 'bhf',
+    'ch': 'chaussee',
+}
+
+# Street-type words that are written both attached and separate
+STREET_SUFFIXES = ('strasse', 'str', 'damm', 'platz', 'allee', 'chaussee', 'weg')
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_SPELLED_OUT = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+_SEPARATOR = re.compile(r'[^0-9a-z]+')
+_SUFFIX = re.compile(rf"^([a-z]{{2,}}?)({'|'.join(STREET_SUFFIXES)})$")
+
+
+def name_tokens(name) -> List[str]:
+    """
+    Normalised tokens of a station name.
+
+    Args:
+        name: Raw station name
+
+    Returns:
+        List of tokens (empty for missing names)
+    """
+    if not isinstance(name, str):
+        return []
+    text = unicodedata.normalize('NFKD', name.casefold().translate(_SPELLED_OUT))
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+
+    tokens = []
+    for token in _SEPARATOR.split(text):
+        if not token:
+            continue
+        # Split repeatedly: "nonnendammallee" -> "nonnen damm allee"
+        suffixes = []
+        split = _SUFFIX.match(token)
+        while split:
+            token, suffix = split.groups()
+            suffixes.insert(0, suffix)
+            split = _SUFFIX.match(token)
+        tokens.extend(TOKEN_ALIASES.get(part, part) for part in [token] + suffixes)
+    return tokens
+
+
+def canonical_key(name) -> str:
+    """Canonical key of a station name: its normalised tokens in order"""
+    return ' '.join(name_tokens(name))
+
+
+def token_signature(name) -> str:
+    """Order-independent signature of a station name: its distinct tokens sorted"""
+    return ' '.join(sorted(set(name_tokens(name))))
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """Exclusive lock on lock_path across processes"""
+    with open(lock_path, 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after ten seconds
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class NameNormaliser:
+    """
+    Canonical keys and token signatures with a persistent cache.
+
+    Args:
+        cache_path: JSON cache file (None keeps the cache in memory only)
+    """
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = DEFAULT_CACHE_PATH):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._entries: Dict[str, Tuple[str, str]] = {}
+        self._dirty = False
+        if self.cache_path and self.cache_path.exists():
+            try:
+                cached = self._read_cache()
+                if cached is not None:
+                    self._entries = cached
+                else:
+                    logger.info(f"Name key cache {self.cache_path} is outdated, rebuilding")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable name key cache {self.cache_path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entry(self, name) -> Tuple[str, str]:
+        """(canonical key, token signature) of a name"""
+        if not isinstance(name, str):
+            return '', ''
+        entry = self._entries.get(name)
+        if entry is None:
+            tokens = name_tokens(name)
+            entry = (' '.join(tokens), ' '.join(sorted(set(tokens))))
+            self._entries[name] = entry
+            self._dirty = True
+        return entry
+
+    def key(self, name) -> str:
+        return self.entry(name)[0]
+
+    def signature(self, name) -> str:
+        return self.entry(name)[1]
+
+    def keys(self, names: Iterable) -> pd.Series:
+        """Canonical keys of a column of names, each distinct name normalised once"""
+        names = pd.Series(names, dtype=object)
+        unique = names.dropna().unique()
+        return names.map({name: self.key(name) for name in unique}).fillna('')
+
+    def signatures(self, names: Iterable) -> pd.Series:
+        """Token signatures of a column of names"""
+        names = pd.Series(names, dtype=object)
+        unique = names.dropna().unique()
+        return names.map({name: self.signature(name) for name in unique}).fillna('')
+
+    def _read_cache(self) -> Optional[Dict[str, Tuple[str, str]]]:
+        # None for a cache written by another NORMALISATION_VERSION
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('version') != NORMALISATION_VERSION:
+            return None
+        return {name: tuple(entry) for name, entry in cached['names'].items()}
+
+    def save(self) -> None:
+        """
+        Write new entries to the cache file.
+
+        Pipeline stages save from several processes at once, so the cache is
+        re-read and merged under a lock file, and each process writes its own
+        temporary file before replacing the cache.
+        """
+        if not self.cache_path or not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with _file_lock(self.cache_path.with_suffix('.lock')):
+            if self.cache_path.exists():
+                try:
+                    self._entries = {**(self._read_cache() or {}), **self._entries}
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"Overwriting unreadable name key cache {self.cache_path}: {e}")
+
+            handle, temporary = tempfile.mkstemp(prefix=self.cache_path.stem, suffix='.tmp',
+                                                 dir=self.cache_path.parent)
+            try:
+                with os.fdopen(handle, 'w', encoding='utf-8') as f:
+                    json.dump({'version': NORMALISATION_VERSION, 'names': self._entries}, f, ensure_ascii=False)
+                os.replace(temporary, self.cache_path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        self._dirty = False
+        logger.debug(f"Saved {len(self._entries)} name keys to {self.cache_path}")
+
+
+_normalisers: Dict[str, NameNormaliser] = {}
+
+
+def get_normaliser(cache_path: Optional[Union[str, Path]] = DEFAULT_CACHE_PATH) -> NameNormaliser:
+    """Shared normaliser for a cache file, loaded on first use"""
+    cache_key = str(Path(cache_path).resolve()) if cache_path else ''
+    if cache_key not in _normalisers:
+        _normalisers[cache_key] = NameNormaliser(cache_path)
+    return _normalisers[cache_key]
+
+
+def match_names(names1: Sequence, names2: Sequence, scorer: Callable[[str, str], float], threshold: float,
+                prepare: Callable[[str], str] = str.lower,
+                normaliser: Optional[NameNormaliser] = None) -> Dict[int, Tuple[int, float]]:
+    """
+    Best match in names2 for each name in names1.
+
+    Names with the same canonical key, then names with the same token
+    signature, match with score 100. Only the names left over are scored
+    with `scorer`, on names passed through `prepare` once per list.
+
+    Args:
+        names1: Names to match
+        names2: Candidate names
+        scorer: Similarity function on two prepared names (0-100)
+        threshold: Minimum score for a fuzzy match
+        prepare: Preprocessing for fuzzy scoring (default: lower-case)
+        normaliser: NameNormaliser (default: the shared one)
+
+    Returns:
+        Dict mapping index in names1 to (index in names2, score)
+    """
+    normaliser = normaliser or get_normaliser()
+    entries1 = [normaliser.entry(name) for name in names1]
+    entries2 = [normaliser.entry(name) for name in names2]
+
+    # First occurrence wins, as with a left-to-right best-score scan
+    by_key: Dict[str, int] = {}
+    by_signature: Dict[str, int] = {}
+    for j, (key, signature) in enumerate(entries2):
+        if key:
+            by_key.setdefault(key, j)
+            by_signature.setdefault(signature, j)
+
+    prepared2 = [prepare(name) if key else None for name, (key, _) in zip(names2, entries2)]
+
+    matches = {}
+    for i, (key, signature) in enumerate(entries1):
+        if not key:
+            continue
+        j = by_key.get(key, by_signature.get(signature))
+        if j is not None:
+            matches[i] = (j, 100.0)
+            continue
+
+        prepared = prepare(names1[i])
+        best_j, best_score = -1, 0
+        for j, candidate in enumerate(prepared2):
+            if candidate is None:
+                continue
+            score = scorer(prepared, candidate)
+            if score > best_score and score >= threshold:
+                best_j, best_score = j, score
+        if best_j >= 0:
+            matches[i] = (best_j, best_score)
+    return matches
@@ -1,105 +1,207 @@
+"""
+Station name standardisation for the raw Fahrplanbuch CSV files.
+
+The spelling rules are declared once in RULES and compiled into one
+combined regex per pass:
+
+- join: remove the space between a word and a street-type suffix
+  ("Tempelhofer Damm" -> "Tempelhoferdamm")
+- abbreviate: shorten "straße"/"strasse" to "str."
+- case: restore capitals after spaces and hyphens and in "Bhf."
+
+Names repeat thousands of times across lines and years, so results are
+memoised per raw name in a bounded LRU cache, and directories are
+processed file by file in a process pool. A dry run reports what each
+rule would change without writing anything.
+"""
+
 import os
 import re
-import pandas as pd
 import glob
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import pandas as pd
+
+# Raw station names kept per process
+CACHE_SIZE = 65536
+
+# Example changes listed per rule in the dry-run report
+REPORT_EXAMPLES = 5
+
+STOP_DELIMITER = " - "
+
+# Report entry for changes made by lower-casing alone
+CASE_FOLDING = 'case_folding'
+
+Rule = namedtuple('Rule', ['name', 'pass_name', 'pattern', 'replacement'])
+
+_SUFFIX_PATTERNS = {
+    'strasse': r'stra(?:ss|ß)e',
+    'damm': r'damm',
+    'platz': r'platz',
+    'allee': r'allee',
+    'chaussee': r'chaussee',
+    'weg': r'weg',
+}
+
+# Rules work on the lower-cased name; within a pass the leftmost match wins
+RULES = (
+    *(Rule(f'join_{name}', 'join', rf'(?<=[a-zäöüß])\s+(?={pattern}\b)', '')
+      for name, pattern in _SUFFIX_PATTERNS.items()),
+    # "Martin-Luther-Straße" -> "Martin-Luther-Str."
+    Rule('abbreviate_hyphenated_strasse', 'abbreviate', r'([a-zäöüß]-[a-zäöüß]+-)stra(?:ss|ß)e\b', r'\1str.'),
+    Rule('abbreviate_strasse', 'abbreviate', r'(?<=[a-zäöüß])stra(?:ss|ß)e\b', 'str.'),
+    Rule('capitalise_bhf', 'case', r'\bbhf\.', 'Bhf.'),
+    Rule('capitalise_word', 'case', r'(?<=[\s-])[a-zäöüß]', lambda match: match.group().upper()),
+)
+
+PASSES = ('join', 'abbreviate', 'case')
+
+
+class _CompiledPass:
+    """All rules of one pass as a single alternation"""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.regexes = [re.compile(rule.pattern) for rule in self.rules]
+        self.regex = re.compile('|'.join(f'(?P<r{i}>{rule.pattern})' for i, rule in enumerate(self.rules)))
+
+    def _replace(self, match):
+        # The rule's own group closes last, so it is the match's lastgroup
+        index = int(match.lastgroup[1:])
+        rule = self.rules[index]
+        if callable(rule.replacement):
+            return rule.replacement(match)
+        # Re-matching at the same position keeps look-behind context and group numbers
+        return self.regexes[index].match(match.string, match.start()).expand(rule.replacement)
+
+    def apply(self, text):
+        return self.regex.sub(self._replace, text) if self.rules else text
+
+
+def compile_rules(rules=RULES):
+    """Compile a rule table into one combined regex per pass"""
+    return [_CompiledPass(rule for rule in rules if rule.pass_name == pass_name) for pass_name in PASSES]
+
+
+_COMPILED = compile_rules()
+# No rules: lower-casing and capital restoration only
+_FOLDING_ONLY = compile_rules(())
+
+
+def _standardize(name, compiled=_COMPILED):
+    # Store original capitalization for later restoration
+    has_capital = name[0].isupper()
+    join, abbreviate, case = compiled
+
+    name = abbreviate.apply(join.apply(name.lower())).strip()
+    if has_capital and name:
+        name = name[0].upper() + name[1:]
+    return case.apply(name)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _standardize_cached(name):
+    return _standardize(name)
+
 
 def standardize_station_name(name):
     """
     Standardize German station names for consistency.
     Handles various spacing and capitalization patterns.
-    
+
     Args:
         name: Original station name
-        
+
     Returns:
         Standardized station name
     """
     if pd.isna(name) or name == '':
         return ''
-    
-    # Store original capitalization for later restoration
-    has_capital = name[0].isupper() if name else False
-    
-    # Convert to lowercase for processing
-    name = name.lower()
-    
-    # Handle compound "straße/strasse" (both with and without spaces, including hyphenated cases)
-    # This matches "Tempelhofer Strasse", "Tempelhoferstrasse", and "Tempelhofer-Strasse"
-    name = re.sub(r'([a-zäöüß]+)er\s*stra(?:ss|ß)e\b', r'\1erstr.', name)  # Adjective forms
-    name = re.sub(r'([a-zäöüß]+)\s*stra(?:ss|ß)e\b', r'\1str.', name)      # Non-adjective forms
-    name = re.sub(r'([a-zäöüß]+)-([a-zäöüß]+)-stra(?:ss|ß)e\b', r'\1-\2-str.', name)  # Hyphenated forms
-    
-    # Compound "damm" variants (both with and without spaces)
-    name = re.sub(r'([a-zäöüß]+)er\s*damm\b', r'\1erdamm', name)  # Adjective forms
-    name = re.sub(r'([a-zäöüß]+)\s*damm\b', r'\1damm', name)      # Non-adjective forms
-    
-    # Compound "platz" variants (both with and without spaces)
-    name = re.sub(r'([a-zäöüß]+)er\s*platz\b', r'\1erplatz', name)  # Adjective forms
-    name = re.sub(r'([a-zäöüß]+)\s*platz\b', r'\1platz', name)      # Non-adjective forms
-    
-    # Compound "allee" variants (both with and without spaces)
-    name = re.sub(r'([a-zäöüß]+)e\s*allee\b', r'\1eallee', name)    # With "e" ending like Märkische
-    name = re.sub(r'([a-zäöüß]+)er\s*allee\b', r'\1erallee', name)  # Adjective forms
-    name = re.sub(r'([a-zäöüß]+)\s*allee\b', r'\1allee', name)      # Non-adjective forms
-    
-    # Compound "chaussee" variants (both with and without spaces)
-    name = re.sub(r'([a-zäöüß]+)er\s*chaussee\b', r'\1erchaussee', name)  # Adjective forms
-    name = re.sub(r'([a-zäöüß]+)\s*chaussee\b', r'\1chaussee', name)      # Non-adjective forms
-    
-    # Compound "weg" variants (both with and without spaces)
-    name = re.sub(r'([a-zäöüß]+)er\s*weg\b', r'\1erweg', name)  # Adjective forms
-    name = re.sub(r'([a-zäöüß]+)\s*weg\b', r'\1weg', name)      # Non-adjective forms
-    
-    # Final cleanup
-    name = name.strip()
-    
-    # Restore initial capitalization
-    if has_capital and name:
-        name = name[0].upper() + name[1:]
-    
-    # Recapitalize 'B' in 'bhf.'
-    name = re.sub(r'\bbhf\.', 'Bhf.', name)
-    
-    # Capitalize the first letter after '-' and after a whitespace
-    name = re.sub(r'(?<=\s|-)([a-zäöüß])', lambda match: match.group(1).upper(), name)
-    return name
+    return _standardize_cached(name)
+
+
+@lru_cache(maxsize=None)
+def _compiled_without(rule_name):
+    return compile_rules(tuple(rule for rule in RULES if rule.name != rule_name))
+
+
+def explain_station_name(name):
+    """
+    Standardize a name and list the rules that changed it.
+
+    A rule counts as changing a name if the result differs without it.
+    Changes that remain with no rules at all come from lower-casing the
+    name and are listed as 'case_folding'.
+
+    Args:
+        name: Original station name
+
+    Returns:
+        Tuple of (standardized name, list of rule names in table order)
+    """
+    if pd.isna(name) or name == '':
+        return '', []
+    standardized = _standardize(name)
+    if standardized == name:
+        return standardized, []
+    applied = [rule.name for rule in RULES if _standardize(name, _compiled_without(rule.name)) != standardized]
+    if _standardize(name, _FOLDING_ONLY) != name:
+        applied.append(CASE_FOLDING)
+    return standardized, applied
+
 
 def process_stops_column(stops_str):
     """
     Process the stops column by standardizing each station name.
-    
+
     Args:
         stops_str: String containing stops separated by delimiter
-        
+
     Returns:
         Standardized stops string
     """
     if pd.isna(stops_str):
         return stops_str
-    
+
     # Split by delimiters and standardize each stop
-    stops = [stop.strip() for stop in stops_str.split(" - ")]
-    standardized_stops = [standardize_station_name(stop) for stop in stops]
-    
-    # Rejoin with the same delimiter
-    return " - ".join(standardized_stops)
+    stops = [stop.strip() for stop in stops_str.split(STOP_DELIMITER)]
+    return STOP_DELIMITER.join(standardize_station_name(stop) for stop in stops)
+
+
+def standardize_stops_series(stops):
+    """Standardize a whole stops column, each distinct value once"""
+    unique = stops.dropna().unique()
+    return stops.map(dict(zip(unique, map(process_stops_column, unique))))
+
+
+def _raw_stop_names(df):
+    if 'stops' not in df.columns:
+        return Counter()
+    return Counter(stop.strip() for value in df['stops'].dropna() for stop in value.split(STOP_DELIMITER))
+
 
 def process_file(input_file, output_file):
     """
     Process a single transport data file by standardizing station names.
-    
+
     Args:
         input_file: Path to input CSV file
         output_file: Path to output standardized CSV file
+
+    Returns:
+        True if successful, False otherwise
     """
     try:
         # Read the data
         df = pd.read_csv(input_file, encoding='utf-8')
-        
+
         # Apply the standardization to the 'stops' column
         if 'stops' in df.columns:
-            df['stops'] = df['stops'].apply(process_stops_column)
-        
+            df['stops'] = standardize_stops_series(df['stops'])
+
         # Save the standardized data
         df.to_csv(output_file, index=False, encoding='utf-8')
         print(f"✓ Processed: {os.path.basename(input_file)} → {os.path.basename(output_file)}")
@@ -108,49 +210,127 @@ def process_file(input_file, output_file):
         print(f"✗ Error processing {input_file}: {str(e)}")
         return False
 
-def process_directory(input_dir, output_dir, pattern="*.csv"):
+
+def count_stop_names(input_file):
+    """
+    Count the raw stop names of a file, for a dry run.
+
+    Args:
+        input_file: Path to input CSV file
+
+    Returns:
+        Counter of raw stop names, None on error
+    """
+    try:
+        return _raw_stop_names(pd.read_csv(input_file, encoding='utf-8'))
+    except Exception as e:
+        print(f"✗ Error reading {input_file}: {str(e)}")
+        return None
+
+
+def _process_file_worker(job):
+    input_file, output_file, dry_run = job
+    return count_stop_names(input_file) if dry_run else process_file(input_file, output_file)
+
+
+def diff_report(stop_counts, examples=REPORT_EXAMPLES):
+    """
+    What each rule changes in a set of raw stop names.
+
+    Args:
+        stop_counts: Counter of raw stop names (occurrences)
+        examples: Example changes to keep per rule
+
+    Returns:
+        Dict with 'names', 'changed_names', 'changed_occurrences' and
+        'rules' (rule name -> names, occurrences and examples)
+    """
+    rules = {name: {'names': 0, 'occurrences': 0, 'examples': []} for name in [rule.name for rule in RULES] + [CASE_FOLDING]}
+    changed_names = changed_occurrences = 0
+    for name, count in stop_counts.most_common():
+        standardized, applied = explain_station_name(name)
+        if standardized == name:
+            continue
+        changed_names += 1
+        changed_occurrences += count
+        for rule_name in applied:
+            entry = rules[rule_name]
+            entry['names'] += 1
+            entry['occurrences'] += count
+            if len(entry['examples']) < examples:
+                entry['examples'].append((name, standardized))
+    return {
+        'names': len(stop_counts),
+        'changed_names': changed_names,
+        'changed_occurrences': changed_occurrences,
+        'rules': rules,
+    }
+
+
+def print_diff_report(report):
+    print(f"\nDry run: {report['changed_names']}/{report['names']} distinct stop names would change "
+          f"({report['changed_occurrences']} occurrences)")
+    for rule_name, entry in report['rules'].items():
+        print(f"\n{rule_name}: {entry['names']} names, {entry['occurrences']} occurrences")
+        for before, after in entry['examples']:
+            print(f"  {before} → {after}")
+
+
+def process_directory(input_dir, output_dir, pattern="*.csv", workers=None, dry_run=False):
     """
     Process all CSV files in a directory, standardizing station names.
-    
+
     Args:
         input_dir: Directory containing input CSV files
         output_dir: Directory to save standardized CSV files
         pattern: File pattern to match (default: "*.csv")
+        workers: Number of processes (default: CPU count, 1 = serial)
+        dry_run: Report what the rules would change instead of writing files
+
+    Returns:
+        Diff report for a dry run, otherwise the number of processed files
     """
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-    
     # Get all matching files in the input directory
-    input_files = glob.glob(os.path.join(input_dir, pattern))
-    
+    input_files = sorted(glob.glob(os.path.join(input_dir, pattern)))
+
     if not input_files:
         print(f"No files matching pattern '{pattern}' found in {input_dir}")
-        return
-    
-    # Process each file
-    success_count = 0
-    for input_file in input_files:
-        # Create output file path with same name in output directory
-        filename = os.path.basename(input_file)
-        output_file = os.path.join(output_dir, filename)
-        
-        # Process the file
-        if process_file(input_file, output_file):
-            success_count += 1
-    
+        return None
+
+    # Create output directory if it doesn't exist
+    if not dry_run:
+        os.makedirs(output_dir, exist_ok=True)
+
+    jobs = [(input_file, os.path.join(output_dir, os.path.basename(input_file)), dry_run)
+            for input_file in input_files]
+    if workers == 1 or len(jobs) < 2:
+        results = [_process_file_worker(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_process_file_worker, jobs))
+
+    if dry_run:
+        report = diff_report(sum((result for result in results if result is not None), Counter()))
+        print_diff_report(report)
+        return report
+
     # Print summary
+    success_count = sum(results)
     print(f"\nProcessing complete: {success_count}/{len(input_files)} files processed successfully")
+    return success_count
 
 # Example usage
 if __name__ == "__main__":
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Standardize station names in transport data files")
     parser.add_argument("input_dir", help="Directory containing input CSV files")
     parser.add_argument("output_dir", help="Directory to save standardized CSV files")
     parser.add_argument("--pattern", default="*.csv", help="File pattern to match (default: *.csv)")
-    
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what each rule would change, write nothing")
+
     args = parser.parse_args()
-    
+
     # Process the directory
-    process_directory(args.input_dir, args.output_dir, args.pattern)
\ No newline at end of file
+    process_directory(args.input_dir, args.output_dir, args.pattern, args.workers, args.dry_run)
@@ -1,14 +1,20 @@
 import pandas as pd
 import difflib
 import argparse
-from typing import List, Dict, Tuple, Set
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Tuple, Set, Optional, Iterable
 import os
 import re
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib_venn import venn2
-from io import BytesIO
-import base64
+
+# Bump when the rendering code changes, so cached figures are redrawn
+FIGURE_STYLE_VERSION = 1
+
+# Pending figures from which rendering uses a process pool by default; each
+# worker imports matplotlib and seaborn, which costs more than a few figures
+POOL_MIN_FIGURES = 8
 
 
 def parse_stops(stops_str: str) -> List[str]:
@@ -42,10 +48,13 @@ def compare_stops(stops1: List[str], stops2: List[str]) -> Dict:
     
     if seq1 != seq2:
         reordered = True
-        # Find stations that changed position
+        # Find stations that changed position (first position in seq2, as list.index)
+        positions2 = {}
+        for idx2, station in enumerate(seq2):
+            positions2.setdefault(station, idx2)
         for i, station in enumerate(seq1):
-            idx2 = seq2.index(station) if station in seq2 else -1
-            if idx2 != -1 and idx2 != i:
+            idx2 = positions2[station]
+            if idx2 != i:
                 reordered_stations.append((station, i, idx2))
     
     return {
@@ -58,9 +67,9 @@ def compare_stops(stops1: List[str], stops2: List[str]) -> Dict:
     }
 
 
-def generate_visualizations(df1, df2, year1, year2):
+def figure_specs(df1, df2, year1, year2) -> List[Dict]:
     """
-    Generate visualizations to compare network snapshots.
+    Data for the comparison figures, without importing any plotting library.
     
     Args:
         df1: DataFrame for the first year
@@ -69,67 +78,139 @@ def generate_visualizations(df1, df2, year1, year2):
         year2: Second year label
     
     Returns:
-        Dict of base64-encoded PNG images
+        List of JSON-serialisable figure specifications
     """
-    images = {}
-    
-    # Set plot style
-    sns.set(style="whitegrid")
-    
     # 1. Line count by type
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Count lines by type for each year
     type_counts1 = df1['type'].value_counts().reset_index()
     type_counts1.columns = ['type', year1]
     
     type_counts2 = df2['type'].value_counts().reset_index()
     type_counts2.columns = ['type', year2]
     
-    # Merge the two counts
     combined = pd.merge(type_counts1, type_counts2, on='type', how='outer').fillna(0)
     
-    # Create a grouped bar chart
-    combined.plot(x='type', y=[year1, year2], kind='bar', ax=ax)
-    plt.title(f'Line Counts by Type: {year1} vs {year2}')
-    plt.xlabel('Transport Type')
-    plt.ylabel('Number of Lines')
-    plt.tight_layout()
+    # 2. Line name overlap (region sizes of the Venn diagram)
+    lines_set1 = set(df1['line_name'])
+    lines_set2 = set(df2['line_name'])
+    
+    return [
+        {
+            'name': 'type_counts',
+            'title': f'Line Counts by Type: {year1} vs {year2}',
+            'labels': [str(year1), str(year2)],
+            'types': [str(t) for t in combined['type']],
+            'counts': [combined[year1].astype(int).tolist(), combined[year2].astype(int).tolist()],
+        },
+        {
+            'name': 'line_overlap',
+            'title': f'Line Overlap: {year1} vs {year2}',
+            'labels': [str(year1), str(year2)],
+            'subsets': [len(lines_set1 - lines_set2), len(lines_set2 - lines_set1), len(lines_set1 & lines_set2)],
+        },
+    ]
+
+
+def figure_key(spec: Dict) -> str:
+    """Content hash of a figure specification"""
+    payload = json.dumps({'version': FIGURE_STYLE_VERSION, 'spec': spec}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def render_figure(spec: Dict, path: str) -> str:
+    """
+    Render one figure specification to a PNG file.
     
-    # Convert to base64 for embedding in the report
-    buf = BytesIO()
-    plt.savefig(buf, format='png')
-    buf.seek(0)
-    images['type_counts'] = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close()
+    matplotlib, seaborn and matplotlib_venn are imported here, so text-only
+    comparisons never load them.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     
-    # 2. Venn diagram of line names
-    fig, ax = plt.subplots(figsize=(8, 6))
+    sns.set(style="whitegrid")
     
-    lines_set1 = set(df1['line_name'])
-    lines_set2 = set(df2['line_name'])
+    if spec['name'] == 'type_counts':
+        fig, ax = plt.subplots(figsize=(10, 6))
+        combined = pd.DataFrame(dict(zip(spec['labels'], spec['counts'])), index=spec['types'])
+        combined.plot(kind='bar', ax=ax)
+        ax.set_xlabel('Transport Type')
+        ax.set_ylabel('Number of Lines')
+    elif spec['name'] == 'line_overlap':
+        from matplotlib_venn import venn2
+        fig, ax = plt.subplots(figsize=(8, 6))
+        venn2(subsets=tuple(spec['subsets']), set_labels=tuple(spec['labels']), ax=ax)
+    else:
+        raise ValueError(f"Unknown figure: {spec['name']}")
     
-    v = venn2([lines_set1, lines_set2], (year1, year2), ax=ax)
-    plt.title(f'Line Overlap: {year1} vs {year2}')
+    ax.set_title(spec['title'])
+    fig.tight_layout()
+    fig.savefig(path, format='png')
+    plt.close(fig)
+    return path
+
+
+def _render_figure_worker(args):
+    return render_figure(*args)
+
+
+def generate_visualizations(df1, df2, year1, year2, figure_dir='figures', workers: Optional[int] = None) -> Dict[str, Path]:
+    """
+    Generate visualizations to compare network snapshots.
     
-    buf = BytesIO()
-    plt.savefig(buf, format='png')
-    buf.seek(0)
-    images['line_overlap'] = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close()
+    Figures are written to figure_dir under a content hash of their data;
+    figures that already exist are reused. The rest are rendered in-process
+    unless a pool is requested or at least POOL_MIN_FIGURES are pending.
     
-    return images
+    Args:
+        df1: DataFrame for the first year
+        df2: DataFrame for the second year
+        year1: First year label
+        year2: Second year label
+        figure_dir: Directory for the PNG files
+        workers: Number of rendering processes (1 renders in-process, None
+            decides by the number of pending figures)
+    
+    Returns:
+        Dict of figure name to PNG path
+    """
+    figure_dir = Path(figure_dir)
+    figure_dir.mkdir(parents=True, exist_ok=True)
+    
+    paths = {}
+    pending = []
+    for spec in figure_specs(df1, df2, year1, year2):
+        path = figure_dir / f"{spec['name']}_{figure_key(spec)}.png"
+        paths[spec['name']] = path
+        if not path.exists():
+            pending.append((spec, str(path)))
+    
+    use_pool = workers != 1 and len(pending) >= 2 and (workers is not None or len(pending) >= POOL_MIN_FIGURES)
+    if not use_pool:
+        for task in pending:
+            _render_figure_worker(task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_render_figure_worker, pending))
+    
+    return paths
 
 
-def compare_network_snapshots(file1: str, file2: str, output_path: str = None, include_viz: bool = True):
+def compare_network_snapshots(file1: str, file2: str, output_path: str = None, include_viz: bool = True,
+                              figure_dir: str = None, workers: Optional[int] = None):
     """
     Compare two network snapshots and generate a report of differences.
     
+    The report text is built first; figures are rendered afterwards (or
+    taken from the figure cache) and linked as PNG files.
+    
     Args:
         file1: Path to the first CSV file
         file2: Path to the second CSV file
         output_path: Optional path to write the report to
         include_viz: Whether to include visualizations in the report
+        figure_dir: Directory for figure files (default: figures/ next to the report)
+        workers: Number of figure rendering processes
     """
     # Extract years from filenames if possible
     year1 = re.search(r'(\d{4})_', os.path.basename(file1))
@@ -328,18 +409,21 @@ def compare_network_snapshots(file1: str, file2: str, output_path: str = None, i
     
     # Generate visualizations if requested
     if include_viz:
+        report_dir = Path(output_path).parent if output_path else Path('.')
+        figure_dir = Path(figure_dir) if figure_dir else report_dir / 'figures'
         try:
-            images = generate_visualizations(df1, df2, year1, year2)
+            images = generate_visualizations(df1, df2, year1, year2, figure_dir, workers)
+            links = {name: Path(os.path.relpath(path, report_dir)).as_posix() for name, path in images.items()}
             
             # Add visualizations to the report
             report.extend([
                 "## Visualizations",
                 "",
                 "### Line Counts by Type",
-                f"![Line Counts by Type](data:image/png;base64,{images['type_counts']})",
+                f"![Line Counts by Type]({links['type_counts']})",
                 "",
                 "### Line Overlap Between Years",
-                f"![Line Overlap](data:image/png;base64,{images['line_overlap']})",
+                f"![Line Overlap]({links['line_overlap']})",
                 ""
             ])
         except ImportError:
@@ -442,23 +526,286 @@ def export_discrepancies_csv(file1: str, file2: str, output_csv: str):
     return f"Discrepancies exported to {output_csv}"
 
 
+# ---- Multi-snapshot diff engine ----
+
+# Line attributes compared between snapshots, with the change label they produce
+ATTRIBUTE_CHANGES = {
+    'frequency (7:30)': 'frequency_changed',
+    'length (time)': 'length_time_changed',
+    'length (km)': 'length_km_changed',
+}
+
+DIFF_COLUMNS = ['from_snapshot', 'to_snapshot', 'line_name', 'type', 'change',
+                'stop_name', 'position_before', 'position_after', 'value_before', 'value_after']
+
+
+class StopInterner:
+    """Maps station names to integer ids shared by all loaded snapshots."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, stops: List[str]) -> Tuple[int, ...]:
+        return tuple(self.ids.setdefault(stop, len(self.ids)) for stop in stops)
+
+    def names(self) -> pd.Series:
+        """Station name of each id (the Series index)"""
+        return pd.Series(list(self.ids), dtype=object)
+
+
+def snapshot_label(file: str) -> str:
+    """Snapshot label of a raw CSV, e.g. '1961_east' for data/raw/1961_east.csv"""
+    return Path(file).stem
+
+
+def load_snapshot_series(files: Iterable[str], interner: Optional[StopInterner] = None
+                         ) -> Tuple[Dict[str, pd.DataFrame], StopInterner]:
+    """
+    Read raw snapshot CSVs once into line tables with interned stop sequences.
+
+    Args:
+        files: Raw CSV paths (one per snapshot)
+        interner: Existing interner to extend (default: a new one)
+
+    Returns:
+        Tuple of ({label: DataFrame indexed by line_name}, interner). Each
+        table has the line attributes and a 'stop_ids' column of id tuples;
+        as in the two-file comparison, the first row of a line name is used.
+    """
+    interner = interner or StopInterner()
+    snapshots = {}
+    for file in files:
+        df = pd.read_csv(file, dtype={'line_name': str})
+        # Raw headers differ in case between years ('Length (km)' / 'length (km)')
+        df.columns = [col.strip().lstrip('\ufeff').lower() for col in df.columns]
+        df['line_name'] = df['line_name'].astype(str).str.strip()
+        df = df.drop_duplicates('line_name', keep='first')
+        df['stop_ids'] = [interner.intern(parse_stops(stops)) for stops in df['stops']]
+        columns = ['line_name', 'type', 'stop_ids'] + [col for col in ATTRIBUTE_CHANGES if col in df.columns]
+        snapshots[snapshot_label(file)] = df[columns].set_index('line_name')
+    return snapshots, interner
+
+
+def _lcs_positions(seq1: List[int], seq2: List[int]) -> Tuple[Set[int], Set[int]]:
+    """Indexes of seq1 and seq2 that form one longest common subsequence."""
+    n, m = len(seq1), len(seq2)
+    if seq1 == seq2:
+        return set(range(n)), set(range(m))
+
+    # table[i][j] = LCS length of seq1[i:] and seq2[j:]
+    table = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n - 1, -1, -1):
+        row, below, item = table[i], table[i + 1], seq1[i]
+        for j in range(m - 1, -1, -1):
+            row[j] = below[j + 1] + 1 if item == seq2[j] else max(below[j], row[j + 1])
+
+    kept1, kept2 = set(), set()
+    i = j = 0
+    while i < n and j < m:
+        if seq1[i] == seq2[j]:
+            kept1.add(i)
+            kept2.add(j)
+            i += 1
+            j += 1
+        elif table[i + 1][j] >= table[i][j + 1]:
+            i += 1
+        else:
+            j += 1
+    return kept1, kept2
+
+
+def diff_stop_sequences(stops1: Tuple[int, ...], stops2: Tuple[int, ...]
+                        ) -> List[Tuple[str, int, Optional[int], Optional[int]]]:
+    """
+    Stop-level changes between two versions of a line.
+
+    Stations kept in the longest common subsequence of the shared stations
+    are unchanged; the remaining shared stations count as moved.
+
+    Args:
+        stops1: Stop ids of the earlier version
+        stops2: Stop ids of the later version
+
+    Returns:
+        List of (change, stop_id, position_before, position_after) with change
+        one of 'stop_removed', 'stop_added' or 'stop_moved'
+    """
+    set1, set2 = set(stops1), set(stops2)
+    changes = [('stop_removed', stop, i, None) for i, stop in enumerate(stops1) if stop not in set2]
+    changes += [('stop_added', stop, None, j) for j, stop in enumerate(stops2) if stop not in set1]
+
+    common1 = [(i, stop) for i, stop in enumerate(stops1) if stop in set2]
+    common2 = [(j, stop) for j, stop in enumerate(stops2) if stop in set1]
+    kept1, kept2 = _lcs_positions([stop for _, stop in common1], [stop for _, stop in common2])
+
+    # Pair each moved station with its first unmatched position in the later version
+    unmatched2: Dict[int, List[int]] = {}
+    for k, (j, stop) in enumerate(common2):
+        if k not in kept2:
+            unmatched2.setdefault(stop, []).append(j)
+    for k, (i, stop) in enumerate(common1):
+        if k not in kept1:
+            positions = unmatched2.get(stop)
+            changes.append(('stop_moved', stop, i, positions.pop(0) if positions else None))
+    return changes
+
+
+def diff_snapshot_pair(label1: str, lines1: pd.DataFrame, label2: str, lines2: pd.DataFrame) -> pd.DataFrame:
+    """
+    Line-level diff of two loaded snapshots as a tidy table.
+
+    Args:
+        label1: Label of the earlier snapshot
+        lines1: Its line table from load_snapshot_series
+        label2: Label of the later snapshot
+        lines2: Its line table
+
+    Returns:
+        DataFrame with DIFF_COLUMNS, plus a 'stop_id' column holding interned
+        ids (stop_name is filled in by compare_snapshot_series)
+    """
+    rows = []
+    base = {'from_snapshot': label1, 'to_snapshot': label2}
+
+    for line_name in lines1.index.difference(lines2.index):
+        rows.append(dict(base, line_name=line_name, type=lines1.at[line_name, 'type'], change='line_removed'))
+    for line_name in lines2.index.difference(lines1.index):
+        rows.append(dict(base, line_name=line_name, type=lines2.at[line_name, 'type'], change='line_added'))
+
+    common = lines1.index.intersection(lines2.index)
+    before, after = lines1.loc[common], lines2.loc[common]
+
+    for column, change in ATTRIBUTE_CHANGES.items():
+        if column not in before.columns or column not in after.columns:
+            continue
+        # Missing in both snapshots is not a change
+        changed = (before[column] != after[column]) & ~(before[column].isna() & after[column].isna())
+        for line_name in common[changed.to_numpy()]:
+            rows.append(dict(base, line_name=line_name, type=before.at[line_name, 'type'], change=change,
+                             value_before=before.at[line_name, column], value_after=after.at[line_name, column]))
+
+    route_changed = (before['stop_ids'] != after['stop_ids']).to_numpy()
+    for line_name in common[route_changed]:
+        line_type = before.at[line_name, 'type']
+        for change, stop_id, position_before, position_after in diff_stop_sequences(
+                before.at[line_name, 'stop_ids'], after.at[line_name, 'stop_ids']):
+            rows.append(dict(base, line_name=line_name, type=line_type, change=change, stop_id=stop_id,
+                             position_before=position_before, position_after=position_after))
+
+    return pd.DataFrame(rows, columns=[col for col in DIFF_COLUMNS if col != 'stop_name'] + ['stop_id'])
+
+
+def _diff_pair_worker(args):
+    return diff_snapshot_pair(*args)
+
+
+def consecutive_pairs(labels: Iterable[str]) -> List[Tuple[str, str]]:
+    """
+    Consecutive snapshot pairs per side.
+
+    Unified snapshots (before the 1961 split) belong to both sides' series,
+    so e.g. 1960_unified is paired with both 1961_east and 1961_west.
+    """
+    parsed = []
+    for label in labels:
+        match = re.match(r'(\d{4})_(\w+)', label)
+        if match:
+            parsed.append((int(match.group(1)), match.group(2), label))
+
+    sides = sorted({side for _, side, _ in parsed if side != 'unified'}) or ['unified']
+    pairs = []
+    for side in sides:
+        chain = [label for _, _, label in sorted(p for p in parsed if p[1] in (side, 'unified'))]
+        pairs.extend(zip(chain, chain[1:]))
+    return list(dict.fromkeys(pairs))
+
+
+def compare_snapshot_series(files: Iterable[str],
+                            pairs: Optional[List[Tuple[str, str]]] = None,
+                            workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Diff many snapshots in one run.
+
+    Every file is read and parsed once; the pairs are then diffed in
+    parallel processes and collected into one tidy table.
+
+    Args:
+        files: Raw CSV paths
+        pairs: (from_label, to_label) pairs to compare (default: consecutive_pairs)
+        workers: Number of worker processes (1 runs in-process)
+
+    Returns:
+        DataFrame with DIFF_COLUMNS, one row per change
+    """
+    snapshots, interner = load_snapshot_series(files)
+    pairs = pairs or consecutive_pairs(snapshots)
+    missing = {label for pair in pairs for label in pair} - set(snapshots)
+    if missing:
+        raise ValueError(f"Unknown snapshots: {', '.join(sorted(missing))}")
+
+    tasks = [(label1, snapshots[label1], label2, snapshots[label2]) for label1, label2 in pairs]
+    if workers == 1 or len(tasks) < 2:
+        results = [_diff_pair_worker(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_diff_pair_worker, tasks))
+
+    if not results:
+        return pd.DataFrame(columns=DIFF_COLUMNS)
+    diff = pd.concat(results, ignore_index=True)
+    diff['stop_name'] = diff['stop_id'].map(interner.names())
+    for col in ['position_before', 'position_after']:
+        diff[col] = diff[col].astype('Int64')
+    return diff[DIFF_COLUMNS]
+
+
+def summarize_series(diff: pd.DataFrame) -> pd.DataFrame:
+    """Number of changes of each kind per snapshot pair"""
+    return diff.groupby(['from_snapshot', 'to_snapshot', 'change'], sort=False).size().unstack(fill_value=0)
+
+
 def main():
-    parser = argparse.ArgumentParser(description='Compare two network snapshots')
-    parser.add_argument('file1', help='Path to the first CSV file')
-    parser.add_argument('file2', help='Path to the second CSV file')
+    parser = argparse.ArgumentParser(description='Compare network snapshots')
+    parser.add_argument('file1', nargs='?', help='Path to the first CSV file')
+    parser.add_argument('file2', nargs='?', help='Path to the second CSV file')
     parser.add_argument('--output', '-o', help='Output markdown report path (optional)')
     parser.add_argument('--csv', help='Output CSV discrepancies path (optional)')
     parser.add_argument('--no-viz', action='store_true', help='Disable visualizations')
+    parser.add_argument('--figure-dir', help='Directory for report figures (default: figures/ next to the report)')
+    parser.add_argument('--series', nargs='+', metavar='PATH',
+                        help='Diff many snapshots at once: raw CSV files or a directory of them')
+    parser.add_argument('--pairs', nargs='+', metavar='FROM:TO',
+                        help='Snapshot pairs for --series, e.g. 1961_east:1964_east (default: consecutive)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for --series diffs and figure rendering')
     
     args = parser.parse_args()
     
+    if args.series:
+        files = []
+        for path in map(Path, args.series):
+            files.extend(sorted(path.glob('*.csv')) if path.is_dir() else [path])
+        pairs = [tuple(pair.split(':', 1)) for pair in args.pairs] if args.pairs else None
+        diff = compare_snapshot_series(files, pairs=pairs, workers=args.workers)
+        
+        if args.csv:
+            diff.to_csv(args.csv, index=False)
+            print(f"{len(diff)} changes exported to {args.csv}")
+        print(summarize_series(diff).to_string())
+        return
+    
+    if not (args.file1 and args.file2):
+        parser.error('file1 and file2 are required unless --series is given')
+    
     # Generate the markdown report if requested
     if args.output or not args.csv:
         result = compare_network_snapshots(
             args.file1, 
             args.file2, 
             args.output, 
-            include_viz=not args.no_viz
+            include_viz=not args.no_viz,
+            figure_dir=args.figure_dir,
+            workers=args.workers
         )
         
         if not args.output:
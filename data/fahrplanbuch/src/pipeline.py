@@ -0,0 +1,509 @@
+# pipeline.py
+"""
+Scriptable per-snapshot processing pipeline replacing notebooks 00-03.
+
+Each year_side runs through the stages
+
+    process -> match -> geolocate -> enrich -> verify
+
+A stage's cache key is a content hash of its input files, its parameters
+and the source of the modules it uses. A stage only re-runs when that key
+changes (or its outputs were modified), and since downstream inputs are
+upstream outputs, invalidation propagates through the DAG. Independent
+year_sides run in parallel processes.
+
+The manual OpenRefine step between `match` and `geolocate` stays manual:
+`geolocate` is reported as blocked until the *_refined.csv file exists.
+
+Usage:
+    python src/pipeline.py                      # all year_sides in data/raw
+    python src/pipeline.py 1971_east 1971_west  # selected year_sides
+    python src/pipeline.py --dry-run            # show what would run
+    python src/pipeline.py --force enrich       # re-run enrich and everything after it
+    python src/pipeline.py --sync-store         # also mirror data/processed into the Parquet store
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+import argparse
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+SRC_DIR = Path(__file__).resolve().parent
+sys.path.append(str(SRC_DIR))
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_DIR = SRC_DIR.parent / 'data'
+
+DEFAULT_PARAMS = {
+    'score_cutoff': 85,
+    'neo4j_uri': os.environ.get('NEO4J_URI', 'bolt://100.82.176.18:7687'),
+    'neo4j_username': os.environ.get('NEO4J_USERNAME', 'neo4j'),
+    'neo4j_password': os.environ.get('NEO4J_PASSWORD', 'BerlinTransport2024'),
+}
+
+
+class StageBlocked(Exception):
+    """Raised when a stage's inputs do not exist yet (e.g. awaiting manual refinement)."""
+
+
+@dataclass
+class Snapshot:
+    """Paths and parameters for processing one year_side."""
+    year: int
+    side: str
+    base_dir: Path
+    params: Dict = field(default_factory=dict)
+
+    @property
+    def year_side(self) -> str:
+        return f"{self.year}_{self.side}"
+
+    @property
+    def paths(self) -> Dict[str, Path]:
+        """Directory layout in the form expected by enricher/table_creation."""
+        return {
+            'base_dir': self.base_dir,
+            'raw_dir': self.base_dir / 'raw',
+            'interim_dir': self.base_dir / 'interim',
+            'processed_dir': self.base_dir / 'processed',
+            'geo_data_dir': self.base_dir / 'data-external',
+        }
+
+    def path(self, template: str) -> Path:
+        return self.base_dir / template.format(ys=self.year_side)
+
+
+@dataclass
+class Stage:
+    """One node of the pipeline DAG."""
+    name: str
+    run: Callable[[Snapshot], None]
+    inputs: List[str]
+    outputs: List[str]
+    deps: List[str] = field(default_factory=list)
+    modules: List[str] = field(default_factory=list)
+    params: List[str] = field(default_factory=list)
+
+
+# ---- Stage implementations ----
+
+def _run_process(snapshot: Snapshot) -> None:
+    """Notebook 00, first half: raw line table -> base lines/stops tables."""
+    from utils.data_loader import DataLoader
+    from processor import TransportDataProcessor
+
+    raw_df = DataLoader().load_raw_data(str(snapshot.path('raw/{ys}.csv')))
+    results = TransportDataProcessor(snapshot.year, snapshot.side).process_raw_data(raw_df)
+
+    for name, df in results.items():
+        output_path = snapshot.path(f'interim/stops_base/{name}_{{ys}}.csv')
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(output_path, index=False)
+
+
+def match_legacy_stations(stops_df: pd.DataFrame, legacy_stops: pd.DataFrame, year: int):
+    """
+    Fill locations of stops the database matcher missed from the legacy station list.
+
+    For each unmatched stop, the legacy station with the same canonical name
+    key (see name_normalisation) and type whose year (first four digits of
+    its stop_id) is closest to `year` wins.
+
+    Args:
+        stops_df: Stops after database matching
+        legacy_stops: Legacy stations with stop_id, stop_name, type, location, identifier
+        year: Year being processed
+
+    Returns:
+        Tuple of (matched_stops, unmatched_stops)
+    """
+    stops_df = stops_df.copy()
+    unmatched_mask = stops_df['latitude'].isna() if 'latitude' in stops_df.columns else \
+        stops_df['location'].isna() | (stops_df['location'] == '')
+
+    from name_normalisation import get_normaliser
+
+    normaliser = get_normaliser()
+    unmatched = stops_df.loc[unmatched_mask, ['stop_id', 'stop_name', 'type']]
+    legacy = legacy_stops[['stop_id', 'stop_name', 'type', 'location', 'identifier']]
+    candidates = unmatched.assign(name_key=normaliser.keys(unmatched['stop_name']).values).merge(
+        legacy.assign(name_key=normaliser.keys(legacy['stop_name']).values).drop(columns='stop_name'),
+        on=['name_key', 'type'], suffixes=('', '_legacy')
+    )
+    candidates = candidates[candidates['name_key'] != '']
+    if not candidates.empty:
+        candidates['year_diff'] = (year - candidates['stop_id_legacy'].astype(str).str[:4].astype(int)).abs()
+        best = (candidates.sort_values('year_diff', kind='stable')
+                .drop_duplicates('stop_id')
+                .set_index('stop_id'))
+        rows = stops_df['stop_id'].isin(best.index) & unmatched_mask
+        ids = stops_df.loc[rows, 'stop_id']
+        stops_df.loc[rows, 'location'] = ids.map(best['location']).values
+        stops_df.loc[rows, 'location_from'] = ids.map(best['stop_id_legacy']).values
+        stops_df.loc[rows, 'identifier'] = ids.map(best['identifier']).values
+
+    has_location = stops_df['location'].notna() & (stops_df['location'] != '')
+    return stops_df[has_location].copy(), stops_df[~has_location].copy()
+
+
+def _run_match(snapshot: Snapshot) -> None:
+    """Notebook 00, second half: database and legacy matching, OpenRefine export."""
+    from df_station_matcher import DataFrameStationMatcher
+
+    stops = pd.read_csv(snapshot.path('interim/stops_base/stops_{ys}.csv'))
+    params = snapshot.params
+
+    matcher = DataFrameStationMatcher(
+        uri=params['neo4j_uri'], username=params['neo4j_username'], password=params['neo4j_password']
+    )
+    try:
+        matched = matcher.add_location_data(stops, snapshot.year, snapshot.side,
+                                            score_cutoff=params['score_cutoff'])
+    finally:
+        matcher.close()
+
+    legacy_stops = pd.read_csv(snapshot.base_dir.parent / 'legacy_data' / 'stations.csv')
+    matched_stops, unmatched_stops = match_legacy_stations(matched, legacy_stops, snapshot.year)
+
+    matched_path = snapshot.path('interim/stops_matched_initial/stops_{ys}.csv')
+    matched_path.parent.mkdir(parents=True, exist_ok=True)
+    matched_stops.to_csv(matched_path, index=False)
+
+    openrefine_path = snapshot.path('interim/stops_for_openrefine/unmatched_stops_{ys}.csv')
+    openrefine_path.parent.mkdir(parents=True, exist_ok=True)
+    unmatched_stops.to_csv(openrefine_path, index=False)
+    logger.info(f"{snapshot.year_side}: {len(matched_stops)} matched, "
+                f"{len(unmatched_stops)} exported for OpenRefine")
+
+
+def _run_geolocate(snapshot: Snapshot) -> None:
+    """Notebook 01: merge OpenRefine results, split combined stations, verify format."""
+    from geolocation import process_geolocation_verification
+
+    refined_path = snapshot.path('interim/stops_for_openrefine/unmatched_stops_{ys}_refined.csv')
+    if not refined_path.exists():
+        raise StageBlocked(f"awaiting OpenRefine output {refined_path.name}")
+
+    process_geolocation_verification(snapshot.year, snapshot.side, snapshot.base_dir)
+
+
+def _run_enrich(snapshot: Snapshot) -> None:
+    """Notebook 02: line/stop enrichment and final table creation."""
+    import enricher
+    import table_creation
+
+    paths = snapshot.paths
+    year, side = snapshot.year, snapshot.side
+
+    line_df_initial, final_stops = enricher.load_data(paths, year, side)
+    line_df = enricher.enrich_lines(line_df_initial, side)
+
+    # District, Ortsteil and postal code in one query against the shared spatial index
+    enriched_stops_df = enricher.add_spatial_data(side, final_stops, paths['geo_data_dir'])
+    enriched_stops_df = enricher.add_historical_bezirk(enriched_stops_df, year)
+
+    # Exploded by the process stage from the same parse as the stops table
+    line_stops = pd.read_csv(snapshot.path('interim/stops_base/line_stops_{ys}.csv'))
+    line_stops = table_creation.add_stop_foreign_keys(line_stops, enriched_stops_df, year, side)
+
+    final_line_df, final_stops_df, final_line_stops_df = table_creation.finalize_data(
+        line_df, enriched_stops_df, line_stops
+    )
+    table_creation.save_data(paths, final_line_df, final_stops_df, final_line_stops_df, year, side)
+
+
+def _run_verify(snapshot: Snapshot) -> None:
+    """Notebook 03: verification checks, distances and a text report."""
+    import verification
+
+    results = verification.run_verification(snapshot.base_dir, snapshot.year, snapshot.side)
+    report = verification.generate_verification_report(results, snapshot.year, snapshot.side)
+
+    report_path = snapshot.path('interim/verification/report_{ys}.txt')
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(report, encoding='utf-8')
+
+    if not results['overall']:
+        logger.warning(f"{snapshot.year_side}: verification found issues, see {report_path}")
+
+
+STAGES = [
+    Stage(
+        name='process',
+        run=_run_process,
+        inputs=['raw/{ys}.csv'],
+        outputs=['interim/stops_base/lines_{ys}.csv', 'interim/stops_base/stops_{ys}.csv',
+                 'interim/stops_base/line_stops_{ys}.csv'],
+        modules=['processor.py', 'table_creation.py', 'utils/data_loader.py'],
+    ),
+    Stage(
+        name='match',
+        run=_run_match,
+        inputs=['interim/stops_base/stops_{ys}.csv', '../legacy_data/stations.csv'],
+        outputs=['interim/stops_matched_initial/stops_{ys}.csv',
+                 'interim/stops_for_openrefine/unmatched_stops_{ys}.csv'],
+        deps=['process'],
+        modules=['df_station_matcher.py', 'name_normalisation.py', 'pipeline.py'],
+        params=['score_cutoff', 'neo4j_uri'],
+    ),
+    Stage(
+        name='geolocate',
+        run=_run_geolocate,
+        inputs=['interim/stops_matched_initial/stops_{ys}.csv',
+                'interim/stops_for_openrefine/unmatched_stops_{ys}_refined.csv'],
+        outputs=['interim/stops_verified/stops_{ys}.csv'],
+        deps=['match'],
+        modules=['geolocation.py', 'coordinates.py'],
+    ),
+    Stage(
+        name='enrich',
+        run=_run_enrich,
+        inputs=['interim/stops_base/lines_{ys}.csv', 'interim/stops_verified/stops_{ys}.csv',
+                'interim/stops_base/line_stops_{ys}.csv',
+                'data-external/lor_ortsteile.geojson',
+                'data-external/berlin_postal_codes.geojson',
+                '../../db/admin_zone_modelling/ortsteil_assignments.json',
+                '../../db/admin_zone_modelling/historical_bezirke.json'],
+        outputs=['processed/{ys}/lines.csv', 'processed/{ys}/stops.csv', 'processed/{ys}/line_stops.csv'],
+        deps=['geolocate'],
+        modules=['enricher.py', 'table_creation.py', 'line_rules.py', 'line_rules.json',
+                 'spatial_assignment.py', 'admin_timeline.py', 'coordinates.py', 'processed_schema.py'],
+    ),
+    Stage(
+        name='verify',
+        run=_run_verify,
+        inputs=['processed/{ys}/lines.csv', 'processed/{ys}/stops.csv', 'processed/{ys}/line_stops.csv'],
+        outputs=['processed/{ys}/line_stops_with_dist.csv', 'interim/verification/report_{ys}.txt'],
+        deps=['enrich'],
+        modules=['verification.py', 'coordinates.py', 'processed_schema.py'],
+    ),
+]
+
+
+def topological_order(stages: List[Stage]) -> List[Stage]:
+    """Order stages so every stage follows its dependencies."""
+    by_name = {stage.name: stage for stage in stages}
+    ordered, visiting, done = [], set(), set()
+
+    def visit(stage):
+        if stage.name in done:
+            return
+        if stage.name in visiting:
+            raise ValueError(f"Cycle in pipeline at stage {stage.name}")
+        visiting.add(stage.name)
+        for dep in stage.deps:
+            visit(by_name[dep])
+        visiting.discard(stage.name)
+        done.add(stage.name)
+        ordered.append(stage)
+
+    for stage in stages:
+        visit(stage)
+    return ordered
+
+
+# ---- Cache ----
+
+def _file_digest(path: Path) -> str:
+    if not path.exists():
+        return 'missing'
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_key(stage: Stage, snapshot: Snapshot) -> str:
+    """Content hash of a stage's inputs, parameters and code."""
+    payload = {
+        'stage': stage.name,
+        'year_side': snapshot.year_side,
+        'inputs': {template: _file_digest(snapshot.path(template)) for template in stage.inputs},
+        'params': {name: snapshot.params.get(name) for name in stage.params},
+        'code': {module: _file_digest(SRC_DIR / module) for module in stage.modules},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _manifest_path(stage: Stage, snapshot: Snapshot) -> Path:
+    return snapshot.base_dir / 'interim' / 'pipeline_cache' / snapshot.year_side / f'{stage.name}.json'
+
+
+def is_up_to_date(stage: Stage, snapshot: Snapshot, key: str) -> bool:
+    """A stage is cached if its key matches and its outputs are unchanged since it ran."""
+    manifest_path = _manifest_path(stage, snapshot)
+    if not manifest_path.exists():
+        return False
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return False
+    if manifest.get('key') != key:
+        return False
+    return all(
+        _file_digest(snapshot.path(template)) == digest
+        for template, digest in manifest.get('outputs', {}).items()
+    )
+
+
+def _write_manifest(stage: Stage, snapshot: Snapshot, key: str) -> None:
+    manifest_path = _manifest_path(stage, snapshot)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        'key': key,
+        'outputs': {template: _file_digest(snapshot.path(template)) for template in stage.outputs},
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+
+
+# ---- Runner ----
+
+def run_snapshot(snapshot: Snapshot, force: Optional[str] = None, dry_run: bool = False) -> Dict[str, str]:
+    """
+    Run all stages for one year_side.
+
+    Args:
+        snapshot: Year_side to process
+        force: Name of a stage to re-run regardless of the cache (with everything after it)
+        dry_run: Only report which stages would run
+
+    Returns:
+        Dict mapping stage name to 'cached', 'ran', 'would run', 'blocked: ...', 'failed: ...' or 'skipped'
+    """
+    status = {}
+    forcing = False
+
+    for stage in topological_order(STAGES):
+        if any(not status.get(dep, '').startswith(('cached', 'ran', 'would run')) for dep in stage.deps):
+            status[stage.name] = 'skipped'
+            continue
+
+        forcing = forcing or stage.name == force
+        key = stage_key(stage, snapshot)
+        if not forcing and is_up_to_date(stage, snapshot, key):
+            status[stage.name] = 'cached'
+            continue
+
+        if dry_run:
+            status[stage.name] = 'would run'
+            continue
+
+        try:
+            logger.info(f"{snapshot.year_side}: running stage {stage.name}")
+            stage.run(snapshot)
+            # Key is recomputed in case the stage wrote to one of its own inputs
+            _write_manifest(stage, snapshot, stage_key(stage, snapshot))
+            status[stage.name] = 'ran'
+        except StageBlocked as e:
+            status[stage.name] = f'blocked: {e}'
+        except Exception as e:
+            logger.error(f"{snapshot.year_side}: stage {stage.name} failed: {e}")
+            status[stage.name] = f'failed: {e}'
+
+    return status
+
+
+def _run_snapshot_worker(args):
+    snapshot, force, dry_run = args
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    return snapshot.year_side, run_snapshot(snapshot, force, dry_run)
+
+
+def discover_year_sides(base_dir: Path) -> List[str]:
+    """All year_sides with a raw line table."""
+    return sorted(path.stem for path in (base_dir / 'raw').glob('*.csv'))
+
+
+def run_pipeline(year_sides: Optional[List[str]] = None,
+                 base_dir: Path = DEFAULT_BASE_DIR,
+                 params: Optional[Dict] = None,
+                 force: Optional[str] = None,
+                 dry_run: bool = False,
+                 workers: Optional[int] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Run the pipeline for several year_sides in parallel.
+
+    Args:
+        year_sides: Year_sides to process (default: all in data/raw)
+        base_dir: Base data directory
+        params: Overrides for DEFAULT_PARAMS
+        force: Stage to re-run regardless of the cache
+        dry_run: Only report which stages would run
+        workers: Number of processes (default: CPU count)
+
+    Returns:
+        Dict mapping year_side to its stage status
+    """
+    base_dir = Path(base_dir)
+    params = dict(DEFAULT_PARAMS, **(params or {}))
+    year_sides = year_sides or discover_year_sides(base_dir)
+
+    if force and force not in {stage.name for stage in STAGES}:
+        raise ValueError(f"Unknown stage: {force}")
+
+    snapshots = []
+    for year_side in year_sides:
+        year, side = year_side.split('_')
+        snapshots.append(Snapshot(int(year), side, base_dir, params))
+
+    jobs = [(snapshot, force, dry_run) for snapshot in snapshots]
+    if workers == 1 or len(jobs) <= 1:
+        return dict(_run_snapshot_worker(job) for job in jobs)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(_run_snapshot_worker, jobs))
+
+
+def print_status(results: Dict[str, Dict[str, str]]) -> None:
+    stage_names = [stage.name for stage in topological_order(STAGES)]
+    print("\n" + "=" * 80)
+    print("PIPELINE SUMMARY")
+    print("=" * 80)
+    for year_side, status in sorted(results.items()):
+        print(f"\n{year_side}:")
+        for name in stage_names:
+            print(f"  - {name}: {status.get(name, 'skipped')}")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="Run the Fahrplanbuch processing pipeline")
+    parser.add_argument("year_sides", nargs="*", help="Year_sides to process (default: all in data/raw)")
+    parser.add_argument("--data-dir", type=str, default=str(DEFAULT_BASE_DIR), help="Base data directory path")
+    parser.add_argument("--force", type=str, choices=[stage.name for stage in STAGES],
+                        help="Re-run this stage and all stages after it")
+    parser.add_argument("--dry-run", action="store_true", help="Only show which stages would run")
+    parser.add_argument("--workers", type=int, default=None, help="Number of parallel processes")
+    parser.add_argument("--score-cutoff", type=int, default=DEFAULT_PARAMS['score_cutoff'],
+                        help="Fuzzy matching cutoff for the match stage")
+    parser.add_argument("--sync-store", action="store_true",
+                        help="Mirror data/processed into the Parquet snapshot store afterwards")
+
+    args = parser.parse_args()
+
+    results = run_pipeline(
+        year_sides=args.year_sides or None,
+        base_dir=Path(args.data_dir),
+        params={'score_cutoff': args.score_cutoff},
+        force=args.force,
+        dry_run=args.dry_run,
+        workers=args.workers,
+    )
+    print_status(results)
+
+    if args.sync_store and not args.dry_run:
+        from snapshot_store import SnapshotStore
+        for name, status in SnapshotStore(Path(args.data_dir)).sync(args.year_sides or None).items():
+            print(f"store {name}: {status}")
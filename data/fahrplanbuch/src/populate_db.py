@@ -12,6 +12,8 @@ import sys
 import os
 import time
 from db_connector import BerlinTransportDB
+from line_rules import capacity_lookup
+from processed_schema import read_table
 
 # Configure logging
 logging.basicConfig(
@@ -284,6 +286,7 @@ class BerlinTransportImporter:
                 session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (d:District) REQUIRE d.name IS UNIQUE")
                 session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (o:Ortsteil) REQUIRE o.name IS UNIQUE")
                 session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (p:PostalCode) REQUIRE p.code IS UNIQUE")
+                session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (b:HistoricalBezirk) REQUIRE b.bezirk_id IS UNIQUE")
                 
                 # Create indexes for performance
                 session.run("CREATE INDEX IF NOT EXISTS FOR (s:Station) ON (s.name, s.type)")
@@ -507,8 +510,8 @@ class BerlinTransportImporter:
             return False
         
         try:
-            # Read stations CSV
-            stops_df = pd.read_csv(file_path)
+            # Read stations CSV (typed latitude/longitude, string IDs and postal codes)
+            stops_df = read_table(file_path, 'stops')
             logger.info(f"Importing {len(stops_df)} stations from {file_path}")
             
             # Get existing stations if needed
@@ -545,13 +548,10 @@ class BerlinTransportImporter:
                 # Create Cypher parameters for this batch
                 stations_params = []
                 for _, row in batch.iterrows():
-                    # Parse coordinates if available
+                    # Coordinates if available
                     lat, lng = None, None
-                    if pd.notna(row.get('location')):
-                        try:
-                            lat, lng = map(float, str(row['location']).split(','))
-                        except (ValueError, TypeError):
-                            pass
+                    if pd.notna(row['latitude']) and pd.notna(row['longitude']):
+                        lat, lng = float(row['latitude']), float(row['longitude'])
                     
                     # Determine source based on data quality/origin
                     source = default_source
@@ -580,7 +580,7 @@ class BerlinTransportImporter:
                     }
                     
                     # Add optional fields if available
-                    for field in ['district', 'neighbourhood', 'postal_code', 'identifier']:
+                    for field in ['district', 'neighbourhood', 'postal_code', 'identifier', 'bezirk_id']:
                         if field in row and pd.notna(row[field]):
                             station_param[field] = row[field]
                     
@@ -629,6 +629,12 @@ class BerlinTransportImporter:
                             MERGE (s)-[:IN_POSTAL_CODE]->(p)
                         )
                         
+                        // Connect to the Bezirk the Ortsteil belonged to in this year, if available
+                        FOREACH (bezirkId IN CASE WHEN station.bezirk_id IS NOT NULL THEN [station.bezirk_id] ELSE [] END |
+                            MERGE (b:HistoricalBezirk {bezirk_id: bezirkId})
+                            MERGE (s)-[:IN_HISTORICAL_BEZIRK]->(b)
+                        )
+                        
                         RETURN count(s) as count
                         """
                     else:
@@ -678,6 +684,12 @@ class BerlinTransportImporter:
                             MERGE (s)-[:IN_POSTAL_CODE]->(p)
                         )
                         
+                        // Connect to the Bezirk the Ortsteil belonged to in this year, if available
+                        FOREACH (bezirkId IN CASE WHEN station.bezirk_id IS NOT NULL THEN [station.bezirk_id] ELSE [] END |
+                            MERGE (b:HistoricalBezirk {bezirk_id: bezirkId})
+                            MERGE (s)-[:IN_HISTORICAL_BEZIRK]->(b)
+                        )
+                        
                         RETURN count(s) as count
                         """
                     
@@ -754,7 +766,7 @@ class BerlinTransportImporter:
         
         try:
             # Read lines CSV
-            lines_df = pd.read_csv(file_path)
+            lines_df = read_table(file_path, 'lines')
             logger.info(f"Importing {len(lines_df)} lines from {file_path}")
             
             # Get existing lines if needed
@@ -902,7 +914,7 @@ class BerlinTransportImporter:
         
         try:
             # Read line_stops CSV
-            line_stops_df = pd.read_csv(file_path)
+            line_stops_df = read_table(file_path, 'line_stops')
             logger.info(f"Importing {len(line_stops_df)} line-stop relationships from {file_path}")
             
             # Process in batches
@@ -962,6 +974,12 @@ class BerlinTransportImporter:
         
         try:
             with self.db.driver.session() as session:
+                # Capacities for lines imported without one come from the same rule table as enrichment
+                type_profiles = [(record["type"], record["profile"]) for record in session.run(
+                    "MATCH (l:Line) RETURN DISTINCT l.type AS type, l.profile AS profile"
+                )]
+                capacity_rules = capacity_lookup(type_profiles)
+                
                 # This query finds adjacent stops on the same line and creates CONNECTS_TO relationships
                 # and calculates hourly_capacity and hourly_services
                 result = session.run("""
@@ -969,8 +987,11 @@ class BerlinTransportImporter:
                 MATCH (l)-[s2:SERVES]->(station2:Station)
                 WHERE s1.stop_order = s2.stop_order - 1
                 
-                // Calculate distance between stations if coordinates are available
                 WITH l, station1, station2,
+                    coalesce(l.capacity, $capacity_rules[l.type + '|' + coalesce(l.profile, '')]) AS capacity
+                
+                // Calculate distance between stations if coordinates are available
+                WITH l, station1, station2, capacity,
                     CASE 
                     WHEN station1.latitude IS NOT NULL AND station1.longitude IS NOT NULL 
                             AND station2.latitude IS NOT NULL AND station2.longitude IS NOT NULL
@@ -987,11 +1008,11 @@ class BerlinTransportImporter:
                     c.line_names = [l.name],
                     c.transport_type = l.type,
                     c.distance_meters = distance_meters,
-                    c.capacities = CASE WHEN l.capacity IS NOT NULL THEN [l.capacity] ELSE [] END,
+                    c.capacities = CASE WHEN capacity IS NOT NULL THEN [capacity] ELSE [] END,
                     c.frequencies = CASE WHEN l.frequency IS NOT NULL THEN [l.frequency] ELSE [] END,
                     // Calculate hourly values
-                    c.hourly_capacity = CASE WHEN l.capacity IS NOT NULL AND l.frequency IS NOT NULL 
-                                    THEN l.capacity * (60 / l.frequency)
+                    c.hourly_capacity = CASE WHEN capacity IS NOT NULL AND l.frequency IS NOT NULL 
+                                    THEN capacity * (60 / l.frequency)
                                     ELSE 0 END,
                     c.hourly_services = CASE WHEN l.frequency IS NOT NULL 
                                     THEN (60 / l.frequency)
@@ -1000,14 +1021,14 @@ class BerlinTransportImporter:
                     c.line_ids = CASE WHEN NOT l.line_id IN c.line_ids THEN c.line_ids + l.line_id ELSE c.line_ids END,
                     c.line_names = CASE WHEN NOT l.name IN c.line_names THEN c.line_names + l.name ELSE c.line_names END,
                     c.distance_meters = distance_meters,
-                    c.capacities = CASE WHEN l.capacity IS NOT NULL AND NOT l.capacity IN c.capacities 
-                                    THEN c.capacities + l.capacity ELSE c.capacities END,
+                    c.capacities = CASE WHEN capacity IS NOT NULL AND NOT capacity IN c.capacities 
+                                    THEN c.capacities + capacity ELSE c.capacities END,
                     c.frequencies = CASE WHEN l.frequency IS NOT NULL AND NOT l.frequency IN c.frequencies 
                                     THEN c.frequencies + l.frequency ELSE c.frequencies END,
                     // Update hourly calculations
                     c.hourly_capacity = CASE 
-                                        WHEN l.capacity IS NOT NULL AND l.frequency IS NOT NULL 
-                                        THEN c.hourly_capacity + (l.capacity * (60 / l.frequency))
+                                        WHEN capacity IS NOT NULL AND l.frequency IS NOT NULL 
+                                        THEN c.hourly_capacity + (capacity * (60 / l.frequency))
                                         ELSE c.hourly_capacity 
                                         END,
                     c.hourly_services = CASE 
@@ -1017,7 +1038,7 @@ class BerlinTransportImporter:
                                     END
                 
                 RETURN count(c) as connections_created
-                """)
+                """, capacity_rules=capacity_rules)
                 
                 connections = result.single()["connections_created"]
                 logger.info(f"Created {connections} station connections")
@@ -0,0 +1,307 @@
+"""
+Versioned schema of the processed snapshot tables (data/processed/{year}_{side}/).
+
+Schema v2 stores stop coordinates as float64 `latitude`/`longitude` columns;
+`location` is kept as a derived "lat,lon" string for older consumers. Every
+table is read with a fixed dtype map, so IDs, line names and postal codes
+always load as strings and coordinates as floats.
+
+Each snapshot directory carries a schema.json with its version. Directories
+without one are v1 and are upgraded in memory on load; run
+
+    python src/processed_schema.py --migrate
+
+once to rewrite the existing tree as v2.
+"""
+
+import json
+import logging
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, Union
+
+import pandas as pd
+
+try:
+    from coordinates import coordinate_columns, format_coordinates
+except ImportError:  # imported as src.processed_schema from the notebooks
+    from .coordinates import coordinate_columns, format_coordinates
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+SCHEMA_FILE = 'schema.json'
+
+_LINE_STOP_DTYPES = {
+    'stop_order': 'Int64',
+    'stop_id': str,
+    'line_id': str,
+}
+
+# Column dtypes per table; columns not listed are read with pandas' inference
+TABLE_DTYPES = {
+    'stops': {
+        'stop_id': str,
+        'stop_name': str,
+        'type': str,
+        'line_name': str,
+        'location': str,
+        'latitude': 'float64',
+        'longitude': 'float64',
+        'identifier': str,
+        'location_from': str,
+        'match_score': 'float64',
+        'matched_name': str,
+        'matched_stop_id': str,
+        'matched_historical_lines': str,
+        'neighbourhood': str,
+        'district': str,
+        'east_west': str,
+        'postal_code': str,
+        'bezirk_id': str,
+        'historical_district': str,
+    },
+    'lines': {
+        'line_id': str,
+        'year': 'Int64',
+        'line_name': str,
+        'type': str,
+        'start_stop': str,
+        'length (time)': 'float64',
+        'length (km)': 'float64',
+        'east_west': str,
+        'frequency (7:30)': 'float64',
+        'profile': str,
+        'capacity': 'Int64',
+    },
+    'line_stops': _LINE_STOP_DTYPES,
+    'line_stops_with_dist': dict(_LINE_STOP_DTYPES, distance_meters='float64'),
+}
+
+REQUIRED_COLUMNS = {
+    'stops': ['stop_id', 'stop_name', 'type', 'line_name', 'latitude', 'longitude'],
+    'lines': ['line_id', 'line_name', 'type'],
+    'line_stops': ['stop_order', 'stop_id', 'line_id'],
+    'line_stops_with_dist': ['stop_order', 'stop_id', 'line_id', 'distance_meters'],
+}
+
+# Integer-like codes that v1 files may hold as floats ("10115.0")
+_CODE_COLUMNS = ['postal_code', 'location_from', 'identifier', 'matched_stop_id']
+
+CORE_TABLES = ('lines', 'stops', 'line_stops')
+
+
+def schema_version(snapshot_dir: Union[str, Path]) -> int:
+    """Schema version of a snapshot directory (1 if it has no schema.json)"""
+    schema_path = Path(snapshot_dir) / SCHEMA_FILE
+    if not schema_path.exists():
+        return 1
+    try:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            return int(json.load(f).get('version', 1))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read {schema_path}: {e}")
+        return 1
+
+
+def normalize_table(df: pd.DataFrame, table: str) -> pd.DataFrame:
+    """
+    Bring a table to the current schema.
+
+    For stops, latitude/longitude are filled from `location` where missing
+    and `location` is re-derived from them. Columns are cast to the schema
+    dtypes and missing required columns are added empty.
+
+    Args:
+        df: Table DataFrame (any schema version)
+        table: Table name (key of TABLE_DTYPES)
+
+    Returns:
+        Normalized copy of the table
+    """
+    df = df.copy()
+    dtypes = TABLE_DTYPES[table]
+
+    if table == 'stops':
+        if 'location' not in df.columns:
+            df['location'] = None
+        coords = coordinate_columns(df)
+        df['latitude'] = coords['latitude']
+        df['longitude'] = coords['longitude']
+        has_coords = coords['latitude'].notna() & coords['longitude'].notna()
+        df['location'] = format_coordinates(coords['latitude'], coords['longitude']).where(has_coords, df['location'])
+
+    for col in REQUIRED_COLUMNS.get(table, []):
+        if col not in df.columns:
+            df[col] = None
+
+    for col in _CODE_COLUMNS:
+        if col in df.columns:
+            present = df[col].notna()
+            df[col] = df[col].astype(str).str.replace(r'^(-?\d+)\.0$', r'\1', regex=True).where(present)
+
+    for col, dtype in dtypes.items():
+        if col not in df.columns:
+            continue
+        if dtype is str:
+            df[col] = df[col].astype(object).where(df[col].notna()).map(str, na_action='ignore')
+        elif dtype == 'Int64':
+            df[col] = pd.to_numeric(df[col], errors='coerce').round().astype('Int64')
+        else:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
+
+    return df
+
+
+def read_table(path: Union[str, Path], table: str, upgrade: bool = True) -> pd.DataFrame:
+    """
+    Read one processed table with the schema's fixed dtypes.
+
+    Args:
+        path: CSV file
+        table: Table name (key of TABLE_DTYPES)
+        upgrade: Normalize tables from directories older than SCHEMA_VERSION
+
+    Returns:
+        DataFrame
+    """
+    path = Path(path)
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {col: dtype for col, dtype in TABLE_DTYPES[table].items() if col in header}
+    version = schema_version(path.parent)
+
+    # Round-trip parsing, so rewriting a table does not change its last float digits
+    try:
+        df = pd.read_csv(path, dtype=dtypes, float_precision='round_trip')
+    except (ValueError, TypeError):
+        # v1 files may hold values the strict dtypes reject (e.g. "7.0" in an integer column)
+        if version >= SCHEMA_VERSION:
+            raise
+        df = pd.read_csv(path, dtype={col: str for col, dtype in dtypes.items() if dtype is str},
+                         float_precision='round_trip')
+
+    if upgrade and version < SCHEMA_VERSION:
+        logger.info(f"Upgrading {path} from schema v{version} in memory")
+        df = normalize_table(df, table)
+    return df
+
+
+def load_snapshot(snapshot_dir: Union[str, Path], tables: Iterable[str] = CORE_TABLES) -> Dict[str, pd.DataFrame]:
+    """
+    Load the tables of one snapshot directory.
+
+    Args:
+        snapshot_dir: data/processed/{year}_{side}
+        tables: Table names to load
+
+    Returns:
+        Dictionary mapping table name to DataFrame (missing files are left out)
+    """
+    snapshot_dir = Path(snapshot_dir)
+    data = {}
+    for table in tables:
+        path = snapshot_dir / f"{table}.csv"
+        if path.exists():
+            data[table] = read_table(path, table)
+    return data
+
+
+def _write_schema(snapshot_dir: Path, tables: Dict[str, pd.DataFrame]) -> None:
+    schema_path = snapshot_dir / SCHEMA_FILE
+    schema = {'version': SCHEMA_VERSION, 'tables': {}}
+    if schema_path.exists() and schema_version(snapshot_dir) == SCHEMA_VERSION:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+    for table, df in tables.items():
+        schema['tables'][table] = {col: str(dtype) for col, dtype in df.dtypes.items()}
+    with open(schema_path, 'w', encoding='utf-8') as f:
+        json.dump(schema, f, indent=2)
+
+
+def save_table(snapshot_dir: Union[str, Path], table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize and write one table, recording it in the directory's schema.json"""
+    return save_snapshot(snapshot_dir, {table: df})[table]
+
+
+def save_snapshot(snapshot_dir: Union[str, Path], tables: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Normalize and write several tables of one snapshot directory.
+
+    Writing marks the whole directory as SCHEMA_VERSION, so the other tables
+    of an older directory are migrated in the same call; otherwise they would
+    no longer be upgraded on load.
+
+    Args:
+        snapshot_dir: data/processed/{year}_{side}
+        tables: Dictionary mapping table name to DataFrame
+
+    Returns:
+        The normalized tables as written
+    """
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    version = schema_version(snapshot_dir)
+    if version < SCHEMA_VERSION:
+        untouched = [table for table in TABLE_DTYPES if table not in tables]
+        existing = load_snapshot(snapshot_dir, untouched)
+        if existing:
+            logger.info(f"Migrating {', '.join(existing)} in {snapshot_dir} from schema v{version}")
+        tables = dict(existing, **tables)
+
+    normalized = {table: normalize_table(df, table) for table, df in tables.items()}
+    for table, df in normalized.items():
+        df.to_csv(snapshot_dir / f"{table}.csv", index=False)
+    _write_schema(snapshot_dir, normalized)
+    return normalized
+
+
+def migrate_processed(processed_dir: Union[str, Path], dry_run: bool = False) -> Dict[str, str]:
+    """
+    Rewrite every snapshot directory below processed_dir as the current schema.
+
+    Args:
+        processed_dir: data/processed
+        dry_run: Only report which directories would be migrated
+
+    Returns:
+        Dictionary mapping directory name to 'migrated', 'current' or 'would migrate'
+    """
+    results = {}
+    for snapshot_dir in sorted(p for p in Path(processed_dir).iterdir() if p.is_dir()):
+        version = schema_version(snapshot_dir)
+        if version >= SCHEMA_VERSION:
+            results[snapshot_dir.name] = 'current'
+            continue
+        if dry_run:
+            results[snapshot_dir.name] = 'would migrate'
+            continue
+
+        tables = load_snapshot(snapshot_dir, TABLE_DTYPES.keys())
+        save_snapshot(snapshot_dir, tables)
+        stops = tables.get('stops')
+        located = int(stops['latitude'].notna().sum()) if stops is not None else 0
+        logger.info(f"Migrated {snapshot_dir.name} from v{version} to v{SCHEMA_VERSION} "
+                    f"({located} located stops)")
+        results[snapshot_dir.name] = 'migrated'
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="Processed data schema tools")
+    parser.add_argument("--migrate", action="store_true", help="Rewrite data/processed as the current schema")
+    parser.add_argument("--dry-run", action="store_true", help="Only show which directories would be migrated")
+    parser.add_argument("--data-dir", type=str, default=str(Path(__file__).resolve().parent.parent / 'data'),
+                        help="Base data directory path")
+
+    args = parser.parse_args()
+    processed_dir = Path(args.data_dir) / 'processed'
+
+    if args.migrate or args.dry_run:
+        for name, status in migrate_processed(processed_dir, dry_run=args.dry_run).items():
+            print(f"{name}: {status}")
+    else:
+        for snapshot_dir in sorted(p for p in processed_dir.iterdir() if p.is_dir()):
+            print(f"{snapshot_dir.name}: schema v{schema_version(snapshot_dir)}")
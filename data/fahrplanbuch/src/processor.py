@@ -4,6 +4,7 @@ import pandas as pd
 import logging
 from typing import Dict, Optional, Union
 from pathlib import Path
+from table_creation import explode_stops
 
 logger = logging.getLogger(__name__)
 
@@ -47,19 +48,24 @@ class TransportDataProcessor:
             else:
                 raise TypeError("input_data must be either a file path or DataFrame")
             
+            # Parse the stop lists once; stops and line_stops both derive from it
+            line_stops_df = explode_stops(df)
+            
             # Clean data
             df = self._clean_line_data(df)
             
             # Create basic tables
             line_df = self._create_line_table(df)
-            stops_df = self._create_stops_table(df)
+            stops_df = self._create_stops_table(line_stops_df)
             
             logger.info(f"Created tables: lines ({len(line_df)} rows), "
-                    f"stops ({len(stops_df)} rows), ")
+                    f"stops ({len(stops_df)} rows), "
+                    f"line_stops ({len(line_stops_df)} rows)")
             
             return {
                 'lines': line_df,
-                'stops': stops_df
+                'stops': stops_df,
+                'line_stops': line_stops_df
             }
             
         except Exception as e:
@@ -106,23 +112,11 @@ class TransportDataProcessor:
 
         return line_df
     
-    def _create_stops_table(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Create stops table with unique stations."""
-        # Split stops into individual stations
-        all_stops = []
-        for idx, row in df.iterrows():
-            stops = row['stops'].split(' - ')
-            for stop in stops:
-                all_stops.append({
-                    'stop_name': stop.strip(),
-                    'type': row['type'],
-                    'line_name': row['line_name']
-                })
-        
-        stops_df = pd.DataFrame(all_stops)
-        
+    def _create_stops_table(self, line_stops_df: pd.DataFrame) -> pd.DataFrame:
+        """Create stops table with unique stations from the exploded line stops."""
         # Remove duplicates keeping first occurrence
-        stops_df = stops_df.drop_duplicates(subset=['stop_name', 'type', 'line_name'])
+        stops_df = line_stops_df.drop_duplicates(subset=['stop_name', 'type', 'line_name'])
+        stops_df = stops_df[['stop_name', 'type', 'line_name']].reset_index(drop=True)
         
         # Add stop IDs
         stops_df['stop_id'] = [f"{self.year}{i}_{self.side}" for i in range(len(stops_df))]
@@ -131,4 +125,4 @@ class TransportDataProcessor:
         stops_df['location'] = ''
         stops_df['identifier'] = ''
         
-        return stops_df
\ No newline at end of file
+        return stops_df
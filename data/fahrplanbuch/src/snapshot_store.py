@@ -0,0 +1,287 @@
+"""
+Columnar Parquet store of the processed snapshots.
+
+The CSVs under data/processed/{year}_{side}/ stay the human-editable source.
+`SnapshotStore.sync` mirrors them into one hive-partitioned Parquet dataset
+per table,
+
+    data/snapshot_store/{table}/year={year}/side={side}/part-0.parquet
+
+rewriting only the partitions whose CSVs changed. Reads go through
+pyarrow.dataset, so filters on year and side prune whole partitions and
+filters on other columns (e.g. type) are pushed down to the row groups.
+Cross-year analyses load every snapshot from a handful of files instead of
+parsing each CSV.
+
+Requires pyarrow; import errors surface when the store is first used.
+
+Usage:
+    python src/snapshot_store.py sync            # mirror data/processed
+    python src/snapshot_store.py status          # list stored partitions
+"""
+
+import json
+import hashlib
+import logging
+import argparse
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+try:
+    from processed_schema import TABLE_DTYPES, load_snapshot
+except ImportError:  # imported as src.snapshot_store from the notebooks
+    from .processed_schema import TABLE_DTYPES, load_snapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+STORE_DIRNAME = 'snapshot_store'
+MANIFEST_FILE = '_manifest.json'
+
+STORE_TABLES = tuple(TABLE_DTYPES.keys())
+
+# Hive partition columns; a table's own 'year' column is replaced by the partition value
+PARTITION_COLUMNS = ('year', 'side')
+
+
+def _arrow_type(pa, dtype):
+    if dtype is str:
+        return pa.string()
+    if dtype == 'Int64':
+        return pa.int64()
+    return pa.float64()
+
+
+def _csv_digest(snapshot_dir: Path) -> Dict[str, str]:
+    digests = {}
+    for path in sorted(snapshot_dir.glob('*.csv')):
+        digests[path.name] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return digests
+
+
+def _split_year_side(name: str) -> Optional[Tuple[int, str]]:
+    year, _, side = name.partition('_')
+    if not year.isdigit() or not side:
+        return None
+    return int(year), side
+
+
+class SnapshotStore:
+    """
+    Parquet mirror of data/processed.
+
+    Args:
+        data_dir: Base data directory (containing processed/)
+        store_dir: Location of the store (default: data_dir/snapshot_store)
+    """
+
+    def __init__(self, data_dir: Union[str, Path] = DEFAULT_DATA_DIR, store_dir: Optional[Union[str, Path]] = None):
+        self.data_dir = Path(data_dir)
+        self.processed_dir = self.data_dir / 'processed'
+        self.store_dir = Path(store_dir) if store_dir else self.data_dir / STORE_DIRNAME
+
+    # ---- Sync ----
+
+    def _read_manifest(self) -> Dict[str, Dict[str, str]]:
+        manifest_path = self.store_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            return {}
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: Dict[str, Dict[str, str]]) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.store_dir / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    def _partition_dir(self, table: str, year: int, side: str) -> Path:
+        return self.store_dir / table / f"year={year}" / f"side={side}"
+
+    def _arrow_table(self, df: pd.DataFrame, table: str):
+        """Convert a processed table to Arrow with fixed column types"""
+        import pyarrow as pa
+
+        df = df.drop(columns=[col for col in PARTITION_COLUMNS if col in df.columns])
+        dtypes = TABLE_DTYPES[table]
+        fields = []
+        for col in df.columns:
+            # Columns outside the schema are stored as strings so partitions always agree
+            fields.append(pa.field(col, _arrow_type(pa, dtypes.get(col, str))))
+            if col not in dtypes:
+                df[col] = df[col].astype(object).where(df[col].notna()).map(str, na_action='ignore')
+        return pa.Table.from_pandas(df, schema=pa.schema(fields), preserve_index=False)
+
+    def write_snapshot(self, year: int, side: str, tables: Dict[str, pd.DataFrame]) -> None:
+        """Replace the partitions of one snapshot with the given tables"""
+        import pyarrow.parquet as pq
+
+        for table, df in tables.items():
+            partition = self._partition_dir(table, year, side)
+            if partition.exists():
+                shutil.rmtree(partition)
+            partition.mkdir(parents=True)
+            pq.write_table(self._arrow_table(df, table), partition / 'part-0.parquet')
+
+    def _remove_snapshot(self, year: int, side: str) -> None:
+        for table in STORE_TABLES:
+            partition = self._partition_dir(table, year, side)
+            if partition.exists():
+                shutil.rmtree(partition)
+
+    def sync(self, year_sides: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, str]:
+        """
+        Mirror the processed CSVs into the store.
+
+        Only snapshots whose CSV contents changed since the last sync are
+        rewritten; snapshots removed from data/processed are dropped from
+        the store.
+
+        Args:
+            year_sides: Snapshots to sync (default: all directories in processed/)
+            force: Rewrite snapshots even if unchanged
+
+        Returns:
+            Dictionary mapping year_side to 'written', 'unchanged' or 'removed'
+        """
+        manifest = self._read_manifest()
+        available = {p.name: p for p in self.processed_dir.iterdir()
+                     if p.is_dir() and _split_year_side(p.name)}
+        selected = set(year_sides) if year_sides else set(available)
+
+        results = {}
+        for name in sorted(selected):
+            year, side = _split_year_side(name) or (None, None)
+            if name not in available:
+                if name in manifest:
+                    self._remove_snapshot(year, side)
+                    del manifest[name]
+                    results[name] = 'removed'
+                    logger.info(f"Removed {name} from the snapshot store")
+                continue
+
+            digest = _csv_digest(available[name])
+            if not force and manifest.get(name) == digest:
+                results[name] = 'unchanged'
+                continue
+
+            tables = load_snapshot(available[name], STORE_TABLES)
+            self._remove_snapshot(year, side)
+            self.write_snapshot(year, side, tables)
+            manifest[name] = digest
+            results[name] = 'written'
+            logger.info(f"Stored {name}: {', '.join(f'{t} ({len(df)})' for t, df in tables.items())}")
+
+        if not year_sides:
+            # Full sync: drop snapshots whose directories no longer exist
+            for name in sorted(set(manifest) - set(available)):
+                year, side = _split_year_side(name)
+                self._remove_snapshot(year, side)
+                del manifest[name]
+                results[name] = 'removed'
+
+        self._write_manifest(manifest)
+        return results
+
+    # ---- Reading ----
+
+    def year_sides(self) -> List[str]:
+        """Snapshots currently in the store"""
+        return sorted(self._read_manifest())
+
+    def _dataset(self, table: str):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        table_dir = self.store_dir / table
+        files = sorted(table_dir.glob('year=*/side=*/*.parquet'))
+        if not files:
+            return None
+        partitioning = ds.partitioning(pa.schema([('year', pa.int64()), ('side', pa.string())]), flavor='hive')
+        # Older snapshots may lack columns added later; unify the file schemas (footers only)
+        schema = pa.unify_schemas([pq.read_schema(f) for f in files] + [partitioning.schema])
+        return ds.dataset([str(f) for f in files], schema=schema, format='parquet',
+                          partitioning=partitioning, partition_base_dir=str(table_dir))
+
+    def read(self, table: str,
+             years: Optional[Iterable[int]] = None,
+             sides: Optional[Iterable[str]] = None,
+             types: Optional[Iterable[str]] = None,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read one table across snapshots.
+
+        Args:
+            table: Table name ('stops', 'lines', 'line_stops', 'line_stops_with_dist')
+            years: Only these years
+            sides: Only these sides
+            types: Only these transport types (tables with a 'type' column)
+            columns: Columns to load (year and side are always included)
+
+        Returns:
+            DataFrame with the schema's dtypes plus year and side columns
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        dataset = self._dataset(table)
+        if dataset is None:
+            logger.warning(f"No '{table}' data in the snapshot store at {self.store_dir}")
+            return pd.DataFrame(columns=list(PARTITION_COLUMNS))
+
+        conditions = []
+        if years is not None:
+            conditions.append(ds.field('year').isin([int(y) for y in years]))
+        if sides is not None:
+            conditions.append(ds.field('side').isin(list(sides)))
+        if types is not None:
+            conditions.append(ds.field('type').isin(list(types)))
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        if columns is not None:
+            columns = list(dict.fromkeys(list(columns) + list(PARTITION_COLUMNS)))
+
+        result = dataset.to_table(columns=columns, filter=expression)
+        # Integer columns stay nullable integers, as in the CSV loader
+        return result.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+
+    def snapshot(self, year: int, side: str, tables: Iterable[str] = ('lines', 'stops', 'line_stops')) -> Dict[str, pd.DataFrame]:
+        """
+        Tables of one snapshot, shaped like processed_schema.load_snapshot.
+
+        The year and side partition columns are dropped again, except for the
+        lines table, whose own 'year' column they replace.
+        """
+        data = {}
+        for table in tables:
+            df = self.read(table, years=[year], sides=[side])
+            if df.empty:
+                continue
+            drop = ['side'] if table == 'lines' else list(PARTITION_COLUMNS)
+            data[table] = df.drop(columns=drop)
+        return data
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="Parquet store of the processed snapshots")
+    parser.add_argument("command", choices=["sync", "status"], help="Mirror data/processed or list stored snapshots")
+    parser.add_argument("year_sides", nargs="*", help="Snapshots to sync (default: all)")
+    parser.add_argument("--data-dir", type=str, default=str(DEFAULT_DATA_DIR), help="Base data directory path")
+    parser.add_argument("--force", action="store_true", help="Rewrite snapshots even if unchanged")
+
+    args = parser.parse_args()
+    store = SnapshotStore(args.data_dir)
+
+    if args.command == "sync":
+        for name, status in store.sync(args.year_sides or None, force=args.force).items():
+            print(f"{name}: {status}")
+    else:
+        for name in store.year_sides():
+            print(name)
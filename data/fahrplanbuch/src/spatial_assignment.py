@@ -0,0 +1,158 @@
+"""
+Spatial assignment of stops to Ortsteil, Bezirk and postal code.
+
+Polygons are loaded once, projected to Berlin's metric CRS and indexed with
+an STRtree over prepared geometries. Each batch of coordinates is answered
+with one tree query per layer, and results are cached by coordinate so that
+enriching every snapshot reuses one warm index.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import shapely
+from shapely.strtree import STRtree
+
+try:
+    from coordinates import coordinate_columns, parse_coordinates
+except ImportError:  # imported as src.spatial_assignment from the notebooks
+    from .coordinates import coordinate_columns, parse_coordinates
+
+logger = logging.getLogger(__name__)
+
+# ETRS89 / UTM zone 33N, the official CRS of Berlin's geodata
+METRIC_CRS = "EPSG:25833"
+
+# Source file and column mapping of each layer under data-external/
+DEFAULT_LAYERS = {
+    'admin': ('lor_ortsteile.geojson', {'OTEIL': 'neighbourhood', 'BEZIRK': 'district'}),
+    'plz': ('berlin_postal_codes.geojson', {'plz': 'postal_code'}),
+}
+
+_assigners: Dict[str, "SpatialAssigner"] = {}
+
+
+def parse_locations(locations: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse 'lat,lon' location strings into coordinate arrays.
+
+    Args:
+        locations: Series of location strings
+
+    Returns:
+        Tuple of (latitudes, longitudes), NaN where the location is missing or invalid
+    """
+    coords = parse_coordinates(locations)
+    return coords['latitude'].to_numpy(), coords['longitude'].to_numpy()
+
+
+class _Layer:
+    """One polygon layer: projected geometries, their tree and the attribute values."""
+
+    def __init__(self, gdf: gpd.GeoDataFrame, columns: Dict[str, str]):
+        if gdf.crs is None:
+            gdf = gdf.set_crs("EPSG:4326")
+        gdf = gdf.to_crs(METRIC_CRS)
+        self.geometries = np.asarray(gdf.geometry.values, dtype=object)
+        shapely.prepare(self.geometries)
+        self.tree = STRtree(self.geometries)
+        self.columns = {source: target for source, target in columns.items() if source in gdf.columns}
+        self.values = {target: gdf[source].to_numpy(dtype=object) for source, target in self.columns.items()}
+
+    def query(self, points: np.ndarray) -> Dict[str, np.ndarray]:
+        """Attribute values of the first polygon containing each point (None if none)"""
+        point_idx, polygon_idx = self.tree.query(points, predicate='within')
+        # Keep the first polygon per point, as in ordered GeoDataFrame joins
+        order = np.lexsort((polygon_idx, point_idx))
+        point_idx, polygon_idx = point_idx[order], polygon_idx[order]
+        first_points, first = np.unique(point_idx, return_index=True)
+
+        results = {}
+        for target, values in self.values.items():
+            column = np.full(len(points), None, dtype=object)
+            column[first_points] = values[polygon_idx[first]]
+            results[target] = column
+        return results
+
+
+class SpatialAssigner:
+    """
+    Point-in-polygon lookup of several layers at once.
+
+    Args:
+        layers: Dict mapping layer name to (GeoDataFrame, {source column: output column})
+    """
+
+    def __init__(self, layers: Dict[str, Tuple[gpd.GeoDataFrame, Dict[str, str]]]):
+        self.layers = {name: _Layer(gdf, columns) for name, (gdf, columns) in layers.items()}
+        self.output_columns = [target for layer in self.layers.values() for target in layer.columns.values()]
+        self._cache: Dict[Tuple[float, float], tuple] = {}
+
+    @classmethod
+    def from_directory(cls, geo_data_dir: Union[str, Path], layers: Optional[Dict] = None) -> "SpatialAssigner":
+        """Load the layers' GeoJSON files from a data-external directory; missing files are skipped"""
+        geo_data_dir = Path(geo_data_dir)
+        loaded = {}
+        for name, (file_name, columns) in (layers or DEFAULT_LAYERS).items():
+            path = geo_data_dir / file_name
+            if not path.exists():
+                logger.warning(f"Layer '{name}' not found at {path}, skipping")
+                continue
+            loaded[name] = (gpd.read_file(path), columns)
+            logger.info(f"Loaded layer '{name}' with {len(loaded[name][0])} polygons")
+        return cls(loaded)
+
+    def assign(self, lats: np.ndarray, lons: np.ndarray) -> pd.DataFrame:
+        """
+        Assign coordinates to every layer.
+
+        Args:
+            lats: Latitudes (WGS84)
+            lons: Longitudes (WGS84)
+
+        Returns:
+            DataFrame with one column per output attribute, None where unassigned
+        """
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        valid = ~(np.isnan(lats) | np.isnan(lons))
+        keys = list(zip(lats[valid].tolist(), lons[valid].tolist()))
+
+        missing = list(dict.fromkeys(key for key in keys if key not in self._cache))
+        if missing:
+            missing_lats, missing_lons = map(np.array, zip(*missing))
+            points = gpd.GeoSeries(gpd.points_from_xy(missing_lons, missing_lats), crs="EPSG:4326") \
+                .to_crs(METRIC_CRS).values
+            points = np.asarray(points, dtype=object)
+            columns = {}
+            for layer in self.layers.values():
+                columns.update(layer.query(points))
+            rows = zip(*(columns[target] for target in self.output_columns)) if columns else ((),) * len(missing)
+            self._cache.update(zip(missing, rows))
+
+        result = pd.DataFrame(None, index=range(len(lats)), columns=self.output_columns, dtype=object)
+        if keys and self.output_columns:
+            result.loc[valid, self.output_columns] = [list(self._cache[key]) for key in keys]
+        return result
+
+    def assign_stops(self, stops_df: pd.DataFrame) -> pd.DataFrame:
+        """Assign stops by their coordinates; the result shares the stops' index"""
+        coords = coordinate_columns(stops_df)
+        result = self.assign(coords['latitude'].to_numpy(), coords['longitude'].to_numpy())
+        result.index = stops_df.index
+        return result
+
+    def clear_cache(self):
+        self._cache.clear()
+
+
+def get_assigner(geo_data_dir: Union[str, Path]) -> SpatialAssigner:
+    """Shared assigner for a data-external directory, built on first use"""
+    key = str(Path(geo_data_dir).resolve())
+    if key not in _assigners:
+        _assigners[key] = SpatialAssigner.from_directory(geo_data_dir)
+    return _assigners[key]
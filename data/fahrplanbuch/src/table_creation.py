@@ -8,36 +8,58 @@ from pathlib import Path
 import logging
 from typing import Dict, Tuple, Optional, List, Union
 
+try:
+    from processed_schema import save_snapshot
+except ImportError:  # imported as src.table_creation from the notebooks
+    from .processed_schema import save_snapshot
+
 logger = logging.getLogger(__name__)
 
 
 # ---- Line-Stop Relationship Functions ----
 
-def create_line_stops_df(raw_df: pd.DataFrame) -> pd.DataFrame:
+def explode_stops(raw_df: pd.DataFrame) -> pd.DataFrame:
     """
-    Create a DataFrame representing the relationships between lines and stops.
-    
+    Split each line's ' - ' separated stop list into one row per stop.
+
+    This is the single parse of the raw line table shared by the processor
+    (stops table) and the line-stops table, so both see identical stop keys.
+
     Args:
-        base_df: Base DataFrame with stop information
-        
+        raw_df: Raw line DataFrame with 'stops', 'type' and 'line_name' columns
+
     Returns:
-        DataFrame with line-stop relationships
+        DataFrame with columns index (row of the line in raw_df), stop_name,
+        type, line_name and stop_order; type and line_name are categorical
     """
-    # Split the stops and create a DataFrame
-    line_stops = raw_df['stops'].str.split(' - ', expand=True).stack().reset_index(level=1, drop=True).reset_index(name='stop_name')
+    stops = raw_df['stops'].str.split(' - ').explode().dropna()
 
-    # Add the 'type' column from the raw_df to the line_stops DataFrame
-    line_stops = line_stops.merge(raw_df[['type', 'line_name']], left_on='index', right_index=True)
+    line_stops = pd.DataFrame({
+        'index': stops.index,
+        'stop_name': stops.str.replace(u'\xa0', ' ', regex=False).str.strip().values,
+    })
+    line_stops['type'] = pd.Categorical(raw_df['type'].astype(str).str.strip().loc[stops.index].values)
+    line_stops['line_name'] = pd.Categorical(raw_df['line_name'].astype(str).str.strip().loc[stops.index].values)
 
-    line_stops['stop_order'] = line_stops.groupby('index').cumcount()
     #index starts from 0 so it looks like 1 row is missing but this is not true
-
-    # Clean the 'Stop Name' column by removing whitespace and non-breaking spaces
-    line_stops['stop_name'] = line_stops['stop_name'].str.replace(u'\xa0', ' ').str.strip()
+    line_stops['stop_order'] = line_stops.groupby('index').cumcount()
 
     return line_stops
 
 
+def create_line_stops_df(raw_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Create a DataFrame representing the relationships between lines and stops.
+    
+    Args:
+        raw_df: Raw line DataFrame
+        
+    Returns:
+        DataFrame with line-stop relationships
+    """
+    return explode_stops(raw_df)
+
+
 def add_stop_foreign_keys(line_stops: pd.DataFrame, stops_df: pd.DataFrame, year, side) -> pd.DataFrame:
     """
     Add stop foreign keys to line-stops DataFrame.
@@ -50,21 +72,24 @@ def add_stop_foreign_keys(line_stops: pd.DataFrame, stops_df: pd.DataFrame, year
         Updated line-stops DataFrame with stop foreign keys
     """
     try:
+        key_cols = ['stop_name', 'type', 'line_name']
         result = line_stops.copy()
         
-        # Create a mapping from stop name to stop ID
-        stop_id_map = {}
-        for _, row in stops_df.iterrows():
-            stop_id_map[(str(row['stop_name']), str(row['type']), str(row['line_name']))] = str(row['stop_id'])
+        # Join on string keys; categorical and numeric columns must compare like the stops table
+        for col in key_cols:
+            result[col] = result[col].astype(str)
+        stop_keys = stops_df[key_cols + ['stop_id']].astype(str).drop_duplicates(subset=key_cols, keep='last')
+        
+        result = result.merge(stop_keys, on=key_cols, how='left', validate='many_to_one')
         
-        def get_line_id(row):
-                key = (str(row['stop_name']), str(row['type']), str(row['line_name']))
-                return stop_id_map.get(key, None)
-            
-        result['stop_id'] = result.apply(get_line_id, axis=1)
+        unmatched = result['stop_id'].isna()
+        if unmatched.any():
+            unmatched_keys = result.loc[unmatched, key_cols].drop_duplicates()
+            logger.warning(f"{unmatched.sum()} line-stops ({len(unmatched_keys)} distinct stop keys) "
+                           f"have no matching stop, e.g.:\n{unmatched_keys.head(10).to_string(index=False)}")
 
         # Add 1 to the 'index' column and convert to string with year prefix
-        result['line_id'] = result['index'].apply(lambda x: f"{year}{x + 1}_{side}")
+        result['line_id'] = f"{year}" + (result['index'].astype(int) + 1).astype(str) + f"_{side}"
         
         result = result.drop(columns=['stop_name', 'index', 'type', 'line_name'])
         
@@ -126,14 +151,14 @@ def save_data(paths: Dict[str, Path],
         side: Side of Berlin (east/west)
     """
     try:
-        # Create processed directory
         processed_dir = paths['processed_dir'] / f"{year}_{side}"
-        processed_dir.mkdir(exist_ok=True, parents=True)
         
-        # Save files
-        final_line_df.to_csv(processed_dir / "lines.csv", index=False)
-        final_stops_df.to_csv(processed_dir / "stops.csv", index=False)
-        final_line_stops_df.to_csv(processed_dir / "line_stops.csv", index=False)
+        # Save files in the processed schema (typed coordinates, schema.json)
+        save_snapshot(processed_dir, {
+            'lines': final_line_df,
+            'stops': final_stops_df,
+            'line_stops': final_line_stops_df,
+        })
         
         logger.info(f"Saved processed data to {processed_dir}")
         
@@ -10,8 +10,16 @@ import logging
 from datetime import datetime
 
 class TransportSummaryGenerator:
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, store=None):
+        """
+        Args:
+            data_dir: Directory with the enriched per-year CSVs
+            store: Optional SnapshotStore; snapshots are then read from Parquet
+        """
         self.data_dir = data_dir
+        self.store = store
+        # Long-format rows per (year, side), so summaries only load new snapshots
+        self._snapshots: Dict[tuple, Dict[str, pd.DataFrame]] = {}
         self.setup_logging()
         
     def setup_logging(self):
@@ -34,6 +42,9 @@ class TransportSummaryGenerator:
         
     def load_year_data(self, year: int, side: str) -> Dict[str, pd.DataFrame]:
         """Load all data files for a specific year and side."""
+        if self.store is not None:
+            return self._load_store_data(year, side)
+            
         files = {
             'stations': f'stops_{year}_{side}_enriched.csv',
             'lines': f'lines_{year}_{side}_enriched.csv',
@@ -51,6 +62,113 @@ class TransportSummaryGenerator:
                 data[key] = None
                 
         return data
+    
+    def _load_store_data(self, year: int, side: str) -> Dict[str, pd.DataFrame]:
+        """
+        Load a snapshot from the Parquet store, named like the enriched CSVs.
+        
+        The store has no in_lines column, so it is built from line_stops: the
+        names of all lines serving each stop, in line order.
+        """
+        snapshot = self.store.snapshot(year, side)
+        stations = snapshot.get('stops')
+        lines = snapshot.get('lines')
+        line_stops = snapshot.get('line_stops')
+        if stations is not None:
+            in_lines = pd.Series(dtype=object)
+            if lines is not None and line_stops is not None:
+                served = line_stops[['line_id', 'stop_id']].merge(
+                    lines[['line_id', 'line_name']].astype({'line_name': str}), on='line_id', how='inner')
+                in_lines = served.drop_duplicates(['stop_id', 'line_name']) \
+                    .groupby('stop_id', sort=False)['line_name'].agg(', '.join)
+            stations = stations.assign(in_lines=stations['stop_id'].map(in_lines).fillna(stations['line_name']))
+        if lines is not None:
+            lines = lines.rename(columns={'frequency (7:30)': 'Frequency'})
+        if stations is None:
+            self.logger.warning(f"No stored snapshot for {year} {side}")
+        return {
+            'stations': stations,
+            'lines': lines,
+            'connections': line_stops
+        }
+        
+    # ---- Long-format snapshot history ----
+    
+    def _snapshot_frames(self, year: int, side: str) -> Dict[str, pd.DataFrame]:
+        """Station and line rows of one snapshot, tagged with the year (loaded once)."""
+        key = (year, side)
+        if key not in self._snapshots:
+            data = self.load_year_data(year, side)
+            stations_df, lines_df = data['stations'], data['lines']
+            frames = {'stations': None, 'lines': None}
+            if stations_df is not None:
+                frames['stations'] = stations_df.assign(year=year)
+                if lines_df is not None:
+                    # Stored snapshots have exact line_stops; the CSVs only in_lines names
+                    if self.store is not None and data['connections'] is not None:
+                        stations = self._stations_from_line_stops(lines_df, data['connections'])
+                    else:
+                        stations = self._stations_per_line(lines_df, stations_df)
+                    frames['lines'] = lines_df.assign(year=year, stations=stations.to_numpy())
+            self._snapshots[key] = frames
+        return self._snapshots[key]
+    
+    def add_snapshot(self, year: int, side: str):
+        """
+        (Re)load a single snapshot.
+        
+        Other snapshots stay cached, so the next summary only reads this one
+        instead of rebuilding the history from every file.
+        """
+        self._snapshots.pop((year, side), None)
+        self._snapshot_frames(year, side)
+        
+    @staticmethod
+    def _stations_per_line(lines_df: pd.DataFrame, stations_df: pd.DataFrame) -> pd.Series:
+        """Stop IDs whose in_lines contains each line's name, in station order."""
+        names = lines_df['line_name'].astype(str)
+        in_lines = stations_df['in_lines'].dropna().astype(str)
+        
+        # Substring test once per distinct (line name, in_lines value) pair
+        pairs = pd.MultiIndex.from_product(
+            [names.unique(), in_lines.unique()], names=['line_name', 'in_lines']
+        ).to_frame(index=False)
+        pairs = pairs[[name in value for name, value in zip(pairs['line_name'], pairs['in_lines'])]]
+        
+        matches = pd.DataFrame({'stop_id': stations_df.loc[in_lines.index, 'stop_id'], 'in_lines': in_lines})
+        matches = matches.merge(pairs, on='in_lines', how='inner')
+        stops_by_line = matches.groupby('line_name', sort=False)['stop_id'].agg(list)
+        
+        return names.map(stops_by_line).apply(lambda stops: stops if isinstance(stops, list) else [])
+        
+    @staticmethod
+    def _stations_from_line_stops(lines_df: pd.DataFrame, line_stops_df: pd.DataFrame) -> pd.Series:
+        """Stop IDs of each line from line_stops, in stop order."""
+        ordered = line_stops_df.sort_values(['line_id', 'stop_order'], kind='stable') \
+            .drop_duplicates(['line_id', 'stop_id'])
+        stops_by_line = ordered.groupby('line_id', sort=False)['stop_id'].agg(list)
+        
+        return lines_df['line_id'].map(stops_by_line).apply(lambda stops: stops if isinstance(stops, list) else [])
+        
+    def _history(self, kind: str, years: List[int], sides: List[str]) -> pd.DataFrame:
+        """Concatenated long-format rows of all requested snapshots."""
+        frames = [self._snapshot_frames(year, side)[kind] for year in years for side in sides]
+        frames = [frame for frame in frames if frame is not None]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+        
+    @staticmethod
+    def _changes(per_year: pd.DataFrame, id_col: str, values: pd.Series) -> pd.Series:
+        """Mask of rows whose value differs from the same id's previous year."""
+        has_previous = per_year.groupby(id_col, sort=False).cumcount() > 0
+        previous = values.groupby(per_year[id_col], sort=False).shift()
+        return has_previous & values.ne(previous)
+        
+    @staticmethod
+    def _years_where(per_year: pd.DataFrame, id_col: str, mask: pd.Series, ids: pd.Index) -> pd.Series:
+        years = per_year.loc[mask].groupby(id_col, sort=False)['year'].agg(list).reindex(ids)
+        return years.apply(lambda y: y if isinstance(y, list) else [])
         
     def generate_station_summary(self, years: List[int], sides: List[str]) -> pd.DataFrame:
         """
@@ -73,79 +191,51 @@ class TransportSummaryGenerator:
         - location_changes: List of years where location changed
         - name_changes: List of years where name changed
         """
-        all_stations = []
-        station_history = {}
-        
-        # First pass: collect all station data
-        for year in years:
-            for side in sides:
-                data = self.load_year_data(year, side)
-                if data['stations'] is not None:
-                    stations_df = data['stations']
-                    
-                    for _, station in stations_df.iterrows():
-                        station_id = station['stop_id']
-                        if station_id not in station_history:
-                            station_history[station_id] = {
-                                'years': set(),
-                                'locations': {},
-                                'names': {},
-                                'lines': {},
-                                'latest_data': None
-                            }
-                        
-                        history = station_history[station_id]
-                        history['years'].add(year)
-                        history['locations'][year] = station['location']
-                        history['names'][year] = station['stop_name']
-                        history['lines'][year] = station['in_lines']
-                        history['latest_data'] = station
-                        
-        # Second pass: create summary records
-        for station_id, history in station_history.items():
-            latest = history['latest_data']
-            
-            # Check for location and name changes
-            location_changes = []
-            name_changes = []
-            prev_loc = None
-            prev_name = None
-            
-            for year in sorted(history['years']):
-                curr_loc = history['locations'][year]
-                curr_name = history['names'][year]
-                
-                if prev_loc is not None and curr_loc != prev_loc:
-                    location_changes.append(year)
-                if prev_name is not None and curr_name != prev_name:
-                    name_changes.append(year)
-                    
-                prev_loc = curr_loc
-                prev_name = curr_name
-                
-            summary = {
-                'stop_id': station_id,
-                'name': latest['stop_name'],
-                'type': latest['type'],
-                'location': latest['location'],
-                'postal_code': latest.get('postal_code', None),
-                'district': latest.get('district', None),
-                'neighborhood': latest.get('neighborhood', None),
-                'east_west': latest.get('east_west', None),
-                'years_active': sorted(list(history['years'])),
-                'lines_by_year': history['lines'],
-                'first_appearance': min(history['years']),
-                'last_appearance': max(history['years']),
-                'consistent_location': len(location_changes) == 0,
-                'location_changes': location_changes,
-                'name_changes': name_changes,
-                'total_years_active': len(history['years'])
-            }
+        history = self._history('stations', years, sides)
+        if history.empty:
+            self.logger.info("Generated summary for 0 stations")
+            return pd.DataFrame()
             
-            all_stations.append(summary)
+        # Station order of first appearance; the last row seen holds the latest data
+        station_ids = pd.Index(history['stop_id'].unique())
+        latest = history.drop_duplicates('stop_id', keep='last').set_index('stop_id').reindex(station_ids)
+        
+        # One row per station and year (a later row of the same year wins)
+        per_year = history.drop_duplicates(['stop_id', 'year'], keep='last') \
+            .sort_values(['stop_id', 'year'], kind='stable')
+        location_changes = self._years_where(
+            per_year, 'stop_id', self._changes(per_year, 'stop_id', per_year['location']), station_ids)
+        name_changes = self._years_where(
+            per_year, 'stop_id', self._changes(per_year, 'stop_id', per_year['stop_name']), station_ids)
+        
+        by_station = per_year.groupby('stop_id', sort=False).agg(
+            years_active=('year', list), lines=('in_lines', list),
+            first_appearance=('year', 'min'), last_appearance=('year', 'max')
+        ).reindex(station_ids)
+        
+        def optional(column):
+            return latest[column].to_numpy() if column in latest.columns else None
             
-        # Create DataFrame and sort by first appearance
-        summary_df = pd.DataFrame(all_stations)
+        summary_df = pd.DataFrame({
+            'stop_id': station_ids,
+            'name': latest['stop_name'].to_numpy(),
+            'type': latest['type'].to_numpy(),
+            'location': latest['location'].to_numpy(),
+            'postal_code': optional('postal_code'),
+            'district': optional('district'),
+            'neighborhood': optional('neighborhood'),
+            'east_west': optional('east_west'),
+            'years_active': by_station['years_active'].to_numpy(),
+            'lines_by_year': [dict(zip(y, l)) for y, l in zip(by_station['years_active'], by_station['lines'])],
+            'first_appearance': by_station['first_appearance'].to_numpy(),
+            'last_appearance': by_station['last_appearance'].to_numpy(),
+            'consistent_location': (location_changes.str.len() == 0).to_numpy(),
+            'location_changes': location_changes.to_numpy(),
+            'name_changes': name_changes.to_numpy(),
+            'total_years_active': by_station['years_active'].str.len().to_numpy()
+        })
+        
+        # Sort by first appearance
         summary_df.sort_values('first_appearance', inplace=True)
         
         self.logger.info(f"Generated summary for {len(summary_df)} stations")
@@ -169,83 +259,56 @@ class TransportSummaryGenerator:
         - route_changes: List of years where route changed
         - capacity_changes: List of years where capacity changed
         """
-        all_lines = []
-        line_history = {}
-        
-        # First pass: collect all line data
-        for year in years:
-            for side in sides:
-                data = self.load_year_data(year, side)
-                if data['lines'] is not None and data['stations'] is not None:
-                    lines_df = data['lines']
-                    stations_df = data['stations']
-                    
-                    for _, line in lines_df.iterrows():
-                        line_id = line['line_id']
-                        if line_id not in line_history:
-                            line_history[line_id] = {
-                                'years': set(),
-                                'stations': {},
-                                'frequencies': {},
-                                'capacities': {},
-                                'latest_data': None
-                            }
-                        
-                        history = line_history[line_id]
-                        history['years'].add(year)
-                        
-                        # Get stations for this line
-                        line_stations = stations_df[
-                            stations_df['in_lines'].str.contains(str(line['line_name']), na=False)
-                        ]['stop_id'].tolist()
-                        
-                        history['stations'][year] = line_stations
-                        history['frequencies'][year] = line['Frequency']
-                        history['capacities'][year] = line.get('capacity', None)
-                        history['latest_data'] = line
-                        
-        # Second pass: create summary records
-        for line_id, history in line_history.items():
-            latest = history['latest_data']
-            
-            # Check for route changes
-            route_changes = []
-            capacity_changes = []
-            prev_stations = None
-            prev_capacity = None
-            
-            for year in sorted(history['years']):
-                curr_stations = set(history['stations'][year])
-                curr_capacity = history['capacities'][year]
-                
-                if prev_stations is not None and curr_stations != prev_stations:
-                    route_changes.append(year)
-                if prev_capacity is not None and curr_capacity != prev_capacity:
-                    capacity_changes.append(year)
-                    
-                prev_stations = curr_stations
-                prev_capacity = curr_capacity
-                
-            summary = {
-                'line_id': line_id,
-                'name': latest['line_name'],
-                'type': latest['type'],
-                'east_west': latest.get('east_west', None),
-                'years_active': sorted(list(history['years'])),
-                'stations_by_year': history['stations'],
-                'first_appearance': min(history['years']),
-                'last_appearance': max(history['years']),
-                'avg_frequency': np.mean(list(history['frequencies'].values())),
-                'avg_capacity': np.mean([c for c in history['capacities'].values() if c is not None]),
-                'route_changes': route_changes,
-                'capacity_changes': capacity_changes,
-                'total_years_active': len(history['years'])
-            }
+        history = self._history('lines', years, sides)
+        if history.empty:
+            self.logger.info("Generated summary for 0 lines")
+            return pd.DataFrame()
             
-            all_lines.append(summary)
+        line_ids = pd.Index(history['line_id'].unique())
+        latest = history.drop_duplicates('line_id', keep='last').set_index('line_id').reindex(line_ids)
+        
+        per_year = history.drop_duplicates(['line_id', 'year'], keep='last') \
+            .sort_values(['line_id', 'year'], kind='stable')
+        frequency = pd.to_numeric(per_year['Frequency'], errors='coerce').astype(float)
+        has_capacity = 'capacity' in per_year.columns
+        capacity = pd.to_numeric(per_year['capacity'], errors='coerce').astype(float) if has_capacity \
+            else pd.Series(np.nan, index=per_year.index)
+        
+        route_changes = self._years_where(
+            per_year, 'line_id', self._changes(per_year, 'line_id', per_year['stations'].map(frozenset)), line_ids)
+        capacity_changed = self._changes(per_year, 'line_id', capacity) if has_capacity \
+            else pd.Series(False, index=per_year.index)
+        capacity_changes = self._years_where(per_year, 'line_id', capacity_changed, line_ids)
+        
+        def mean_with_nan(values):
+            # Like np.mean over the yearly values: any missing value makes the mean NaN
+            grouped = values.groupby(per_year['line_id'], sort=False)
+            means = grouped.mean()
+            means[grouped.count() < grouped.size()] = np.nan
+            return means.reindex(line_ids).to_numpy()
             
-        # Create DataFrame and sort by first appearance
-        summary_df = pd.DataFrame(all_lines)
+        by_line = per_year.groupby('line_id', sort=False).agg(
+            years_active=('year', list), stations=('stations', list),
+            first_appearance=('year', 'min'), last_appearance=('year', 'max')
+        ).reindex(line_ids)
+        
+        summary_df = pd.DataFrame({
+            'line_id': line_ids,
+            'name': latest['line_name'].to_numpy(),
+            'type': latest['type'].to_numpy(),
+            'east_west': latest['east_west'].to_numpy() if 'east_west' in latest.columns else None,
+            'years_active': by_line['years_active'].to_numpy(),
+            'stations_by_year': [dict(zip(y, s)) for y, s in zip(by_line['years_active'], by_line['stations'])],
+            'first_appearance': by_line['first_appearance'].to_numpy(),
+            'last_appearance': by_line['last_appearance'].to_numpy(),
+            'avg_frequency': mean_with_nan(frequency),
+            'avg_capacity': mean_with_nan(capacity),
+            'route_changes': route_changes.to_numpy(),
+            'capacity_changes': capacity_changes.to_numpy(),
+            'total_years_active': by_line['years_active'].str.len().to_numpy()
+        })
+        
+        # Sort by first appearance
         summary_df.sort_values('first_appearance', inplace=True)
         
         self.logger.info(f"Generated summary for {len(summary_df)} lines")
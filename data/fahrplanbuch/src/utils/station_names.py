@@ -1,5 +1,10 @@
 import re
 
+try:
+    from name_normalisation import get_normaliser
+except ImportError:  # imported as src.utils.station_names from the notebooks
+    from ..name_normalisation import get_normaliser
+
 class StationNameCleaner:
     """Standardizes station names according to Berlin transport conventions."""
     
@@ -47,4 +52,20 @@ class StationNameCleaner:
         for direction, abbr in cls.DIRECTION_MAP.items():
             name = name.replace(f" {direction} ", f" {abbr} ")
             
-        return name.strip()
\ No newline at end of file
+        return name.strip()
+
+    @classmethod
+    def canonical_key(cls, name: str) -> str:
+        """
+        Matching key of a station name, shared with the station matchers.
+        
+        Computed from the raw name rather than from standardize_name, whose
+        direction abbreviations (Süd -> S) would clash with S-Bahn prefixes.
+        
+        Args:
+            name: Raw station name
+            
+        Returns:
+            Canonical key (see name_normalisation)
+        """
+        return get_normaliser().key(name)
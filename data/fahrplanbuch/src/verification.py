@@ -10,13 +10,20 @@ from typing import Dict, List, Tuple
 import numpy as np
 from scipy.spatial.distance import euclidean
 
+try:
+    from coordinates import coordinate_columns
+    from processed_schema import load_snapshot, save_table
+except ImportError:  # imported as src.verification from the notebooks
+    from .coordinates import coordinate_columns
+    from .processed_schema import load_snapshot, save_table
+
 
 logger = logging.getLogger(__name__)
 
 # Define valid transport types
 VALID_TRANSPORT_TYPES = {'autobus', 'omnibus', 'tram', 'u-bahn', 's-bahn', 'ferry'}
 
-def load_processed_data(base_dir: Path, year: int, side: str) -> Dict[str, pd.DataFrame]:
+def load_processed_data(base_dir: Path, year: int, side: str, store=None) -> Dict[str, pd.DataFrame]:
     """
     Load processed data files for verification.
     
@@ -24,11 +31,18 @@ def load_processed_data(base_dir: Path, year: int, side: str) -> Dict[str, pd.Da
         base_dir: Base data directory
         year: Year of data
         side: Side of Berlin (east/west)
+        store: Optional SnapshotStore to read from instead of the CSVs
         
     Returns:
         Dictionary containing loaded DataFrames
     """
     try:
+        if store is not None:
+            data = store.snapshot(year, side)
+            if all(table in data for table in ('lines', 'stops', 'line_stops')):
+                return data
+            logger.warning(f"{year}_{side} not in the snapshot store, reading the CSVs")
+        
         processed_dir = base_dir / 'processed' / f"{year}_{side}"
         
         if not processed_dir.exists():
@@ -46,10 +60,9 @@ def load_processed_data(base_dir: Path, year: int, side: str) -> Dict[str, pd.Da
             logger.error(f"Missing files in {processed_dir}: {', '.join(missing)}")
             return {}
             
-        # Load data
-        lines_df = pd.read_csv(lines_path)
-        stops_df = pd.read_csv(stops_path)
-        line_stops_df = pd.read_csv(line_stops_path)
+        # Load data with the processed schema's dtypes
+        data = load_snapshot(processed_dir)
+        lines_df, stops_df, line_stops_df = data['lines'], data['stops'], data['line_stops']
         
         logger.info(f"Loaded processed data: {len(lines_df)} lines, {len(stops_df)} stops, "
                    f"{len(line_stops_df)} line-stop relationships")
@@ -69,7 +82,7 @@ def calculate_station_distances(stops_df: pd.DataFrame, line_stops_df: pd.DataFr
     Calculate Euclidean distances between connected stations.
     
     Args:
-        stops_df: DataFrame with stop information including location
+        stops_df: DataFrame with stop information including latitude/longitude
         line_stops_df: DataFrame with line-stop relationships
         
     Returns:
@@ -78,66 +91,29 @@ def calculate_station_distances(stops_df: pd.DataFrame, line_stops_df: pd.DataFr
     try:
         # Create a copy to avoid modifying the original
         line_stops_with_dist = line_stops_df.copy()
-        
-        # Create a function to extract lat/lon from location string
-        def extract_coords(loc_str):
-            if pd.isna(loc_str) or loc_str == '':
-                return None
-            try:
-                lat, lon = map(float, loc_str.split(','))
-                return (lat, lon)
-            except (ValueError, TypeError):
-                return None
-        
-        # Create a mapping of stop_id to coordinates
-        stop_coords = {}
-        for _, row in stops_df.iterrows():
-            if pd.notna(row['location']) and row['location'] != '':
-                coords = extract_coords(row['location'])
-                if coords:
-                    stop_coords[row['stop_id']] = coords
-        
-        # Group line_stops by line_id to get pairs of connected stops
-        line_stops_grouped = line_stops_with_dist.sort_values(['line_id', 'stop_order']).groupby('line_id')
-        
-        # Initialize distance column
-        line_stops_with_dist['distance_meters'] = np.nan
-        
-        # Calculate distances
-        for line_id, group in line_stops_grouped:
-            # Get the ordered stops for this line
-            ordered_stops = group.sort_values('stop_order')
-            
-            if len(ordered_stops) < 2:
-                continue
-                
-            # Calculate distance between consecutive stops
-            for i in range(len(ordered_stops) - 1):
-                current_stop_id = ordered_stops.iloc[i]['stop_id']
-                next_stop_id = ordered_stops.iloc[i + 1]['stop_id']
-                
-                # Skip if we don't have coordinates for either stop
-                if current_stop_id not in stop_coords or next_stop_id not in stop_coords:
-                    continue
-                
-                # Get coordinates
-                current_coords = stop_coords[current_stop_id]
-                next_coords = stop_coords[next_stop_id]
-                
-                # Calculate rough distance in meters (approximation)
-                # 1 degree of latitude ~ 111km
-                # 1 degree of longitude ~ 111km * cos(latitude)
-                lat1, lon1 = current_coords
-                lat2, lon2 = next_coords
-                
-                # Simple Euclidean distance scaled to approximate meters
-                dx = (lon2 - lon1) * 111000 * np.cos(np.radians((lat1 + lat2) / 2))
-                dy = (lat2 - lat1) * 111000
-                distance = np.sqrt(dx**2 + dy**2)
-                
-                # Update the distance for the current stop
-                idx = ordered_stops.iloc[i].name
-                line_stops_with_dist.loc[idx, 'distance_meters'] = distance
+
+        # Coordinates per stop_id from the typed latitude/longitude columns
+        coords = coordinate_columns(stops_df)
+        coords['stop_id'] = stops_df['stop_id']
+        stop_coords = coords.dropna().drop_duplicates('stop_id', keep='last').set_index('stop_id')
+
+        # Order each line's stops and pair every stop with the next one
+        ordered = line_stops_with_dist.sort_values(['line_id', 'stop_order'])
+        lat1 = ordered['stop_id'].map(stop_coords['latitude'])
+        lon1 = ordered['stop_id'].map(stop_coords['longitude'])
+        next_stops = ordered.groupby('line_id')['stop_id'].shift(-1)
+        lat2 = next_stops.map(stop_coords['latitude'])
+        lon2 = next_stops.map(stop_coords['longitude'])
+
+        # Calculate rough distance in meters (approximation)
+        # 1 degree of latitude ~ 111km
+        # 1 degree of longitude ~ 111km * cos(latitude)
+        dx = (lon2 - lon1) * 111000 * np.cos(np.radians((lat1 + lat2) / 2))
+        dy = (lat2 - lat1) * 111000
+
+        # The distance to the next stop is stored on the current stop; the last
+        # stop of a line and stops without coordinates stay NaN
+        line_stops_with_dist['distance_meters'] = np.sqrt(dx**2 + dy**2).astype(float)
         
         return line_stops_with_dist
         
@@ -180,9 +156,7 @@ def verify_station_distances(stops_df: pd.DataFrame, line_stops_df: pd.DataFrame
             line_stops_with_dist = line_stops_df.copy()
         
         # Get transport type for each line
-        line_types = {}
-        for _, row in stops_df.iterrows():
-            line_types[row['line_name']] = row['type'].lower() if pd.notna(row['type']) else None
+        line_types = dict(zip(stops_df['line_name'], stops_df['type'].str.lower()))
         
         # Filter out rows without distance (e.g., terminal stations)
         valid_distances = line_stops_with_dist[line_stops_with_dist['distance_meters'].notna()].copy()
@@ -397,12 +371,15 @@ def verify_geographic_data(stops_df: pd.DataFrame) -> Tuple[bool, pd.DataFrame]:
     Returns:
         Tuple of (is_valid, missing_geo)
     """
-    if 'location' not in stops_df.columns:
+    if 'location' not in stops_df.columns and 'latitude' not in stops_df.columns:
         logger.error("Missing 'location' column in stops DataFrame")
         return False, pd.DataFrame()
         
-    # Find stops with missing location
-    missing_geo = stops_df[stops_df['location'].isna() | (stops_df['location'] == '')].copy()
+    # Find stops without usable coordinates
+    if 'location' not in stops_df.columns:
+        stops_df = stops_df.assign(location=None)
+    coords = coordinate_columns(stops_df)
+    missing_geo = stops_df[coords['latitude'].isna() | coords['longitude'].isna()].copy()
     
     is_valid = len(missing_geo) == 0
     
@@ -500,7 +477,7 @@ def run_verification(base_dir: Path, year: int, side: str) -> Dict[str, Dict[str
     processed_dir = base_dir / 'processed' / f"{year}_{side}"
     if processed_dir.exists():
         try:
-            line_stops_with_dist.to_csv(processed_dir / "line_stops_with_dist.csv", index=False)
+            save_table(processed_dir, 'line_stops_with_dist', line_stops_with_dist)
             logger.info(f"Saved line_stops with distances to {processed_dir / 'line_stops_with_dist.csv'}")
         except Exception as e:
             logger.error(f"Error saving line_stops with distances: {e}")
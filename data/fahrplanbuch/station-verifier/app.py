@@ -1,5 +1,5 @@
 # app.py - Refactored main application file
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 import json
 import os
 from pathlib import Path
@@ -11,6 +11,8 @@ from data_handlers import DataHandler
 from station_manager import StationManager
 from validation_service import ValidationService
 from tile_service import TileService
+from spatial_index import StationIndexRegistry
+from driver_registry import pool_metrics
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +31,8 @@ def create_app():
         DATA_DIR=Path("data"),
         CORRECTIONS_DIR=Path("corrections"),
         TILES_DIR=Path("tiles"),
+        TILE_FORMAT=os.environ.get("TILE_FORMAT", "mbtiles"),  # "mbtiles" or "directory"
+        JOB_WORKERS=int(os.environ.get("JOB_WORKERS", "1")),  # 0 = run job_queue.py separately
         DB_URI=os.environ.get("NEO4J_URI", "bolt://100.82.176.18:7687"),
         DB_USERNAME=os.environ.get("NEO4J_USERNAME", "neo4j"),
         DB_PASSWORD=os.environ.get("NEO4J_PASSWORD", "BerlinTransport2024")
@@ -40,8 +44,11 @@ def create_app():
     
     # Initialize services
     data_handler = DataHandler(app.config)
-    station_manager = StationManager(app.config)
-    validation_service = ValidationService(app.config)
+    station_index = StationIndexRegistry(
+        data_handler.db, app.config['CORRECTIONS_DIR'] / "station_corrections.json"
+    )
+    station_manager = StationManager(app.config, station_index)
+    validation_service = ValidationService(app.config, station_index)
     tile_service = TileService(app.config)
     
     # Register routes
@@ -68,6 +75,15 @@ def register_main_routes(app, data_handler):
             logger.error(f"Error loading main page: {e}")
             return render_template('error.html', error=str(e)), 500
 
+    @app.route('/db_pool_metrics')
+    def db_pool_metrics():
+        """Connection pool metrics of the shared Neo4j drivers"""
+        try:
+            return jsonify(pool_metrics())
+        except Exception as e:
+            logger.error(f"Error getting pool metrics: {e}")
+            return jsonify({"error": str(e)}), 500
+
 # =============================================================================
 # DATA ROUTES
 # =============================================================================
@@ -125,6 +141,25 @@ def register_data_routes(app, data_handler):
             logger.error(f"Error exporting corrections: {e}")
             return jsonify({"status": "error", "message": str(e)}), 500
 
+    @app.route('/export/stations')
+    @app.route('/export/<year_side>/<table>')
+    def stream_export(table="stations", year_side="all"):
+        """Stream a table as NDJSON (default) or Arrow IPC (?format=arrow)"""
+        try:
+            result = data_handler.stream_export(
+                table,
+                None if year_side == "all" else year_side,
+                request.args.get('format', 'ndjson')
+            )
+            if isinstance(result, dict):
+                return jsonify(result), 400
+            
+            chunks, mimetype = result
+            return Response(stream_with_context(chunks), mimetype=mimetype)
+        except Exception as e:
+            logger.error(f"Error exporting {table} for {year_side}: {e}")
+            return jsonify({"error": str(e)}), 500
+
 # =============================================================================
 # STATION MANAGEMENT ROUTES
 # =============================================================================
@@ -293,6 +328,27 @@ def register_validation_routes(app, validation_service):
             logger.error(f"Error validating position: {e}")
             return jsonify({"status": "error", "message": "Internal server error"}), 500
 
+    @app.route('/nearest_stations', methods=['POST'])
+    def nearest_stations():
+        """Find the stations nearest to a position"""
+        try:
+            data = request.json
+            if not data:
+                return jsonify({"status": "error", "message": "No data provided"}), 400
+            
+            result = validation_service.find_nearest_stations(
+                data.get('year_side'),
+                data.get('latitude'),
+                data.get('longitude'),
+                data.get('k', 5),
+                data.get('line_id')
+            )
+            return jsonify(result)
+            
+        except Exception as e:
+            logger.error(f"Error finding nearest stations: {e}")
+            return jsonify({"status": "error", "message": "Internal server error"}), 500
+
 # =============================================================================
 # TILE SERVICE ROUTES
 # =============================================================================
@@ -326,11 +382,11 @@ def register_tile_routes(app, tile_service):
 
     @app.route('/process_tif/<filename>', methods=['POST'])
     def process_single_tif(filename):
-        """Process a single TIF file"""
+        """Queue a single TIF file for background processing"""
         try:
             result = tile_service.process_single_tif(filename)
-            if result["status"] == "success":
-                return jsonify(result)
+            if result["status"] == "queued":
+                return jsonify(result), 202
             else:
                 return jsonify(result), 400
         except Exception as e:
@@ -339,14 +395,61 @@ def register_tile_routes(app, tile_service):
 
     @app.route('/process_all_tifs', methods=['POST'])
     def process_all_tifs():
-        """Process all TIF files in the tif directory"""
+        """Queue all TIF files in the tif directory for background processing"""
         try:
             result = tile_service.process_all_tifs()
+            if result["status"] == "queued":
+                return jsonify(result), 202
             return jsonify(result)
         except Exception as e:
             logger.error(f"Error processing all TIFs: {e}")
             return jsonify({"status": "error", "message": "Internal server error"}), 500
 
+    @app.route('/jobs')
+    def list_jobs():
+        """List recent tile generation jobs, optionally filtered by status"""
+        try:
+            return jsonify(tile_service.list_jobs(request.args.get('status')))
+        except Exception as e:
+            logger.error(f"Error listing jobs: {e}")
+            return jsonify({"status": "error", "message": "Internal server error"}), 500
+
+    @app.route('/jobs/<job_id>')
+    def get_job(job_id):
+        """Get status and tiles done/total per zoom level for a job"""
+        try:
+            result = tile_service.get_job(job_id)
+            if result["status"] == "error":
+                return jsonify(result), 404
+            return jsonify(result)
+        except Exception as e:
+            logger.error(f"Error getting job {job_id}: {e}")
+            return jsonify({"status": "error", "message": "Internal server error"}), 500
+
+    @app.route('/jobs/<job_id>/cancel', methods=['POST'])
+    def cancel_job(job_id):
+        """Cancel a queued or running job"""
+        try:
+            result = tile_service.cancel_job(job_id)
+            if result["status"] == "error":
+                return jsonify(result), 404
+            return jsonify(result)
+        except Exception as e:
+            logger.error(f"Error cancelling job {job_id}: {e}")
+            return jsonify({"status": "error", "message": "Internal server error"}), 500
+
+    @app.route('/jobs/<job_id>/resume', methods=['POST'])
+    def resume_job(job_id):
+        """Resume a cancelled or failed job from the tiles already written"""
+        try:
+            result = tile_service.resume_job(job_id)
+            if result["status"] == "error":
+                return jsonify(result), 400
+            return jsonify(result), 202
+        except Exception as e:
+            logger.error(f"Error resuming job {job_id}: {e}")
+            return jsonify({"status": "error", "message": "Internal server error"}), 500
+
     @app.route('/tile_set_info/<tile_set_name>')
     def get_tile_set_info(tile_set_name):
         """Get detailed information about a tile set"""
@@ -4,6 +4,7 @@ import json
 import logging
 from pathlib import Path
 from db_connector import StationVerifierDB
+from export_stream import EXPORT_COLUMNS, EXPORT_FORMATS, ndjson_stream, arrow_stream
 
 logger = logging.getLogger(__name__)
 
@@ -159,4 +160,38 @@ class DataHandler:
             return result
         except Exception as e:
             logger.error(f"Error exporting corrections: {e}")
-            return {"status": "error", "message": str(e)}
\ No newline at end of file
+            return {"status": "error", "message": str(e)}
+    
+    def stream_export(self, table, year_side=None, export_format="ndjson"):
+        """
+        Build a streaming export of one table
+
+        Args:
+            table: 'stops', 'lines', 'line_stops' or 'stations'
+            year_side: 'YYYY_side', or None for every year_side
+            export_format: 'ndjson' or 'arrow'
+
+        Returns:
+            Tuple (chunk generator, mimetype), or an error dict
+        """
+        if table not in EXPORT_COLUMNS:
+            return {"error": f"Unknown table: {table}"}
+        if export_format not in EXPORT_FORMATS:
+            return {"error": f"Unknown format: {export_format} (use {', '.join(EXPORT_FORMATS)})"}
+        if year_side:
+            try:
+                year, side = year_side.split('_')
+                int(year)
+            except ValueError:
+                return {"error": "Invalid year_side format (must be 'YYYY_side')"}
+        
+        records = self.db.iter_export_records(table, year_side)
+        if export_format == "arrow":
+            try:
+                chunks = arrow_stream(records, table)
+            except ImportError:
+                return {"error": "Arrow export requires pyarrow"}
+        else:
+            chunks = ndjson_stream(records)
+        
+        return chunks, EXPORT_FORMATS[export_format]
@@ -1,13 +1,17 @@
 # station-verifier/db_connector.py
 
 import datetime
-from neo4j import GraphDatabase
 import logging
 import os
+import sys
 from pathlib import Path
 import pandas as pd
 import json
 
+# Shared driver registry lives with the src tooling
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
+from driver_registry import get_driver
+
 logger = logging.getLogger(__name__)
 
 class StationVerifierDB:
@@ -37,11 +41,8 @@ class StationVerifierDB:
     def connect(self):
         """Connect to the database if not already connected"""
         if self.driver is None:
-            self.driver = GraphDatabase.driver(
-                self.uri, 
-                auth=(self.username, self.password),
-                max_connection_lifetime=3600  # 1 hour
-            )
+            # All verifier services share one pooled driver per URI
+            self.driver = get_driver(self.uri, self.username, self.password)
     
     def close(self):
         """Close the database connection"""
@@ -185,7 +186,117 @@ class StationVerifierDB:
         except Exception as e:
             logger.error(f"Error retrieving data for {year_side}: {e}")
             return {"stops": pd.DataFrame(), "lines": pd.DataFrame(), "line_stops": pd.DataFrame()}
-    
+
+    def get_station_positions(self, year_side):
+        """
+        Get positioned stations of a year_side with the lines serving them
+
+        Args:
+            year_side: String in format 'YYYY_side'
+
+        Returns:
+            List of dicts with stop_id, name, type, lat, lng and line_ids
+
+        Raises:
+            Query errors are re-raised, so callers never cache an empty result
+        """
+        self.connect()
+
+        try:
+            year, side = year_side.split('_')
+
+            with self.driver.session() as session:
+                result = session.run("""
+                MATCH (s:Station)-[:IN_YEAR]->(y:Year {year: $year})
+                WHERE s.east_west = $side AND s.latitude IS NOT NULL AND s.longitude IS NOT NULL
+                OPTIONAL MATCH (l:Line)-[:SERVES]->(s)
+                RETURN s.stop_id as stop_id, s.name as name, s.type as type,
+                       s.latitude as lat, s.longitude as lng,
+                       collect(DISTINCT l.line_id) as line_ids
+                """, year=int(year), side=side)
+
+                return [dict(record) for record in result]
+        except Exception as e:
+            logger.error(f"Error retrieving station positions for {year_side}: {e}")
+            raise
+
+    # Queries for streamed exports; $year/$side may be null to export every year_side
+    EXPORT_QUERIES = {
+        "stops": """
+        MATCH (s:Station)-[:IN_YEAR]->(y:Year)
+        WHERE ($year IS NULL OR y.year = $year) AND ($side IS NULL OR s.east_west = $side)
+        RETURN
+            y.year as year,
+            s.east_west as side,
+            s.stop_id as stop_id,
+            s.name as stop_name,
+            s.type as type,
+            s.latitude as latitude,
+            s.longitude as longitude,
+            s.source as source
+        ORDER BY year, side, stop_id
+        """,
+        "lines": """
+        MATCH (l:Line)-[:IN_YEAR]->(y:Year)
+        WHERE ($year IS NULL OR y.year = $year) AND ($side IS NULL OR l.east_west = $side)
+        RETURN
+            y.year as year,
+            l.east_west as side,
+            l.line_id as line_id,
+            l.name as line_name,
+            l.type as type
+        ORDER BY year, side, line_id
+        """,
+        "line_stops": """
+        MATCH (l:Line)-[:IN_YEAR]->(y:Year)
+        WHERE ($year IS NULL OR y.year = $year) AND ($side IS NULL OR l.east_west = $side)
+        MATCH (l)-[r:SERVES]->(s:Station)
+        RETURN
+            y.year as year,
+            l.east_west as side,
+            l.line_id as line_id,
+            s.stop_id as stop_id,
+            r.stop_order as stop_order,
+            l.name as line_name
+        ORDER BY year, side, line_id, stop_order
+        """,
+        "stations": """
+        MATCH (s:Station)
+        WHERE ($year IS NULL OR (s)-[:IN_YEAR]->(:Year {year: $year}))
+          AND ($side IS NULL OR s.east_west = $side)
+        RETURN s.stop_id as stop_id, s.name as name, s.latitude as latitude,
+               s.longitude as longitude, s.source as source, s.east_west as east_west
+        """
+    }
+
+    def iter_export_records(self, table, year_side=None):
+        """
+        Lazily iterate the records of an export table
+
+        Records are pulled from Neo4j in fetch-size batches while the caller
+        consumes them, so the full result is never held in memory.
+
+        Args:
+            table: One of EXPORT_QUERIES ('stops', 'lines', 'line_stops', 'stations')
+            year_side: 'YYYY_side' to restrict the export, or None for all year_sides
+
+        Yields:
+            One dict per record
+        """
+        if table not in self.EXPORT_QUERIES:
+            raise ValueError(f"Unknown export table: {table}")
+
+        year, side = None, None
+        if year_side:
+            year, side = year_side.split('_')
+            year = int(year)
+
+        self.connect()
+        with self.driver.session(fetch_size=1000) as session:
+            result = session.run(self.EXPORT_QUERIES[table], year=year, side=side)
+            for record in result:
+                yield dict(record)
+
     def get_station_coordinates(self, stop_id):
         """
         Get the coordinates for a station
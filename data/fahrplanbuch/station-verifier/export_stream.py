@@ -0,0 +1,94 @@
+# export_stream.py
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Column types of each export table, used to build a fixed Arrow schema
+EXPORT_COLUMNS = {
+    "stops": {
+        "year": "int64", "side": "string", "stop_id": "string", "stop_name": "string",
+        "type": "string", "latitude": "float64", "longitude": "float64", "source": "string"
+    },
+    "lines": {
+        "year": "int64", "side": "string", "line_id": "string", "line_name": "string", "type": "string"
+    },
+    "line_stops": {
+        "year": "int64", "side": "string", "line_id": "string", "stop_id": "string",
+        "stop_order": "int64", "line_name": "string"
+    },
+    "stations": {
+        "stop_id": "string", "name": "string", "latitude": "float64", "longitude": "float64",
+        "source": "string", "east_west": "string"
+    }
+}
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream"
+}
+
+
+def ndjson_stream(records, chunk_size=500):
+    """Encode records as newline-delimited JSON, yielding one chunk per chunk_size records"""
+    lines = []
+    for record in records:
+        lines.append(json.dumps(record, default=str, ensure_ascii=False))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+class _ChunkSink:
+    """Minimal writable file object collecting what the Arrow writer emits"""
+
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def arrow_stream(records, table, batch_size=5000):
+    """
+    Encode records as an Arrow IPC stream, yielding one record batch at a time
+
+    Requires pyarrow; import errors surface before the first chunk is sent.
+    """
+    import pyarrow as pa
+
+    schema = pa.schema([(name, pa.type_for_alias(dtype)) for name, dtype in EXPORT_COLUMNS[table].items()])
+    return _arrow_batches(pa, schema, records, batch_size)
+
+
+def _arrow_batches(pa, schema, records, batch_size):
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(sink, schema)
+    columns = schema.names
+
+    batch = []
+    for record in records:
+        batch.append({name: record.get(name) for name in columns})
+        if len(batch) >= batch_size:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            batch = []
+            yield sink.drain()
+    if batch:
+        writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+    writer.close()
+    yield sink.drain()
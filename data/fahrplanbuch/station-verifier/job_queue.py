@@ -0,0 +1,358 @@
+# job_queue.py
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import argparse
+import threading
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ("queued", "running", "done", "failed", "cancelled")
+
+
+class JobQueue:
+    """
+    Persistent queue of tile generation jobs backed by SQLite.
+
+    The queue is shared between the Flask process (which enqueues and reports
+    progress) and the worker processes (which claim and run jobs). Jobs left
+    "running" by a worker that died are put back in the queue; since the tile
+    generator skips tiles that already exist, a requeued job resumes where it
+    stopped.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._create_schema()
+
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _create_schema(self):
+        conn = self._connect()
+        try:
+            conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                cancel_requested INTEGER NOT NULL DEFAULT 0,
+                worker_pid INTEGER,
+                error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_progress (
+                job_id TEXT NOT NULL,
+                zoom INTEGER NOT NULL,
+                done INTEGER NOT NULL,
+                total INTEGER NOT NULL,
+                PRIMARY KEY (job_id, zoom)
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+            """)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _now():
+        return datetime.now().isoformat()
+
+    def enqueue(self, kind, payload):
+        """Add a job to the queue and return its id"""
+        job_id = uuid.uuid4().hex[:12]
+        now = self._now()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO jobs (job_id, kind, payload, status, created_at, updated_at) VALUES (?, ?, ?, 'queued', ?, ?)",
+                (job_id, kind, json.dumps(payload), now, now)
+            )
+        finally:
+            conn.close()
+        logger.info(f"Queued {kind} job {job_id}")
+        return job_id
+
+    def claim_next(self, worker_pid):
+        """Atomically move the oldest queued job to running and return it"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker_pid = ?, error = NULL, updated_at = ? WHERE job_id = ?",
+                (worker_pid, self._now(), row["job_id"])
+            )
+            conn.execute("COMMIT")
+            job = dict(row)
+            job["payload"] = json.loads(job["payload"])
+            return job
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def finish(self, job_id, status, error=None):
+        """Record the final status of a job"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, worker_pid = NULL, updated_at = ? WHERE job_id = ?",
+                (status, error, self._now(), job_id)
+            )
+        finally:
+            conn.close()
+
+    def update_progress(self, job_id, zoom, done, total):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO job_progress (job_id, zoom, done, total) VALUES (?, ?, ?, ?)",
+                (job_id, zoom, done, total)
+            )
+        finally:
+            conn.close()
+
+    def request_cancel(self, job_id):
+        """
+        Cancel a job. Queued jobs are cancelled immediately, running jobs stop
+        at their next progress report.
+
+        Returns:
+            The job's status after the request, or None if the job does not exist
+        """
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE jobs SET status = 'cancelled', updated_at = ? WHERE job_id = ? AND status = 'queued'",
+                (self._now(), job_id)
+            )
+            conn.execute(
+                "UPDATE jobs SET cancel_requested = 1, updated_at = ? WHERE job_id = ? AND status = 'running'",
+                (self._now(), job_id)
+            )
+            row = conn.execute("SELECT status FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return row["status"] if row else None
+        finally:
+            conn.close()
+
+    def is_cancel_requested(self, job_id):
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return bool(row and row["cancel_requested"])
+        finally:
+            conn.close()
+
+    def resume(self, job_id):
+        """
+        Put a cancelled or failed job back in the queue
+
+        Returns:
+            True if the job was requeued
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute("""
+            UPDATE jobs SET status = 'queued', cancel_requested = 0, error = NULL, updated_at = ?
+            WHERE job_id = ? AND status IN ('cancelled', 'failed')
+            """, (self._now(), job_id))
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def requeue_interrupted(self):
+        """Requeue running jobs whose worker process no longer exists"""
+        conn = self._connect()
+        requeued = 0
+        try:
+            rows = conn.execute("SELECT job_id, worker_pid FROM jobs WHERE status = 'running'").fetchall()
+            for row in rows:
+                if row["worker_pid"] and _pid_alive(row["worker_pid"]):
+                    continue
+                conn.execute(
+                    "UPDATE jobs SET status = 'queued', worker_pid = NULL, updated_at = ? WHERE job_id = ?",
+                    (self._now(), row["job_id"])
+                )
+                requeued += 1
+        finally:
+            conn.close()
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted job(s)")
+        return requeued
+
+    def get_job(self, job_id):
+        """Get a job with its per-zoom progress, or None if it does not exist"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            progress = conn.execute(
+                "SELECT zoom, done, total FROM job_progress WHERE job_id = ? ORDER BY zoom", (job_id,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        zooms = [dict(p) for p in progress]
+        done = sum(p["done"] for p in zooms)
+        total = sum(p["total"] for p in zooms)
+        return {
+            "job_id": row["job_id"],
+            "kind": row["kind"],
+            "payload": json.loads(row["payload"]),
+            "status": row["status"],
+            "cancel_requested": bool(row["cancel_requested"]),
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "progress": {
+                "zoom_levels": zooms,
+                "tiles_done": done,
+                "tiles_total": total,
+                "percent": round(100 * done / total, 1) if total else 0.0
+            }
+        }
+
+    def list_jobs(self, status=None, limit=100):
+        conn = self._connect()
+        try:
+            if status:
+                rows = conn.execute(
+                    "SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?", (status, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT job_id FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+        finally:
+            conn.close()
+        return [self.get_job(row["job_id"]) for row in rows]
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def run_job(queue, job):
+    """Run a single claimed job and record its outcome"""
+    job_id = job["job_id"]
+    payload = job["payload"]
+
+    if job["kind"] != "tif":
+        queue.finish(job_id, "failed", f"Unknown job kind: {job['kind']}")
+        return
+
+    try:
+        from rasterio_tile_generator import generate_xyz_tiles_rasterio
+
+        def report(zoom, done, total):
+            queue.update_progress(job_id, zoom, done, total)
+            return not queue.is_cancel_requested(job_id)
+
+        success = generate_xyz_tiles_rasterio(
+            tiff_file=payload["tif_path"],
+            output_dir=payload["output_dir"],
+            min_zoom=payload.get("min_zoom", 10),
+            max_zoom=payload.get("max_zoom", 16),
+            tile_format=payload.get("tile_format", "directory"),
+            progress_callback=report
+        )
+
+        if queue.is_cancel_requested(job_id):
+            queue.finish(job_id, "cancelled")
+            logger.info(f"Job {job_id} cancelled")
+        elif success:
+            queue.finish(job_id, "done")
+            logger.info(f"Job {job_id} finished")
+        else:
+            queue.finish(job_id, "failed", "Failed to generate tiles")
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {e}")
+        queue.finish(job_id, "failed", str(e))
+
+
+def run_worker(db_path, poll_interval=2.0):
+    """Worker process main loop: claim and run jobs until terminated"""
+    queue = JobQueue(db_path)
+    pid = os.getpid()
+    logger.info(f"Tile job worker {pid} started")
+
+    while True:
+        job = queue.claim_next(pid)
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+        logger.info(f"Worker {pid} running job {job['job_id']}")
+        run_job(queue, job)
+
+
+class WorkerPool:
+    """Starts worker processes on demand and keeps them alive"""
+
+    def __init__(self, db_path, num_workers=1):
+        self.db_path = db_path
+        self.num_workers = num_workers
+        self._processes = []
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        with self._lock:
+            self._processes = [p for p in self._processes if p.is_alive()]
+            while len(self._processes) < self.num_workers:
+                process = multiprocessing.Process(
+                    target=run_worker, args=(str(self.db_path),), daemon=True
+                )
+                process.start()
+                self._processes.append(process)
+                logger.info(f"Started tile job worker {process.pid}")
+
+    def stop(self):
+        with self._lock:
+            for process in self._processes:
+                process.terminate()
+            for process in self._processes:
+                process.join(timeout=5)
+            self._processes = []
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run tile generation workers outside the Flask app")
+    parser.add_argument("--db", default="tiles/jobs.sqlite3", help="Path to the job queue database")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    JobQueue(args.db).requeue_interrupted()
+    pool = WorkerPool(args.db, args.workers)
+    pool.ensure_started()
+    try:
+        while True:
+            time.sleep(10)
+            pool.ensure_started()
+    except KeyboardInterrupt:
+        pool.stop()
@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 import rasterio
@@ -8,18 +9,42 @@ import mercantile
 from PIL import Image
 import numpy as np
 from pyproj import Transformer
+from tile_store import MBTilesStore, MBTILES_SUFFIX
 
-def generate_xyz_tiles_rasterio(tiff_file, output_dir, min_zoom=10, max_zoom=16):
-    """Generate XYZ tiles using Rasterio for georeferenced images"""
+# Number of tiles between progress reports (and archive commits)
+PROGRESS_INTERVAL = 50
+
+def generate_xyz_tiles_rasterio(tiff_file, output_dir, min_zoom=10, max_zoom=16, tile_format="directory",
+                                progress_callback=None):
+    """
+    Generate XYZ tiles using Rasterio for georeferenced images
+
+    Args:
+        tiff_file: Georeferenced source image
+        output_dir: Tile set location; with tile_format="mbtiles" the tiles are
+            written to output_dir + ".mbtiles" instead of a z/x/y.png tree
+        min_zoom: Lowest zoom level to generate
+        max_zoom: Highest zoom level to generate
+        tile_format: "directory" or "mbtiles"
+        progress_callback: Optional callable(zoom, done, total); returning False
+            cancels generation. Tiles that already exist are skipped and counted
+            as done, so an interrupted run can be resumed.
+    """
+    store = None
     try:
         tiff_file = Path(tiff_file).resolve()
         output_dir = Path(output_dir).resolve()
         
         print(f"Processing file: {tiff_file}")
-        print(f"Output directory: {output_dir}")
         
-        # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
+        if tile_format == "mbtiles":
+            mbtiles_path = output_dir.with_name(output_dir.name + MBTILES_SUFFIX)
+            print(f"Output archive: {mbtiles_path}")
+            store = MBTilesStore(mbtiles_path)
+        else:
+            print(f"Output directory: {output_dir}")
+            # Create output directory
+            os.makedirs(output_dir, exist_ok=True)
         
         # Open the source dataset
         with rasterio.open(tiff_file) as src:
@@ -44,24 +69,52 @@ def generate_xyz_tiles_rasterio(tiff_file, output_dir, min_zoom=10, max_zoom=16)
             else:
                 west_lng, south_lat, east_lng, north_lat = west, south, east, north
                 
+            if store is not None:
+                # Header is written up front so listing works while tiles are generated
+                store.set_metadata({
+                    "name": output_dir.name,
+                    "format": "png",
+                    "type": "overlay",
+                    "bounds": f"{west_lng},{south_lat},{east_lng},{north_lat}",
+                    "minzoom": min_zoom,
+                    "maxzoom": max_zoom
+                })
  
             # Calculate the actual tiles that would contain our image
-            for zoom in range(min_zoom, max_zoom + 1):
-                # Find all tiles that intersect with the bounds at this zoom level using WGS84 coordinates
-                tiles = list(mercantile.tiles(west_lng, south_lat, east_lng, north_lat, zoom))
-                
+            # Find all tiles that intersect with the bounds at each zoom level using WGS84 coordinates
+            zoom_tiles = {
+                zoom: list(mercantile.tiles(west_lng, south_lat, east_lng, north_lat, zoom))
+                for zoom in range(min_zoom, max_zoom + 1)
+            }
+            if progress_callback is not None:
+                for zoom, tiles in zoom_tiles.items():
+                    progress_callback(zoom, 0, len(tiles))
+            
+            for zoom, tiles in zoom_tiles.items():
                 # Process each tile
                 success_count = 0
                 error_count = 0
                 
-                for tile in tiles:
-                    # Create directory for this tile
-                    tile_dir = output_dir / str(zoom) / str(tile.x)
-                    os.makedirs(tile_dir, exist_ok=True)
-                    tile_path = tile_dir / f"{tile.y}.png"
+                for index, tile in enumerate(tiles):
+                    if index and index % PROGRESS_INTERVAL == 0:
+                        if store is not None:
+                            store.commit()
+                        if progress_callback is not None and progress_callback(zoom, index, len(tiles)) is False:
+                            print(f"Tile generation cancelled at zoom level {zoom}")
+                            return False
                     
-                    if tile_path.exists():
-                        continue  # Skip if already exists
+                    if store is not None:
+                        tile_path = None
+                        if store.has_tile(zoom, tile.x, tile.y):
+                            continue  # Skip if already exists
+                    else:
+                        # Create directory for this tile
+                        tile_dir = output_dir / str(zoom) / str(tile.x)
+                        os.makedirs(tile_dir, exist_ok=True)
+                        tile_path = tile_dir / f"{tile.y}.png"
+                        
+                        if tile_path.exists():
+                            continue  # Skip if already exists
                     
                     # Get the bounds of this tile in the original CRS of the image
                     # First get the bounds in WGS84
@@ -130,7 +183,12 @@ def generate_xyz_tiles_rasterio(tiff_file, output_dir, min_zoom=10, max_zoom=16)
                         
                         # Create and save the image
                         image = Image.fromarray(image_data, mode=mode)
-                        image.save(tile_path)
+                        if store is not None:
+                            buffer = io.BytesIO()
+                            image.save(buffer, format="PNG")
+                            store.put_tile(zoom, tile.x, tile.y, buffer.getvalue())
+                        else:
+                            image.save(tile_path)
                         success_count += 1
                         
                     except Exception as e:
@@ -139,6 +197,11 @@ def generate_xyz_tiles_rasterio(tiff_file, output_dir, min_zoom=10, max_zoom=16)
                         if error_count <= 3:
                             print(f"  Error processing tile {tile.x}/{tile.y}/{zoom}: {e}")
                 
+                if store is not None:
+                    store.commit()
+                if progress_callback is not None:
+                    progress_callback(zoom, len(tiles), len(tiles))
+                
                 print(f"  Zoom level {zoom}: {success_count} tiles created, {error_count} errors")
             
             return True
@@ -148,8 +211,12 @@ def generate_xyz_tiles_rasterio(tiff_file, output_dir, min_zoom=10, max_zoom=16)
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        if store is not None:
+            store.commit()
+            store.close()
 
-def process_tif_directory(base_dir, output_base_dir, min_zoom=10, max_zoom=16):
+def process_tif_directory(base_dir, output_base_dir, min_zoom=10, max_zoom=16, tile_format="directory"):
     """Process all TIF files in a directory structure"""
     base_dir = Path(base_dir)
     output_base_dir = Path(output_base_dir)
@@ -178,7 +245,8 @@ def process_tif_directory(base_dir, output_base_dir, min_zoom=10, max_zoom=16):
             tiff_file=tif_file,
             output_dir=output_dir,
             min_zoom=min_zoom,
-            max_zoom=max_zoom
+            max_zoom=max_zoom,
+            tile_format=tile_format
         )
         
         results[str(tif_file)] = {
@@ -0,0 +1,231 @@
+# spatial_index.py
+import json
+import math
+import threading
+import logging
+from collections import defaultdict
+from db_connector import StationVerifierDB
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS = 6371000  # meters
+# Reference latitude for the local equirectangular projection (central Berlin)
+REFERENCE_LAT = 52.5
+
+
+def project(lat, lng):
+    """Project WGS84 coordinates to approximate planar meters around Berlin"""
+    x = math.radians(lng) * EARTH_RADIUS * math.cos(math.radians(REFERENCE_LAT))
+    y = math.radians(lat) * EARTH_RADIUS
+    return x, y
+
+
+class GridIndex:
+    """
+    Grid hash of station positions on projected meters.
+
+    Candidate cells are selected on the projected grid; the returned distances
+    are exact haversine distances, so results match a full scan.
+    """
+
+    def __init__(self, cell_size=500):
+        self.cell_size = cell_size
+        self._cells = defaultdict(set)
+        self._points = {}
+        # Cell extent ever occupied; bounds the ring search in nearest()
+        self._extent = None
+
+    def __len__(self):
+        return len(self._points)
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, stop_id, lat, lng, info=None):
+        """Add or move a station"""
+        self.remove(stop_id)
+        x, y = project(lat, lng)
+        cell = self._cell(x, y)
+        self._points[stop_id] = (lat, lng, cell, info or {})
+        self._cells[cell].add(stop_id)
+        if self._extent is None:
+            self._extent = [cell[0], cell[1], cell[0], cell[1]]
+        else:
+            self._extent = [min(self._extent[0], cell[0]), min(self._extent[1], cell[1]),
+                            max(self._extent[2], cell[0]), max(self._extent[3], cell[1])]
+
+    def remove(self, stop_id):
+        point = self._points.pop(stop_id, None)
+        if point is None:
+            return False
+        cell = point[2]
+        self._cells[cell].discard(stop_id)
+        if not self._cells[cell]:
+            del self._cells[cell]
+        return True
+
+    def move(self, stop_id, lat, lng):
+        """Update a station's position, keeping its attributes"""
+        point = self._points.get(stop_id)
+        if point is None:
+            return False
+        self.insert(stop_id, lat, lng, point[3])
+        return True
+
+    def _ring(self, center, radius):
+        """Cells at Chebyshev distance exactly `radius` from center"""
+        cx, cy = center
+        if radius == 0:
+            yield center
+            return
+        for dx in range(-radius, radius + 1):
+            yield cx + dx, cy - radius
+            yield cx + dx, cy + radius
+        for dy in range(-radius + 1, radius):
+            yield cx - radius, cy + dy
+            yield cx + radius, cy + dy
+
+    def _result(self, stop_id, lat, lng):
+        p_lat, p_lng, _, info = self._points[stop_id]
+        return {
+            "stop_id": stop_id,
+            "name": info.get("name"),
+            "type": info.get("type"),
+            "distance": StationVerifierDB._calculate_distance(lat, lng, p_lat, p_lng)
+        }
+
+    def within(self, lat, lng, radius, predicate=None):
+        """
+        Find stations within a radius
+
+        Args:
+            lat, lng: Query position
+            radius: Search radius in meters
+            predicate: Optional filter called with each station's attributes
+
+        Returns:
+            List of station dicts with distance, sorted by distance
+        """
+        center = self._cell(*project(lat, lng))
+        # One extra ring absorbs the scale error of the fixed reference latitude
+        reach = int(math.ceil(radius / self.cell_size)) + 1
+        results = []
+        for r in range(reach + 1):
+            for cell in self._ring(center, r):
+                for stop_id in self._cells.get(cell, ()):
+                    if predicate is not None and not predicate(self._points[stop_id][3]):
+                        continue
+                    station = self._result(stop_id, lat, lng)
+                    if station["distance"] < radius:
+                        results.append(station)
+        results.sort(key=lambda s: s["distance"])
+        return results
+
+    def nearest(self, lat, lng, k=5, predicate=None):
+        """Find the k nearest stations, sorted by distance"""
+        if not self._points:
+            return []
+        center = self._cell(*project(lat, lng))
+        min_cx, min_cy, max_cx, max_cy = self._extent
+        max_reach = max(abs(center[0] - min_cx), abs(center[0] - max_cx),
+                        abs(center[1] - min_cy), abs(center[1] - max_cy))
+        results = []
+        for r in range(max_reach + 1):
+            for cell in self._ring(center, r):
+                for stop_id in self._cells.get(cell, ()):
+                    if predicate is None or predicate(self._points[stop_id][3]):
+                        results.append(self._result(stop_id, lat, lng))
+            # Everything beyond ring r is at least r cells away (less one cell of slack)
+            if len(results) >= k:
+                results.sort(key=lambda s: s["distance"])
+                if results[k - 1]["distance"] <= (r - 1) * self.cell_size:
+                    break
+        results.sort(key=lambda s: s["distance"])
+        return results[:k]
+
+
+class StationIndexRegistry:
+    """
+    Lazily built GridIndex per year_side, shared by the verifier services.
+
+    Indexes are built from the database with the curator's pending location
+    corrections applied, and kept current as stations are added, deleted or
+    moved.
+    """
+
+    def __init__(self, db, corrections_file, cell_size=500):
+        self.db = db
+        self.corrections_file = corrections_file
+        self.cell_size = cell_size
+        self._indexes = {}
+        self._lock = threading.RLock()
+
+    def _load_corrections(self, year_side):
+        try:
+            if self.corrections_file.exists() and self.corrections_file.stat().st_size > 0:
+                with open(self.corrections_file, 'r') as f:
+                    content = f.read().strip()
+                    if content:
+                        return json.loads(content).get(year_side, {})
+        except Exception as e:
+            logger.error(f"Error loading corrections: {e}")
+        return {}
+
+    def _build(self, year_side):
+        index = GridIndex(self.cell_size)
+        for record in self.db.get_station_positions(year_side):
+            index.insert(record['stop_id'], record['lat'], record['lng'], {
+                "name": record['name'],
+                "type": record['type'],
+                "line_ids": set(record.get('line_ids') or [])
+            })
+        for stop_id, correction in self._load_corrections(year_side).items():
+            if 'lat' in correction and 'lng' in correction:
+                index.move(stop_id, float(correction['lat']), float(correction['lng']))
+        logger.info(f"Built spatial index for {year_side} with {len(index)} stations")
+        return index
+
+    def get(self, year_side):
+        """Return the index for a year_side, building it on first use (build errors propagate and nothing is cached)"""
+        with self._lock:
+            index = self._indexes.get(year_side)
+            if index is None:
+                index = self._build(year_side)
+                self._indexes[year_side] = index
+            return index
+
+    def invalidate(self, year_side=None):
+        """Drop one or all indexes; they are rebuilt on next use"""
+        with self._lock:
+            if year_side is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(year_side, None)
+
+    def add_station(self, year_side, stop_id, lat, lng, name=None, station_type=None, line_ids=()):
+        with self._lock:
+            index = self._indexes.get(year_side)
+            if index is not None:
+                index.insert(stop_id, lat, lng, {"name": name, "type": station_type, "line_ids": set(line_ids)})
+
+    def remove_station(self, year_side, stop_id):
+        with self._lock:
+            index = self._indexes.get(year_side)
+            if index is not None:
+                index.remove(stop_id)
+
+    def move_station(self, year_side, stop_id, lat, lng):
+        with self._lock:
+            index = self._indexes.get(year_side)
+            if index is not None:
+                index.move(stop_id, lat, lng)
+
+    def within(self, year_side, lat, lng, radius, line_id=None):
+        predicate = (lambda info: line_id in info["line_ids"]) if line_id else None
+        with self._lock:
+            return self.get(year_side).within(lat, lng, radius, predicate)
+
+    def nearest(self, year_side, lat, lng, k=5, line_id=None):
+        predicate = (lambda info: line_id in info["line_ids"]) if line_id else None
+        with self._lock:
+            return self.get(year_side).nearest(lat, lng, k, predicate)
@@ -7,7 +7,7 @@ from db_connector import StationVerifierDB
 logger = logging.getLogger(__name__)
 
 class StationManager:
-    def __init__(self, config):
+    def __init__(self, config, station_index=None):
         self.config = config
         self.corrections_file = config['CORRECTIONS_DIR'] / "station_corrections.json"
         self.additions_file = config['CORRECTIONS_DIR'] / "station_additions.json"
@@ -24,6 +24,8 @@ class StationManager:
             username=config['DB_USERNAME'],
             password=config['DB_PASSWORD']
         )
+        # Optional StationIndexRegistry kept in sync with additions, deletions and moves
+        self.station_index = station_index
     
     def add_station(self, station_data):
         """Add a new station with proper validation and line integration"""
@@ -75,6 +77,12 @@ class StationManager:
             
             if result['status'] == 'success':
                 logger.info(f"Successfully added station {result.get('new_station_id')} in {station_data['year_side']}")
+                if self.station_index is not None:
+                    self.station_index.add_station(
+                        station_data['year_side'], result['new_station_id'], lat, lng,
+                        name=station_name, station_type=station_data['type'],
+                        line_ids=[c['line_id'] for c in station_data.get('line_connections', [])]
+                    )
             
             return result
             
@@ -91,6 +99,8 @@ class StationManager:
             # If successful, also remove from corrections
             if result.get('status') == 'success':
                 self._remove_from_corrections(stop_id, year_side)
+                if self.station_index is not None:
+                    self.station_index.remove_station(year_side, stop_id)
                 logger.info(f"Successfully deleted station {stop_id} from {year_side}")
             
             return result
@@ -123,6 +133,8 @@ class StationManager:
             corrections[year_side][stop_id]["lng"] = lng
             
             self._save_corrections(corrections)
+            if self.station_index is not None:
+                self.station_index.move_station(year_side, stop_id, lat, lng)
             logger.info(f"Saved location correction for station {stop_id} in {year_side}")
             
             return {"status": "success"}
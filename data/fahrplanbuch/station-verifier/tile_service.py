@@ -1,8 +1,12 @@
 # tile_service.py
 import os
+import zlib
+import threading
 import logging
 from pathlib import Path
-from flask import send_from_directory
+from flask import send_from_directory, request, Response
+from tile_store import MBTilesStore, TileCache, MBTILES_SUFFIX
+from job_queue import JobQueue, WorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -11,21 +15,86 @@ class TileService:
         self.config = config
         self.tiles_dir = config['TILES_DIR']
         self.tif_dir = self.tiles_dir / "tif"
+        self.tile_format = config.get('TILE_FORMAT', 'mbtiles')
+        self.cache_max_age = config.get('TILE_CACHE_MAX_AGE', 86400)
+        self.tile_cache = TileCache(config.get('TILE_CACHE_SIZE', 2048))
+        
+        # Open archives are kept for the lifetime of the service
+        self._stores = {}
+        self._stores_lock = threading.Lock()
         
         # Ensure directories exist
         self.tiles_dir.mkdir(exist_ok=True)
         self.tif_dir.mkdir(exist_ok=True)
         
-        logger.info(f"TileService initialized - tiles_dir: {self.tiles_dir}, tif_dir: {self.tif_dir}")
+        # Tile generation runs in background worker processes, started on first use
+        jobs_db = config.get('JOBS_DB', self.tiles_dir / "jobs.sqlite3")
+        self.job_queue = JobQueue(jobs_db)
+        self.job_queue.requeue_interrupted()
+        self.worker_pool = WorkerPool(jobs_db, config.get('JOB_WORKERS', 1))
+        
+        logger.info(f"TileService initialized - tiles_dir: {self.tiles_dir}, tif_dir: {self.tif_dir}, "
+                    f"format: {self.tile_format}")
+    
+    def _archive_path(self, tile_set_name):
+        return self.tiles_dir / f"{tile_set_name}{MBTILES_SUFFIX}"
+    
+    def _get_store(self, tile_set_name):
+        """Return an open read-only store for a tile set, or None if it has no archive"""
+        with self._stores_lock:
+            store = self._stores.get(tile_set_name)
+            if store is None:
+                archive_path = self._archive_path(tile_set_name)
+                if not archive_path.is_file():
+                    return None
+                store = MBTilesStore(archive_path, readonly=True)
+                self._stores[tile_set_name] = store
+            return store
+    
+    def _release_store(self, tile_set_name):
+        """Close a cached store handle and drop its cached tiles"""
+        with self._stores_lock:
+            store = self._stores.pop(tile_set_name, None)
+        if store is not None:
+            store.close()
+        self.tile_cache.invalidate(tile_set_name)
     
     def serve_tile(self, filepath):
-        """Serve a tile from the tiles directory"""
+        """Serve a tile from an MBTiles archive, falling back to the tiles directory"""
         try:
-            return send_from_directory(str(self.tiles_dir), filepath)
+            parts = filepath.split('/')
+            if len(parts) == 4 and parts[3].endswith('.png'):
+                tile_set_name = parts[0]
+                store = self._get_store(tile_set_name)
+                if store is not None:
+                    return self._serve_archived_tile(store, tile_set_name,
+                                                     int(parts[1]), int(parts[2]), int(parts[3][:-4]))
+            
+            return send_from_directory(str(self.tiles_dir), filepath, max_age=self.cache_max_age)
         except Exception as e:
             logger.error(f"Error serving tile {filepath}: {e}")
             return {"error": "Tile not found"}, 404
     
+    def _serve_archived_tile(self, store, tile_set_name, z, x, y):
+        """Serve a single tile from an archive through the in-process LRU"""
+        key = (tile_set_name, z, x, y)
+        cached = self.tile_cache.get(key)
+        if cached is None:
+            data = store.get_tile(z, x, y)
+            if data is None:
+                return {"error": "Tile not found"}, 404
+            cached = (data, f'"{zlib.crc32(data):08x}"')
+            self.tile_cache.put(key, cached)
+        
+        data, etag = cached
+        headers = {
+            "Cache-Control": f"public, max-age={self.cache_max_age}",
+            "ETag": etag
+        }
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=304, headers=headers)
+        return Response(data, mimetype="image/png", headers=headers)
+    
     def get_available_tile_sets(self):
         """List all available tile sets"""
         if not self.tiles_dir.exists():
@@ -35,11 +104,32 @@ class TileService:
         tile_sets = []
         
         try:
+            archived = set()
+            for item in sorted(os.listdir(self.tiles_dir)):
+                if not item.endswith(MBTILES_SUFFIX):
+                    continue
+                tile_set_name = item[:-len(MBTILES_SUFFIX)]
+                try:
+                    # Listing reads only the archive header
+                    description = self._get_store(tile_set_name).describe()
+                except Exception as e:
+                    logger.warning(f"Error reading tile archive {item}: {e}")
+                    continue
+                if description is None:
+                    continue
+                archived.add(tile_set_name)
+                tile_sets.append({
+                    "name": tile_set_name,
+                    "url": f"/tiles/{tile_set_name}/{{z}}/{{x}}/{{y}}.png",
+                    "zoom_levels": description["zoom_levels"],
+                    "bounds": description["bounds"]
+                })
+            
             for item in os.listdir(self.tiles_dir):
                 item_path = self.tiles_dir / item
                 
-                # Skip the TIF source files directory and individual files
-                if item.endswith(('.tif', '.tiff')) or item == "tif":
+                # Skip the TIF source files directory, individual files and archived sets
+                if item.endswith(('.tif', '.tiff')) or item == "tif" or item in archived:
                     continue
                     
                 if item_path.is_dir():
@@ -103,61 +193,64 @@ class TileService:
             logger.error(f"Error listing TIF files: {e}")
             return {"error": f"Error listing TIF files: {str(e)}"}
     
+    def _validate_tif(self, filename):
+        """Check that a TIF exists and is small enough to process; returns an error dict or None"""
+        tif_path = self.tif_dir / filename
+        
+        if not tif_path.exists():
+            return {"status": "error", "message": f"File not found: {filename}"}
+        
+        # Validate file size (optional - prevent processing huge files)
+        file_size = tif_path.stat().st_size
+        max_size = 500 * 1024 * 1024  # 500 MB limit
+        
+        if file_size > max_size:
+            return {
+                "status": "error",
+                "message": f"File too large: {file_size / (1024*1024):.1f}MB (max: {max_size / (1024*1024):.1f}MB)"
+            }
+        return None
+    
+    def _enqueue_tif(self, tif_path):
+        """Queue tile generation for a TIF file and return the job id"""
+        output_dir = self.tiles_dir / tif_path.stem
+        job_id = self.job_queue.enqueue("tif", {
+            "filename": tif_path.name,
+            "tif_path": str(tif_path.resolve()),
+            "output_dir": str(output_dir.resolve()),
+            "min_zoom": 10,
+            "max_zoom": 16,
+            "tile_format": self.tile_format
+        })
+        logger.info(f"Queued TIF file: {tif_path.name} -> {output_dir} ({self.tile_format}), job {job_id}")
+        return job_id
+    
     def process_single_tif(self, filename):
-        """Process a single TIF file into tiles"""
+        """Queue a single TIF file for tile generation"""
         try:
-            from rasterio_tile_generator import generate_xyz_tiles_rasterio
+            error = self._validate_tif(filename)
+            if error:
+                return error
             
             tif_path = self.tif_dir / filename
+            job_id = self._enqueue_tif(tif_path)
+            self.worker_pool.ensure_started()
             
-            if not tif_path.exists():
-                return {"status": "error", "message": f"File not found: {filename}"}
-            
-            # Validate file size (optional - prevent processing huge files)
-            file_size = tif_path.stat().st_size
-            max_size = 500 * 1024 * 1024  # 500 MB limit
-            
-            if file_size > max_size:
-                return {
-                    "status": "error",
-                    "message": f"File too large: {file_size / (1024*1024):.1f}MB (max: {max_size / (1024*1024):.1f}MB)"
-                }
-            
-            output_dir = self.tiles_dir / tif_path.stem
-            
-            logger.info(f"Processing TIF file: {filename} -> {output_dir}")
-            
-            success = generate_xyz_tiles_rasterio(
-                tiff_file=tif_path,
-                output_dir=output_dir,
-                min_zoom=10,
-                max_zoom=16
-            )
-            
-            if success:
-                logger.info(f"Successfully processed {filename}")
-                return {
-                    "status": "success",
-                    "message": f"Tiles generated for {filename}",
-                    "url": f"/tiles/{tif_path.stem}/{{z}}/{{x}}/{{y}}.png",
-                    "output_dir": str(output_dir)
-                }
-            else:
-                logger.error(f"Failed to process {filename}")
-                return {"status": "error", "message": "Failed to generate tiles"}
+            return {
+                "status": "queued",
+                "message": f"Tile generation queued for {filename}",
+                "job_id": job_id,
+                "job_url": f"/jobs/{job_id}",
+                "url": f"/tiles/{tif_path.stem}/{{z}}/{{x}}/{{y}}.png"
+            }
                 
-        except ImportError:
-            logger.error("rasterio_tile_generator module not found")
-            return {"status": "error", "message": "Tile generation module not available"}
         except Exception as e:
-            logger.error(f"Error processing TIF file {filename}: {e}")
+            logger.error(f"Error queueing TIF file {filename}: {e}")
             return {"status": "error", "message": f"Processing error: {str(e)}"}
     
     def process_all_tifs(self):
-        """Process all TIF files in the tif directory"""
+        """Queue all TIF files in the tif directory for tile generation"""
         try:
-            from rasterio_tile_generator import process_tif_directory
-            
             # Check if TIF directory exists and has files
             if not self.tif_dir.exists():
                 return {
@@ -165,8 +258,8 @@ class TileService:
                     "message": "TIF directory does not exist. Please create it and add TIF files."
                 }
             
-            tif_files = [f for f in os.listdir(self.tif_dir) 
-                        if f.lower().endswith(('.tif', '.tiff'))]
+            tif_files = sorted(f for f in os.listdir(self.tif_dir) 
+                               if f.lower().endswith(('.tif', '.tiff')))
             
             if not tif_files:
                 return {
@@ -174,55 +267,79 @@ class TileService:
                     "message": "No TIF files found in the tiles/tif directory. Please add TIF files first."
                 }
             
-            logger.info(f"Processing {len(tif_files)} TIF files: {tif_files}")
-            
             # Calculate total file size for progress estimation
             total_size = sum((self.tif_dir / f).stat().st_size for f in tif_files)
             total_size_mb = total_size / (1024 * 1024)
             
-            logger.info(f"Total file size to process: {total_size_mb:.1f} MB")
+            logger.info(f"Queueing {len(tif_files)} TIF files ({total_size_mb:.1f} MB): {tif_files}")
             
-            results = process_tif_directory(
-                base_dir=self.tif_dir,
-                output_base_dir=self.tiles_dir,
-                min_zoom=10,
-                max_zoom=16
-            )
-            
-            success_count = sum(1 for result in results.values() if result["success"])
-            failed_count = len(results) - success_count
+            jobs = {}
+            skipped = {}
+            for filename in tif_files:
+                error = self._validate_tif(filename)
+                if error:
+                    skipped[filename] = error["message"]
+                    continue
+                jobs[filename] = self._enqueue_tif(self.tif_dir / filename)
             
-            logger.info(f"Processing complete: {success_count} succeeded, {failed_count} failed")
+            if jobs:
+                self.worker_pool.ensure_started()
             
             return {
-                "status": "success",
-                "message": f"Processed {len(results)} files. {success_count} succeeded, {failed_count} failed.",
-                "details": results,
+                "status": "queued",
+                "message": f"Queued {len(jobs)} files. {len(skipped)} skipped.",
+                "jobs": jobs,
+                "skipped": skipped,
                 "summary": {
-                    "total_files": len(results),
-                    "successful": success_count,
-                    "failed": failed_count,
+                    "total_files": len(tif_files),
+                    "queued": len(jobs),
+                    "skipped": len(skipped),
                     "total_size_mb": total_size_mb
                 }
             }
             
-        except ImportError:
-            logger.error("rasterio_tile_generator module not found")
-            return {
-                "status": "error",
-                "message": "Tile generation module not available. Please ensure rasterio_tile_generator.py is present."
-            }
         except Exception as e:
-            logger.error(f"Error processing all TIFs: {e}")
+            logger.error(f"Error queueing all TIFs: {e}")
             return {"status": "error", "message": f"Processing error: {str(e)}"}
     
+    def get_job(self, job_id):
+        """Get status and per-zoom progress of a tile generation job"""
+        job = self.job_queue.get_job(job_id)
+        if job is None:
+            return {"status": "error", "message": f"Job not found: {job_id}"}
+        return {"status": "success", "job": job}
+    
+    def list_jobs(self, status=None):
+        """List recent tile generation jobs"""
+        return {"status": "success", "jobs": self.job_queue.list_jobs(status)}
+    
+    def cancel_job(self, job_id):
+        """Cancel a queued or running job"""
+        job_status = self.job_queue.request_cancel(job_id)
+        if job_status is None:
+            return {"status": "error", "message": f"Job not found: {job_id}"}
+        return {"status": "success", "job_status": job_status}
+    
+    def resume_job(self, job_id):
+        """Requeue a cancelled or failed job; tiles already written are skipped"""
+        if not self.job_queue.resume(job_id):
+            return {"status": "error", "message": f"Job {job_id} cannot be resumed"}
+        self.worker_pool.ensure_started()
+        return {"status": "success", "job_status": "queued"}
+    
     def cleanup_tiles(self, tile_set_name=None):
         """Clean up generated tiles (for maintenance)"""
         try:
             if tile_set_name:
                 # Clean up specific tile set
                 tile_set_path = self.tiles_dir / tile_set_name
-                if tile_set_path.exists() and tile_set_path.is_dir():
+                archive_path = self._archive_path(tile_set_name)
+                if archive_path.exists():
+                    self._release_store(tile_set_name)
+                    archive_path.unlink()
+                    logger.info(f"Cleaned up tile archive: {archive_path.name}")
+                    return {"status": "success", "message": f"Cleaned up tile set: {tile_set_name}"}
+                elif tile_set_path.exists() and tile_set_path.is_dir():
                     import shutil
                     shutil.rmtree(tile_set_path)
                     logger.info(f"Cleaned up tile set: {tile_set_name}")
@@ -233,7 +350,11 @@ class TileService:
                 # Clean up all generated tiles (keep TIF source files)
                 for item in os.listdir(self.tiles_dir):
                     item_path = self.tiles_dir / item
-                    if item_path.is_dir() and item != "tif":
+                    if item.endswith(MBTILES_SUFFIX):
+                        self._release_store(item[:-len(MBTILES_SUFFIX)])
+                        item_path.unlink()
+                        logger.info(f"Cleaned up tile archive: {item}")
+                    elif item_path.is_dir() and item != "tif":
                         import shutil
                         shutil.rmtree(item_path)
                         logger.info(f"Cleaned up tile directory: {item}")
@@ -249,6 +370,26 @@ class TileService:
         try:
             tile_set_path = self.tiles_dir / tile_set_name
             
+            store = self._get_store(tile_set_name)
+            if store is not None:
+                zoom_levels = store.tile_statistics()
+                total_size = sum(level["size"] for level in zoom_levels)
+                description = store.describe() or {}
+                info = {
+                    "name": tile_set_name,
+                    "path": str(self._archive_path(tile_set_name)),
+                    "bounds": description.get("bounds"),
+                    "zoom_levels": [
+                        {"zoom": level["zoom"], "tiles": level["tiles"],
+                         "size_mb": round(level["size"] / (1024 * 1024), 2)}
+                        for level in zoom_levels
+                    ],
+                    "total_tiles": sum(level["tiles"] for level in zoom_levels),
+                    "total_size": total_size,
+                    "total_size_mb": round(total_size / (1024 * 1024), 2)
+                }
+                return {"status": "success", "info": info}
+            
             if not tile_set_path.exists():
                 return {"status": "error", "message": f"Tile set not found: {tile_set_name}"}
             
@@ -0,0 +1,223 @@
+# tile_store.py
+import os
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MBTILES_SUFFIX = ".mbtiles"
+
+
+class MBTilesStore:
+    """
+    Single-file tile set stored as an MBTiles (SQLite) archive.
+
+    Tiles are addressed with XYZ coordinates; the archive itself uses the
+    TMS row order required by the MBTiles spec. Bounds and zoom range are kept
+    in the ``metadata`` table so a tile set can be described without touching
+    the tiles themselves.
+    """
+
+    def __init__(self, path, readonly=False):
+        self.path = Path(path)
+        self.readonly = readonly
+        self._lock = threading.Lock()
+
+        if readonly:
+            uri = f"file:{self.path.resolve()}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._create_schema()
+
+    @property
+    def name(self):
+        return self.path.stem
+
+    def _create_schema(self):
+        with self._lock:
+            self._conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tiles (
+                zoom_level INTEGER,
+                tile_column INTEGER,
+                tile_row INTEGER,
+                tile_data BLOB,
+                PRIMARY KEY (zoom_level, tile_column, tile_row)
+            );
+            """)
+            self._conn.commit()
+
+    @staticmethod
+    def _tms_row(z, y):
+        """Convert an XYZ row to the TMS row used inside MBTiles"""
+        return (1 << z) - 1 - y
+
+    def get_tile(self, z, x, y):
+        """Return the tile bytes for z/x/y, or None if the tile does not exist"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+                (z, x, self._tms_row(z, y))
+            ).fetchone()
+        return row[0] if row else None
+
+    def has_tile(self, z, x, y):
+        """Check whether a tile has already been written"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+                (z, x, self._tms_row(z, y))
+            ).fetchone()
+        return row is not None
+
+    def put_tile(self, z, x, y, data):
+        """Write a tile; call commit() to persist a batch of writes"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) VALUES (?, ?, ?, ?)",
+                (z, x, self._tms_row(z, y), sqlite3.Binary(data))
+            )
+
+    def commit(self):
+        with self._lock:
+            self._conn.commit()
+
+    def get_metadata(self):
+        """Return the metadata table as a dict of strings"""
+        with self._lock:
+            rows = self._conn.execute("SELECT name, value FROM metadata").fetchall()
+        return dict(rows)
+
+    def set_metadata(self, metadata):
+        """Update metadata entries (values are stored as strings)"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)",
+                [(key, str(value)) for key, value in metadata.items()]
+            )
+            self._conn.commit()
+
+    def describe(self):
+        """
+        Describe the tile set from its metadata header only
+
+        Returns:
+            Dict with name, zoom levels and bounds, or None if the header is incomplete
+        """
+        metadata = self.get_metadata()
+        try:
+            min_zoom = int(metadata["minzoom"])
+            max_zoom = int(metadata["maxzoom"])
+        except (KeyError, ValueError):
+            return None
+
+        bounds = None
+        if metadata.get("bounds"):
+            bounds = [float(value) for value in metadata["bounds"].split(",")]
+
+        return {
+            "name": metadata.get("name", self.name),
+            "zoom_levels": list(range(min_zoom, max_zoom + 1)),
+            "bounds": bounds,
+            "format": metadata.get("format", "png")
+        }
+
+    def tile_statistics(self):
+        """Count tiles and bytes per zoom level"""
+        with self._lock:
+            rows = self._conn.execute("""
+            SELECT zoom_level, COUNT(*), SUM(LENGTH(tile_data))
+            FROM tiles GROUP BY zoom_level ORDER BY zoom_level
+            """).fetchall()
+        return [{"zoom": zoom, "tiles": count, "size": size or 0} for zoom, count, size in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class TileCache:
+    """Small in-process LRU of recently served tiles"""
+
+    def __init__(self, max_items=2048):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def invalidate(self, prefix):
+        """Drop all cached tiles whose key starts with the given tile set name"""
+        with self._lock:
+            for key in [k for k in self._items if k[0] == prefix]:
+                del self._items[key]
+
+
+def pack_directory(tile_dir, mbtiles_path, metadata=None):
+    """
+    Pack an existing z/x/y.png directory tree into a single MBTiles archive
+
+    Args:
+        tile_dir: Directory containing zoom level subdirectories
+        mbtiles_path: Output archive path
+        metadata: Optional extra metadata (e.g. bounds) for the archive header
+
+    Returns:
+        Number of tiles written
+    """
+    tile_dir = Path(tile_dir)
+    store = MBTilesStore(mbtiles_path)
+    zooms = []
+    count = 0
+
+    try:
+        for zoom_name in os.listdir(tile_dir):
+            zoom_path = tile_dir / zoom_name
+            if not zoom_name.isdigit() or not zoom_path.is_dir():
+                continue
+            z = int(zoom_name)
+            zooms.append(z)
+            for x_name in os.listdir(zoom_path):
+                x_path = zoom_path / x_name
+                if not x_name.isdigit() or not x_path.is_dir():
+                    continue
+                for y_file in os.listdir(x_path):
+                    if not y_file.endswith('.png'):
+                        continue
+                    store.put_tile(z, int(x_name), int(y_file[:-4]), (x_path / y_file).read_bytes())
+                    count += 1
+            store.commit()
+
+        header = {"name": tile_dir.name, "format": "png", "type": "overlay"}
+        if zooms:
+            header.update({"minzoom": min(zooms), "maxzoom": max(zooms)})
+        header.update(metadata or {})
+        store.set_metadata(header)
+    finally:
+        store.close()
+
+    logger.info(f"Packed {count} tiles from {tile_dir} into {mbtiles_path}")
+    return count
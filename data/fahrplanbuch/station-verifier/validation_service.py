@@ -1,17 +1,22 @@
 # validation_service.py
 import logging
 from db_connector import StationVerifierDB
+from spatial_index import StationIndexRegistry
 
 logger = logging.getLogger(__name__)
 
 class ValidationService:
-    def __init__(self, config):
+    def __init__(self, config, station_index=None):
         self.config = config
         self.db = StationVerifierDB(
             uri=config['DB_URI'],
             username=config['DB_USERNAME'],
             password=config['DB_PASSWORD']
         )
+        # Shared with StationManager so edits keep the index current
+        self.station_index = station_index or StationIndexRegistry(
+            self.db, config['CORRECTIONS_DIR'] / "station_corrections.json"
+        )
     
     def validate_station_distances(self, year_side, line_id=None):
         """Validate distances between stations"""
@@ -76,48 +81,12 @@ class ValidationService:
             nearby_stations = []
             warning_stations = []
             
-            self.db.connect()
-            with self.db.driver.session() as session:
-                # Base query to get stations
-                base_query = """
-                MATCH (s:Station)-[:IN_YEAR]->(y:Year {year: $year})
-                WHERE s.east_west = $side AND s.latitude IS NOT NULL AND s.longitude IS NOT NULL
-                """
-                
-                # Add line filter if specified
-                if line_id:
-                    query = base_query + """
-                    AND EXISTS((l:Line {line_id: $line_id})-[:SERVES]->(s))
-                    RETURN s.stop_id as stop_id, s.name as name, s.type as type,
-                           s.latitude as lat, s.longitude as lng
-                    """
-                    params = {"year": int(year), "side": side, "line_id": line_id}
+            # Radius query against the cached per-year_side index instead of a full scan
+            for station_info in self.station_index.within(year_side, lat, lng, warning_distance_threshold, line_id):
+                if station_info["distance"] < min_distance_threshold:
+                    nearby_stations.append(station_info)
                 else:
-                    query = base_query + """
-                    RETURN s.stop_id as stop_id, s.name as name, s.type as type,
-                           s.latitude as lat, s.longitude as lng
-                    """
-                    params = {"year": int(year), "side": side}
-                
-                result = session.run(query, params)
-                
-                for record in result:
-                    distance = self.db._calculate_distance(
-                        lat, lng,
-                        record['lat'], record['lng']
-                    )
-                    
-                    station_info = {
-                        "stop_id": record['stop_id'],
-                        "name": record['name'],
-                        "type": record['type'],
-                        "distance": distance
-                    }
-                    
-                    if distance < min_distance_threshold:
-                        nearby_stations.append(station_info)
-                    elif distance < warning_distance_threshold:
-                        warning_stations.append(station_info)
+                    warning_stations.append(station_info)
             
             # Sort by distance
             nearby_stations.sort(key=lambda x: x['distance'])
@@ -172,6 +141,35 @@ class ValidationService:
             logger.error(f"Error validating position: {e}")
             return {"status": "error", "message": str(e)}
     
+    def find_nearest_stations(self, year_side, latitude, longitude, k=5, line_id=None):
+        """Find the k stations closest to a position"""
+        try:
+            if not all([year_side, latitude is not None, longitude is not None]):
+                return {"status": "error", "message": "year_side, latitude, and longitude are required"}
+            
+            try:
+                lat = float(latitude)
+                lng = float(longitude)
+                k = int(k)
+                if not (-90 <= lat <= 90) or not (-180 <= lng <= 180):
+                    return {"status": "error", "message": "Invalid coordinates"}
+                if k < 1:
+                    return {"status": "error", "message": "k must be positive"}
+            except (ValueError, TypeError):
+                return {"status": "error", "message": "Invalid coordinate format"}
+            
+            stations = self.station_index.nearest(year_side, lat, lng, k, line_id)
+            
+            return {
+                "status": "success",
+                "position": {"latitude": lat, "longitude": lng},
+                "stations": stations
+            }
+            
+        except Exception as e:
+            logger.error(f"Error finding nearest stations: {e}")
+            return {"status": "error", "message": str(e)}
+    
     def validate_line_connection(self, year_side, line_id, stop_order):
         """Validate a proposed line connection for a new station"""
         try:
@@ -0,0 +1,78 @@
+import json
+
+import pandas as pd
+
+from processed_schema import SCHEMA_FILE, SCHEMA_VERSION, read_table, save_table, schema_version
+
+
+def _write_v1_snapshot(snapshot_dir):
+    """A v1 directory: coordinates only in `location`, floats in integer and code columns"""
+    snapshot_dir.mkdir()
+    (snapshot_dir / 'stops.csv').write_text(
+        "stop_name,type,line_name,stop_id,location,latitude,longitude,location_from,postal_code\n"
+        'U-Bhf. Friedrichsfelde,omnibus,D,19460_unified,"52.50624112,13.51285306",,,1946567.0,10315\n'
+        'Treskowallee,omnibus,D,19461_unified,"52.49277654,13.52652007",,,1946562.0,10318.0\n'
+    )
+    (snapshot_dir / 'lines.csv').write_text(
+        "line_id,year,line_name,type,start_stop,length (time),length (km),east_west,frequency (7:30),profile,capacity\n"
+        "19461_unified,1946,D,omnibus,U-Bhf. Friedrichsfelde,0.0,,unified,12.0,,7.0\n"
+    )
+    (snapshot_dir / 'line_stops.csv').write_text(
+        "stop_order,stop_id,line_id\n"
+        "0.0,19460_unified,19461_unified\n"
+        "1.0,19461_unified,19461_unified\n"
+    )
+
+
+def test_v1_tables_are_upgraded_on_load(tmp_path):
+    snapshot_dir = tmp_path / '1946_unified'
+    _write_v1_snapshot(snapshot_dir)
+
+    assert schema_version(snapshot_dir) == 1
+    stops = read_table(snapshot_dir / 'stops.csv', 'stops')
+    assert stops['latitude'].tolist() == [52.50624112, 52.49277654]
+    assert stops['longitude'].tolist() == [13.51285306, 13.52652007]
+    assert stops['location_from'].tolist() == ['1946567', '1946562']
+    assert stops['postal_code'].tolist() == ['10315', '10318']
+    assert read_table(snapshot_dir / 'lines.csv', 'lines')['capacity'].tolist() == [7]
+
+
+def test_partial_write_migrates_untouched_tables(tmp_path):
+    snapshot_dir = tmp_path / '1946_unified'
+    _write_v1_snapshot(snapshot_dir)
+
+    line_stops_with_dist = pd.DataFrame({
+        'stop_order': [0, 1],
+        'stop_id': ['19460_unified', '19461_unified'],
+        'line_id': ['19461_unified', '19461_unified'],
+        'distance_meters': [1756.9, None],
+    })
+    save_table(snapshot_dir, 'line_stops_with_dist', line_stops_with_dist)
+
+    assert schema_version(snapshot_dir) == SCHEMA_VERSION
+    with open(snapshot_dir / SCHEMA_FILE, encoding='utf-8') as f:
+        recorded = json.load(f)['tables']
+    assert set(recorded) == {'stops', 'lines', 'line_stops', 'line_stops_with_dist'}
+
+    # The untouched tables now load as v2 without the in-memory upgrade
+    stops = read_table(snapshot_dir / 'stops.csv', 'stops', upgrade=False)
+    assert stops['latitude'].notna().all() and stops['longitude'].notna().all()
+    assert stops['postal_code'].tolist() == ['10315', '10318']
+    lines = read_table(snapshot_dir / 'lines.csv', 'lines')
+    assert lines['capacity'].tolist() == [7]
+    line_stops = read_table(snapshot_dir / 'line_stops.csv', 'line_stops')
+    assert line_stops['stop_order'].tolist() == [0, 1]
+
+
+def test_write_to_current_directory_leaves_other_tables(tmp_path):
+    snapshot_dir = tmp_path / '1946_unified'
+    _write_v1_snapshot(snapshot_dir)
+    save_table(snapshot_dir, 'line_stops_with_dist', pd.DataFrame(
+        {'stop_order': [0], 'stop_id': ['19460_unified'], 'line_id': ['19461_unified'], 'distance_meters': [1.0]}))
+    stops_before = (snapshot_dir / 'stops.csv').read_text()
+
+    save_table(snapshot_dir, 'line_stops_with_dist', pd.DataFrame(
+        {'stop_order': [0], 'stop_id': ['19460_unified'], 'line_id': ['19461_unified'], 'distance_meters': [2.0]}))
+
+    assert (snapshot_dir / 'stops.csv').read_text() == stops_before
+    assert read_table(snapshot_dir / 'line_stops_with_dist.csv', 'line_stops_with_dist')['distance_meters'].tolist() == [2.0]